@@ -4,11 +4,25 @@ A versatile system for converting various file formats into clean,
 structured text optimized for Large Language Models (LLMs).
 """
 
+import importlib
+
 __version__ = "0.5.5"
 
-# Import essential components
-from textcleaner.config.config_manager import ConfigManager
-from textcleaner.core.processor import TextProcessor
-from textcleaner.core.models import ProcessingResult
+# Essential components, imported on first access so that importing the
+# package (e.g. for the CLI's --version) does not load the processing stack
+_LAZY_ATTRIBUTES = {
+    "ConfigManager": "textcleaner.config.config_manager",
+    "TextProcessor": "textcleaner.core.processor",
+    "ProcessingResult": "textcleaner.core.models",
+}
 
 __all__ = ["ConfigManager", "TextProcessor", "ProcessingResult", "__version__"]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
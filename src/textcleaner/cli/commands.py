@@ -5,27 +5,30 @@ import sys
 import time
 import json
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Union
 
 import click
-from tqdm import tqdm
 
-from textcleaner import TextProcessor, ProcessingResult, __version__
-from textcleaner.core.factories import TextProcessorFactory
+from textcleaner import __version__
 from textcleaner.config.config_factory import ConfigFactory
 from textcleaner.config.presets import get_preset_names, get_preset_description, get_preset
-from textcleaner.core.file_registry import FileTypeRegistry
 from textcleaner.utils.file_utils import get_supported_extensions
 from textcleaner.utils.logging_config import configure_logging, get_logger
-from textcleaner.utils.log_utils import ProcessingLogger
-from textcleaner.utils.security import SecurityUtils
-from textcleaner.core.directory_processor import DirectoryProcessor
-from textcleaner.utils.parallel import ParallelProcessor
+from textcleaner.core.directory_processor import EXECUTOR_TYPES
+from textcleaner.utils.events import PROGRESS_FORMATS
+from textcleaner.core.service import (
+    DEFAULT_HOST, DEFAULT_PORT, DEFAULT_PROFILE, ProcessorRegistry, TextCleanerService
+)
+
+if TYPE_CHECKING:
+    from textcleaner.core.factories import TextProcessorFactory
+    from textcleaner.core.models import ProcessingResult
+    from textcleaner.core.processor import TextProcessor
 
 # Constants
 DEFAULT_CONFIG_TYPE = "standard"
 TOKEN_STAT_FORMAT = "{:,}"
-OUTPUT_FORMATS = ['markdown', 'plain_text', 'json', 'csv']
+OUTPUT_FORMATS = ['markdown', 'plain_text', 'json', 'csv', 'jsonl']
 # Use the presets from the config module
 LLM_PRESETS = get_preset_names()
 
@@ -66,14 +69,25 @@ def cli(log_level, log_file, verbose, quiet):
     logger.debug(f"Quiet mode: {quiet}")
     logger.debug(f"Log file: {log_file}")
 
-# Get factory instance early for shared components
-_factory = TextProcessorFactory()
+# Shared factory for all commands, created on first use so that commands
+# which never process files (--version, list-formats, ...) start quickly
+_factory: Optional["TextProcessorFactory"] = None
+
+
+def _get_factory() -> "TextProcessorFactory":
+    """Return the shared factory, importing the processing stack on first use."""
+    global _factory
+    if _factory is None:
+        from textcleaner.core.factories import TextProcessorFactory
+        _factory = TextProcessorFactory()
+    return _factory
+
 
 def _validate_and_prepare_paths(input_path: str, output_path: Optional[str]) -> tuple[Path, Optional[Path]]:
     """Validates input path and prepares output path object."""
     logger = get_logger(__name__)
     # Get security utils from the factory
-    security_utils = _factory._get_security_utils() # Access private method for now
+    security_utils = _get_factory()._get_security_utils() # Access private method for now
     
     is_valid, error = security_utils.validate_path(Path(input_path)) 
     if not is_valid:
@@ -115,8 +129,9 @@ def _initialize_processor(
     config: Optional[str],
     config_type: str,
     preset: Optional[str],
-    quiet_mode: bool
-) -> TextProcessor:
+    quiet_mode: bool,
+    extra_overrides: Optional[Dict[str, Any]] = None
+) -> "TextProcessor":
     """Initializes the TextProcessor based on configuration and presets."""
     logger = get_logger(__name__)
     
@@ -130,23 +145,26 @@ def _initialize_processor(
     custom_overrides = {}
     if preset:
         logger.info(f"Using LLM preset: {preset}")
-        if not quiet_mode:
-            try:
+        try:
+            custom_overrides = get_preset(preset)
+            if not quiet_mode:
                 preset_desc = get_preset_description(preset)
                 click.echo(f"Using {preset} preset: {preset_desc}")
-                custom_overrides = get_preset(preset)
                 token_limit = custom_overrides.get("token_limit", "unlimited")
                 if token_limit:
                     click.echo(f"Target token limit: {token_limit:,}")
-            except ValueError as e:
-                logger.error(f"Error loading preset: {e}")
-                click.echo(f"Error: {e}", err=True)
-                sys.exit(1)
+        except ValueError as e:
+            logger.error(f"Error loading preset: {e}")
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
     
+    if extra_overrides:
+        custom_overrides = {**custom_overrides, **extra_overrides}
+
     # Initialize processor using factory
     # factory = TextProcessorFactory() # Use the global factory instance
     try:
-        processor = _factory.create_processor(
+        processor = _get_factory().create_processor(
             config_path=config, 
             config_type=config_type,
             custom_overrides=custom_overrides
@@ -160,29 +178,38 @@ def _initialize_processor(
 
 
 def _process_directory(
-    processor: TextProcessor,
+    processor: "TextProcessor",
     input_dir: Path,
     output_dir: Optional[Path],
     output_format: Optional[str],
     recursive: bool,
     quiet_mode: bool,  # Add quiet_mode
     no_progress: bool, # Add no_progress
-    # TODO: Expose these as CLI options if needed
     use_parallel: bool = True, 
     max_workers: Optional[int] = None,
-    file_extensions: Optional[List[str]] = None
-) -> List[ProcessingResult]: # Add return type hint
-    """Processes all supported files within a directory."""
+    file_extensions: Optional[List[str]] = None,
+    incremental: bool = False,
+    executor: Optional[str] = None,
+    progress_format: str = "text"
+) -> List["ProcessingResult"]: # Add return type hint
+    """Processes all supported files within a directory.
+    
+    ``executor`` is one of "thread", "process", "sequential" or "lanes"; when None the
+    configured ``processing.executor`` is used. ``use_parallel=False`` forces
+    sequential processing.
+    """
     logger = get_logger(__name__)
     logger.info(f"Processing directory: {input_dir}")
 
     # Instantiate components needed for directory processing
     # These might be better managed by a factory or dependency injection in a larger app
     # security_utils = SecurityUtils() # Get from factory
-    parallel_processor = _factory.create_parallel_processor(max_workers=max_workers) 
+    parallel_processor = _get_factory().create_parallel_processor(
+        max_workers=max_workers, config_manager=processor.config
+    )
     
     # Use factory to create the DirectoryProcessor
-    directory_processor = _factory.create_directory_processor(
+    directory_processor = _get_factory().create_directory_processor(
         config_manager=processor.config, # Pass config from the file processor
         # security_utils=security_utils, # Handled by factory
         parallel_processor=parallel_processor,
@@ -200,7 +227,10 @@ def _process_directory(
                  recursive=recursive,
                  file_extensions=file_extensions,
                  quiet_mode=quiet_mode, # Pass down
-                 no_progress=no_progress # Pass down
+                 no_progress=no_progress, # Pass down
+                 incremental=incremental,
+                 executor=executor,
+                 progress_format=progress_format
                  # max_workers is handled by ParallelProcessor instance now
              )
         else:
@@ -212,7 +242,9 @@ def _process_directory(
                  recursive=recursive,
                  file_extensions=file_extensions,
                  quiet_mode=quiet_mode, # Pass down
-                 no_progress=no_progress # Pass down
+                 no_progress=no_progress, # Pass down
+                 incremental=incremental,
+                 progress_format=progress_format
              )
         logger.info(f"Finished processing directory: {input_dir}")
         return results # Return the results
@@ -241,6 +273,23 @@ def _process_directory(
 @click.option('--recursive', '-r', is_flag=True, default=True,
               help='Process directories recursively (default: True)')
 @click.option('--no-progress', is_flag=True, help='Disable progress bar')
+@click.option('--cache-dir', type=click.Path(file_okay=False),
+              help='Cache results in this directory and reuse them for unchanged files')
+@click.option('--incremental', is_flag=True,
+              help='Only process files changed since the last run into the same output directory')
+@click.option('--max-workers', type=click.IntRange(min=1),
+              help='Maximum number of parallel workers for directory processing')
+@click.option('--executor', type=click.Choice(EXECUTOR_TYPES),
+              help='How directory files are processed: thread pool (default), process pool, '
+                   'sequentially, or in per-format lanes (see processing.lanes)')
+@click.option('--progress-format', type=click.Choice(PROGRESS_FORMATS), default='text',
+              help='Directory progress on stderr: live status line or JSON-lines event stream')
+@click.option('--estimate-tokens', is_flag=True,
+              help='Estimate token counts instead of counting them exactly with tiktoken')
+@click.option('--token-limit', type=click.IntRange(min=1),
+              help='Maximum tokens in the processed text (overrides the preset token_limit)')
+@click.option('--enforce-token-limit', is_flag=True,
+              help='Cut the processed text at a heading, paragraph or sentence boundary to fit the token limit')
 def process(
     input_path: str,
     output_path: Optional[str] = None,
@@ -249,7 +298,15 @@ def process(
     config_type: str = DEFAULT_CONFIG_TYPE,
     preset: Optional[str] = None,
     recursive: bool = True,
-    no_progress: bool = False
+    no_progress: bool = False,
+    cache_dir: Optional[str] = None,
+    incremental: bool = False,
+    max_workers: Optional[int] = None,
+    executor: Optional[str] = None,
+    progress_format: str = "text",
+    estimate_tokens: bool = False,
+    token_limit: Optional[int] = None,
+    enforce_token_limit: bool = False
 ):
     """Process a file or directory of files.
     
@@ -271,6 +328,12 @@ def process(
       tc process document.pdf
       tc process documents/ --format markdown
       tc process large_file.txt --preset claude
+      tc process documents/ --cache-dir ~/.cache/textcleaner/results
+      tc process documents/ cleaned/ --incremental
+      tc process documents/ --executor process --max-workers 16
+      tc process documents/ --progress-format jsonl 2> events.jsonl
+      tc process large.pdf --estimate-tokens
+      tc process report.pdf --preset gpt4 --enforce-token-limit
     """
     logger = get_logger(__name__)
     logger.info(f"Process command initiated for: {input_path}")
@@ -287,12 +350,25 @@ def process(
     # Validate paths and prepare output path object
     input_path_obj, output_path_obj = _validate_and_prepare_paths(input_path, output_path)
     
+    # Collect overrides coming from command-line options
+    cli_overrides: Dict[str, Any] = {}
+    if cache_dir:
+        cli_overrides["cache.enabled"] = True
+        cli_overrides["cache.directory"] = cache_dir
+    if estimate_tokens:
+        cli_overrides["metrics.exact_token_counts"] = False
+    if token_limit:
+        cli_overrides["token_limit"] = token_limit
+    if enforce_token_limit:
+        cli_overrides["token_budget.enforce"] = True
+
     # Initialize the processor
     processor = _initialize_processor(
         config=config,
         config_type=config_type,
         preset=preset,
-        quiet_mode=quiet_mode
+        quiet_mode=quiet_mode,
+        extra_overrides=cli_overrides
     )
 
     # Decide how to process based on input type
@@ -319,7 +395,7 @@ def process(
 
             # Validate and create this default path
             # We need access to security_utils, get it from the factory
-            security_utils = _factory._get_security_utils()
+            security_utils = _get_factory()._get_security_utils()
             is_valid, error = security_utils.validate_output_path(final_output_dir)
             if not is_valid:
                 error_msg = f"Validation failed for default output path '{final_output_dir}': {error}"
@@ -339,22 +415,25 @@ def process(
 
         # Now call _process_directory with the determined final_output_dir
         # Pass quiet_mode and no_progress down
-        # TODO: Add CLI option for parallel vs sequential?
-        use_parallel_processing = True # Default to parallel for now
         results = _process_directory(
             processor=processor,
             input_dir=input_path_obj,
             output_dir=final_output_dir, # Pass the determined path
             output_format=format,
             recursive=recursive,
-            use_parallel=use_parallel_processing,
             quiet_mode=quiet_mode, # Pass down
-            no_progress=no_progress # Pass down
-            # Pass other relevant params like max_workers if added as CLI options
+            no_progress=no_progress, # Pass down
+            max_workers=max_workers,
+            incremental=incremental,
+            executor=executor,
+            progress_format=progress_format
         )
         
         # Process and display aggregate results for directory
         if not quiet_mode and results:
+            # Imported here so that starting the CLI does not load tiktoken
+            from textcleaner.utils.metrics import get_token_counts
+
             successful_count = sum(1 for r in results if r.success)
             failed_count = len(results) - successful_count
             
@@ -364,13 +443,10 @@ def process(
             
             for r in results:
                 if r.success:
-                    # Check for both key types (estimated and non-estimated)
-                    orig_tokens = (r.metrics.get("original_token_estimate") or 
-                                  r.metrics.get("original_tokens", 0))
-                    proc_tokens = (r.metrics.get("processed_token_estimate") or 
-                                  r.metrics.get("processed_tokens", 0))
+                    # Token counts may be exact or estimated
+                    orig_tokens, proc_tokens, _, _ = get_token_counts(r.metrics)
                     
-                    if orig_tokens > 0 and proc_tokens > 0:
+                    if orig_tokens and proc_tokens:
                         total_original_tokens += orig_tokens
                         total_processed_tokens += proc_tokens
                         token_files_count += 1
@@ -398,7 +474,7 @@ def process(
 
 
 def _process_single_file(
-    processor: TextProcessor,
+    processor: "TextProcessor",
     input_path: Path,
     output_path: Optional[Path],
     output_format: Optional[str],
@@ -433,7 +509,8 @@ def _process_single_file(
             
             if not quiet_mode:
                 # Default output includes token reduction % if available
-                token_reduction = result.metrics.get("token_reduction_percent")
+                from textcleaner.utils.metrics import get_token_counts
+                token_reduction = get_token_counts(result.metrics)[2]
                 if token_reduction is not None:
                     success_msg = f"{base_success_msg} (Token reduction: {token_reduction:.1f}%)"
                 else:
@@ -498,7 +575,7 @@ def _process_single_file(
         click.echo(error_msg, err=True)
 
 
-def _log_detailed_metrics(result: ProcessingResult, logger):
+def _log_detailed_metrics(result: "ProcessingResult", logger):
     """Log detailed metrics for processed file."""
     metrics = result.metrics
     # Ensure input_path is available and has a name attribute
@@ -510,9 +587,11 @@ def _log_detailed_metrics(result: ProcessingResult, logger):
     logger.debug(f"Removed whitespace: {metrics.get('whitespace_removed', 'N/A')} chars")
     logger.debug(f"Removed duplicates: {metrics.get('duplicates_removed', 'N/A')} lines")
     logger.debug(f"Processing stages: {', '.join(metrics.get('processing_stages', ['N/A']))}") # Handle empty list
-    logger.debug(f"Original Tokens: {metrics.get('original_token_estimate', 'N/A')}")
-    logger.debug(f"Processed Tokens: {metrics.get('processed_token_estimate', 'N/A')}")
-    logger.debug(f"Token Reduction: {metrics.get('token_reduction_percent', 'N/A'):.1f}%") # Ensure float format
+    from textcleaner.utils.metrics import get_token_counts
+    original_tokens, processed_tokens, token_reduction, _ = get_token_counts(metrics)
+    logger.debug(f"Original Tokens: {original_tokens if original_tokens is not None else 'N/A'}")
+    logger.debug(f"Processed Tokens: {processed_tokens if processed_tokens is not None else 'N/A'}")
+    logger.debug(f"Token Reduction: {f'{token_reduction:.1f}%' if token_reduction is not None else 'N/A'}")
     logger.debug("--- End Detailed Metrics ---")
 
 
@@ -523,9 +602,8 @@ def _display_token_statistics(
     verbose: bool = False # Added verbose flag
 ) -> None:
     """Display token statistics in a consistent format."""
-    original_tokens = metrics.get("original_token_estimate")
-    processed_tokens = metrics.get("processed_token_estimate")
-    token_reduction = metrics.get("token_reduction_percent")
+    from textcleaner.utils.metrics import get_token_counts
+    original_tokens, processed_tokens, token_reduction, is_estimate = get_token_counts(metrics)
     size_reduction = metrics.get("size_reduction_percent") # Get size reduction
     
     # Format output based on requested format
@@ -541,20 +619,24 @@ def _display_token_statistics(
         
         # Add other metrics present in the dictionary, excluding those already handled
         handled_keys = {
-            "original_token_estimate", "processed_token_estimate", 
-            "token_reduction_percent", "size_reduction_percent"
+            "original_tokens", "processed_tokens", "token_reduction_percent",
+            "original_tokens_estimate", "processed_tokens_estimate",
+            "token_reduction_percent_estimate", "size_reduction_percent"
         }
+        if original_tokens is not None:
+            stats["token_counts_estimated"] = is_estimate
         stats.update({k: v for k, v in metrics.items() if k not in handled_keys})
         
         click.echo(json.dumps(stats, indent=2))
     else:
         click.echo(f"\nProcessing Summary:")
+        label_suffix = " (est.)" if is_estimate else ""
         if original_tokens is not None:
-            click.echo(f"  Original tokens:  {original_tokens:,}")
+            click.echo(f"  Original tokens{label_suffix}:  {original_tokens:,}")
         if processed_tokens is not None:
-            click.echo(f"  Processed tokens: {processed_tokens:,}")
+            click.echo(f"  Processed tokens{label_suffix}: {processed_tokens:,}")
         if token_reduction is not None:
-            click.echo(f"  Token reduction:  {token_reduction:.1f}%")
+            click.echo(f"  Token reduction{label_suffix}:  {token_reduction:.1f}%")
         # Show size reduction in non-JSON verbose mode as well
         if verbose and size_reduction is not None:
              click.echo(f"  Size reduction:   {size_reduction:.1f}%")
@@ -773,6 +855,86 @@ def list_formats(format: str):
                 click.echo(f"  - {ext}")
 
 
+@cli.command()
+@click.option('--host', default=DEFAULT_HOST, show_default=True, help='Interface to listen on')
+@click.option('--port', type=click.IntRange(min=0, max=65535), default=DEFAULT_PORT, show_default=True,
+              help='Port to listen on')
+@click.option('--config', '-c', type=click.Path(exists=True),
+              help='Configuration file applied to every profile')
+@click.option('--profile', '-p', 'profiles', multiple=True,
+              type=click.Choice(ProcessorRegistry.profile_names()),
+              help='Profile (config type or preset) to load at startup; repeatable. Others load on first use')
+@click.option('--workers', type=click.IntRange(min=1), help='Maximum concurrent batches (default: CPU count)')
+@click.option('--batch-size', type=click.IntRange(min=1), default=8, show_default=True,
+              help='Maximum requests per micro-batch')
+@click.option('--batch-window-ms', type=click.FloatRange(min=0), default=5.0, show_default=True,
+              help='How long to wait for more requests before dispatching a batch')
+@click.option('--max-queue', type=click.IntRange(min=1), default=256, show_default=True,
+              help='Queued requests beyond this are rejected with HTTP 503')
+def serve(
+    host: str,
+    port: int,
+    config: Optional[str],
+    profiles: tuple,
+    workers: Optional[int],
+    batch_size: int,
+    batch_window_ms: float,
+    max_queue: int
+):
+    """Run a local HTTP service with warm processors.
+    
+    Processors are built once and reused, so small documents are cleaned in
+    milliseconds instead of paying startup costs on every call.
+    
+    Examples:
+      tc serve --profile standard --profile rag
+      curl -s localhost:8765/process -H 'Content-Type: application/json' -d '{"path": "/data/report.pdf"}'
+      curl -s 'localhost:8765/process?filename=notes.html&profile=rag' --data-binary @notes.html
+    """
+    logger = get_logger(__name__)
+    service = TextCleanerService(
+        factory=_get_factory(),
+        config_path=config,
+        profiles=profiles or (DEFAULT_PROFILE,),
+        max_workers=workers,
+        max_batch_size=batch_size,
+        batch_window_ms=batch_window_ms,
+        max_queue=max_queue,
+    )
+    server = service.create_server(host, port)
+    bound_host, bound_port = server.server_address[:2]
+    click.echo(f"Serving on http://{bound_host}:{bound_port} (profiles: {', '.join(service.registry.warm_profiles)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down service")
+    finally:
+        server.server_close()
+        service.close()
+
+
+@cli.command(name="build-lexicon")
+@click.argument('output_path', type=click.Path(dir_okay=False))
+def build_lexicon(output_path: str):
+    """Precompute the synonym lexicon for vocabulary simplification.
+
+    Requires NLTK and the WordNet corpus; processing with the lexicon needs
+    neither.
+
+    Examples:
+      textcleaner build-lexicon synonyms.lex
+      textcleaner process docs/ -c config.yaml  # with optimization.synonym_lexicon: synonyms.lex
+    """
+    from textcleaner.utils.word_simplifier import build_wordnet_lexicon
+
+    try:
+        count = build_wordnet_lexicon(output_path)
+    except (RuntimeError, OSError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    click.echo(f"Wrote {count:,} entries to {output_path}")
+
+
 @cli.command(name="version")
 def show_version():
     """Show detailed version information."""
@@ -1,5 +1,7 @@
 """Configuration management for the text processor."""
 
+import hashlib
+import json
 import os
 import yaml
 from pathlib import Path
@@ -122,6 +124,18 @@ class ConfigManager:
         """
         return self.get(section, {})
     
+    def fingerprint(self) -> str:
+        """Return a stable fingerprint of the effective configuration.
+        
+        Two managers holding equal settings produce the same fingerprint,
+        regardless of key order, so it can be used as part of cache keys.
+        
+        Returns:
+            Hex-encoded SHA-256 digest of the canonical configuration.
+        """
+        canonical = json.dumps(self.config, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
     def save_to_file(self, path: str) -> None:
         """Save the current configuration to a file.
         
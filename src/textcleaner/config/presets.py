@@ -126,6 +126,10 @@ LLM_PRESETS: Dict[str, Dict[str, Any]] = {
             "chunk_by_heading": True,
             "normalize_whitespace": True
         },
+        "chunking": {
+            "max_tokens": 512,
+            "overlap_tokens": 64
+        },
         "html": {
             "remove_scripts": True,
             "remove_styles": True,
@@ -1,11 +1,16 @@
 """Base converter classes for handling different file formats."""
 
 # import os # Removed - Unused import
+import importlib
+import os
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from textcleaner.config.config_manager import ConfigManager
+from textcleaner.utils.file_sniffer import KIND_EXECUTABLE, sniff_file
+from textcleaner.utils.logging_config import get_logger
 
 # Import specific converter implementations here
 # Removed direct imports to avoid circular dependency
@@ -19,6 +24,15 @@ class BaseConverter(ABC):
     Each converter is responsible for handling specific file formats and extracting
     content and metadata.
     """
+
+    # Whether convert() picks its parser from the file extension, in which
+    # case files whose content does not match their extension cannot be
+    # rerouted to this converter
+    dispatches_on_extension = False
+
+    # Whether stream() can read files window by window (see
+    # textcleaner.utils.streaming) instead of into memory at once
+    supports_streaming = False
     
     def __init__(self, config: Optional[ConfigManager] = None):
         """Initialize the converter.
@@ -29,6 +43,11 @@ class BaseConverter(ABC):
         self.config = config or ConfigManager()
         # List of file extensions this converter can handle
         self.supported_extensions: List[str] = []
+
+    @property
+    def name(self) -> str:
+        """Class name of the converter, used for logging and lane routing."""
+        return type(self).__name__
         
     def can_handle(self, file_path: Union[str, Path]) -> bool:
         """Check if this converter can handle the given file.
@@ -63,6 +82,25 @@ class BaseConverter(ABC):
             RuntimeError: If conversion fails.
         """
         pass
+
+    def stream(self, file_path: Union[str, Path], window_size: int) -> Tuple[Iterator[str], Dict[str, Any]]:
+        """Convert a file lazily, as paragraph-aligned windows of raw content.
+
+        Only converters that set ``supports_streaming`` implement this.
+
+        Args:
+            file_path: Path to the file to convert.
+            window_size: Target size of each window, in characters.
+
+        Returns:
+            Tuple of (window iterator, metadata_dict). Metadata that depends
+            on the whole content is added to the dictionary as the windows
+            are read.
+
+        Raises:
+            NotImplementedError: If the converter cannot stream.
+        """
+        raise NotImplementedError(f"{self.name} cannot stream its input")
     
     def get_stats(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """Get statistics about the file.
@@ -76,15 +114,111 @@ class BaseConverter(ABC):
         if isinstance(file_path, str):
             file_path = Path(file_path)
             
+        size = file_path.stat().st_size
         return {
             "file_name": file_path.name,
             "file_extension": file_path.suffix,
-            "file_size_bytes": file_path.stat().st_size,
-            "file_size_kb": round(file_path.stat().st_size / 1024, 2),
-            "file_size_mb": round(file_path.stat().st_size / (1024 * 1024), 2),
+            "file_size_bytes": size,
+            "file_size_kb": round(size / 1024, 2),
+            "file_size_mb": round(size / (1024 * 1024), 2),
         }
 
 
+class LazyConverter(BaseConverter):
+    """Stand-in for a converter whose module is imported on first use.
+
+    Extension checks are answered from the declared extensions without
+    importing anything. The real converter is built the first time a file is
+    converted (or a check needs the converter's own logic, e.g. for URLs), and
+    every other attribute access is forwarded to it.
+    """
+
+    def __init__(
+        self,
+        module: str,
+        class_name: str,
+        extensions: List[str],
+        options: Optional[Dict[str, Any]] = None,
+        handles_urls: bool = False,
+        dispatches_on_extension: bool = False,
+        config: Optional[ConfigManager] = None
+    ):
+        """Initialize the stand-in.
+
+        Args:
+            module: Module defining the converter class.
+            class_name: Name of the converter class.
+            extensions: File extensions the converter handles.
+            options: Keyword arguments for the converter's constructor.
+            handles_urls: Whether the converter also accepts http(s) URLs.
+            dispatches_on_extension: Mirrors the converter's class attribute.
+            config: Configuration manager instance.
+        """
+        self._converter: Optional[BaseConverter] = None
+        self._lock = threading.Lock()
+        super().__init__(config)
+        self.module = module
+        self.class_name = class_name
+        self.supported_extensions = list(extensions)
+        self.options = options or {}
+        self.handles_urls = handles_urls
+        self.dispatches_on_extension = dispatches_on_extension
+
+    @property
+    def config(self) -> ConfigManager:
+        return self._config
+
+    @config.setter
+    def config(self, config: ConfigManager) -> None:
+        self._config = config
+        if self._converter is not None:
+            self._converter.config = config
+
+    @property
+    def name(self) -> str:
+        return self.class_name
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the real converter has been built."""
+        return self._converter is not None
+
+    def load(self) -> BaseConverter:
+        """Import and build the real converter if needed and return it."""
+        if self._converter is None:
+            with self._lock:
+                if self._converter is None:
+                    converter_class = getattr(importlib.import_module(self.module), self.class_name)
+                    self._converter = converter_class(config=self._config, **self.options)
+        return self._converter
+
+    def can_handle(self, file_path: Union[str, Path]) -> bool:
+        if self._converter is not None:
+            return self._converter.can_handle(file_path)
+        if self.handles_urls and str(file_path).lower().startswith(("http://", "https://")):
+            return self.load().can_handle(file_path)
+        return super().can_handle(file_path)
+
+    def convert(self, file_path: Union[str, Path]) -> Tuple[str, Dict[str, Any]]:
+        return self.load().convert(file_path)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.load().supports_streaming
+
+    def stream(self, file_path: Union[str, Path], window_size: int) -> Tuple[Iterator[str], Dict[str, Any]]:
+        return self.load().stream(file_path, window_size)
+
+    def get_stats(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+        return self.load().get_stats(file_path)
+
+    def __getattr__(self, attribute: str) -> Any:
+        # Only called for attributes the stand-in does not define itself
+        if attribute.startswith("__") or attribute in ("_converter", "_config", "_lock"):
+            raise AttributeError(attribute)
+        return getattr(self.load(), attribute)
+
+
 class ConverterRegistry:
     """Registry for file format converters.
     
@@ -98,19 +232,19 @@ class ConverterRegistry:
         Args:
             config: Configuration manager instance to pass to converters.
         """
+        self.logger = get_logger(__name__)
         self.config = config or ConfigManager()
         self.converters: List['BaseConverter'] = [] # Use forward reference string
+        # Extension -> first registered converter declaring it
+        self._by_extension: Dict[str, 'BaseConverter'] = {}
     
     def populate_registry(self) -> None:
-        """Register all standard converters with the registry using the current config."""
-        # Import here to avoid circular dependency at module level
-        from textcleaner.converters.pdf_converter import PDFConverter
-        from textcleaner.converters.office_converter import OfficeConverter
-        from textcleaner.converters.html_converter import HTMLConverter
-        from textcleaner.converters.text_converter import TextConverter
-        from textcleaner.converters.markdown_converter import MarkdownConverter
-        from textcleaner.converters.csv_converter import CSVConverter
+        """Register all standard converters with the registry using the current config.
 
+        Converters are registered as ``LazyConverter`` stand-ins, so their
+        modules (and libraries such as pandas or pdfminer) are only imported
+        when a file of that format is first converted.
+        """
         if not self.config:
             raise RuntimeError("Registry must have a config set before populating.")
 
@@ -118,39 +252,64 @@ class ConverterRegistry:
 
         # Clear existing converters before repopulating
         self.converters = []
+        self._by_extension = {}
 
         # Register the PDF converter
-        self.register(PDFConverter(config=config))
+        self.register(LazyConverter(
+            "textcleaner.converters.pdf_converter", "PDFConverter", [".pdf"], config=config
+        ))
 
         # Register the Office document converter with specific config values
-        self.register(OfficeConverter(
-            extract_comments=config.get("formats.office.extract_comments", False),
-            extract_tracked_changes=config.get("formats.office.extract_tracked_changes", False),
-            extract_hidden_content=config.get("formats.office.extract_hidden_content", False),
-            max_excel_rows=config.get("formats.office.max_excel_rows", 1000),
-            max_excel_cols=config.get("formats.office.max_excel_cols", 20),
+        self.register(LazyConverter(
+            "textcleaner.converters.office_converter", "OfficeConverter",
+            [".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".odt", ".ods", ".odp"],
+            options={
+                "extract_comments": config.get("formats.office.extract_comments", False),
+                "extract_tracked_changes": config.get("formats.office.extract_tracked_changes", False),
+                "extract_hidden_content": config.get("formats.office.extract_hidden_content", False),
+                "max_excel_rows": config.get("formats.office.max_excel_rows", 1000),
+                "max_excel_cols": config.get("formats.office.max_excel_cols", 20),
+            },
+            dispatches_on_extension=True,
             config=config
         ))
 
         # Register the HTML/XML converter with specific config values
-        self.register(HTMLConverter(
-            parser=config.get("converters.html.parser", "html.parser"),
-            remove_comments=config.get("converters.html.remove_comments", True),
-            remove_scripts=config.get("converters.html.remove_scripts", True),
-            remove_styles=config.get("converters.html.remove_styles", True),
-            extract_metadata=config.get("converters.html.extract_metadata", True),
-            preserve_links=config.get("converters.html.preserve_links", True),
+        self.register(LazyConverter(
+            "textcleaner.converters.html_converter", "HTMLConverter",
+            [".html", ".htm", ".xhtml", ".xml"],
+            options={
+                "parser": config.get("converters.html.parser", "html.parser"),
+                "remove_comments": config.get("converters.html.remove_comments", True),
+                "remove_scripts": config.get("converters.html.remove_scripts", True),
+                "remove_styles": config.get("converters.html.remove_styles", True),
+                "extract_metadata": config.get("converters.html.extract_metadata", True),
+                "preserve_links": config.get("converters.html.preserve_links", True),
+            },
+            handles_urls=True,
             config=config
         ))
 
         # Register the plain text converter
-        self.register(TextConverter(config=config))
+        self.register(LazyConverter(
+            "textcleaner.converters.text_converter", "TextConverter", [".txt"], config=config
+        ))
 
         # Register the markdown converter
-        self.register(MarkdownConverter(config=config))
+        self.register(LazyConverter(
+            "textcleaner.converters.markdown_converter", "MarkdownConverter", [".md", ".markdown"], config=config
+        ))
 
         # Register the CSV converter
-        self.register(CSVConverter(config=config))
+        self.register(LazyConverter(
+            "textcleaner.converters.csv_converter", "CSVConverter", [".csv"], config=config
+        ))
+
+    def load_all(self) -> None:
+        """Import and build every lazily registered converter now."""
+        for converter in self.converters:
+            if isinstance(converter, LazyConverter):
+                converter.load()
 
     def register(self, converter: 'BaseConverter') -> None: # Use forward reference string
         """Register an instantiated converter.
@@ -166,6 +325,8 @@ class ConverterRegistry:
             
         # Add to registry
         self.converters.append(converter)
+        for ext in converter.supported_extensions:
+            self._by_extension.setdefault(ext.lower(), converter)
         
         # Set config if available
         if self.config:
@@ -185,6 +346,9 @@ class ConverterRegistry:
         
     def find_converter(self, file_path: Union[str, Path]) -> Optional['BaseConverter']: # Use forward reference string
         """Find a converter that can handle the given file.
+
+        Looks the extension up in the dispatch index and only falls back to
+        asking every converter (e.g. for URLs) when that finds nothing.
         
         Args:
             file_path: Path to the file.
@@ -192,8 +356,54 @@ class ConverterRegistry:
         Returns:
             A converter instance that can handle the file, or None if no converter is found.
         """
+        converter = self._by_extension.get(os.path.splitext(str(file_path))[1].lower())
+        if converter is not None:
+            return converter
+
         for converter in self.converters:
             if converter.can_handle(file_path):
                 return converter
                 
         return None
+
+    def dispatch(self, file_path: Path) -> Tuple['BaseConverter', Optional[str]]:
+        """Choose the converter for a local file, checking its content.
+
+        The file's leading bytes are sniffed (see ``utils.file_sniffer``).
+        Files whose content matches their extension go to that extension's
+        converter; mislabelled files are rerouted to the converter of the
+        detected format where possible and rejected otherwise. Nothing is
+        imported or opened by a converter before this decision. Sniffing can
+        be turned off with ``formats.sniff_content``.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            Tuple of (converter, detected extension if the file was rerouted).
+
+        Raises:
+            ValueError: If no converter can handle the file or its content
+                does not match its extension.
+        """
+        ext = file_path.suffix.lower()
+        converter = self.find_converter(file_path)
+        if self.config.get("formats.sniff_content", True):
+            sniffed = sniff_file(file_path)
+            if sniffed.kind == KIND_EXECUTABLE:
+                raise ValueError(f"File content is an executable: {file_path.name}")
+            if not sniffed.matches(ext):
+                target = self._by_extension.get(sniffed.extension) if sniffed.extension else None
+                if target is None or target.dispatches_on_extension:
+                    detected = sniffed.extension or f"{sniffed.kind} data"
+                    raise ValueError(
+                        f"File content does not match its extension '{ext}' (looks like {detected}): {file_path.name}"
+                    )
+                self.logger.warning(
+                    f"{file_path.name} looks like a {sniffed.extension} file, converting it with {target.name}"
+                )
+                return target, sniffed.extension
+
+        if converter is None:
+            raise ValueError(f"No converter found for file type: {file_path.suffix}")
+        return converter, None
@@ -2,11 +2,12 @@
 
 import csv
 from pathlib import Path
-from typing import Any, Dict, Tuple, Union, Optional
+from typing import Any, Dict, Iterator, List, Tuple, Union, Optional
 
 from textcleaner.config.config_manager import ConfigManager
 from textcleaner.converters.base import BaseConverter
 from textcleaner.utils.logging_config import get_logger
+from textcleaner.utils.mapped_input import bom_length, iter_lines, map_file
 
 logger = get_logger(__name__)
 
@@ -14,6 +15,8 @@ logger = get_logger(__name__)
 class CSVConverter(BaseConverter):
     """Converter for CSV files."""
 
+    supports_streaming = True
+
     def __init__(self, config: Optional[ConfigManager] = None):
         """Initialize the CSV converter."""
         super().__init__(config=config)
@@ -38,46 +41,13 @@ class CSVConverter(BaseConverter):
             raise ValueError(f"Unsupported file type: {file_path.suffix}")
 
         logger.info(f"Converting CSV file: {file_path}")
-        content_lines = []
         metadata = self.get_stats(file_path)
         metadata['converter'] = self.__class__.__name__
 
         try:
-            with open(file_path, 'r', newline='', encoding='utf-8-sig') as csvfile: # Use utf-8-sig to handle potential BOM
-                # Use configured delimiter and quotechar
-                reader = csv.reader(csvfile, delimiter=self.delimiter, quotechar=self.quotechar)
-                header = None
-                original_rows = 0
-                for i, row in enumerate(reader):
-                    original_rows += 1
-                    if self.max_rows is not None and i >= self.max_rows:
-                        logger.warning(f"Reached max_rows limit ({self.max_rows}) for {file_path}. Truncating file.")
-                        metadata['truncated'] = True
-                        break
-                    
-                    if i == 0 and not self.include_header:
-                        header = row
-                        metadata['header'] = header
-                        continue
-                    
-                    # Handle potential empty cells or different data types gracefully
-                    processed_row = []
-                    for cell in row:
-                        try:
-                            processed_row.append(str(cell).strip())
-                        except Exception as cell_err:
-                            logger.warning(f"Could not process cell in row {i+1} of {file_path}: {cell_err}. Replacing with empty string.")
-                            processed_row.append("") # Replace problematic cell with empty string
-                    
-                    content_lines.append(" ".join(processed_row))
-
+            content_lines = list(self._iter_lines(file_path, metadata))
             raw_content = "\n".join(content_lines)
-            logger.debug(f"Successfully converted {file_path}. Extracted {len(raw_content)} characters from {len(content_lines)} rows (original: {original_rows}).")
-            metadata['original_rows'] = original_rows
-            metadata['processed_rows'] = len(content_lines)
-            metadata['delimiter'] = self.delimiter
-            metadata['quotechar'] = self.quotechar
-            metadata['included_header'] = self.include_header if header is None else False
+            logger.debug(f"Successfully converted {file_path}. Extracted {len(raw_content)} characters from {len(content_lines)} rows (original: {metadata['original_rows']}).")
 
         except csv.Error as e:
             logger.error(f"Error reading CSV file {file_path}: {e}")
@@ -86,4 +56,82 @@ class CSVConverter(BaseConverter):
             logger.error(f"An unexpected error occurred during CSV conversion of {file_path}: {e}")
             raise RuntimeError(f"Conversion failed for {file_path}") from e
 
-        return raw_content, metadata 
\ No newline at end of file
+        return raw_content, metadata
+
+    def stream(self, file_path: Union[str, Path], window_size: int) -> Tuple[Iterator[str], Dict[str, Any]]:
+        """Convert a CSV file lazily, as windows of whole rows.
+
+        Row counts are added to the metadata once all windows have been read.
+        """
+        if isinstance(file_path, str):
+            file_path = Path(file_path)
+
+        if not file_path.exists():
+            logger.error(f"File not found: {file_path}")
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        logger.info(f"Streaming CSV file: {file_path}")
+        metadata = self.get_stats(file_path)
+        metadata['converter'] = self.__class__.__name__
+        return self._read_windows(file_path, window_size, metadata), metadata
+
+    def _read_windows(self, file_path: Path, window_size: int, metadata: Dict[str, Any]) -> Iterator[str]:
+        """Group the rows of a CSV file into windows of about window_size characters."""
+        lines: List[str] = []
+        size = 0
+        try:
+            for line in self._iter_lines(file_path, metadata):
+                lines.append(line)
+                size += len(line) + 1
+                if size >= window_size:
+                    yield "\n".join(lines) + "\n"
+                    lines, size = [], 0
+        except csv.Error as e:
+            logger.error(f"Error reading CSV file {file_path}: {e}")
+            raise RuntimeError(f"Failed to parse CSV file {file_path}: {e}") from e
+        if lines:
+            yield "\n".join(lines)
+
+    def _iter_lines(self, file_path: Path, metadata: Dict[str, Any]) -> Iterator[str]:
+        """Read the rows of a CSV file as lines of text.
+
+        The header (if not included) and, once all rows have been read, the
+        row counts and dialect are added to the metadata.
+        """
+        with map_file(file_path) as buffer:
+            # Rows are decoded line by line from the mapped file, after any BOM
+            lines = iter_lines(buffer, bom_length(buffer))
+            # Use configured delimiter and quotechar
+            reader = csv.reader(lines, delimiter=self.delimiter, quotechar=self.quotechar)
+            header = None
+            original_rows = 0
+            processed_rows = 0
+            for i, row in enumerate(reader):
+                original_rows += 1
+                if self.max_rows is not None and i >= self.max_rows:
+                    logger.warning(f"Reached max_rows limit ({self.max_rows}) for {file_path}. Truncating file.")
+                    metadata['truncated'] = True
+                    break
+                
+                if i == 0 and not self.include_header:
+                    header = row
+                    metadata['header'] = header
+                    continue
+                
+                # Handle potential empty cells or different data types gracefully
+                processed_row = []
+                for cell in row:
+                    try:
+                        processed_row.append(str(cell).strip())
+                    except Exception as cell_err:
+                        logger.warning(f"Could not process cell in row {i+1} of {file_path}: {cell_err}. Replacing with empty string.")
+                        processed_row.append("") # Replace problematic cell with empty string
+                
+                processed_rows += 1
+                yield " ".join(processed_row)
+
+        metadata['original_rows'] = original_rows
+        metadata['processed_rows'] = processed_rows
+        metadata['delimiter'] = self.delimiter
+        metadata['quotechar'] = self.quotechar
+        metadata['included_header'] = self.include_header if header is None else False 
\ No newline at end of file
@@ -8,14 +8,33 @@ with preservation of markdown formatting.
 # import os # Removed unused import
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 # Import yaml at the top level
 import yaml
 
 from textcleaner.converters.base import BaseConverter
 from textcleaner.utils.logging_config import get_logger
+from textcleaner.utils.mapped_input import bom_length, decode_buffer, frontmatter_span, iter_decoded, map_file
+from textcleaner.utils.streaming import iter_windows
 from textcleaner.config.config_manager import ConfigManager
 
+# ATX-style headings (# Heading), optionally closed by #s, one per line
+_HEADING_PATTERN = re.compile(r'^[^\S\n]*(#{1,6})[^\S\n]+(.+?)(?:[^\S\n]+#{1,6})?[^\S\n]*$', re.MULTILINE)
+
+# Line breaks other than "\n" that str.splitlines() recognizes
+_OTHER_LINE_BREAKS = re.compile('[\r\v\f\x1c-\x1e\x85\u2028\u2029]')
+
+
+def _normalize_line_breaks(text: str) -> str:
+    """Turn every line break into "\n", like joining ``text.splitlines()``.
+
+    Text that only uses "\n" is returned as is, without a copy.
+    """
+    if not _OTHER_LINE_BREAKS.search(text):
+        return text
+    normalized = "\n".join(text.splitlines())
+    return normalized + "\n" if text.endswith("\n") else normalized
+
 
 class MarkdownConverter(BaseConverter):
     """Converter for markdown files.
@@ -23,6 +42,8 @@ class MarkdownConverter(BaseConverter):
     This converter reads markdown files and preserves their formatting
     while extracting metadata from frontmatter if present.
     """
+
+    supports_streaming = True
     
     def __init__(self, config: Optional[ConfigManager] = None):
         """Initialize the markdown converter."""
@@ -61,44 +82,17 @@ class MarkdownConverter(BaseConverter):
         # Read the file content
         try:
             self.logger.debug(f"Reading markdown file content from {file_path}")
-            with open(file_path, "r", encoding="utf-8") as f:
-                original_content = f.read() # Store original content
-                
-            lines = original_content.splitlines() # Split into lines
-            frontmatter_text = None
-            body_lines = lines
             metadata = {}
-            
-            if lines and lines[0].strip() == '---':
-                try:
-                    end_marker_index = -1
-                    for i, line in enumerate(lines[1:], start=1):
-                        if line.strip() == '---':
-                            end_marker_index = i
-                            break
-                            
-                    if end_marker_index > 0:
-                        frontmatter_lines = lines[1:end_marker_index]
-                        frontmatter_text = "\n".join(frontmatter_lines)
-                        body_lines = lines[end_marker_index + 1:]
-                        
-                        # Attempt to parse the extracted frontmatter
-                        metadata = self._extract_frontmatter(frontmatter_text)
-                        
-                except Exception as e: # Catch potential errors during index/slice
-                    self.logger.warning(f"Error processing potential frontmatter: {e}")
-                    # Reset in case of error, treat as no frontmatter found
-                    frontmatter_text = None
-                    body_lines = lines 
-                    metadata = {}
-                    
-            # Reconstruct body content, preserving potential trailing newline
-            content = "\n".join(body_lines)
-            # Check original content for trailing newline
-            if original_content.endswith('\n') and not content.endswith('\n'):
-                 content += "\n" 
-            
-            # Extract basic file metadata (outside the frontmatter try block)
+            with map_file(file_path) as buffer:
+                body_start = bom_length(buffer)
+                span = frontmatter_span(buffer, body_start)
+                if span:
+                    # Parse the frontmatter; it is removed even if invalid
+                    frontmatter_start, frontmatter_end, body_start = span
+                    metadata = self._extract_frontmatter(decode_buffer(buffer[frontmatter_start:frontmatter_end]))
+                content = _normalize_line_breaks(decode_buffer(buffer, body_start))
+
+            # Extract basic file metadata
             file_stats = self.get_stats(file_path) # Use BaseConverter method
             metadata.update({
                 "file_name": file_path.name,
@@ -127,6 +121,62 @@ class MarkdownConverter(BaseConverter):
             self.logger.error(error_msg)
             raise
             
+    def stream(self, file_path: Union[str, Path], window_size: int) -> Tuple[Iterator[str], Dict[str, Any]]:
+        """Convert a markdown file lazily, as paragraph-aligned windows.
+
+        Frontmatter at the start of the file is parsed into the metadata
+        and removed before the first window, and headings are added to the metadata as the
+        windows are read.
+
+        Args:
+            file_path: Path to the markdown file to convert.
+            window_size: Target size of each window, in characters.
+
+        Returns:
+            Tuple of (window iterator, metadata dictionary).
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            ValueError: While iterating, if the file is not a valid markdown file.
+        """
+        if isinstance(file_path, str):
+            file_path = Path(file_path)
+        if not file_path.exists():
+            error_msg = f"File not found: {file_path}"
+            self.logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        self.logger.info(f"Streaming markdown file: {file_path}")
+        file_stats = self.get_stats(file_path)
+        metadata: Dict[str, Any] = {
+            "file_name": file_path.name,
+            "file_extension": file_path.suffix.lower(),
+            "file_stats": {
+                "size_bytes": file_stats.get("file_size_bytes"),
+            }
+        }
+        return self._read_windows(file_path, window_size, metadata), metadata
+
+    def _read_windows(self, file_path: Path, window_size: int, metadata: Dict[str, Any]) -> Iterator[str]:
+        """Read the windows of a markdown file, collecting its metadata."""
+        try:
+            with map_file(file_path) as buffer:
+                body_start = bom_length(buffer)
+                span = frontmatter_span(buffer, body_start)
+                if span:
+                    frontmatter_start, frontmatter_end, body_start = span
+                    metadata.update(self._extract_frontmatter(decode_buffer(buffer[frontmatter_start:frontmatter_end])))
+                for window in iter_windows(iter_decoded(buffer, body_start), window_size):
+                    window = _normalize_line_breaks(window)
+                    headings = self._extract_headings(window)
+                    if headings:
+                        metadata.setdefault("headings", []).extend(headings)
+                    yield window
+        except UnicodeDecodeError:
+            error_msg = f"File is not a valid markdown file or has an unsupported encoding: {file_path}"
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
+
     def _extract_frontmatter(self, frontmatter_text: Optional[str]) -> Dict[str, Any]:
         """Extract YAML frontmatter from markdown content if present.
         
@@ -165,18 +215,11 @@ class MarkdownConverter(BaseConverter):
         Returns:
             List of heading dictionaries with level and text.
         """
-        # Match ATX-style headings (# Heading)
-        heading_pattern = r'^(#{1,6})\s+(.+?)(?:\s+#{1,6})?$'
         headings = []
-        
-        for line in content.split('\n'):
-            match = re.match(heading_pattern, line.strip())
-            if match:
-                level = len(match.group(1))
-                text = match.group(2).strip()
-                headings.append({
-                    "level": level,
-                    "text": text
-                })
-                
+        for match in _HEADING_PATTERN.finditer(content):
+            headings.append({
+                "level": len(match.group(1)),
+                "text": match.group(2).strip()
+            })
+
         return headings
@@ -29,6 +29,8 @@ class OfficeConverter(BaseConverter):
     - PowerPoint presentations (.ppt, .pptx, .odp)
     """
     
+    dispatches_on_extension = True
+
     def __init__(self, 
                  extract_comments: bool,
                  extract_tracked_changes: bool,
@@ -1,25 +1,236 @@
 """Converter for PDF files."""
 
+import concurrent.futures
+import multiprocessing
+import os
+import re
+import threading
+import unicodedata
+from io import StringIO
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from pypdf import PdfReader
-from pypdf.errors import PdfReadError
+from pdfminer.converter import TextConverter
 from pdfminer.high_level import extract_text as pdfminer_extract_text
-from pdfminer.pdfparser import PDFSyntaxError
-from pdfminer.pdfdocument import PDFEncryptionError
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser, PDFSyntaxError
+from pdfminer.pdfdocument import PDFDocument, PDFEncryptionError
+from pdfminer.pdftypes import resolve1
+from pdfminer.psparser import PSException
+from pdfminer.utils import decode_text
+from pypdf import PdfReader
 
 from textcleaner.converters.base import BaseConverter
 from textcleaner.config.config_manager import ConfigManager
+from textcleaner.core.worker_template import create_worker_context, template_initializer
 from textcleaner.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Page ranges per worker, so that a slow range does not hold up the others
+RANGES_PER_WORKER = 2
+
+# Smallest page range worth starting a task for
+MIN_RANGE_PAGES = 8
+
+# Text extraction engines: pypdf, pdfminer without ordering text boxes
+# across the page, and pdfminer with full layout analysis
+ENGINE_PYPDF = "pypdf"
+ENGINE_PDFMINER_FAST = "pdfminer_fast"
+ENGINE_PDFMINER = "pdfminer"
+TEXT_ENGINES = (ENGINE_PYPDF, ENGINE_PDFMINER_FAST, ENGINE_PDFMINER)
+
+# Default bounds of the quality check for text from the fast engine
+DEFAULT_TEXT_QUALITY = {
+    "min_chars_per_word": 2.0,
+    "max_chars_per_word": 10.0,
+    "max_garbled_ratio": 0.02,
+    "max_whitespace_ratio": 0.3,
+}
+
+# Pages of fast-engine text checked before extracting the rest of a document
+FAST_PROBE_PAGES = 2
+
+# Unmapped glyphs as pdfminer writes them, and replacement or control characters
+_GARBLED_PATTERN = re.compile(r"\(cid:\d+\)|[\ufffd\x00-\x08\x0b\x0e-\x1f\x7f-\x9f]")
+
+# Unassigned and private-use code points, typical of fonts decoded with the wrong map
+_GARBLED_CATEGORIES = {"Cn", "Co"}
+
+# Document information entries copied into the metadata
+_INFO_FIELDS = {"Title": "title", "Author": "author", "Subject": "subject", "Creator": "creator"}
+
+# Process pool shared by all documents extracted in parallel in this process
+_page_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_page_pool_workers = 0
+_page_pool_lock = threading.Lock()
+
+
+def _parse_document(fp: Any) -> PDFDocument:
+    """Parse the cross-reference table and trailer of a PDF opened in binary mode.
+
+    Objects are read from the file lazily, so it must stay open while the
+    document is used.
+    """
+    return PDFDocument(PDFParser(fp))
+
+
+def _page_count(document: PDFDocument) -> int:
+    """Number of pages, from the page tree root or else by walking the tree."""
+    try:
+        count = resolve1(resolve1(document.catalog["Pages"])["Count"])
+        if isinstance(count, int) and count >= 0:
+            return count
+    except (KeyError, TypeError, PSException):
+        pass
+    return sum(1 for _ in PDFPage.create_pages(document))
+
+
+def _document_info(document: PDFDocument) -> Dict[str, str]:
+    """Title, author, subject and creator from the document information dictionary."""
+    info: Dict[str, str] = {}
+    # Trailers are listed newest first; earlier entries win
+    for fields in document.info:
+        for key, name in _INFO_FIELDS.items():
+            if name in info or key not in fields:
+                continue
+            value = resolve1(fields[key])
+            if isinstance(value, bytes):
+                value = decode_text(value)
+            if isinstance(value, str) and value:
+                info[name] = value
+    return info
+
+
+def _layout_params(order_boxes: bool = True) -> LAParams:
+    """pdfminer layout analysis parameters.
+
+    Without ``order_boxes`` characters are still grouped into lines and
+    text boxes, but the boxes are not ordered across the page by their
+    hierarchical grouping, the costliest step; they stay in the order the
+    page draws them.
+    """
+    return LAParams() if order_boxes else LAParams(boxes_flow=None)
+
+
+def _extract_document_text(document: PDFDocument, order_boxes: bool = True) -> str:
+    """Extract the text of a parsed document, like pdfminer's ``extract_text``."""
+    resource_manager = PDFResourceManager(caching=True)
+    with StringIO() as output:
+        device = TextConverter(resource_manager, output, codec="utf-8", laparams=_layout_params(order_boxes))
+        interpreter = PDFPageInterpreter(resource_manager, device)
+        for page in PDFPage.create_pages(document):
+            interpreter.process_page(page)
+        return output.getvalue()
+
+
+def _pypdf_info(reader: PdfReader) -> Dict[str, str]:
+    """Title, author, subject and creator from pypdf's document information."""
+    info = reader.metadata
+    if not info:
+        return {}
+    values = {name: getattr(info, name, None) for name in _INFO_FIELDS.values()}
+    return {name: value for name, value in values.items() if isinstance(value, str) and value}
+
+
+def text_quality(text: str) -> Optional[Dict[str, float]]:
+    """Measure how plausible extracted text is.
+
+    Args:
+        text: Extracted text.
+
+    Returns:
+        ``chars_per_word``: mean length of whitespace-separated words, which
+        is too high when spaces were lost and too low when letters were
+        spaced apart; ``garbled_ratio``: share of unmapped, replacement,
+        control, unassigned or private-use characters among the
+        non-whitespace characters; ``whitespace_ratio``: share of
+        whitespace, which is too high when words were broken onto lines of
+        their own. None if the text has no words.
+    """
+    words = text.split()
+    if not words:
+        return None
+    chars = sum(len(word) for word in words)
+    garbled = len(_GARBLED_PATTERN.findall(text)) + sum(
+        1 for char in text if unicodedata.category(char) in _GARBLED_CATEGORIES
+    )
+    return {
+        "chars_per_word": chars / len(words),
+        "garbled_ratio": garbled / chars,
+        "whitespace_ratio": (len(text) - chars) / len(text),
+    }
+
+
+def _page_ranges(page_count: int, range_count: int) -> List[Tuple[int, int]]:
+    """Split pages into consecutive ranges of nearly equal size.
+
+    Returns:
+        Start (inclusive) and end (exclusive) page indices of each range.
+    """
+    range_count = max(1, min(range_count, page_count))
+    size, extra = divmod(page_count, range_count)
+    ranges = []
+    start = 0
+    for index in range(range_count):
+        end = start + size + (1 if index < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _extract_page_range(file_path: str, first_page: int, end_page: int, order_boxes: bool = True) -> str:
+    """Extract the text of a range of pages with pdfminer (run in a worker process)."""
+    return pdfminer_extract_text(
+        file_path, page_numbers=range(first_page, end_page), laparams=_layout_params(order_boxes)
+    )
+
+
+def _get_page_pool(workers: int, config: ConfigManager) -> concurrent.futures.ProcessPoolExecutor:
+    """Return the shared page extraction pool, (re)creating it for ``workers`` workers."""
+    global _page_pool, _page_pool_workers
+    with _page_pool_lock:
+        if _page_pool is None or _page_pool_workers != workers:
+            if _page_pool is not None:
+                _page_pool.shutdown(wait=False)
+            mp_context = create_worker_context(config)
+            initializer, initargs = template_initializer(mp_context)
+            _page_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, mp_context=mp_context, initializer=initializer, initargs=initargs
+            )
+            _page_pool_workers = workers
+        return _page_pool
+
+
+def _discard_page_pool(pool: concurrent.futures.ProcessPoolExecutor) -> None:
+    """Forget a broken page extraction pool so that the next document starts a new one."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+    pool.shutdown(wait=False)
+
+
 class PDFConverter(BaseConverter):
     """Converter for PDF files.
     
-    Extracts text and metadata from PDF files using a combination of
-    PyPDF2 (for metadata) and pdfminer.six (for text extraction).
+    Extracts text and metadata from PDF files with pdfminer.six. The
+    document is parsed once: the page count and document information are
+    read from the same parse that text is extracted from.
+
+    Text is extracted with the engine set in ``formats.pdf.text_engine``:
+    ``pypdf``, ``pdfminer_fast`` (layout analysis without ordering text
+    boxes across the page) or ``pdfminer``. With ``auto``, pypdf parses
+    the document and extracts the text first, and its text and metadata are
+    kept if the text passes a quality check (see ``text_quality``);
+    otherwise pdfminer parses the document and the fallback engine extracts
+    it. The engine used is recorded as ``text_engine`` in the metadata.
+
+    Documents with at least ``formats.pdf.parallel_pages.min_pages`` pages
+    are split into page ranges that are extracted in separate processes and
+    reassembled in page order, so one long document uses every core.
     """
     
     def __init__(self, config: Optional[ConfigManager] = None):
@@ -39,7 +250,7 @@ class PDFConverter(BaseConverter):
     def convert(self, file_path: Union[str, Path]) -> Tuple[str, Dict[str, Any]]:
         """Convert a PDF file to text and extract metadata.
         
-        Uses pdfminer.six for text extraction and PyPDF2 for metadata.
+        Metadata is read from the parse of the engine that extracts the text.
         
         Args:
             file_path: Path to the PDF file.
@@ -58,11 +269,8 @@ class PDFConverter(BaseConverter):
             raise FileNotFoundError(f"PDF file not found: {file_path}")
             
         try:
-            # Extract metadata using PyPDF2
-            metadata = self._extract_metadata(file_path)
-            
-            # Extract text using pdfminer.six
-            final_text = self._extract_with_pdfminer(file_path)
+            with file_path.open("rb") as fp:
+                final_text, metadata = self._extract_text(file_path, fp)
             
             # Raise an error if extraction returned an empty string
             if not final_text:
@@ -80,36 +288,42 @@ class PDFConverter(BaseConverter):
             logger.exception(f"Unexpected error during PDF conversion for {file_path}")
             raise RuntimeError(f"Unexpected error converting PDF {file_path}: {str(e)}") from e
     
-    def _extract_metadata(self, file_path: Path) -> Dict[str, Any]:
-        """Extract metadata from the PDF.
+    def _parse_document(self, file_path: Path, fp: Any) -> Optional[PDFDocument]:
+        """Parse a PDF once for metadata and text extraction.
+
+        Args:
+            file_path: Path to the PDF file, for logging.
+            fp: The file, opened in binary mode.
+
+        Returns:
+            The parsed document, or None if pdfminer cannot read it.
+        """
+        try:
+            return _parse_document(fp)
+        except (PDFSyntaxError, PDFEncryptionError, OSError) as e:
+            logger.error(f"pdfminer extraction failed for {file_path} ({type(e).__name__}): {e}")
+            return None
+
+    def _extract_metadata(self, file_path: Path, document: PDFDocument) -> Dict[str, Any]:
+        """Extract metadata from the parsed PDF.
         
         Args:
             file_path: Path to the PDF file.
+            document: The parsed document.
             
         Returns:
             Dictionary containing metadata.
         """
         try:
-            reader = PdfReader(file_path)
             metadata = {
-                "page_count": len(reader.pages),
+                "page_count": _page_count(document),
                 "file_stats": self.get_stats(file_path),
             }
-            
             # Get document info (title, author, etc.)
-            doc_info = reader.metadata
-            if doc_info:
-                # Check attributes defensively
-                metadata["title"] = getattr(doc_info, 'title', None)
-                metadata["author"] = getattr(doc_info, 'author', None)
-                metadata["subject"] = getattr(doc_info, 'subject', None)
-                metadata["creator"] = getattr(doc_info, 'creator', None)
-                # Remove None values
-                metadata = {k: v for k, v in metadata.items() if v is not None}
-                
+            metadata.update(_document_info(document))
             return metadata
             
-        except (PdfReadError, IOError) as e:
+        except (PSException, IOError) as e:
             # Specific, potentially recoverable errors related to reading the PDF
             logger.warning(f"Could not read PDF metadata for {file_path} ({type(e).__name__}): {e}")
             return {
@@ -122,17 +336,149 @@ class PDFConverter(BaseConverter):
             # Re-raise the exception to be caught by the main convert method's handler
             raise e
     
-    def _extract_with_pdfminer(self, file_path: Path) -> str:
+    def _text_engine(self, key: str, default: str, allowed: Tuple[str, ...]) -> str:
+        """Read an engine name from ``formats.pdf.text_engine``, falling back to ``default``."""
+        engine = self.config.get(f"formats.pdf.text_engine.{key}", default)
+        if engine not in allowed:
+            logger.warning(
+                f"Unknown PDF text engine {engine!r} in formats.pdf.text_engine.{key}, "
+                f"expected one of: {', '.join(allowed)}; using '{default}'"
+            )
+            return default
+        return engine
+
+    def _extract_text(self, file_path: Path, fp: Any) -> Tuple[str, Dict[str, Any]]:
+        """Extract text and metadata with the configured engine.
+
+        Args:
+            file_path: Path to the PDF file.
+            fp: The file, opened in binary mode.
+
+        Returns:
+            Tuple of (extracted text, metadata). The text is empty on
+            failure; the metadata records the engine used as ``text_engine``.
+        """
+        engine = self._text_engine("engine", "auto", ("auto",) + TEXT_ENGINES)
+        if engine in ("auto", ENGINE_PYPDF):
+            result = self._extract_with_pypdf(file_path, fp, probe=engine == "auto")
+            if engine == ENGINE_PYPDF:
+                return result or ("", {})
+            if result is not None and self._accept_fast_text(file_path, result[0]):
+                return result
+            engine = self._text_engine("fallback", ENGINE_PDFMINER, (ENGINE_PDFMINER_FAST, ENGINE_PDFMINER))
+
+        document = self._parse_document(file_path, fp)
+        if document is None:
+            return "", {}
+        metadata = self._extract_metadata(file_path, document)
+        metadata["text_engine"] = engine
+        text = self._extract_with_pdfminer(
+            file_path, metadata.get("page_count"), metadata, document, order_boxes=engine == ENGINE_PDFMINER
+        )
+        return text, metadata
+
+    def _extract_with_pypdf(
+        self,
+        file_path: Path,
+        fp: Any,
+        probe: bool = False
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Extract text and metadata using pypdf.
+
+        Args:
+            file_path: Path to the PDF file.
+            fp: The file, opened in binary mode.
+            probe: Stop once the first ``FAST_PROBE_PAGES`` pages fail the
+                quality check, so a document the fallback engine extracts
+                anyway is not read to the end.
+
+        Returns:
+            Tuple of (extracted text, metadata), or None on failure or if
+            the probe failed.
+        """
+        pages = []
+        try:
+            fp.seek(0)
+            reader = PdfReader(fp)
+            for page in reader.pages:
+                # End every page with a form feed, like pdfminer
+                pages.append(f"{page.extract_text() or ''}\f")
+                if probe and len(pages) == FAST_PROBE_PAGES:
+                    quality = text_quality("".join(pages))
+                    if quality is not None and self._quality_problems(quality):
+                        logger.debug(f"pypdf text of the first pages of {file_path} rejected, falling back")
+                        return None
+            metadata: Dict[str, Any] = {
+                "page_count": len(reader.pages),
+                "file_stats": self.get_stats(file_path),
+            }
+            metadata.update(_pypdf_info(reader))
+        except Exception as e:
+            # pypdf is less tolerant of damaged files than pdfminer
+            logger.warning(f"pypdf extraction failed for {file_path} ({type(e).__name__}): {e}")
+            return None
+        metadata["text_engine"] = ENGINE_PYPDF
+        return "".join(pages), metadata
+
+    def _accept_fast_text(self, file_path: Path, text: str) -> bool:
+        """Check text from the fast engine against the bounds in ``formats.pdf.text_engine``."""
+        quality = text_quality(text)
+        if quality is None:
+            logger.debug(f"pypdf found no text in {file_path}, falling back")
+            return False
+        problems = self._quality_problems(quality)
+        if problems:
+            logger.debug(f"pypdf text of {file_path} rejected ({', '.join(problems)}), falling back")
+            return False
+        return True
+
+    def _quality_problems(self, quality: Dict[str, float]) -> List[str]:
+        """Describe the measures of ``text_quality`` that are out of bounds."""
+        bounds = {}
+        for key, default in DEFAULT_TEXT_QUALITY.items():
+            value = self.config.get(f"formats.pdf.text_engine.{key}", default)
+            bounds[key] = value if isinstance(value, (int, float)) else default
+
+        problems = []
+        if not bounds["min_chars_per_word"] <= quality["chars_per_word"] <= bounds["max_chars_per_word"]:
+            problems.append(f"{quality['chars_per_word']:.1f} characters per word")
+        if quality["garbled_ratio"] > bounds["max_garbled_ratio"]:
+            problems.append(f"{quality['garbled_ratio']:.1%} garbled characters")
+        if quality["whitespace_ratio"] > bounds["max_whitespace_ratio"]:
+            problems.append(f"{quality['whitespace_ratio']:.1%} whitespace")
+        return problems
+
+    def _extract_with_pdfminer(
+        self,
+        file_path: Path,
+        page_count: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        document: Optional[PDFDocument] = None,
+        order_boxes: bool = True
+    ) -> str:
         """Extract text using pdfminer.six.
-        
+
+        Long documents are extracted in page ranges in parallel (see
+        ``_parallel_workers``). Pages are separated by form feeds either way.
+
         Args:
             file_path: Path to the PDF file.
-            
+            page_count: Number of pages, if known; needed for parallel extraction.
+            metadata: Optional metadata; receives the number of page ranges
+                when the document is extracted in parallel.
+            document: The parsed document, if already parsed; otherwise the
+                file is parsed here.
+            order_boxes: Order text boxes across the page (full layout
+                analysis); see ``_layout_params``.
+
         Returns:
             Extracted text, or empty string on failure.
         """
         try:
-            return pdfminer_extract_text(file_path)
+            workers = self._parallel_workers(page_count)
+            if workers > 1:
+                return self._extract_page_ranges(file_path, page_count, workers, metadata, document, order_boxes)
+            return self._extract_serially(file_path, document, order_boxes)
         except (PDFSyntaxError, PDFEncryptionError, OSError) as e:
             # Specific, potentially recoverable errors from pdfminer
             logger.error(f"pdfminer extraction failed for {file_path} ({type(e).__name__}): {e}")
@@ -151,4 +497,56 @@ class PDFConverter(BaseConverter):
             logger.exception(f"Unexpected error during pdfminer extraction for {file_path}")
             return "" # Return empty string on unexpected failures too
     
+    def _parallel_workers(self, page_count: Optional[int]) -> int:
+        """Number of processes to extract a document with; 1 extracts it serially."""
+        min_pages = self.config.get("formats.pdf.parallel_pages.min_pages", None)
+        if not isinstance(min_pages, int) or not page_count or page_count < min_pages:
+            return 1
+        if multiprocessing.parent_process() is not None:
+            # Process workers of a batch already run in parallel
+            return 1
+        workers = self.config.get("formats.pdf.parallel_pages.max_workers", None)
+        if not isinstance(workers, int):
+            configured = self.config.get("processing.max_workers", None)
+            workers = min(configured if isinstance(configured, int) else 4, os.cpu_count() or 1)
+        return max(1, min(workers, page_count // MIN_RANGE_PAGES))
+
+    def _extract_serially(self, file_path: Path, document: Optional[PDFDocument], order_boxes: bool = True) -> str:
+        """Extract a whole document in this process, reusing its parse if there is one."""
+        if document is not None:
+            return _extract_document_text(document, order_boxes)
+        return pdfminer_extract_text(file_path, laparams=_layout_params(order_boxes))
+
+    def _extract_page_ranges(
+        self,
+        file_path: Path,
+        page_count: int,
+        workers: int,
+        metadata: Optional[Dict[str, Any]] = None,
+        document: Optional[PDFDocument] = None,
+        order_boxes: bool = True
+    ) -> str:
+        """Extract page ranges of a document in worker processes and join them in order.
+
+        Falls back to serial extraction if the worker pool breaks.
+        """
+        ranges = _page_ranges(page_count, min(workers * RANGES_PER_WORKER, page_count // MIN_RANGE_PAGES))
+        logger.info(f"Extracting {page_count} pages of {file_path} in {len(ranges)} ranges on {workers} processes")
+        pool = _get_page_pool(workers, self.config)
+        futures = []
+        try:
+            futures = [pool.submit(_extract_page_range, str(file_path), start, end, order_boxes) for start, end in ranges]
+            text = "".join(future.result() for future in futures)
+        except concurrent.futures.BrokenExecutor as e:
+            logger.warning(f"Parallel PDF extraction failed for {file_path} ({e}), extracting serially")
+            _discard_page_pool(pool)
+            return self._extract_serially(file_path, document, order_boxes)
+        finally:
+            # Do not leave the ranges of a failed document queued
+            for future in futures:
+                future.cancel()
+        if metadata is not None:
+            metadata["page_ranges"] = len(ranges)
+        return text
+
     # Removed _post_process_text method as it's handled by pipeline
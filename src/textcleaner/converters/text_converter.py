@@ -7,19 +7,33 @@ text extraction without special formatting or metadata handling.
 
 # import os # Removed unused import
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from textcleaner.converters.base import BaseConverter
 from textcleaner.utils.logging_config import get_logger
+from textcleaner.utils.mapped_input import bom_length, decode_buffer, map_file
+from textcleaner.utils.streaming import StreamProcessor
 from textcleaner.config.config_manager import ConfigManager
 
 
+def _universal_newlines(text: str) -> str:
+    """Turn "\r\n" and "\r" into "\n", like reading a file in text mode.
+
+    Text without "\r" is returned as is, without a copy.
+    """
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
 class TextConverter(BaseConverter):
     """Converter for plain text files.
     
     This converter simply reads text files and returns their content with minimal
     processing.
     """
+
+    supports_streaming = True
     
     def __init__(self, config: Optional[ConfigManager] = None):
         """Initialize the text converter."""
@@ -58,9 +72,9 @@ class TextConverter(BaseConverter):
         # Read the file content
         try:
             self.logger.debug(f"Reading text file content from {file_path}")
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                
+            with map_file(file_path) as buffer:
+                content = _universal_newlines(decode_buffer(buffer, bom_length(buffer)))
+
             # Extract basic file metadata
             file_stats = file_path.stat()
             metadata = {
@@ -86,3 +100,52 @@ class TextConverter(BaseConverter):
             error_msg = f"Error reading text file {file_path}: {str(e)}"
             self.logger.error(error_msg)
             raise
+
+    def stream(self, file_path: Union[str, Path], window_size: int) -> Tuple[Iterator[str], Dict[str, Any]]:
+        """Convert a text file lazily, as paragraph-aligned windows.
+
+        Args:
+            file_path: Path to the text file to convert.
+            window_size: Target size of each window, in characters.
+
+        Returns:
+            Tuple of (window iterator, metadata dictionary).
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            ValueError: While iterating, if the file is not a valid text file.
+        """
+        if isinstance(file_path, str):
+            file_path = Path(file_path)
+        if not file_path.exists():
+            error_msg = f"File not found: {file_path}"
+            self.logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        self.logger.info(f"Streaming text file: {file_path}")
+        file_stats = file_path.stat()
+        metadata = {
+            "file_name": file_path.name,
+            "file_extension": file_path.suffix.lower(),
+            "file_stats": {
+                "size_bytes": file_stats.st_size,
+                "created_at": file_stats.st_ctime,
+                "modified_at": file_stats.st_mtime,
+            }
+        }
+        return self._read_windows(file_path, window_size), metadata
+
+    def _read_windows(self, file_path: Path, window_size: int) -> Iterator[str]:
+        """Read the windows of a text file, reporting invalid text as ValueError."""
+        try:
+            ends_with_cr = False
+            for window in StreamProcessor().stream_windows(file_path, window_size):
+                # A "\r\n" split between two windows is a single line break
+                if ends_with_cr and window.startswith("\n"):
+                    window = window[1:]
+                ends_with_cr = window.endswith("\r")
+                yield _universal_newlines(window)
+        except UnicodeDecodeError:
+            error_msg = f"File is not a valid text file or has an unsupported encoding: {file_path}"
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
@@ -1,8 +1,21 @@
 """Core functionality for the TextCleaner."""
 
+import importlib
+
 # Define what will be exported
 __all__ = ["FileTypeRegistry", "ProcessingResult"]
 
-# Import core components
-from textcleaner.core.file_registry import FileTypeRegistry
-from textcleaner.core.models import ProcessingResult
+# Core components, imported on first access
+_LAZY_ATTRIBUTES = {
+    "FileTypeRegistry": "textcleaner.core.file_registry",
+    "ProcessingResult": "textcleaner.core.models",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,304 @@
+"""Asyncio interface to the text processor.
+
+``AsyncTextProcessor`` wraps an existing ``TextProcessor`` and reuses its
+converters, pipeline and output manager. Validation, cache lookups and
+output writes run on the event loop's default executor so they never block
+the loop; conversion and the processing pipeline, which are CPU-bound, run
+on a managed thread or process pool, and so does streaming a large file
+through them. A semaphore bounds how many files are
+in progress at once, and work is only handed to a pool after a slot has
+been acquired, so cancelling a call drops its queued work instead of
+leaving it behind in the pool.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from textcleaner.core.models import ProcessingResult
+from textcleaner.core.processor import TextProcessor
+from textcleaner.core.worker_template import template_initializer
+from textcleaner.converters.base import BaseConverter
+from textcleaner.core.workers import convert_and_process, initialize_worker, stream_and_process
+from textcleaner.utils.logging_config import get_logger
+
+PathLike = Union[str, Path]
+# An input file, or an (input file, output file) pair
+FileSpec = Union[PathLike, Tuple[PathLike, Optional[PathLike]]]
+
+
+class AsyncTextProcessor:
+    """Process files from asyncio code with bounded concurrency."""
+
+    def __init__(
+        self,
+        processor: TextProcessor,
+        max_concurrency: Optional[int] = None,
+        use_processes: bool = False,
+        executor: Optional[concurrent.futures.Executor] = None,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        """Initialize the async processor.
+
+        Args:
+            processor: Configured processor whose components are used.
+            max_concurrency: Maximum number of files in progress at once.
+                Defaults to the number of CPUs.
+            use_processes: Run conversion and the pipeline in worker processes
+                (each with its own processor built from this configuration)
+                instead of threads.
+            executor: Optional pool to use instead of a managed one. It is not
+                shut down by ``aclose``.
+            mp_context: Multiprocessing context for the managed process pool,
+                e.g. a warm worker template.
+        """
+        self.logger = get_logger(__name__)
+        self.processor = processor
+        self.max_concurrency = max(1, max_concurrency or os.cpu_count() or 4)
+        self.use_processes = use_processes
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._mp_context = mp_context
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        """Return the compute pool, creating the managed one on first use."""
+        if self._executor is None:
+            self._owns_executor = True
+            if self.use_processes:
+                initializer, initargs = template_initializer(
+                    self._mp_context,
+                    initialize_worker,
+                    (self.processor.config.config, self.processor.security),
+                )
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    mp_context=self._mp_context,
+                    initializer=initializer,
+                    initargs=initargs,
+                )
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="textcleaner-async"
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency limiter, created inside the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _run_io(self, func, *args: Any) -> Any:
+        """Run blocking I/O on the loop's default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    async def _run_compute(self, input_path: Path) -> Tuple[str, str, Dict[str, Any]]:
+        """Run conversion and the pipeline for one file on the compute pool."""
+        loop = asyncio.get_running_loop()
+        if self.use_processes:
+            func = functools.partial(convert_and_process, input_path)
+        else:
+            func = functools.partial(self._convert_and_process, input_path)
+        return await loop.run_in_executor(self._get_executor(), func)
+
+    async def _run_streaming(
+        self,
+        converter: BaseConverter,
+        input_path: Path,
+        output_path: Path,
+        output_format: str,
+        start_time: float,
+    ) -> ProcessingResult:
+        """Stream a large file through conversion, the pipeline and output on the compute pool."""
+        loop = asyncio.get_running_loop()
+        if self.use_processes:
+            func = functools.partial(stream_and_process, (input_path, output_path, output_format, start_time))
+        else:
+            func = functools.partial(
+                self.processor._execute_streaming_steps, converter, input_path, output_path, output_format, start_time
+            )
+        return await loop.run_in_executor(self._get_executor(), func)
+
+    def _convert_and_process(self, input_path: Path) -> Tuple[str, str, Dict[str, Any]]:
+        """Thread-pool variant of ``workers.convert_and_process``."""
+        extracted_content, metadata = self.processor._convert(input_path)
+        processed_text = self.processor._apply_pipeline(input_path, extracted_content, metadata)
+        return extracted_content, processed_text, metadata
+
+    async def aprocess_file(
+        self,
+        input_path: PathLike,
+        output_path: Optional[PathLike] = None,
+        output_format: Optional[str] = None,
+    ) -> ProcessingResult:
+        """Process a single file.
+
+        Waits for a free concurrency slot first. Failures are returned as
+        unsuccessful results, as with ``TextProcessor.process_file``;
+        cancellation propagates.
+
+        Args:
+            input_path: File to process.
+            output_path: Output file. Defaults to the configured output directory.
+            output_format: Output format. Defaults to the configured format.
+
+        Returns:
+            The processing result.
+        """
+        async with self._get_semaphore():
+            return await self._process(input_path, output_path, output_format)
+
+    async def _process(
+        self,
+        input_path: PathLike,
+        output_path: Optional[PathLike],
+        output_format: Optional[str],
+    ) -> ProcessingResult:
+        """Process a file once a concurrency slot is held."""
+        processor = self.processor
+        start_time = time.time()
+        input_path_p = Path(input_path)
+        try:
+            input_path_p, output_path_p, final_format = await self._run_io(
+                processor._prepare_and_validate_paths, input_path, output_path, output_format
+            )
+            converter = await self._run_io(processor._streaming_converter, input_path_p)
+            if converter is not None:
+                return await self._run_streaming(converter, input_path_p, output_path_p, final_format, start_time)
+
+            cache_key = await self._run_io(processor._get_cache_key, input_path_p, final_format)
+            if cache_key is not None:
+                cached = await self._run_io(
+                    processor._load_cached_result, cache_key, input_path_p, output_path_p, start_time
+                )
+                if cached is not None:
+                    return cached
+
+            extracted_content, processed_text, metadata = await self._run_compute(input_path_p)
+            await self._run_io(processor._write_output, processed_text, output_path_p, final_format, input_path_p)
+            return await self._run_io(
+                processor._build_result, input_path_p, output_path_p, final_format,
+                extracted_content, processed_text, metadata, start_time, cache_key
+            )
+        except asyncio.CancelledError:
+            raise
+        except (ValueError, FileNotFoundError, PermissionError, RuntimeError) as e:
+            self.logger.error(f"Processing failed for {input_path}: {str(e)}")
+            error = str(e)
+        except Exception as e:
+            self.logger.exception(f"Unexpected error processing file: {input_path}")
+            error = f"Unexpected error: {str(e)}"
+        return ProcessingResult(
+            input_path=input_path_p,
+            success=False,
+            error=error,
+            metrics={"processing_time_seconds": time.time() - start_time},
+        )
+
+    @staticmethod
+    def _split_spec(spec: FileSpec) -> Tuple[PathLike, Optional[PathLike]]:
+        """Split a file spec into input and output paths."""
+        if isinstance(spec, tuple):
+            return spec[0], spec[1]
+        return spec, None
+
+    async def aprocess_many(
+        self,
+        files: Iterable[FileSpec],
+        output_format: Optional[str] = None,
+    ) -> List[ProcessingResult]:
+        """Process several files concurrently.
+
+        Args:
+            files: Input paths, or (input path, output path) pairs.
+            output_format: Output format for all files.
+
+        Returns:
+            Results in the order of ``files``.
+        """
+        results = []
+        async for index, result in self._iter_indexed(files, output_format):
+            results.append((index, result))
+        results.sort(key=lambda item: item[0])
+        return [result for _, result in results]
+
+    async def aiter_process(
+        self,
+        files: Iterable[FileSpec],
+        output_format: Optional[str] = None,
+        ordered: bool = False,
+    ) -> AsyncIterator[ProcessingResult]:
+        """Process files and yield results as they finish.
+
+        ``files`` is consumed lazily and only ``max_concurrency`` files are
+        scheduled at a time. Breaking out of the loop or cancelling the
+        consuming task cancels the files still in progress.
+
+        Args:
+            files: Input paths, or (input path, output path) pairs.
+            output_format: Output format for all files.
+            ordered: Yield results in the order of ``files``.
+
+        Yields:
+            Processing results.
+        """
+        buffered: Dict[int, ProcessingResult] = {}
+        next_index = 0
+        async for index, result in self._iter_indexed(files, output_format):
+            if not ordered:
+                yield result
+                continue
+            buffered[index] = result
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
+
+    async def _iter_indexed(
+        self,
+        files: Iterable[FileSpec],
+        output_format: Optional[str],
+    ) -> AsyncIterator[Tuple[int, ProcessingResult]]:
+        """Yield (input index, result) pairs, keeping a bounded window of tasks."""
+        file_iter = enumerate(files)
+        pending: Dict[asyncio.Task, int] = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_concurrency:
+                    try:
+                        index, spec = next(file_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    input_path, output_path = self._split_spec(spec)
+                    task = asyncio.ensure_future(self.aprocess_file(input_path, output_path, output_format))
+                    pending[task] = index
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield pending.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Shut down the managed compute pool."""
+        executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            await self._run_io(executor.shutdown, True)
+
+    async def __aenter__(self) -> "AsyncTextProcessor":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
@@ -0,0 +1,143 @@
+"""Processing cost model used to schedule long tasks first.
+
+The model learns, per file extension, how many bytes per second past runs
+processed, and estimates the processing time of a new file from its size.
+Extensions without history fall back to the average rate over all
+extensions, and an empty model to a fixed rate, so the estimate degrades
+to ordering by file size.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from textcleaner.core.models import ProcessingResult
+from textcleaner.utils.file_utils import atomic_write_text, get_cache_dir
+from textcleaner.utils.logging_config import get_logger
+
+COST_MODEL_VERSION = 1
+COST_MODEL_FILENAME = "cost_model.json"
+DEFAULT_BYTES_PER_SECOND = 1024 * 1024
+# Once an extension has this many samples, older ones are down-weighted by half
+MAX_SAMPLES_PER_EXTENSION = 1000
+
+
+class CostModel:
+    """Per-extension throughput statistics persisted across runs."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """Initialize the model, loading previous statistics if present.
+
+        Args:
+            path: JSON file holding the statistics. Defaults to the
+                per-user textcleaner cache directory.
+        """
+        self.logger = get_logger(__name__)
+        self.path = Path(path) if path else get_cache_dir() / COST_MODEL_FILENAME
+        self.stats: Dict[str, Dict[str, float]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        """Load statistics, starting empty if the file is missing or unusable."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cost model {self.path}: {e}")
+            return {}
+        if data.get("version") != COST_MODEL_VERSION:
+            return {}
+        return data.get("extensions", {})
+
+    def save(self) -> None:
+        """Persist the statistics atomically; failures are logged, not raised."""
+        data = {"version": COST_MODEL_VERSION, "extensions": self.stats}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.path, json.dumps(data, sort_keys=True))
+        except OSError as e:
+            self.logger.warning(f"Could not save cost model to {self.path}: {e}")
+
+    def bytes_per_second(self, extension: str) -> float:
+        """Return the learned throughput for an extension.
+
+        Args:
+            extension: File extension including the dot, e.g. ".pdf".
+
+        Returns:
+            Bytes per second, falling back to the overall and then the default rate.
+        """
+        entry = self.stats.get(extension.lower())
+        if entry and entry["seconds"] > 0:
+            return entry["bytes"] / entry["seconds"]
+        total_bytes = sum(e["bytes"] for e in self.stats.values())
+        total_seconds = sum(e["seconds"] for e in self.stats.values())
+        if total_seconds > 0 and total_bytes > 0:
+            return total_bytes / total_seconds
+        return DEFAULT_BYTES_PER_SECOND
+
+    def estimate(self, file_path: Path, size: Optional[int] = None) -> float:
+        """Estimate the processing time of a file in seconds.
+
+        Args:
+            file_path: Path to the file.
+            size: File size in bytes, if already known.
+
+        Returns:
+            Estimated seconds; 0.0 if the file cannot be stat'ed.
+        """
+        if size is None:
+            try:
+                size = file_path.stat().st_size
+            except OSError:
+                return 0.0
+        return size / self.bytes_per_second(file_path.suffix)
+
+    def observe(self, file_path: Path, size: int, seconds: float) -> None:
+        """Add one measurement to the model.
+
+        Args:
+            file_path: Path of the processed file (for its extension).
+            size: Size of the file in bytes.
+            seconds: Time it took to process.
+        """
+        if size <= 0 or seconds <= 0:
+            return
+        entry = self.stats.setdefault(file_path.suffix.lower(), {"bytes": 0.0, "seconds": 0.0, "files": 0})
+        if entry["files"] >= MAX_SAMPLES_PER_EXTENSION:
+            # Let recent runs dominate so the model tracks hardware and code changes
+            for key in entry:
+                entry[key] /= 2
+        entry["bytes"] += size
+        entry["seconds"] += seconds
+        entry["files"] += 1
+
+    def observe_results(self, results: Iterable[ProcessingResult]) -> int:
+        """Learn from the results of a run.
+
+        Failed results and results that were served from the cache or skipped
+        as unchanged are ignored since their timing says nothing about cost.
+
+        Args:
+            results: Processing results of the run.
+
+        Returns:
+            Number of results that were used.
+        """
+        used = 0
+        for result in results:
+            metrics: Dict[str, Any] = result.metrics or {}
+            if not result.success or metrics.get("cache_hit") or metrics.get("skipped_unchanged"):
+                continue
+            seconds = metrics.get("processing_time_seconds")
+            if not seconds:
+                continue
+            try:
+                size = os.path.getsize(result.input_path)
+            except OSError:
+                continue
+            self.observe(result.input_path, size, seconds)
+            used += 1
+        return used
@@ -1,18 +1,28 @@
 """Directory processing functionality for TextCleaner."""
 
 # import time # Removed - Unused import
+import concurrent.futures
+import multiprocessing
+import os
+from contextlib import closing, contextmanager, nullcontext
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Tuple, Set
+from typing import Any, Dict, Iterator, List, Optional, Union, Tuple, Set
 # import concurrent.futures # Removed - Unused import
 
 from textcleaner.utils.logging_config import get_logger
 from textcleaner.config.config_manager import ConfigManager
 from textcleaner.core.models import ProcessingResult # Import from models
+from textcleaner.core.cost_model import CostModel
+from textcleaner.core.lanes import LaneRouter, load_lanes
+from textcleaner.core.manifest import BuildManifest, commit_output, temporary_output_path
+from textcleaner.core.workers import initialize_worker, process_path
 from textcleaner.utils.security import SecurityUtils
 from textcleaner.utils.performance import performance_monitor
+from textcleaner.utils.events import (
+    EventRelay, JsonLinesEventWriter, ProgressRenderer, PROGRESS_FORMATS, event_bus
+)
 from textcleaner.utils.parallel import ParallelProcessor, ParallelResult
 from textcleaner.utils.file_utils import (
-    find_files, 
     get_default_extension, # Still needed for fallback logic within the utility
     get_format_from_extension, # Used by the utility
     resolve_output_dir, 
@@ -24,7 +34,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from textcleaner.core.processor import TextProcessor
 
-from tqdm import tqdm # Add tqdm import
+# Backends accepted by process_directory_parallel
+EXECUTOR_TYPES = ("thread", "process", "sequential", "lanes")
+
 
 class DirectoryProcessor:
     """Handles processing of entire directories of files."""
@@ -34,13 +46,17 @@ class DirectoryProcessor:
         config: ConfigManager,
         security_utils: SecurityUtils,
         parallel_processor: ParallelProcessor,
-        single_file_processor: 'TextProcessor' # String literal hint
+        single_file_processor: 'TextProcessor', # String literal hint
+        cost_model: Optional[CostModel] = None
     ):
         self.logger = get_logger(__name__)
         self.config = config
         self.security = security_utils
         self.parallel = parallel_processor
         self.single_file_processor = single_file_processor
+        # When set, parallel runs schedule files longest-expected-first and
+        # every run's timings are fed back into the model
+        self.cost_model = cost_model
         # Ensure the single file processor uses the same security context
         self.single_file_processor.security = self.security
 
@@ -52,6 +68,18 @@ class DirectoryProcessor:
         file_extensions: Optional[List[str]]
     ) -> Tuple[Path, Path, List[Path]]:
         """Validate paths, setup directories, and find files for directory processing."""
+        input_dir_p, output_dir_p = self._prepare_directories(input_dir, output_dir)
+
+        files_to_process = self._find_files_to_process(input_dir_p, recursive, file_extensions)
+
+        return input_dir_p, output_dir_p, files_to_process
+
+    def _prepare_directories(
+        self,
+        input_dir: Union[str, Path],
+        output_dir: Optional[Union[str, Path]]
+    ) -> Tuple[Path, Path]:
+        """Validate the input directory and resolve (and create) the output directory."""
         input_dir_p = Path(input_dir) if isinstance(input_dir, str) else input_dir
         is_valid, error = self.security.validate_path(input_dir_p)
         if not is_valid:
@@ -61,10 +89,7 @@ class DirectoryProcessor:
 
         # Resolve, validate, and create the output directory using the utility
         output_dir_p = resolve_output_dir(output_dir, self.config, self.security)
-
-        files_to_process = self._find_files_to_process(input_dir_p, recursive, file_extensions)
-
-        return input_dir_p, output_dir_p, files_to_process
+        return input_dir_p, output_dir_p
 
     def _find_files_to_process(
         self, 
@@ -73,7 +98,15 @@ class DirectoryProcessor:
         file_extensions: Optional[List[str]] = None
     ) -> List[Path]:
         """Find all files to process in a directory, applying filters early."""
-        files_to_process = []
+        return list(self._iter_files_to_process(input_dir, recursive, file_extensions))
+
+    def _iter_files_to_process(
+        self, 
+        input_dir: Path, 
+        recursive: bool = True,
+        file_extensions: Optional[List[str]] = None
+    ) -> Iterator[Path]:
+        """Lazily yield the files to process in a directory, applying filters early."""
         extension_process_cache: Dict[str, bool] = {} # Cache for extension processability
         try:
             # Normalize filter extensions ONCE (ensure leading dot, lower case)
@@ -84,7 +117,9 @@ class DirectoryProcessor:
                     for ext in file_extensions 
                 }
 
-            for file_path in find_files(input_dir, recursive):
+            # Validates files in bulk while walking, so per-file validation
+            # in the processor is reduced to checking they are unchanged
+            for file_path in self.security.validate_tree(input_dir, recursive):
                 file_ext_with_dot = file_path.suffix.lower()
                 
                 # Apply file extension filter FIRST (using dot comparison)
@@ -102,18 +137,17 @@ class DirectoryProcessor:
                     extension_process_cache[file_ext_with_dot] = should_process
                 
                 if should_process:
-                    files_to_process.append(file_path)
+                    yield file_path
         except (FileNotFoundError, NotADirectoryError) as e:
             self.logger.error(f"Error finding files in {input_dir}: {e}")
-            return []
-        return files_to_process
 
     def _calculate_relative_output_path(
         self,
         input_file: Path,
         input_dir: Path,
         output_dir: Path,
-        output_format: Optional[str]
+        output_format: Optional[str],
+        create_dirs: bool = True
     ) -> Path:
         """Calculate the output path for a file, preserving relative structure."""
         try:
@@ -123,7 +157,8 @@ class DirectoryProcessor:
              rel_path = Path(input_file.name)
 
         rel_output_dir = output_dir / rel_path.parent
-        rel_output_dir.mkdir(parents=True, exist_ok=True)
+        if create_dirs:
+            rel_output_dir.mkdir(parents=True, exist_ok=True)
 
         # Determine format and extension using the utility
         # We don't have an explicit output path parameter here, so pass None
@@ -136,6 +171,236 @@ class DirectoryProcessor:
 
         return rel_output_dir / f"{input_file.stem}.{output_ext}"
 
+    def _plan_incremental_run(
+        self,
+        files_to_process: List[Path],
+        input_dir: Path,
+        output_dir: Path,
+        output_format: Optional[str],
+        manifest: BuildManifest
+    ) -> Tuple[List[Tuple[Path, Path, os.stat_result]], List[ProcessingResult]]:
+        """Split files into those needing processing and unchanged ones.
+
+        Returns:
+            A list of (file, final output path, stat) for files to process and
+            the results reported for skipped files.
+        """
+        final_format, _ = determine_output_format_and_extension(
+            output_format_param=output_format,
+            output_path_param=None,
+            config=self.config,
+            file_registry=self.single_file_processor.file_registry
+        )
+        pending = []
+        skipped = []
+        for file_path in files_to_process:
+            key = self._manifest_key(file_path, input_dir)
+            try:
+                stat = file_path.stat()
+            except OSError as e:
+                self.logger.warning(f"Cannot stat {file_path}, processing it anyway: {e}")
+                stat = None
+            output_path = self._calculate_relative_output_path(
+                file_path, input_dir, output_dir, output_format, create_dirs=False
+            )
+            if stat is not None and manifest.is_up_to_date(key, file_path, stat, output_path, final_format):
+                skipped.append(manifest.skipped_result(key, file_path))
+            else:
+                pending.append((file_path, output_path, stat))
+        if skipped:
+            self.logger.info(f"Skipping {len(skipped)} unchanged files")
+        return pending, skipped
+
+    def _finish_incremental_result(
+        self,
+        result: ProcessingResult,
+        staged_path: Path,
+        final_path: Path,
+        stat: Optional[os.stat_result],
+        input_dir: Path,
+        output_format: Optional[str],
+        manifest: BuildManifest
+    ) -> ProcessingResult:
+        """Commit a staged output and record the result in the manifest."""
+        if not result.success:
+            try:
+                staged_path.unlink()
+            except OSError:
+                pass
+            return result
+        try:
+            if not commit_output(staged_path, final_path):
+                self.logger.debug(f"Output unchanged, kept existing {final_path}")
+        except OSError as e:
+            result.success = False
+            result.error = f"Failed to move output into place: {e}"
+            return result
+        result.output_path = final_path
+        if stat is not None:
+            final_format, _ = determine_output_format_and_extension(
+                output_format_param=output_format,
+                output_path_param=None,
+                config=self.config,
+                file_registry=self.single_file_processor.file_registry
+            )
+            manifest.record(self._manifest_key(result.input_path, input_dir), result.input_path,
+                            stat, result, final_format)
+        return result
+
+    def _to_processing_result(
+        self,
+        parallel_result: ParallelResult[Tuple[Path, Path, str], ProcessingResult]
+    ) -> ProcessingResult:
+        """Unwrap a ParallelResult, turning task failures into failed results."""
+        if parallel_result.success and parallel_result.result is not None:
+            return parallel_result.result
+        failed_input_path, failed_output_path, _ = parallel_result.input_item
+        self.logger.error(f"Parallel task failed for input {failed_input_path}: {parallel_result.error}")
+        return ProcessingResult(
+            input_path=failed_input_path,
+            output_path=failed_output_path,
+            success=False,
+            error=parallel_result.error or "Parallel task failed without specific error message",
+            metrics={"processing_time_seconds": parallel_result.processing_time}
+        )
+
+    def _run_lanes(
+        self,
+        processor: ParallelProcessor,
+        tasks: List[Tuple[Path, Path, Optional[str]]],
+        task_ids: List[str],
+        cost_func: Optional[Any] = None
+    ) -> List[ParallelResult[Tuple[Path, Path, str], ProcessingResult]]:
+        """Run tasks in per-format lanes, all lanes at the same time.
+
+        Each lane gets its own pool with the lane's executor type and worker
+        limit (defaulting to ``processor.max_workers``).
+
+        Returns:
+            Parallel results in the order of ``tasks``.
+        """
+        router = LaneRouter(load_lanes(self.config), self.single_file_processor.converter_registry)
+        lane_indices: Dict[str, List[int]] = {}
+        for index, task in enumerate(tasks):
+            lane_indices.setdefault(router.route(task[0]).name, []).append(index)
+
+        def run_lane(lane_name: str) -> List[ParallelResult[Tuple[Path, Path, str], ProcessingResult]]:
+            lane = router.lanes[lane_name]
+            indices = lane_indices[lane_name]
+            workers = lane.worker_limit(processor.max_workers)
+            self.logger.info(f"Lane '{lane.name}': {len(indices)} files, {workers} {lane.executor} workers")
+            lane_processor = ParallelProcessor(
+                max_workers=workers, adaptive_workers=False, min_workers=1, mp_context=processor.mp_context
+            )
+            items = [tasks[i] for i in indices]
+            ids = [task_ids[i] for i in indices]
+            if lane.executor == "process":
+                initargs, relay = self._process_pool_arguments(processor.mp_context)
+                with relay:
+                    return lane_processor.process_items(
+                        items=items,
+                        process_func=process_path,
+                        task_ids=ids,
+                        use_processes=True,
+                        show_progress=False,
+                        initializer=initialize_worker,
+                        initargs=initargs,
+                        cost_func=cost_func
+                    )
+            return lane_processor.process_items(
+                items=items,
+                process_func=lambda task: self.single_file_processor.process_file(*task),
+                task_ids=ids,
+                use_processes=False,
+                show_progress=False,
+                cost_func=cost_func
+            )
+
+        results: List[Any] = [None] * len(tasks)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(lane_indices) or 1) as lane_pool:
+            futures = {lane_pool.submit(run_lane, name): name for name in lane_indices}
+            for future in concurrent.futures.as_completed(futures):
+                for index, parallel_result in zip(lane_indices[futures[future]], future.result()):
+                    results[index] = parallel_result
+        return results
+
+    def _task_cost(self, task: Tuple[Path, Path, Optional[str]]) -> float:
+        """Estimate the processing time of a task from the cost model."""
+        return self.cost_model.estimate(task[0])
+
+    def _update_cost_model(self, results: List[ProcessingResult]) -> None:
+        """Feed a run's timings back into the cost model and persist it."""
+        if self.cost_model is None:
+            return
+        if self.cost_model.observe_results(results):
+            self.cost_model.save()
+
+    @staticmethod
+    def _manifest_key(file_path: Path, input_dir: Path) -> str:
+        """Return the manifest key for a file (its relative POSIX path)."""
+        try:
+            return file_path.relative_to(input_dir).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def _open_manifest(self, output_dir: Path) -> BuildManifest:
+        """Load the build manifest and remove outputs staged by interrupted runs."""
+        manifest = BuildManifest(output_dir, self.config.fingerprint(), self.security)
+        manifest.sweep_partial_outputs()
+        return manifest
+
+    @staticmethod
+    def _in_discovery_order(files: List[Path], results: List[ProcessingResult]) -> List[ProcessingResult]:
+        """Sort results (of skipped and processed files) into the order the files were found."""
+        position = {file_path: index for index, file_path in enumerate(files)}
+        return sorted(results, key=lambda result: position.get(result.input_path, len(position)))
+
+    def _close_manifest(self, manifest: BuildManifest, input_dir: Path) -> None:
+        """Prune outputs of deleted sources and persist the manifest."""
+        manifest.prune(input_dir)
+        try:
+            manifest.save()
+        except OSError as e:
+            self.logger.error(f"Failed to save build manifest {manifest.path}: {e}")
+
+    @contextmanager
+    def _progress_reporting(
+        self,
+        total_files: int,
+        quiet_mode: bool,
+        no_progress: bool,
+        progress_format: str
+    ) -> Iterator[None]:
+        """Report progress from processing events for the duration of a run.
+
+        "text" draws a rate-limited status line unless ``quiet_mode`` is set;
+        "jsonl" streams every event as a JSON line. ``no_progress`` disables both.
+        """
+        if progress_format not in PROGRESS_FORMATS:
+            raise ValueError(f"Unknown progress format '{progress_format}', expected one of: {', '.join(PROGRESS_FORMATS)}")
+        if no_progress or (quiet_mode and progress_format == "text"):
+            yield
+            return
+        reporter = JsonLinesEventWriter() if progress_format == "jsonl" else ProgressRenderer(total_files)
+        with reporter:
+            yield
+
+    def _process_pool_arguments(
+        self,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None
+    ) -> Tuple[Tuple[Any, ...], Any]:
+        """Build worker initializer arguments and a matching event relay.
+
+        Events are only forwarded from worker processes while somebody is
+        subscribed to the event bus in this process. The event queue is
+        created from the pool's context (``mp_context``), since a queue
+        from another start method cannot be shared with its workers.
+        """
+        event_queue = (mp_context or multiprocessing).Queue() if event_bus.active else None
+        initargs = (self.single_file_processor.config.config, self.security, event_queue)
+        relay = EventRelay(event_queue) if event_queue is not None else nullcontext()
+        return initargs, relay
+
     def process_directory(
         self,
         input_dir: Union[str, Path],
@@ -145,8 +410,17 @@ class DirectoryProcessor:
         file_extensions: Optional[List[str]] = None,
         quiet_mode: bool = False,
         no_progress: bool = False,
+        incremental: bool = False,
+        progress_format: str = "text",
     ) -> List[ProcessingResult]:
-        """Process all supported files in a directory sequentially."""
+        """Process all supported files in a directory sequentially.
+
+        With ``incremental`` set, a build manifest kept in the output directory
+        is used to skip unchanged files, leave identical outputs untouched and
+        prune outputs whose source file was deleted. ``progress_format`` is
+        "text" for a live status line or "jsonl" for a machine-readable
+        event stream on stderr.
+        """
         self.logger.info(f"Starting sequential processing for directory: {input_dir}")
         try:
             input_dir_p, output_dir_p, files_to_process = self._prepare_directory_processing(
@@ -157,47 +431,64 @@ class DirectoryProcessor:
             input_path_p = Path(input_dir) if isinstance(input_dir, str) else input_dir
             return [ProcessingResult(input_path=input_path_p, success=False, error=str(e))]
 
-        total_files = len(files_to_process)
+        manifest: Optional[BuildManifest] = None
+        results: List[ProcessingResult] = []
+        planned: List[Tuple[Path, Optional[Path], Optional[os.stat_result]]] = [
+            (file_path, None, None) for file_path in files_to_process
+        ]
+        if incremental:
+            manifest = self._open_manifest(output_dir_p)
+            planned, results = self._plan_incremental_run(
+                files_to_process, input_dir_p, output_dir_p, output_format, manifest
+            )
+
+        total_files = len(planned)
         if total_files == 0:
-            self.logger.warning(f"No files to process in {input_dir_p}")
-            return []
+            if manifest is not None:
+                self._close_manifest(manifest, input_dir_p)
+            if not files_to_process:
+                self.logger.warning(f"No files to process in {input_dir_p}")
+            return results
 
         # Simpler logging for directory processing start
         if not quiet_mode:
+            if results:
+                print(f"Skipping {len(results)} unchanged files")
             print(f"Processing {total_files} files from: {input_dir_p}")
 
-        results = []
         successful = 0
         failed = 0
         
-        # Process files without tqdm progress bar
-        for i, file_path in enumerate(files_to_process):
-            current_file_num = i + 1
-            if not quiet_mode and not no_progress:
-                progress_pct = int((current_file_num / total_files) * 100)
-                print(f"Processing \"{file_path.name}\" ({current_file_num}/{total_files})")
-                print(f"----------{progress_pct}%")
-                
-            try:
-                output_file = self._calculate_relative_output_path(
-                    file_path, input_dir_p, output_dir_p, output_format
-                )
-                # Use the single file processor
-                result = self.single_file_processor.process_file(file_path, output_file, output_format)
-                if result.success:
-                    successful += 1
-                else:
+        with self._progress_reporting(total_files, quiet_mode, no_progress, progress_format):
+            for file_path, final_output, stat in planned:
+                try:
+                    if manifest is not None:
+                        final_output.parent.mkdir(parents=True, exist_ok=True)
+                        staged_output = temporary_output_path(final_output)
+                        result = self.single_file_processor.process_file(file_path, staged_output, output_format)
+                        result = self._finish_incremental_result(
+                            result, staged_output, final_output, stat, input_dir_p, output_format, manifest
+                        )
+                    else:
+                        output_file = self._calculate_relative_output_path(
+                            file_path, input_dir_p, output_dir_p, output_format
+                        )
+                        # Use the single file processor
+                        result = self.single_file_processor.process_file(file_path, output_file, output_format)
+                    if result.success:
+                        successful += 1
+                    else:
+                        failed += 1
+                        self.logger.error(f"Failed: {file_path.name} - {result.error}")
+                    results.append(result)
+                except Exception as e:
+                    self.logger.error(f"Error processing file {file_path.name}: {e}")
+                    results.append(ProcessingResult(
+                        input_path=file_path, 
+                        success=False, 
+                        error=f"Unexpected error: {str(e)}"
+                    ))
                     failed += 1
-                    self.logger.error(f"Failed: {file_path.name} - {result.error}")
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Error processing file {file_path.name}: {e}")
-                results.append(ProcessingResult(
-                    input_path=file_path, 
-                    success=False, 
-                    error=f"Unexpected error: {str(e)}"
-                ))
-                failed += 1
 
         # Calculate token reduction statistics if available
         if successful > 0 and not quiet_mode:
@@ -210,6 +501,11 @@ class DirectoryProcessor:
                 # Remove the print statement that duplicates the CLI output
                 # print(f"\nToken reduction: {total_original_tokens:,} → {total_processed_tokens:,} ({reduction_percent:.1f}%)")
 
+        if manifest is not None:
+            self._close_manifest(manifest, input_dir_p)
+            results = self._in_discovery_order(files_to_process, results)
+        self._update_cost_model(results)
+
         # Log completion message
         self.logger.info(f"Sequential directory processing complete: {successful} successful, {failed} failed")
         
@@ -225,8 +521,31 @@ class DirectoryProcessor:
         max_workers: Optional[int] = None,
         quiet_mode: bool = False,
         no_progress: bool = False,
+        incremental: bool = False,
+        executor: Optional[str] = None,
+        progress_format: str = "text",
     ) -> List[ProcessingResult]:
-        """Process all supported files in a directory using parallel processing."""
+        """Process all supported files in a directory using parallel processing.
+
+        ``executor`` selects the backend: "thread" (default), "process",
+        "sequential" or "lanes". Process workers each build their own
+        TextProcessor from this processor's configuration and only receive
+        file paths; their progress events are relayed to this process. With
+        "lanes", files are split by format into the lanes configured under
+        ``processing.lanes``, each with its own executor and worker limit. Results are returned in
+        discovery order for every backend. See ``process_directory`` for the
+        meaning of ``incremental`` and ``progress_format``.
+        """
+        executor = executor or self.config.get("processing.executor", "thread")
+        if executor not in EXECUTOR_TYPES:
+            raise ValueError(f"Unknown executor '{executor}', expected one of: {', '.join(EXECUTOR_TYPES)}")
+        if executor == "sequential":
+            return self.process_directory(
+                input_dir, output_dir, output_format, recursive, file_extensions,
+                quiet_mode=quiet_mode, no_progress=no_progress, incremental=incremental,
+                progress_format=progress_format
+            )
+
         with performance_monitor.performance_context("process_directory_parallel"):
             self.logger.info(f"Starting parallel processing for directory: {input_dir}")
             try:
@@ -238,13 +557,29 @@ class DirectoryProcessor:
                 input_path_p = Path(input_dir) if isinstance(input_dir, str) else input_dir
                 return [ProcessingResult(input_path=input_path_p, success=False, error=str(e))]
 
-            total_files = len(files_to_process)
+            manifest: Optional[BuildManifest] = None
+            skipped_results: List[ProcessingResult] = []
+            planned: List[Tuple[Path, Optional[Path], Optional[os.stat_result]]] = [
+                (file_path, None, None) for file_path in files_to_process
+            ]
+            if incremental:
+                manifest = self._open_manifest(output_dir_p)
+                planned, skipped_results = self._plan_incremental_run(
+                    files_to_process, input_dir_p, output_dir_p, output_format, manifest
+                )
+
+            total_files = len(planned)
             if total_files == 0:
-                self.logger.warning(f"No files to process in {input_dir_p}")
-                return []
+                if manifest is not None:
+                    self._close_manifest(manifest, input_dir_p)
+                if not files_to_process:
+                    self.logger.warning(f"No files to process in {input_dir_p}")
+                return skipped_results
 
             # Simpler logging for directory processing start
             if not quiet_mode:
+                if skipped_results:
+                    print(f"Skipping {len(skipped_results)} unchanged files")
                 print(f"Processing {total_files} files from: {input_dir_p}")
 
             processor = self.parallel
@@ -257,62 +592,76 @@ class DirectoryProcessor:
                      processor = ParallelProcessor(max_workers=max_workers)
                 else:
                      # Create a new instance with the specified worker count
-                     processor = ParallelProcessor(max_workers=max_workers)
+                     processor = ParallelProcessor(max_workers=max_workers, mp_context=processor.mp_context)
 
             results = [] # Initialize results before try block
             try:
                 # Prepare tasks for parallel execution
                 tasks = []
                 task_ids = []
-                for i, file_path in enumerate(files_to_process):
-                    output_path = self._calculate_relative_output_path(
-                        file_path, input_dir_p, output_dir_p, output_format
-                    )
+                staged_outputs: Dict[Path, Tuple[Path, Path, Optional[os.stat_result]]] = {}
+                for file_path, final_output, stat in planned:
+                    if manifest is not None:
+                        final_output.parent.mkdir(parents=True, exist_ok=True)
+                        output_path = temporary_output_path(final_output)
+                        staged_outputs[file_path] = (output_path, final_output, stat)
+                    else:
+                        output_path = self._calculate_relative_output_path(
+                            file_path, input_dir_p, output_dir_p, output_format
+                        )
                     tasks.append((file_path, output_path, output_format))
                     task_ids.append(str(file_path)) # Use file path as task ID
 
-                # Define the function to be executed in parallel
-                def process_single_task(task_data: Tuple[Path, Path, str]) -> ProcessingResult:
-                    file_path, output_path, fmt = task_data
-                    # Custom progress output for each file
-                    if not quiet_mode and not no_progress:
-                        # Get current task index
-                        task_idx = tasks.index(task_data) + 1
-                        progress_pct = int((task_idx / total_files) * 100)
-                        print(f"Processing \"{file_path.name}\" ({task_idx}/{total_files})")
-                        print(f"----------{progress_pct}%")
-                    return self.single_file_processor.process_file(file_path, output_path, fmt)
+                # Start the files expected to take longest first
+                cost_func = self._task_cost if self.cost_model is not None else None
 
                 # Execute tasks in parallel using the ParallelProcessor instance
-                parallel_results: List[ParallelResult[Tuple[Path, Path, str], ProcessingResult]] = processor.process_items(
-                    items=tasks,
-                    process_func=process_single_task,
-                    task_ids=task_ids,
-                    use_processes=False, # Set explicitly to False (use threads)
-                    show_progress=False  # We're handling our own progress display
-                )
-
-                # Convert ParallelResult back to ProcessingResult
-                results = [pr.result for pr in parallel_results if pr.success]
-                # Optionally log errors from pr.error where pr.success is False
-                failed_results = [pr for pr in parallel_results if not pr.success]
-                for fr in failed_results:
-                    self.logger.error(f"Parallel task failed for input {fr.input_item[0]}: {fr.error}")
-                    # Add a failed ProcessingResult to the main results list
-                    failed_input_path, failed_output_path, _ = fr.input_item
-                    results.append(ProcessingResult(
-                        input_path=failed_input_path,
-                        output_path=failed_output_path, 
-                        success=False,
-                        error=fr.error or "Parallel task failed without specific error message",
-                        original_token_count=0, # Or fetch if possible
-                        final_token_count=0,
-                        processing_time=fr.processing_time
-                    )) 
+                with self._progress_reporting(total_files, quiet_mode, no_progress, progress_format):
+                    if executor == "process":
+                        # Workers rebuild the processor once; tasks carry paths only
+                        initargs, relay = self._process_pool_arguments(processor.mp_context)
+                        with relay:
+                            parallel_results: List[ParallelResult[Tuple[Path, Path, str], ProcessingResult]] = processor.process_items(
+                                items=tasks,
+                                process_func=process_path,
+                                task_ids=task_ids,
+                                use_processes=True,
+                                show_progress=False,
+                                initializer=initialize_worker,
+                                initargs=initargs,
+                                cost_func=cost_func
+                            )
+                    elif executor == "lanes":
+                        parallel_results = self._run_lanes(processor, tasks, task_ids, cost_func)
+                    else:
+                        parallel_results = processor.process_items(
+                            items=tasks,
+                            process_func=lambda task: self.single_file_processor.process_file(*task),
+                            task_ids=task_ids,
+                            use_processes=False,
+                            show_progress=False,  # Progress comes from processing events
+                            cost_func=cost_func
+                        )
+
+                # Convert ParallelResult back to ProcessingResult, keeping input order
+                results = [self._to_processing_result(pr) for pr in parallel_results]
+
+                if manifest is not None:
+                    results = [
+                        self._finish_incremental_result(
+                            r, *staged_outputs[r.input_path], input_dir_p, output_format, manifest
+                        ) if r.input_path in staged_outputs else r
+                        for r in results
+                    ]
 
             except Exception as e:
                 self.logger.error(f"Parallel execution failed: {e}", exc_info=True)
 
+            if manifest is not None:
+                self._close_manifest(manifest, input_dir_p)
+                results = self._in_discovery_order(files_to_process, skipped_results + results)
+            self._update_cost_model(results)
+
             successful = len([r for r in results if r.success])
             failed = len(results) - successful
             
@@ -328,4 +677,101 @@ class DirectoryProcessor:
             # Log completion message
             self.logger.info(f"Parallel directory processing complete: {successful} successful, {failed} failed")
             
-            return results
\ No newline at end of file
+            return results
+
+    def iter_process_directory(
+        self,
+        input_dir: Union[str, Path],
+        output_dir: Optional[Union[str, Path]] = None,
+        output_format: Optional[str] = None,
+        recursive: bool = True,
+        file_extensions: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[str] = None,
+        preserve_order: bool = False,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[ProcessingResult]:
+        """Process a directory, yielding results as files finish.
+
+        Files are discovered lazily and at most ``max_in_flight`` of them are
+        queued or held at any time, so memory use does not grow with the size
+        of the directory and the first results are available immediately.
+        Results arrive in completion order unless ``preserve_order`` is set,
+        in which case they follow discovery order.
+
+        Incremental processing is not available here because pruning the
+        manifest requires a complete view of the input directory.
+
+        Args:
+            input_dir: Directory containing the files to process.
+            output_dir: Directory for the outputs (defaults to the configured one).
+            output_format: Output format for all files.
+            recursive: Whether to descend into subdirectories.
+            file_extensions: Optional extensions to restrict processing to.
+            max_workers: Worker count for this run.
+            executor: "thread", "process" or "sequential"; defaults to the
+                configured ``processing.executor``.
+            preserve_order: Yield results in discovery order.
+            max_in_flight: Window of submitted but not yet yielded files.
+
+        Yields:
+            A ProcessingResult per file. Setup failures yield a single failed result.
+
+        Raises:
+            ValueError: If ``executor`` is not a known backend.
+        """
+        executor = executor or self.config.get("processing.executor", "thread")
+        if executor not in EXECUTOR_TYPES:
+            raise ValueError(f"Unknown executor '{executor}', expected one of: {', '.join(EXECUTOR_TYPES)}")
+        if executor == "lanes":
+            raise ValueError("The lanes executor is not supported for streaming; use process_directory_parallel")
+
+        try:
+            input_dir_p, output_dir_p = self._prepare_directories(input_dir, output_dir)
+        except (ValueError, PermissionError, RuntimeError) as e:
+            self.logger.error(f"Directory processing setup failed: {e}")
+            input_path_p = Path(input_dir) if isinstance(input_dir, str) else input_dir
+            yield ProcessingResult(input_path=input_path_p, success=False, error=str(e))
+            return
+
+        tasks = (
+            (file_path,
+             self._calculate_relative_output_path(file_path, input_dir_p, output_dir_p, output_format),
+             output_format)
+            for file_path in self._iter_files_to_process(input_dir_p, recursive, file_extensions)
+        )
+
+        if executor == "sequential":
+            for file_path, output_path, fmt in tasks:
+                yield self.single_file_processor.process_file(file_path, output_path, fmt)
+            return
+
+        processor = self.parallel
+        if max_workers is not None:
+            processor = ParallelProcessor(max_workers=max_workers, mp_context=processor.mp_context)
+
+        relay: Any = nullcontext()
+        if executor == "process":
+            initargs, relay = self._process_pool_arguments(processor.mp_context)
+            parallel_results = processor.iter_items(
+                tasks,
+                process_path,
+                use_processes=True,
+                max_in_flight=max_in_flight,
+                preserve_order=preserve_order,
+                task_id_func=lambda task: str(task[0]),
+                initializer=initialize_worker,
+                initargs=initargs
+            )
+        else:
+            parallel_results = processor.iter_items(
+                tasks,
+                lambda task: self.single_file_processor.process_file(*task),
+                max_in_flight=max_in_flight,
+                preserve_order=preserve_order,
+                task_id_func=lambda task: str(task[0])
+            )
+
+        with relay, closing(parallel_results):
+            for parallel_result in parallel_results:
+                yield self._to_processing_result(parallel_result)
@@ -3,6 +3,7 @@
 from typing import Dict, Any, Optional
 
 from textcleaner.core.processor import TextProcessor
+from textcleaner.core.async_processor import AsyncTextProcessor
 from textcleaner.core.file_registry import FileTypeRegistry
 from textcleaner.config.config_factory import ConfigFactory
 from textcleaner.converters.base import ConverterRegistry
@@ -12,17 +13,25 @@ from textcleaner.utils.logging_config import get_logger
 from textcleaner.utils.security import SecurityUtils
 from textcleaner.utils.parallel import ParallelProcessor
 from textcleaner.core.directory_processor import DirectoryProcessor
+from textcleaner.core.cost_model import CostModel
+from textcleaner.core.worker_template import create_worker_context
 from textcleaner.config.config_manager import ConfigManager
+from textcleaner.utils.result_cache import ResultCache, DEFAULT_MAX_SIZE_MB
 
 
 class TextProcessorFactory:
     """Factory for creating TextProcessor instances with appropriate configuration."""
     
-    def __init__(self):
-        """Initialize the factory."""
+    def __init__(self, security_utils: Optional[SecurityUtils] = None):
+        """Initialize the factory.
+        
+        Args:
+            security_utils: Optional security utilities shared by every
+                component the factory creates. Defaults to SecurityUtils().
+        """
         self.logger = get_logger(__name__)
         self.config_factory = ConfigFactory()
-        self._security_utils_instance: Optional[SecurityUtils] = None
+        self._security_utils_instance: Optional[SecurityUtils] = security_utils
     
     def _get_security_utils(self) -> SecurityUtils:
         """Return a cached instance of SecurityUtils."""
@@ -30,6 +39,27 @@ class TextProcessorFactory:
             self._security_utils_instance = SecurityUtils()
         return self._security_utils_instance
 
+    def _create_result_cache(self, config_manager: ConfigManager) -> Optional[ResultCache]:
+        """Create the result cache if it is enabled in the configuration."""
+        if not config_manager.get("cache.enabled", False):
+            return None
+        max_size_mb = config_manager.get("cache.max_size_mb", DEFAULT_MAX_SIZE_MB)
+        try:
+            return ResultCache(
+                cache_dir=config_manager.get("cache.directory"),
+                max_size_bytes=int(max_size_mb * 1024 * 1024),
+                security_utils=self._get_security_utils(),
+            )
+        except OSError as e:
+            self.logger.warning(f"Result cache disabled, could not create cache directory: {e}")
+            return None
+
+    def _create_cost_model(self, config_manager: ConfigManager) -> Optional[CostModel]:
+        """Create the scheduling cost model if it is enabled in the configuration."""
+        if not config_manager.get("processing.cost_scheduling", True):
+            return None
+        return CostModel(config_manager.get("processing.cost_model_path"))
+
     def create_processor(
         self,
         config_path: Optional[str] = None,
@@ -55,6 +85,20 @@ class TextProcessorFactory:
             custom_overrides=custom_overrides
         )
         
+        return self.create_processor_from_config(config)
+    
+    def create_processor_from_config(self, config: Dict[str, Any]) -> TextProcessor:
+        """Create a TextProcessor from an already resolved configuration.
+        
+        This is used to rebuild an equivalent processor elsewhere, for example
+        inside worker processes, from the parent's ``ConfigManager.config``.
+        
+        Args:
+            config: Fully merged configuration dictionary
+            
+        Returns:
+            Configured TextProcessor instance
+        """
         # Create ConfigManager instance, passing the pre-loaded and merged config
         config_manager = ConfigManager(initial_config=config)
         # config_manager.config = config # Removed direct assignment
@@ -83,6 +127,7 @@ class TextProcessorFactory:
             file_registry=file_registry,
             output_manager=output_manager,
             security_utils=security_utils,
+            result_cache=self._create_result_cache(config_manager),
         )
     
     def create_processor_from_preset(
@@ -138,18 +183,46 @@ class TextProcessorFactory:
 
     def create_parallel_processor(
         self,
-        max_workers: Optional[int] = None
+        max_workers: Optional[int] = None,
+        config_manager: Optional[ConfigManager] = None
     ) -> ParallelProcessor:
         """Create a ParallelProcessor instance.
 
         Args:
             max_workers: Maximum number of worker processes.
+            config_manager: Configuration of the processor the workers run.
+                When given, process workers are forked from a warm template
+                if ``processing.worker_template.enabled`` is set.
 
         Returns:
             Configured ParallelProcessor instance.
         """
-        # Configuration for max_workers could potentially come from ConfigManager in the future
-        return ParallelProcessor(max_workers=max_workers)
+        mp_context = create_worker_context(config_manager) if config_manager is not None else None
+        return ParallelProcessor(max_workers=max_workers, mp_context=mp_context)
+
+    def create_async_processor(
+        self,
+        processor: Optional[TextProcessor] = None,
+        max_concurrency: Optional[int] = None,
+        use_processes: bool = False
+    ) -> AsyncTextProcessor:
+        """Create an AsyncTextProcessor.
+
+        Args:
+            processor: Processor to wrap. Defaults to a standard processor.
+            max_concurrency: Maximum number of files in progress at once.
+            use_processes: Run conversion and the pipeline in worker processes.
+
+        Returns:
+            Configured AsyncTextProcessor instance.
+        """
+        processor = processor or self.create_standard_processor()
+        return AsyncTextProcessor(
+            processor,
+            max_concurrency=max_concurrency,
+            use_processes=use_processes,
+            mp_context=create_worker_context(processor.config) if use_processes else None
+        )
 
     def create_directory_processor(
         self,
@@ -172,5 +245,6 @@ class TextProcessorFactory:
             config=config_manager,
             security_utils=security_utils,
             parallel_processor=parallel_processor,
-            single_file_processor=single_file_processor
+            single_file_processor=single_file_processor,
+            cost_model=self._create_cost_model(config_manager)
         )
@@ -19,6 +19,7 @@ class FileTypeRegistry:
             "plain_text": "txt",
             "json": "json",
             "csv": "csv",
+            "jsonl": "jsonl",
             "html": "html",
             "xml": "xml",
         }
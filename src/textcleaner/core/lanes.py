@@ -0,0 +1,144 @@
+"""Per-format execution lanes for directory processing.
+
+A lane is a group of files that share an executor type and a concurrency
+limit. Files are routed to a lane by extension or by the class name of the
+converter that handles them, so expensive formats (PDFs in worker processes,
+memory-hungry spreadsheets) can be capped without slowing down cheap text
+files, which run in their own lane at the same time.
+
+Lanes are configured under ``processing.lanes``::
+
+    processing:
+      lanes:
+        pdf:
+          converters: [PDFConverter]
+          executor: process
+          max_workers: 4
+        spreadsheets:
+          extensions: [".xlsx", ".xls"]
+          memory_per_task_mb: 1024
+
+Files that match no lane run in the ``default`` lane.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from textcleaner.config.config_manager import ConfigManager
+from textcleaner.converters.base import ConverterRegistry
+from textcleaner.utils.logging_config import get_logger
+
+DEFAULT_LANE = "default"
+LANE_EXECUTORS = ("thread", "process")
+
+
+@dataclass
+class Lane:
+    """Execution settings for one group of files."""
+    name: str
+    executor: str = "thread"
+    max_workers: Optional[int] = None
+    memory_per_task_mb: Optional[float] = None
+    converters: Tuple[str, ...] = ()
+    extensions: Tuple[str, ...] = ()
+
+    def worker_limit(self, default_workers: int) -> int:
+        """Return how many files of this lane may run at once.
+
+        The configured ``max_workers`` (or ``default_workers``) is further
+        capped so that ``memory_per_task_mb`` times the worker count fits into
+        the memory currently available.
+
+        Args:
+            default_workers: Worker count used when the lane sets none.
+
+        Returns:
+            Concurrency limit, at least 1.
+        """
+        limit = self.max_workers or default_workers
+        if self.memory_per_task_mb:
+            import psutil
+
+            available_mb = psutil.virtual_memory().available / (1024 * 1024)
+            limit = min(limit, int(available_mb // self.memory_per_task_mb))
+        return max(1, limit)
+
+
+def load_lanes(config: ConfigManager) -> List[Lane]:
+    """Build the lanes defined in the configuration.
+
+    Args:
+        config: Configuration manager.
+
+    Returns:
+        Configured lanes, always including the default lane.
+
+    Raises:
+        ValueError: If a lane is malformed.
+    """
+    lanes = []
+    lane_configs: Dict[str, Any] = config.get("processing.lanes") or {}
+    for name, settings in lane_configs.items():
+        settings = settings or {}
+        if not isinstance(settings, dict):
+            raise ValueError(f"Lane '{name}' must be a mapping of settings")
+        executor = settings.get("executor", "thread")
+        if executor not in LANE_EXECUTORS:
+            raise ValueError(
+                f"Lane '{name}' has unknown executor '{executor}', expected one of: {', '.join(LANE_EXECUTORS)}"
+            )
+        lanes.append(Lane(
+            name=name,
+            executor=executor,
+            max_workers=settings.get("max_workers"),
+            memory_per_task_mb=settings.get("memory_per_task_mb"),
+            converters=tuple(settings.get("converters") or ()),
+            extensions=tuple(
+                ext.lower() if ext.startswith(".") else f".{ext.lower()}"
+                for ext in settings.get("extensions") or ()
+            ),
+        ))
+    if not any(lane.name == DEFAULT_LANE for lane in lanes):
+        lanes.append(Lane(name=DEFAULT_LANE))
+    return lanes
+
+
+class LaneRouter:
+    """Assigns files to lanes."""
+
+    def __init__(self, lanes: List[Lane], converter_registry: ConverterRegistry):
+        """Initialize the router.
+
+        Args:
+            lanes: Available lanes; must include the default lane.
+            converter_registry: Registry used to find the converter of a file.
+        """
+        self.logger = get_logger(__name__)
+        self.lanes = {lane.name: lane for lane in lanes}
+        self.converter_registry = converter_registry
+        # Extensions are matched before converters so they can split a converter's formats
+        self._by_extension: Dict[str, Lane] = {}
+        self._by_converter: Dict[str, Lane] = {}
+        for lane in lanes:
+            for ext in lane.extensions:
+                self._by_extension.setdefault(ext, lane)
+            for converter in lane.converters:
+                self._by_converter.setdefault(converter, lane)
+        # Routing only depends on the extension, so remember each decision
+        self._cache: Dict[str, Lane] = {}
+
+    def route(self, file_path: Path) -> Lane:
+        """Return the lane a file should run in."""
+        ext = file_path.suffix.lower()
+        lane = self._cache.get(ext)
+        if lane is None:
+            lane = self._by_extension.get(ext)
+            if lane is None:
+                converter = self.converter_registry.find_converter(file_path)
+                if converter is not None:
+                    lane = self._by_converter.get(converter.name)
+            lane = lane or self.lanes[DEFAULT_LANE]
+            self._cache[ext] = lane
+            self.logger.debug(f"Routing '{ext}' files to lane '{lane.name}'")
+        return lane
@@ -0,0 +1,286 @@
+"""Build manifest for incremental directory processing.
+
+The manifest lives in the output directory and records, for every source
+file that was processed successfully, enough information to decide on the
+next run whether the file has to be processed again: its size, mtime and
+inode (checked without opening the file), a content hash (checked only when
+the cheap stat comparison fails), the configuration fingerprint and the
+output it produced.
+"""
+
+import filecmp
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from textcleaner.core.models import ProcessingResult
+from textcleaner.utils.file_utils import atomic_write_text
+from textcleaner.utils.logging_config import get_logger
+from textcleaner.utils.security import SecurityUtils
+
+MANIFEST_FILENAME = ".textcleaner-manifest.json"
+MANIFEST_VERSION = 1
+TEMP_OUTPUT_PREFIX = ".tc-partial-"
+# Staged output names start with the prefix and the ID of the writing process
+_TEMP_OUTPUT_PATTERN = re.compile(rf"{re.escape(TEMP_OUTPUT_PREFIX)}(\d+)-")
+
+# Metrics carried over to results of skipped files so run summaries stay complete
+SUMMARY_METRIC_KEYS = (
+    "original_tokens", "processed_tokens", "token_reduction_percent",
+    "original_tokens_estimate", "processed_tokens_estimate", "token_reduction_percent_estimate",
+)
+
+
+@dataclass
+class ManifestEntry:
+    """What the manifest knows about one source file."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    content_hash: Optional[str]
+    config_fingerprint: str
+    output_format: str
+    output_path: str  # Relative to the output directory
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+
+class BuildManifest:
+    """Tracks processed sources so unchanged files can be skipped."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        config_fingerprint: str,
+        security_utils: SecurityUtils,
+    ):
+        """Initialize the manifest, loading any previous state.
+
+        Args:
+            output_dir: Output directory the manifest is stored in.
+            config_fingerprint: Fingerprint of the configuration for this run.
+            security_utils: Security utilities used to hash source files.
+        """
+        self.logger = get_logger(__name__)
+        self.output_dir = output_dir
+        self.path = output_dir / MANIFEST_FILENAME
+        self.config_fingerprint = config_fingerprint
+        self.security = security_utils
+        self.entries: Dict[str, ManifestEntry] = self._load()
+        self._seen: set = set()
+
+    def _load(self) -> Dict[str, ManifestEntry]:
+        """Load entries from disk, starting fresh if the file is unusable."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            return {}
+
+        if data.get("version") != MANIFEST_VERSION:
+            self.logger.info("Manifest version changed, rebuilding all outputs")
+            return {}
+        try:
+            return {key: ManifestEntry(**value) for key, value in data.get("entries", {}).items()}
+        except TypeError as e:
+            self.logger.warning(f"Ignoring malformed manifest {self.path}: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "entries": {key: asdict(entry) for key, entry in sorted(self.entries.items())},
+        }
+        atomic_write_text(self.path, json.dumps(data, separators=(",", ":")))
+
+    def is_up_to_date(
+        self,
+        key: str,
+        source: Path,
+        stat: os.stat_result,
+        output_path: Path,
+        output_format: str,
+    ) -> bool:
+        """Decide whether a source can be skipped.
+
+        The stat comparison does not open the file. Only when it fails but the
+        size still matches is the content hash computed, which catches files
+        that were touched or copied without being modified.
+
+        Args:
+            key: Manifest key of the source (its path relative to the input).
+            source: Path to the source file.
+            stat: Result of ``os.stat`` for the source.
+            output_path: Output path this run would write to.
+            output_format: Output format for this run.
+
+        Returns:
+            True if the recorded output is still valid.
+        """
+        self._seen.add(key)
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        if (entry.config_fingerprint != self.config_fingerprint
+                or entry.output_format != output_format
+                or self.output_dir / entry.output_path != output_path
+                or not output_path.exists()):
+            return False
+        if (entry.size, entry.mtime_ns, entry.inode) == (stat.st_size, stat.st_mtime_ns, stat.st_ino):
+            return True
+        if entry.size != stat.st_size or entry.content_hash is None:
+            return False
+
+        content_hash, _ = self.security.compute_file_hash(source)
+        if content_hash != entry.content_hash:
+            return False
+        # Same bytes under a new stat signature: remember it for next time
+        entry.mtime_ns, entry.inode = stat.st_mtime_ns, stat.st_ino
+        return True
+
+    def skipped_result(self, key: str, source: Path) -> ProcessingResult:
+        """Build the result reported for a skipped source."""
+        entry = self.entries[key]
+        metrics = dict(entry.metrics)
+        metrics["processing_time_seconds"] = 0.0
+        metrics["skipped_unchanged"] = True
+        return ProcessingResult(
+            input_path=source,
+            output_path=self.output_dir / entry.output_path,
+            success=True,
+            metrics=metrics,
+        )
+
+    def record(
+        self,
+        key: str,
+        source: Path,
+        stat: os.stat_result,
+        result: ProcessingResult,
+        output_format: str,
+    ) -> None:
+        """Record a successful result.
+
+        Args:
+            key: Manifest key of the source.
+            source: Path to the source file.
+            stat: Stat of the source taken before it was processed.
+            result: Result of processing the source.
+            output_format: Output format the result was written in.
+        """
+        content_hash, _ = self.security.compute_file_hash(source)
+        try:
+            current = source.stat()
+            if (current.st_size, current.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                content_hash = None  # Modified while processing; force a rebuild next run
+        except OSError:
+            content_hash = None
+        self.entries[key] = ManifestEntry(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            content_hash=content_hash,
+            config_fingerprint=self.config_fingerprint,
+            output_format=output_format,
+            output_path=result.output_path.relative_to(self.output_dir).as_posix(),
+            metrics={k: result.metrics[k] for k in SUMMARY_METRIC_KEYS if k in result.metrics},
+        )
+
+    def prune(self, input_dir: Path) -> List[Path]:
+        """Delete outputs whose source no longer exists.
+
+        Sources that were merely filtered out of this run (and still exist)
+        keep their entries and outputs.
+
+        Args:
+            input_dir: Input directory the manifest keys are relative to.
+
+        Returns:
+            Output paths that were removed.
+        """
+        removed = []
+        for key in [k for k in self.entries if k not in self._seen]:
+            if (input_dir / key).exists():
+                continue
+            entry = self.entries.pop(key)
+            output_path = self.output_dir / entry.output_path
+            try:
+                output_path.unlink()
+                removed.append(output_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Could not prune stale output {output_path}: {e}")
+        if removed:
+            self.logger.info(f"Pruned {len(removed)} outputs of deleted sources")
+        return removed
+
+    def sweep_partial_outputs(self) -> List[Path]:
+        """Remove outputs staged by runs that were killed before committing them.
+
+        Staged outputs are named after the process writing them; those of
+        this process and of other processes still running (a concurrent run
+        on the same output directory) are left alone.
+
+        Returns:
+            Staged output paths that were removed.
+        """
+        removed = []
+        own_pid = os.getpid()
+        for path in self.output_dir.rglob(f"{TEMP_OUTPUT_PREFIX}*"):
+            match = _TEMP_OUTPUT_PATTERN.match(path.name)
+            if match is None or int(match.group(1)) == own_pid:
+                continue
+            # psutil is only imported once a staged output is found
+            import psutil
+
+            if psutil.pid_exists(int(match.group(1))):
+                continue
+            try:
+                path.unlink()
+                removed.append(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Could not remove partial output {path}: {e}")
+        if removed:
+            self.logger.info(f"Removed {len(removed)} partial outputs left by interrupted runs")
+        return removed
+
+
+def temporary_output_path(output_path: Path) -> Path:
+    """Return a sibling path used to stage an output before committing it.
+
+    The suffix is preserved so format inference from the extension still works.
+    """
+    return output_path.with_name(f"{TEMP_OUTPUT_PREFIX}{os.getpid()}-{output_path.stem}{output_path.suffix}")
+
+
+def commit_output(staged_path: Path, output_path: Path) -> bool:
+    """Move a staged output into place unless the existing file is identical.
+
+    Leaving identical outputs untouched keeps their mtime stable for
+    downstream jobs that rebuild on modification time.
+
+    Args:
+        staged_path: Path the output was written to.
+        output_path: Final output path.
+
+    Returns:
+        True if the output file was replaced, False if it was already identical.
+    """
+    try:
+        if output_path.exists() and filecmp.cmp(staged_path, output_path, shallow=False):
+            staged_path.unlink()
+            return False
+    except OSError:
+        pass  # Fall through and replace the output
+    os.replace(staged_path, output_path)
+    return True
@@ -34,6 +34,30 @@ class ProcessingResult:
         self.metadata = metadata or {}
         self.processing_time = self.metrics.get("processing_time_seconds", 0)
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-friendly representation of the result."""
+        return {
+            "input_path": str(self.input_path),
+            "output_path": str(self.output_path) if self.output_path else None,
+            "success": self.success,
+            "error": self.error,
+            "metrics": self.metrics,
+            "metadata": self.metadata,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProcessingResult":
+        """Rebuild a result from the output of ``to_dict``."""
+        output_path = data.get("output_path")
+        return cls(
+            input_path=Path(data["input_path"]),
+            output_path=Path(output_path) if output_path else None,
+            success=data.get("success", True),
+            error=data.get("error"),
+            metrics=data.get("metrics"),
+            metadata=data.get("metadata"),
+        )
+    
     def __str__(self) -> str:
         """Return a string representation of the result."""
         if self.success:
@@ -12,14 +12,20 @@ from textcleaner.config.config_factory import ConfigFactory
 from textcleaner.converters.base import ConverterRegistry, BaseConverter
 from textcleaner.processors.processor_pipeline import ProcessorPipeline
 from textcleaner.outputs.output_manager import OutputManager
-from textcleaner.utils.metrics import calculate_metrics
+from textcleaner.utils.metrics import StreamMetrics, calculate_metrics
 from textcleaner.core.file_registry import FileTypeRegistry
 from textcleaner.utils.security import SecurityUtils
 from textcleaner.utils.performance import performance_monitor
+from textcleaner.utils.events import event_bus, FILE_STARTED, FILE_FINISHED, STAGE_TIMING
 # from textcleaner.utils.parallel import ParallelProcessor # Removed - Unused in this class (commented out below)
 from textcleaner.utils.file_utils import get_default_extension, get_format_from_extension
 from textcleaner.utils.file_utils import resolve_output_dir, determine_output_format_and_extension
 from textcleaner.core.models import ProcessingResult # Import from models
+from textcleaner.utils.result_cache import ResultCache
+from textcleaner.utils.streaming import DEFAULT_WINDOW_SIZE
+
+# Files larger than this are streamed (processing.streaming.threshold_mb)
+DEFAULT_STREAMING_THRESHOLD_MB = 64
 
 
 class TextProcessor:
@@ -37,7 +43,8 @@ class TextProcessor:
                 processor_pipeline: ProcessorPipeline,
                 file_registry: FileTypeRegistry,
                 output_manager: OutputManager,
-                security_utils: SecurityUtils):
+                security_utils: SecurityUtils,
+                result_cache: Optional[ResultCache] = None):
         """Initialize the text processor with components for single file processing.
         
         Args:
@@ -47,6 +54,7 @@ class TextProcessor:
             file_registry: Pre-configured file type registry.
             output_manager: Pre-configured output manager.
             security_utils: Pre-configured security utilities.
+            result_cache: Optional cache of previously processed results.
         """
         self.logger = get_logger(__name__)
         self.logger.info("Initializing TextProcessor")
@@ -57,6 +65,8 @@ class TextProcessor:
         self.processor_pipeline = processor_pipeline
         self.output_manager = output_manager
         self.security = security_utils
+        self.result_cache = result_cache
+        self._config_fingerprint: Optional[str] = None
         # self.parallel = parallel_processor # Removed, handled by DirectoryProcessor
         
         performance_monitor.reset()
@@ -68,7 +78,37 @@ class TextProcessor:
         output_path: Optional[Union[str, Path]] = None,
         output_format: Optional[str] = None,
     ) -> ProcessingResult:
-        """Process a single file after validation and path preparation."""
+        """Process a single file after validation and path preparation.
+
+        Publishes ``file_started`` and ``file_finished`` events when anybody
+        is subscribed to the event bus.
+        """
+        if not event_bus.active:
+            return self._process_file(input_path, output_path, output_format)
+
+        event_bus.emit(FILE_STARTED, input_path)
+        result = self._process_file(input_path, output_path, output_format)
+        try:
+            input_bytes = os.path.getsize(input_path)
+        except OSError:
+            input_bytes = 0
+        event_bus.emit(
+            FILE_FINISHED, input_path,
+            success=result.success,
+            error=result.error,
+            input_bytes=input_bytes,
+            tokens=result.metrics.get("processed_tokens") or result.metrics.get("processed_token_estimate") or 0,
+            seconds=result.metrics.get("processing_time_seconds"),
+        )
+        return result
+
+    def _process_file(
+        self,
+        input_path: Union[str, Path],
+        output_path: Optional[Union[str, Path]],
+        output_format: Optional[str],
+    ) -> ProcessingResult:
+        """Process a single file, converting all failures into failed results."""
         start_time = time.time()
         
         with performance_monitor.performance_context("process_file"):
@@ -163,56 +203,263 @@ class TextProcessor:
     ) -> ProcessingResult:
         """Execute the core conversion, processing, and output steps."""
         with performance_monitor.performance_context("execute_processing_steps"):
-            converter = self.converter_registry.find_converter(input_path)
-            if converter is None:
-                raise ValueError(f"No converter found for file type: {input_path.suffix}")
-            
-            self.logger.debug(f"Using converter: {converter.__class__.__name__}")
-            try:
-                extracted_content, metadata = converter.convert(input_path)
-                if not extracted_content:
-                    error_detail = metadata.get("conversion_error_details")
-                    if error_detail:
-                        raise RuntimeError(f"Conversion failed for {input_path}: {error_detail}")
-                    else:
-                        raise RuntimeError(f"Conversion resulted in empty content for {input_path}")
-            except Exception as e:
-                self.logger.error(f"Conversion step failed for {input_path} with error type {type(e).__name__}: {e}")
-                raise RuntimeError(f"Conversion failed for {input_path}: {e}") from e
-
-            self.logger.debug("Applying processing pipeline")
-            try:
-                processed_text = self.processor_pipeline.process(extracted_content, metadata)
-                # Raise error if processing pipeline results in empty content
-                if not processed_text:
-                    raise RuntimeError(f"Processing pipeline resulted in empty content for {input_path}")
-            except Exception as e:
-                raise RuntimeError(f"Processing pipeline failed for {input_path}: {e}") from e
-            
-            self.logger.debug(f"Writing output to: {output_path}")
-            try:
-                self.output_manager.write(processed_text, output_path, output_format)
-            except Exception as e:
-                raise RuntimeError(f"Failed to write output to {output_path}: {e}") from e
-            
-            processing_time = time.time() - start_time
-            metrics = calculate_metrics(
-                raw_text=extracted_content,
-                processed_text=processed_text,
-                processing_time=processing_time,
-                config=self.config,
-                input_file_stats=metadata.get("file_stats")
+            converter = self._streaming_converter(input_path)
+            if converter is not None:
+                return self._execute_streaming_steps(converter, input_path, output_path, output_format, start_time)
+
+            cache_key = self._get_cache_key(input_path, output_format)
+            if cache_key is not None:
+                cached_result = self._load_cached_result(cache_key, input_path, output_path, start_time)
+                if cached_result is not None:
+                    return cached_result
+
+            stage_start = time.perf_counter()
+            extracted_content, metadata = self._convert(input_path)
+            converted_at = time.perf_counter()
+            processed_text = self._apply_pipeline(input_path, extracted_content, metadata)
+            processed_at = time.perf_counter()
+            self._write_output(processed_text, output_path, output_format, input_path)
+            written_at = time.perf_counter()
+
+            result = self._build_result(
+                input_path, output_path, output_format,
+                extracted_content, processed_text, metadata, start_time, cache_key
             )
-            
-            self.logger.info(f"Successfully processed {input_path.name} to {output_path.name}")
-            return ProcessingResult(
-                input_path=input_path,
-                output_path=output_path,
-                success=True,
-                metrics=metrics,
-                metadata=metadata
+            event_bus.emit(
+                STAGE_TIMING, input_path,
+                convert=converted_at - stage_start,
+                pipeline=processed_at - converted_at,
+                write=written_at - processed_at,
+                metrics=time.perf_counter() - written_at,
+            )
+            return result
+
+    def _streaming_converter(self, input_path: Path) -> Optional[BaseConverter]:
+        """Converter to stream a file with, if the file is large enough to stream.
+
+        Files above ``processing.streaming.threshold_mb`` whose converter can
+        read them window by window are streamed; a null threshold turns
+        streaming off.
+        """
+        threshold_mb = self.config.get("processing.streaming.threshold_mb", DEFAULT_STREAMING_THRESHOLD_MB)
+        if not isinstance(threshold_mb, (int, float)):
+            return None
+        try:
+            if input_path.stat().st_size <= threshold_mb * 1024 * 1024:
+                return None
+        except OSError:
+            return None
+        converter, _ = self.converter_registry.dispatch(input_path)
+        return converter if converter.supports_streaming else None
+
+    def _execute_streaming_steps(
+        self,
+        converter: BaseConverter,
+        input_path: Path,
+        output_path: Path,
+        output_format: str,
+        start_time: float
+    ) -> ProcessingResult:
+        """Convert, process and write a large file one window at a time.
+
+        Memory use is bounded by the window size and the state the pipeline
+        carries between windows, whatever the size of the file. Streamed
+        results are not cached, as caching would read the whole output back.
+        """
+        window_size = self.config.get("processing.streaming.window_kb", DEFAULT_WINDOW_SIZE // 1024) * 1024
+        self.logger.info(f"Streaming {input_path.name} in windows of {window_size // 1024} KB")
+        stage_start = time.perf_counter()
+        metrics = StreamMetrics(self.config)
+        try:
+            windows, metadata = converter.stream(input_path, window_size)
+            processed_windows = self.processor_pipeline.process_stream(metrics.count_raw(windows), metadata)
+            # Written like whole-file output, which carries no metadata
+            self.output_manager.write_stream(
+                metrics.count_processed(processed_windows), output_path, output_format,
+                source_path=input_path
             )
+        except Exception as e:
+            self.logger.error(f"Streaming failed for {input_path} with error type {type(e).__name__}: {e}")
+            raise RuntimeError(f"Streaming failed for {input_path}: {e}") from e
+        if not metrics.processed_windows:
+            raise RuntimeError(f"Processing pipeline resulted in empty content for {input_path}")
+        metadata["streamed"] = True
+        streamed_at = time.perf_counter()
+
+        result_metrics = metrics.result(time.time() - start_time, metadata.get("file_stats"))
+        event_bus.emit(STAGE_TIMING, input_path, stream=streamed_at - stage_start)
+        self.logger.info(f"Successfully streamed {input_path.name} to {output_path.name}")
+        return ProcessingResult(
+            input_path=input_path,
+            output_path=output_path,
+            success=True,
+            metrics=result_metrics,
+            metadata=metadata
+        )
+
+    def _convert(self, input_path: Path) -> Tuple[str, Dict[str, Any]]:
+        """Extract text and metadata from a file with the matching converter."""
+        converter, detected_extension = self.converter_registry.dispatch(input_path)
+        
+        self.logger.debug(f"Using converter: {converter.name}")
+        try:
+            extracted_content, metadata = converter.convert(input_path)
+            if detected_extension:
+                metadata["detected_format"] = detected_extension
+            if not extracted_content:
+                error_detail = metadata.get("conversion_error_details")
+                if error_detail:
+                    raise RuntimeError(f"Conversion failed for {input_path}: {error_detail}")
+                else:
+                    raise RuntimeError(f"Conversion resulted in empty content for {input_path}")
+        except Exception as e:
+            self.logger.error(f"Conversion step failed for {input_path} with error type {type(e).__name__}: {e}")
+            raise RuntimeError(f"Conversion failed for {input_path}: {e}") from e
+        return extracted_content, metadata
+
+    def _apply_pipeline(self, input_path: Path, extracted_content: str, metadata: Dict[str, Any]) -> str:
+        """Run the processor pipeline over extracted content."""
+        self.logger.debug("Applying processing pipeline")
+        try:
+            processed_text = self.processor_pipeline.process(extracted_content, metadata)
+            # Raise error if processing pipeline results in empty content
+            if not processed_text:
+                raise RuntimeError(f"Processing pipeline resulted in empty content for {input_path}")
+        except Exception as e:
+            raise RuntimeError(f"Processing pipeline failed for {input_path}: {e}") from e
+        return processed_text
+
+    def _write_output(
+        self,
+        processed_text: str,
+        output_path: Path,
+        output_format: str,
+        source_path: Optional[Path] = None
+    ) -> None:
+        """Write processed text through the output manager."""
+        self.logger.debug(f"Writing output to: {output_path}")
+        try:
+            self.output_manager.write(processed_text, output_path, output_format, source_path=source_path)
+        except Exception as e:
+            raise RuntimeError(f"Failed to write output to {output_path}: {e}") from e
+
+    def _build_result(
+        self,
+        input_path: Path,
+        output_path: Path,
+        output_format: str,
+        extracted_content: str,
+        processed_text: str,
+        metadata: Dict[str, Any],
+        start_time: float,
+        cache_key: Optional[str]
+    ) -> ProcessingResult:
+        """Calculate metrics, populate the result cache and build the result."""
+        processing_time = time.time() - start_time
+        metrics = calculate_metrics(
+            raw_text=extracted_content,
+            processed_text=processed_text,
+            processing_time=processing_time,
+            config=self.config,
+            input_file_stats=metadata.get("file_stats")
+        )
+        if cache_key is not None:
+            self._store_cached_result(cache_key, output_path, output_format, metrics, metadata)
+        
+        self.logger.info(f"Successfully processed {input_path.name} to {output_path.name}")
+        return ProcessingResult(
+            input_path=input_path,
+            output_path=output_path,
+            success=True,
+            metrics=metrics,
+            metadata=metadata
+        )
     
+    def _get_cache_key(self, input_path: Path, output_format: str) -> Optional[str]:
+        """Return the result cache key for a file, or None if caching is off."""
+        if self.result_cache is None:
+            return None
+        if self._config_fingerprint is None:
+            self._config_fingerprint = self.config.fingerprint()
+        return self.result_cache.make_key(
+            input_path, self._config_fingerprint, output_format,
+            include_path=self.output_manager.embeds_source_path(output_format)
+        )
+
+    def _load_cached_result(
+        self,
+        cache_key: str,
+        input_path: Path,
+        output_path: Path,
+        start_time: float
+    ) -> Optional[ProcessingResult]:
+        """Serve a result from the cache, writing the cached output to disk."""
+        entry = self.result_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        try:
+            with open(output_path, "w", encoding="utf-8", newline="") as f:
+                f.write(entry["output"])
+        except OSError as e:
+            raise RuntimeError(f"Failed to write output to {output_path}: {e}") from e
+
+        metadata = self._refresh_cached_metadata(entry.get("metadata") or {}, input_path)
+        metrics = dict(entry.get("metrics") or {})
+        metrics["processing_time_seconds"] = time.time() - start_time
+        metrics["cache_hit"] = True
+        if "input_file_stats" in metrics:
+            metrics["input_file_stats"] = metadata.get("file_stats")
+        self.logger.info(f"Served {input_path.name} from result cache")
+        return ProcessingResult(
+            input_path=input_path,
+            output_path=output_path,
+            success=True,
+            metrics=metrics,
+            metadata=metadata
+        )
+
+    def _refresh_cached_metadata(self, metadata: Dict[str, Any], input_path: Path) -> Dict[str, Any]:
+        """Replace the path-dependent fields of cached metadata with those of the input.
+
+        Entries are keyed by file contents, so files with the same bytes share
+        one entry; its name and timestamps are those of the first file stored.
+        """
+        file_stat = input_path.stat()
+        metadata = dict(metadata)
+        if "file_name" in metadata:
+            metadata["file_name"] = input_path.name
+        if "file_extension" in metadata:
+            metadata["file_extension"] = input_path.suffix.lower()
+        if isinstance(metadata.get("file_stats"), dict):
+            current_stats = {
+                "file_name": input_path.name,
+                "file_extension": input_path.suffix,
+                "created_at": file_stat.st_ctime,
+                "modified_at": file_stat.st_mtime,
+            }
+            file_stats = dict(metadata["file_stats"])
+            file_stats.update({key: value for key, value in current_stats.items() if key in file_stats})
+            metadata["file_stats"] = file_stats
+        return metadata
+
+    def _store_cached_result(
+        self,
+        cache_key: str,
+        output_path: Path,
+        output_format: str,
+        metrics: Dict[str, Any],
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Store a freshly written output in the result cache."""
+        try:
+            with open(output_path, "r", encoding="utf-8", newline="") as f:
+                rendered_output = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning(f"Not caching result for {output_path.name}: {e}")
+            return
+        self.result_cache.put(cache_key, rendered_output, output_format, metrics, metadata)
+
     def _should_process_file(
         self, 
         file_path: Path, 
@@ -240,20 +487,27 @@ class TextProcessor:
     
     def validate_file(self, file_path: Path) -> Tuple[bool, Optional[str]]:
         """Validate that a file is safe to process."""
-        is_valid, error = self.security.validate_path(file_path)
+        # A file validated in bulk (and unchanged since) needs no further
+        # path, type or permission checks, which would stat it again
+        if not self.security.is_validated_file(file_path):
+            is_valid, error = self.security.validate_path(file_path)
+            if not is_valid:
+                return False, error
+                
+            if not file_path.exists():
+                return False, f"File does not exist: {file_path}"
+                
+            if not file_path.is_file():
+                return False, f"Path is not a file: {file_path}"
+                
+            has_permission, error = self.security.check_file_permissions(file_path)
+            if not has_permission:
+                return False, error
+
+        is_valid, error = self.security.validate_file_content(file_path)
         if not is_valid:
             return False, error
             
-        if not file_path.exists():
-            return False, f"File does not exist: {file_path}"
-            
-        if not file_path.is_file():
-            return False, f"Path is not a file: {file_path}"
-            
-        has_permission, error = self.security.check_file_permissions(file_path)
-        if not has_permission:
-            return False, error
-            
         # Use the internal check method which also consults converters if needed
         if not self._should_process_file(file_path):
             return False, f"Unsupported file type or no converter found: {file_path.suffix}"
@@ -0,0 +1,431 @@
+"""Long-running local HTTP service with warm processors.
+
+The service keeps one fully built ``TextProcessor`` per profile (a
+configuration type such as ``standard`` or an LLM preset such as ``rag``),
+so converters, tokenizers and word lists are loaded once instead of on every
+invocation. Documents are accepted either as a path on the local machine or
+as uploaded bytes.
+
+Requests go through a ``MicroBatcher``: they wait in a bounded queue for at
+most a few milliseconds so that bursts are dispatched together. A burst is
+split evenly over the workers, so requests arriving together still run in
+parallel, and at most ``max_workers`` batches run at a time. When the queue
+is full new requests are rejected with HTTP 503 instead of piling up.
+
+Endpoints:
+    ``GET /health`` reports the warm profiles.
+    ``POST /process`` with a JSON body ``{"path": ..., "profile": ..., "format": ...}``
+    processes a local file; with any other content type the body is the
+    document itself and ``filename`` (for its extension), ``profile`` and
+    ``format`` are taken from the query string.
+"""
+
+import concurrent.futures
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from textcleaner.config.presets import get_preset, get_preset_names
+from textcleaner.utils.file_utils import determine_output_format_and_extension, get_cache_dir
+from textcleaner.utils.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from textcleaner.core.processor import TextProcessor
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_PROFILE = "standard"
+CONFIG_TYPES = ("minimal", "standard", "aggressive")
+DEFAULT_MAX_UPLOAD_MB = 64
+
+
+class ServiceBusyError(RuntimeError):
+    """Raised when the request queue is full."""
+
+
+@dataclass
+class ServiceRequest:
+    """A document waiting to be processed by the service."""
+    profile: str = DEFAULT_PROFILE
+    output_format: Optional[str] = None
+    path: Optional[Path] = None
+    content: Optional[bytes] = None
+    filename: Optional[str] = None
+    future: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+
+
+class ProcessorRegistry:
+    """Builds processors on first use and keeps them warm."""
+
+    def __init__(self, factory: Any, config_path: Optional[str] = None):
+        """Initialize the registry.
+
+        Args:
+            factory: TextProcessorFactory used to build processors.
+            config_path: Optional configuration file applied to every profile.
+        """
+        self.logger = get_logger(__name__)
+        self.factory = factory
+        self.config_path = config_path
+        self._processors: Dict[str, "TextProcessor"] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def profile_names() -> List[str]:
+        """Return every profile the registry can build."""
+        return list(CONFIG_TYPES) + [name for name in get_preset_names() if name not in CONFIG_TYPES]
+
+    def get(self, profile: str) -> "TextProcessor":
+        """Return the processor for a profile, building it if needed.
+
+        Args:
+            profile: Configuration type or LLM preset name.
+
+        Returns:
+            The warm processor.
+
+        Raises:
+            ValueError: If the profile is unknown.
+        """
+        processor = self._processors.get(profile)
+        if processor is not None:
+            return processor
+        with self._lock:
+            processor = self._processors.get(profile)
+            if processor is None:
+                processor = self._build(profile)
+                self._processors[profile] = processor
+        return processor
+
+    def _build(self, profile: str) -> "TextProcessor":
+        """Build the processor for a profile."""
+        if profile in CONFIG_TYPES:
+            config_type, overrides = profile, {}
+        elif profile in get_preset_names():
+            config_type, overrides = DEFAULT_PROFILE, get_preset(profile)
+        else:
+            raise ValueError(f"Unknown profile '{profile}'. Available: {', '.join(self.profile_names())}")
+        self.logger.info(f"Building processor for profile '{profile}'")
+        return self.factory.create_processor(
+            config_path=self.config_path, config_type=config_type, custom_overrides=overrides
+        )
+
+    def warm(self, profiles: Iterable[str]) -> None:
+        """Build the processors for the given profiles up front."""
+        for profile in profiles:
+            self.get(profile)
+
+    @property
+    def warm_profiles(self) -> List[str]:
+        """Profiles whose processors are already built."""
+        return sorted(self._processors)
+
+
+class MicroBatcher:
+    """Groups queued requests into small batches run on a bounded pool."""
+
+    def __init__(
+        self,
+        handler: Callable[[List[ServiceRequest]], None],
+        max_workers: int,
+        max_batch_size: int = 8,
+        batch_window: float = 0.005,
+        max_queue: int = 256,
+    ):
+        """Initialize and start the batcher.
+
+        Args:
+            handler: Called with each batch; must resolve every request's future.
+            max_workers: Maximum number of batches processed at once.
+            max_batch_size: Maximum number of requests collected at once.
+            batch_window: Seconds to wait for more requests after the first one.
+            max_queue: Maximum number of queued requests.
+        """
+        self.logger = get_logger(__name__)
+        self.handler = handler
+        self.max_workers = max(1, max_workers)
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window = batch_window
+        self._queue: "queue.Queue[Optional[ServiceRequest]]" = queue.Queue(maxsize=max_queue)
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="textcleaner-serve"
+        )
+        self._dispatcher = threading.Thread(target=self._dispatch, name="textcleaner-batcher", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, request: ServiceRequest) -> concurrent.futures.Future:
+        """Queue a request.
+
+        Returns:
+            Future resolved with the request's result.
+
+        Raises:
+            ServiceBusyError: If the queue is full.
+        """
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            raise ServiceBusyError("Service is busy, try again later") from None
+        return request.future
+
+    def _collect(self, first: ServiceRequest) -> List[ServiceRequest]:
+        """Gather requests arriving within the batch window."""
+        batch = [first]
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                self._queue.put(None)  # Let the main loop see the stop signal
+                break
+            batch.append(request)
+        return batch
+
+    def _split(self, requests: List[ServiceRequest]) -> List[List[ServiceRequest]]:
+        """Split collected requests into one batch per worker, keeping their order."""
+        size = -(-len(requests) // min(len(requests), self.max_workers))
+        return [requests[start:start + size] for start in range(0, len(requests), size)]
+
+    def _dispatch(self) -> None:
+        """Move batches from the queue to the pool as workers become free."""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            for batch in self._split(self._collect(first)):
+                self._slots.acquire()
+                future = self._pool.submit(self._run_batch, batch)
+                future.add_done_callback(lambda _: self._slots.release())
+
+    def _run_batch(self, batch: List[ServiceRequest]) -> None:
+        """Run the handler, failing any request it left unresolved."""
+        try:
+            self.handler(batch)
+        except Exception as e:
+            self.logger.exception(f"Batch of {len(batch)} requests failed")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+
+    def close(self) -> None:
+        """Stop accepting batches and wait for running ones."""
+        self._queue.put(None)
+        self._dispatcher.join(timeout=5.0)
+        self._pool.shutdown(wait=True)
+
+
+class TextCleanerService:
+    """Processes documents with warm processors behind a micro-batcher."""
+
+    def __init__(
+        self,
+        factory: Optional[Any] = None,
+        config_path: Optional[str] = None,
+        profiles: Iterable[str] = (DEFAULT_PROFILE,),
+        max_workers: Optional[int] = None,
+        max_batch_size: int = 8,
+        batch_window_ms: float = 5.0,
+        max_queue: int = 256,
+        max_upload_mb: float = DEFAULT_MAX_UPLOAD_MB,
+        scratch_dir: Optional[Path] = None,
+    ):
+        """Initialize the service and warm the requested profiles.
+
+        Args:
+            factory: TextProcessorFactory to build processors with.
+            config_path: Optional configuration file applied to every profile.
+            profiles: Profiles to build before accepting requests.
+            max_workers: Maximum number of batches processed at once.
+                Defaults to the number of CPUs.
+            max_batch_size: Maximum number of requests per batch.
+            batch_window_ms: Milliseconds to wait for more requests per batch.
+            max_queue: Maximum number of queued requests.
+            max_upload_mb: Largest accepted upload.
+            scratch_dir: Directory for uploaded documents and outputs.
+                Defaults to the textcleaner cache directory.
+        """
+        if factory is None:
+            # Imported here to avoid a circular import with the factory module
+            from textcleaner.core.factories import TextProcessorFactory
+            factory = TextProcessorFactory()
+        self.logger = get_logger(__name__)
+        self.registry = ProcessorRegistry(factory, config_path)
+        self.registry.warm(profiles)
+        self.max_upload_bytes = int(max_upload_mb * 1024 * 1024)
+        self.scratch_dir = Path(scratch_dir) if scratch_dir else get_cache_dir("serve")
+        self.scratch_dir.mkdir(parents=True, exist_ok=True)
+        self.batcher = MicroBatcher(
+            self.process_batch,
+            max_workers=max_workers or os.cpu_count() or 4,
+            max_batch_size=max_batch_size,
+            batch_window=batch_window_ms / 1000.0,
+            max_queue=max_queue,
+        )
+
+    def process_batch(self, batch: List[ServiceRequest]) -> None:
+        """Process a batch, resolving each request's future."""
+        for request in batch:
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            try:
+                request.future.set_result(self._process_one(request))
+            except Exception as e:
+                request.future.set_exception(e)
+
+    def _process_one(self, request: ServiceRequest) -> Dict[str, Any]:
+        """Process a single request in its own scratch directory."""
+        processor = self.registry.get(request.profile)
+        output_format, output_ext = determine_output_format_and_extension(
+            output_format_param=request.output_format,
+            output_path_param=None,
+            config=processor.config,
+            file_registry=processor.file_registry,
+        )
+        with tempfile.TemporaryDirectory(prefix="request-", dir=self.scratch_dir) as scratch:
+            scratch_path = Path(scratch)
+            if request.path is not None:
+                input_path = request.path
+            else:
+                # Only the extension of the client's name is used, never its path
+                suffix = Path(request.filename or "").suffix.lower() or ".txt"
+                input_path = scratch_path / f"input{suffix}"
+                input_path.write_bytes(request.content or b"")
+            output_path = scratch_path / f"output.{output_ext}"
+
+            result = processor.process_file(input_path, output_path, output_format)
+            text = output_path.read_text(encoding="utf-8") if result.success else None
+
+        return {
+            "success": result.success,
+            "error": result.error,
+            "output_format": output_format,
+            "text": text,
+            "metrics": result.metrics,
+            "metadata": result.metadata,
+        }
+
+    def process(self, request: ServiceRequest, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Submit a request and wait for its result.
+
+        Raises:
+            ServiceBusyError: If the queue is full.
+            ValueError: If the profile is unknown.
+        """
+        return self.batcher.submit(request).result(timeout=timeout)
+
+    def create_server(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+        """Create the HTTP server for this service (not yet serving)."""
+        server = ThreadingHTTPServer((host, port), _make_handler(self))
+        server.daemon_threads = True
+        return server
+
+    def close(self) -> None:
+        """Stop the batcher."""
+        self.batcher.close()
+
+
+def _make_handler(service: TextCleanerService) -> type:
+    """Create a request handler class bound to a service."""
+
+    class ServiceRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            service.logger.debug("%s - %s" % (self.address_string(), format % args))
+
+        def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if urlparse(self.path).path != "/health":
+                self._send_json(404, {"error": "Not found"})
+                return
+            self._send_json(200, {"status": "ok", "profiles": service.registry.warm_profiles})
+
+        def do_POST(self) -> None:
+            url = urlparse(self.path)
+            if url.path != "/process":
+                self._send_json(404, {"error": "Not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                # The body cannot be delimited, so the connection cannot be reused
+                self.close_connection = True
+                self._send_json(400, {"error": "Content-Length must be a non-negative integer"})
+                return
+            if length > service.max_upload_bytes:
+                self._send_json(413, {"error": f"Upload exceeds {service.max_upload_bytes} bytes"})
+                return
+            body = self.rfile.read(length)
+            try:
+                request = self._parse_request(url.query, body)
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            try:
+                result = service.process(request)
+            except ServiceBusyError as e:
+                self._send_json(503, {"error": str(e)})
+                return
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            except Exception as e:
+                service.logger.exception("Unexpected error while serving request")
+                self._send_json(500, {"error": f"Unexpected error: {e}"})
+                return
+            self._send_json(200 if result["success"] else 422, result)
+
+        def _parse_request(self, query: str, body: bytes) -> ServiceRequest:
+            params = {key: values[-1] for key, values in parse_qs(query).items()}
+            content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip()
+            if content_type == "application/json":
+                try:
+                    json_body = json.loads(body or b"{}")
+                except ValueError as e:
+                    raise ValueError(f"Invalid JSON body: {e}") from e
+                if not isinstance(json_body, dict):
+                    raise ValueError("JSON body must be an object")
+                params.update(json_body)
+                if not params.get("path") or not isinstance(params["path"], str):
+                    raise ValueError("JSON requests must include 'path' as a string")
+                for key in ("profile", "format"):
+                    if params.get(key) is not None and not isinstance(params[key], str):
+                        raise ValueError(f"'{key}' must be a string")
+                return ServiceRequest(
+                    profile=params.get("profile") or DEFAULT_PROFILE,
+                    output_format=params.get("format"),
+                    path=Path(params["path"]),
+                )
+            if not body:
+                raise ValueError("Request body is empty")
+            return ServiceRequest(
+                profile=params.get("profile") or DEFAULT_PROFILE,
+                output_format=params.get("format"),
+                content=body,
+                filename=params.get("filename"),
+            )
+
+    return ServiceRequestHandler
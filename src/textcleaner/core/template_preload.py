@@ -0,0 +1,9 @@
+"""Fork server preload hook, see ``textcleaner.core.worker_template``.
+
+Importing this module warms the importing process. It is only meant to be
+imported by the fork server.
+"""
+
+from textcleaner.core.worker_template import warm_template
+
+warm_template()
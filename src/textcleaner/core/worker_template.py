@@ -0,0 +1,228 @@
+"""Warm worker template for process pools.
+
+Every worker of a process pool normally starts cold: it imports the converter
+libraries (pandas, BeautifulSoup, pdfminer, NLTK), loads the tiktoken encoding
+and the WordNet corpus and compiles the processors' regular expressions before
+it can take its first file.
+
+With the template enabled, pools use the ``forkserver`` start method and the
+fork server imports ``textcleaner.core.template_preload`` when it starts. That
+module calls ``warm_template``, which loads all of the above for the default
+configuration once, moves the result into the permanent generation with
+``gc.freeze()`` and leaves the fork server as a template. Workers are forked
+from it, so they start without any imports and share the preloaded pages
+copy-on-write instead of holding private copies.
+
+Settings that differ between pools (the tokenizer encoding and pdfminer
+CMaps) travel with the pool's context and are applied by its initializer in
+each worker (see ``template_initializer``); nothing is passed through the
+environment.
+
+The template is configured under ``processing.worker_template``::
+
+    processing:
+      worker_template:
+        enabled: true
+        pdf_cmaps: [UniJIS-UCS2-H]
+
+A fork server is started once per parent process and is shared by every
+forkserver pool of the process; its preload list only names the template
+module, so pools of other code merely find textcleaner already imported.
+"""
+
+import gc
+import multiprocessing
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from textcleaner.config.config_manager import ConfigManager
+from textcleaner.utils.logging_config import get_logger
+from textcleaner.utils.metrics import get_tokenizer
+
+PRELOAD_MODULE = "textcleaner.core.template_preload"
+
+logger = get_logger(__name__)
+
+# Not available on platforms without the forkserver start method
+_ForkServerContext = getattr(multiprocessing.context, "ForkServerContext", multiprocessing.context.BaseContext)
+
+
+def _load_wordnet() -> bool:
+    """Load the WordNet corpus if NLTK and the corpus are installed."""
+    try:
+        import nltk
+        from nltk.corpus import wordnet
+    except ImportError:
+        return False
+    try:
+        # Never download from a preloader; missing data is loaded lazily later
+        nltk.data.find("corpora/wordnet")
+    except LookupError:
+        return False
+    wordnet.ensure_loaded()
+    return True
+
+
+def _load_pdf_resources(cmaps: Iterable[str]) -> int:
+    """Import pdfminer and load the given CMaps into its class-level cache."""
+    try:
+        from pdfminer import high_level  # noqa: F401 - imported for its side effect
+        from pdfminer.cmapdb import CMapDB
+    except ImportError:
+        return 0
+    loaded = 0
+    for name in cmaps:
+        try:
+            CMapDB.get_cmap(name)
+            loaded += 1
+        except CMapDB.CMapNotFound:
+            logger.warning(f"Unknown pdfminer CMap '{name}' not preloaded")
+    return loaded
+
+
+def warm_up(config: Dict[str, Any], pdf_cmaps: Iterable[str] = ()) -> Dict[str, float]:
+    """Load everything a worker processor needs, then freeze the heap.
+
+    Args:
+        config: Resolved configuration dictionary of the parent processor.
+        pdf_cmaps: Names of pdfminer CMaps to preload.
+
+    Returns:
+        Seconds spent in each preload step.
+    """
+    timings: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    # Imported here to avoid a circular import with the factory module
+    from textcleaner.core.factories import TextProcessorFactory
+
+    # Building a processor and loading its (lazily registered) converters
+    # imports every converter and processor module and compiles their
+    # patterns; the instance itself is not kept
+    processor = TextProcessorFactory().create_processor_from_config(config)
+    processor.converter_registry.load_all()
+    timings["processor"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_tokenizer(processor.config.get("metrics.tokenizer_encoding", "cl100k_base"))
+    timings["tokenizer"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _load_wordnet()
+    timings["wordnet"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _load_pdf_resources(pdf_cmaps)
+    timings["pdf"] = time.perf_counter() - start
+
+    del processor
+    gc.collect()
+    # Keep the collector from touching (and thereby copying) the shared pages
+    gc.freeze()
+    return timings
+
+
+def warm_template() -> None:
+    """Warm the fork server for the default configuration.
+
+    Errors are logged rather than raised: the fork server must start even if
+    preloading fails, workers then simply load what they need themselves.
+    """
+    try:
+        timings = warm_up(ConfigManager().config)
+        logger.debug(
+            "Worker template ready: " + ", ".join(f"{step} {seconds:.2f}s" for step, seconds in timings.items())
+        )
+    except Exception as e:
+        logger.warning(f"Worker template preload failed, workers will start cold: {e}")
+
+
+def initialize_template_worker(
+    settings: Dict[str, Any],
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = ()
+) -> None:
+    """Apply a pool's template settings in a worker, then run the pool's initializer.
+
+    Args:
+        settings: Template settings of the pool, see ``WorkerTemplateContext``.
+        initializer: The pool's own initializer, if any.
+        initargs: Arguments for ``initializer``.
+    """
+    try:
+        # Already loaded by the template unless the pool's settings differ
+        get_tokenizer(settings.get("tokenizer_encoding") or "cl100k_base")
+        _load_pdf_resources(settings.get("pdf_cmaps") or ())
+    except Exception as e:
+        logger.warning(f"Worker template settings could not be applied: {e}")
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class WorkerTemplateContext(_ForkServerContext):  # type: ignore[misc, valid-type]
+    """Forkserver context carrying the template settings of one pool."""
+
+    def __init__(self, settings: Dict[str, Any]):
+        """Initialize the context.
+
+        Args:
+            settings: Tokenizer encoding and pdfminer CMaps the pool's
+                workers load on top of the template.
+        """
+        super().__init__()
+        self.template_settings = settings
+
+    def wrap_initializer(
+        self,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = ()
+    ) -> Tuple[Callable[..., None], Tuple[Any, ...]]:
+        """Return a pool initializer that applies the template settings first."""
+        return initialize_template_worker, (self.template_settings, initializer, initargs)
+
+
+def template_initializer(
+    mp_context: Optional[multiprocessing.context.BaseContext],
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = ()
+) -> Tuple[Optional[Callable[..., None]], Tuple[Any, ...]]:
+    """Return the initializer and arguments for a process pool started with ``mp_context``.
+
+    Args:
+        mp_context: Context of the pool, as returned by ``create_worker_context``.
+        initializer: The pool's own initializer, if any.
+        initargs: Arguments for ``initializer``.
+    """
+    if isinstance(mp_context, WorkerTemplateContext):
+        return mp_context.wrap_initializer(initializer, initargs)
+    return initializer, initargs
+
+
+def create_worker_context(config: ConfigManager) -> Optional[multiprocessing.context.BaseContext]:
+    """Create the multiprocessing context process pools should use.
+
+    Pools started with the context must run ``template_initializer`` (or the
+    context's ``wrap_initializer``) as their initializer.
+
+    Args:
+        config: Configuration manager of the processor the workers rebuild.
+
+    Returns:
+        A forkserver context preloading the worker template, or None (use the
+        platform default) if the template is disabled or unsupported.
+    """
+    if not config.get("processing.worker_template.enabled", True):
+        return None
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        logger.debug("forkserver start method unavailable, process workers start cold")
+        return None
+
+    encoding = config.get("metrics.tokenizer_encoding", "cl100k_base")
+    cmaps = config.get("processing.worker_template.pdf_cmaps", None)
+    context = WorkerTemplateContext({
+        "tokenizer_encoding": encoding if isinstance(encoding, str) else "cl100k_base",
+        "pdf_cmaps": [str(name) for name in cmaps] if isinstance(cmaps, (list, tuple)) else [],
+    })
+    # Only takes effect before the fork server has started
+    context.set_forkserver_preload([PRELOAD_MODULE])
+    return context
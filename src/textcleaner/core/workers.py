@@ -0,0 +1,103 @@
+"""Worker-process entry points for process-based processing.
+
+Process pools are started with ``initialize_worker`` as their initializer so
+that every worker builds its ``TextProcessor`` exactly once, from the parent's
+resolved configuration. Tasks sent to the workers afterwards only carry paths,
+which keeps them cheap to pickle.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from textcleaner.core.models import ProcessingResult
+from textcleaner.utils.events import QueueForwarder, event_bus
+from textcleaner.utils.logging_config import get_logger
+from textcleaner.utils.security import SecurityUtils
+
+# Per-process processor, created by initialize_worker
+_worker_processor = None
+
+
+def initialize_worker(
+    config: Dict[str, Any],
+    security_utils: SecurityUtils,
+    event_queue: Optional[Any] = None
+) -> None:
+    """Build the processor used by this worker process.
+
+    Args:
+        config: Resolved configuration dictionary of the parent processor.
+        security_utils: Security utilities of the parent, so workers apply
+            the same validation policy.
+        event_queue: Optional multiprocessing queue; when given, processing
+            events are forwarded to the parent's event bus through it.
+    """
+    global _worker_processor
+    if event_queue is not None:
+        event_bus.subscribe(QueueForwarder(event_queue))
+    # Imported here to avoid a circular import with the factory module
+    from textcleaner.core.factories import TextProcessorFactory
+
+    factory = TextProcessorFactory(security_utils=security_utils)
+    _worker_processor = factory.create_processor_from_config(config)
+    get_logger(__name__).debug("Worker processor initialized")
+
+
+def process_path(task: Tuple[Path, Path, Optional[str]]) -> ProcessingResult:
+    """Process one file inside a worker process.
+
+    Args:
+        task: Tuple of (input path, output path, output format).
+
+    Returns:
+        The processing result for the file.
+
+    Raises:
+        RuntimeError: If the worker was not initialized.
+    """
+    if _worker_processor is None:
+        raise RuntimeError("Worker process was not initialized with initialize_worker")
+    input_path, output_path, output_format = task
+    return _worker_processor.process_file(input_path, output_path, output_format)
+
+
+def convert_and_process(input_path: Path) -> Tuple[str, str, Dict[str, Any]]:
+    """Run the CPU-bound steps for one file inside a worker process.
+
+    Args:
+        input_path: Validated path of the file to convert.
+
+    Returns:
+        Tuple of (extracted content, processed text, metadata).
+
+    Raises:
+        RuntimeError: If the worker was not initialized or a step failed.
+    """
+    if _worker_processor is None:
+        raise RuntimeError("Worker process was not initialized with initialize_worker")
+    extracted_content, metadata = _worker_processor._convert(input_path)
+    processed_text = _worker_processor._apply_pipeline(input_path, extracted_content, metadata)
+    return extracted_content, processed_text, metadata
+
+
+def stream_and_process(task: Tuple[Path, Path, str, float]) -> ProcessingResult:
+    """Stream a large file through the pipeline inside a worker process.
+
+    The parent has already decided that the file is streamed; the worker
+    dispatches the same converter for it.
+
+    Args:
+        task: Tuple of (validated input path, output path, output format,
+            processing start time).
+
+    Returns:
+        The processing result for the file.
+
+    Raises:
+        RuntimeError: If the worker was not initialized or streaming failed.
+    """
+    if _worker_processor is None:
+        raise RuntimeError("Worker process was not initialized with initialize_worker")
+    input_path, output_path, output_format, start_time = task
+    converter, _ = _worker_processor.converter_registry.dispatch(input_path)
+    return _worker_processor._execute_streaming_steps(converter, input_path, output_path, output_format, start_time)
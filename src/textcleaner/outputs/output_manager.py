@@ -1,34 +1,53 @@
 """Output management for processed text."""
 
-import json
 import csv
+import importlib.util
+import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-# Import markdown-it-py
-try:
-    from markdown_it import MarkdownIt
-    from markdown_it.token import Token # For table parsing
-    _markdown_it_available = True
-except ImportError:
-    _markdown_it_available = False
-
-# Add BeautifulSoup import
-try:
-    from bs4 import BeautifulSoup, NavigableString, Tag
-    _bs4_available = True
-except ImportError:
-    _bs4_available = False
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple, Union
 
 from textcleaner.config.config_manager import ConfigManager
+from textcleaner.utils.chunking import DEFAULT_CHUNK_TOKENS, iter_chunks
 from textcleaner.utils.logging_config import get_logger # Import logger
+from textcleaner.utils.metrics import DEFAULT_TOKENIZER_ENCODING, get_token_service, get_tokenizer
+from textcleaner.utils.streaming import WINDOW_SEPARATOR
+from textcleaner.utils.token_budget import token_end_offsets
 
+# markdown-it-py and BeautifulSoup are imported when a writer first needs its
+# parser; only check here whether they are installed
+_markdown_it_available = importlib.util.find_spec("markdown_it") is not None
+_bs4_available = importlib.util.find_spec("bs4") is not None
 
 # Get logger for warnings
 logger = get_logger(__name__)
 
+# Alternative names accepted for output formats
+FORMAT_ALIASES = {
+    "text": "plain_text",
+    "txt": "plain_text",
+    "md": "markdown",
+}
+
 class BaseOutputWriter(ABC):
     """Base class for all output format writers."""
+
+    _parser: Any = None
+    _parser_created: bool = False
+    # Writers that record where their content came from receive source_path
+    accepts_source_path: bool = False
+
+    @property
+    def parser(self) -> Any:
+        """Markdown parser of the writer, created on first use (None if unavailable)."""
+        if not self._parser_created:
+            self._parser = self._create_parser()
+            self._parser_created = True
+        return self._parser
+
+    def _create_parser(self) -> Any:
+        """Create the writer's Markdown parser; writers without one return None."""
+        return None
     
     @abstractmethod
     def write(
@@ -49,6 +68,30 @@ class BaseOutputWriter(ABC):
         """
         pass
 
+    def write_stream(
+        self,
+        windows: Iterable[str],
+        output_path: Path,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write content given as consecutive windows of a streamed document.
+
+        The written content is the windows joined with a blank line. Writers
+        that can write each window as it arrives override this; the others
+        (such as CSV, which needs all content to find its table) join the
+        windows and write them at once.
+
+        Args:
+            windows: Processed windows, in document order.
+            output_path: Path to the output file.
+            metadata: Optional metadata to include; read once all windows
+                have been consumed where the format allows.
+
+        Raises:
+            IOError: If the file cannot be written.
+        """
+        self.write(WINDOW_SEPARATOR.join(windows), output_path, metadata)
+
 
 class MarkdownWriter(BaseOutputWriter):
     """Writer for Markdown output format."""
@@ -79,6 +122,60 @@ class MarkdownWriter(BaseOutputWriter):
         Raises:
             IOError: If the file cannot be written.
         """
+        metadata_content = self._metadata_section(metadata)
+
+        # Combine content and metadata based on config
+        if metadata_content:
+            if self.metadata_position == "end":
+                final_content = content + "\n\n" + metadata_content
+            else: # Default to 'start' or if position is invalid
+                final_content = metadata_content + "\n\n" + content
+        else:
+            # If no metadata, just use the original content
+            final_content = content
+
+        # Write to file
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(final_content)
+        except IOError as e:
+            logger.error(f"Failed to write Markdown file {output_path}: {e}")
+            raise # Re-raise the exception
+
+    def write_stream(
+        self,
+        windows: Iterable[str],
+        output_path: Path,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write streamed content as Markdown, one window at a time.
+
+        A metadata section at the end reflects the metadata once all windows
+        have been read; one at the start only what is known before.
+        """
+        at_end = self.metadata_position == "end"
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                separator = ""
+                if not at_end:
+                    metadata_content = self._metadata_section(metadata)
+                    if metadata_content:
+                        f.write(metadata_content)
+                        separator = "\n\n"
+                for window in windows:
+                    f.write(separator)
+                    f.write(window)
+                    separator = WINDOW_SEPARATOR
+                if at_end:
+                    metadata_content = self._metadata_section(metadata)
+                    if metadata_content:
+                        f.write("\n\n" + metadata_content)
+        except IOError as e:
+            logger.error(f"Failed to write Markdown file {output_path}: {e}")
+            raise # Re-raise the exception
+
+    def _metadata_section(self, metadata: Optional[Dict[str, Any]]) -> str:
+        """Build the metadata section, or an empty string if there is none."""
         # Use stored configuration values
         include_metadata = self.include_metadata
         
@@ -118,23 +215,7 @@ class MarkdownWriter(BaseOutputWriter):
             if metadata_items:
                 metadata_content = "## Document Metadata\n\n" + "\n".join(metadata_items)
 
-        # Combine content and metadata based on config
-        if metadata_content:
-            if self.metadata_position == "end":
-                final_content = content + "\n\n" + metadata_content
-            else: # Default to 'start' or if position is invalid
-                final_content = metadata_content + "\n\n" + content
-        else:
-            # If no metadata, just use the original content
-            final_content = content
-
-        # Write to file
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(final_content)
-        except IOError as e:
-            logger.error(f"Failed to write Markdown file {output_path}: {e}")
-            raise # Re-raise the exception
+        return metadata_content
 
 
 class PlainTextWriter(BaseOutputWriter):
@@ -142,28 +223,30 @@ class PlainTextWriter(BaseOutputWriter):
     
     def __init__(self):
         """Initialize the PlainTextWriter."""
-        self.parser = None
-        if _markdown_it_available:
-            # Initialize markdown-it. We want it to produce standard HTML first.
-            # We will strip HTML tags later using BeautifulSoup.
-            self.parser = MarkdownIt(
-                options_update={
-                    'html': False,      # Keep this False to prevent raw HTML passthrough
-                    'linkify': True,    # Enable linkify to handle plain URLs
-                    'typographer': True # Enable smart quotes, etc.
-                }
-            ).enable('table') # Enable table parsing
-
-            if not _bs4_available:
-                 logger.warning("BeautifulSoup4 not found. Plain text output via markdown-it may not work correctly. Please install 'beautifulsoup4'.")
-
-            # Add known block-level tags
-            self._block_tags = {'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'div', 'blockquote', 'hr', 'table', 'tr', 'pre'}
-            # Add known void tags (don't need closing, handle special cases like <br>, <hr>)
-            self._void_tags = {'br', 'hr', 'img'}
-
-        else:
+        # Add known block-level tags
+        self._block_tags = {'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'div', 'blockquote', 'hr', 'table', 'tr', 'pre'}
+        # Add known void tags (don't need closing, handle special cases like <br>, <hr>)
+        self._void_tags = {'br', 'hr', 'img'}
+
+    def _create_parser(self) -> Any:
+        """Create the markdown-it parser on first use."""
+        if not _markdown_it_available:
             logger.warning("markdown-it-py not found. Plain text output might be suboptimal using regex.")
+            return None
+        from markdown_it import MarkdownIt
+
+        if not _bs4_available:
+             logger.warning("BeautifulSoup4 not found. Plain text output via markdown-it may not work correctly. Please install 'beautifulsoup4'.")
+
+        # Initialize markdown-it. We want it to produce standard HTML first.
+        # We will strip HTML tags later using BeautifulSoup.
+        return MarkdownIt(
+            options_update={
+                'html': False,      # Keep this False to prevent raw HTML passthrough
+                'linkify': True,    # Enable linkify to handle plain URLs
+                'typographer': True # Enable smart quotes, etc.
+            }
+        ).enable('table') # Enable table parsing
 
     def write(
         self, 
@@ -181,11 +264,52 @@ class PlainTextWriter(BaseOutputWriter):
         Raises:
             IOError: If the file cannot be written.
         """
+        plain_content = self._to_plain(content)
+
+        # Write to file
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(plain_content)
+        except IOError as e:
+            logger.error(f"Failed to write plain text file {output_path}: {e}")
+            raise # Re-raise the exception
+
+    def write_stream(
+        self,
+        windows: Iterable[str],
+        output_path: Path,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write streamed content as plain text, converting one window at a time.
+
+        Windows end at blank lines, so text made of separate blocks gives the
+        same file as ``write``. Where the conversion depends on blocks on both
+        sides of a window boundary it can differ: a fenced code block with a
+        blank line in it is converted as two blocks, and a heading keeps a
+        blank line before a list that starts the next window.
+        """
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                separator = ""
+                for window in windows:
+                    plain_window = self._to_plain(window)
+                    if plain_window:
+                        f.write(separator)
+                        f.write(plain_window)
+                        separator = WINDOW_SEPARATOR
+        except IOError as e:
+            logger.error(f"Failed to write plain text file {output_path}: {e}")
+            raise # Re-raise the exception
+
+    def _to_plain(self, content: str) -> str:
+        """Convert Markdown content to plain text."""
         plain_content = "" # Initialize plain_content
 
         # For plain text, convert markdown to plain text
         if self.parser and _bs4_available:
             try:
+                from bs4 import BeautifulSoup
+
                 html_content = self.parser.render(content)
                 soup = BeautifulSoup(html_content, 'html.parser')
                 # Replace get_text with manual traversal
@@ -208,16 +332,12 @@ class PlainTextWriter(BaseOutputWriter):
             # Fallback to basic regex if markdown-it library not available
             plain_content = self._markdown_to_plain_fallback(content)
 
-        # Write to file
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(plain_content)
-        except IOError as e:
-            logger.error(f"Failed to write plain text file {output_path}: {e}")
-            raise # Re-raise the exception
+        return plain_content
     
-    def _extract_text_from_soup(self, element: Union[Tag, NavigableString]) -> str:
+    def _extract_text_from_soup(self, element: Any) -> str:
         """Recursively extract text from BeautifulSoup elements, handling block/inline tags."""
+        from bs4 import NavigableString, Tag
+
         text = ''
         if isinstance(element, NavigableString):
             string = str(element).replace('\r\n', '\n').replace('\r', '\n')
@@ -261,8 +381,9 @@ class PlainTextWriter(BaseOutputWriter):
                    not child_text.startswith(('\n', ' ')):
                     text += ' '
                 
-                # Append the child text, merging spaces if needed
-                if text.endswith(' ') and child_text.startswith(' '):
+                # Append the child text, merging spaces if needed; a line
+                # never starts with the whitespace between two blocks
+                if text.endswith((' ', '\n')) and child_text.startswith(' '):
                     text += child_text.lstrip(' ')
                 else:
                     text += child_text
@@ -418,6 +539,38 @@ class JsonWriter(BaseOutputWriter):
             logger.error(f"Failed to serialize data to JSON for {output_path}: {e}")
             raise RuntimeError(f"JSON serialization error: {e}") from e
 
+    def write_stream(
+        self,
+        windows: Iterable[str],
+        output_path: Path,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write streamed content as JSON, escaping one window at a time.
+
+        The content string is written window by window; the rest of the
+        document, with the metadata, once all windows have been read.
+        """
+        content_start = '"content": "'
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write('{\n  ' + content_start)
+                separator = ""
+                for window in windows:
+                    # The JSON string literal without its quotes
+                    f.write(json.dumps(separator + window, ensure_ascii=False)[1:-1])
+                    separator = WINDOW_SEPARATOR
+                data: Dict[str, Any] = {"content": ""}
+                if metadata:
+                    data["metadata"] = metadata
+                closing = json.dumps(data, indent=2, ensure_ascii=False)
+                f.write(closing[closing.index(content_start) + len(content_start):])
+        except IOError as e:
+            logger.error(f"Failed to write JSON file {output_path}: {e}")
+            raise # Re-raise the exception
+        except TypeError as e: # Catch potential JSON serialization errors
+            logger.error(f"Failed to serialize data to JSON for {output_path}: {e}")
+            raise RuntimeError(f"JSON serialization error: {e}") from e
+
 
 class CsvWriter(BaseOutputWriter):
     """Writer for CSV output format.
@@ -425,15 +578,16 @@ class CsvWriter(BaseOutputWriter):
     Extracts the first table found in the Markdown content and writes it as CSV.
     If no table is found, writes the content line-by-line into a single column.
     """
-    def __init__(self):
-        """Initialize the CsvWriter."""
-        self.parser = None
-        if _markdown_it_available:
-            # Basic parser is enough, we will traverse tokens
-            # Enable the 'table' extension for parsing
-            self.parser = MarkdownIt().enable('table')
-        else:
+    def _create_parser(self) -> Any:
+        """Create the markdown-it parser on first use."""
+        if not _markdown_it_available:
             logger.warning("markdown-it-py not found. CSV output from tables might be suboptimal using regex.")
+            return None
+        from markdown_it import MarkdownIt
+
+        # Basic parser is enough, we will traverse tokens
+        # Enable the 'table' extension for parsing
+        return MarkdownIt().enable('table')
 
     def write(
         self, 
@@ -593,6 +747,131 @@ class CsvWriter(BaseOutputWriter):
         return extracted_tables
 
 
+class JsonlChunkWriter(BaseOutputWriter):
+    """Writer for chunked JSON Lines output, one retrieval chunk per line.
+
+    Each record holds the source path, chunk index, heading path, UTF-8 byte
+    offsets of the chunk in the processed text, its token count and its
+    text. Records are written as the chunker produces them.
+    """
+
+    accepts_source_path = True
+
+    def __init__(
+        self,
+        max_tokens: int = DEFAULT_CHUNK_TOKENS,
+        overlap_tokens: int = 0,
+        by_heading: bool = True,
+        encoding_name: str = DEFAULT_TOKENIZER_ENCODING,
+        exact: bool = True
+    ):
+        """Initialize the chunk writer.
+
+        Args:
+            max_tokens: Maximum tokens per chunk.
+            overlap_tokens: Tokens shared by consecutive chunks of a section.
+            by_heading: Start a new chunk at every heading.
+            encoding_name: tiktoken encoding chunks are measured in.
+            exact: Count with tiktoken; if False (or tiktoken is unavailable)
+                chunks are bounded by estimated tokens.
+        """
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.by_heading = by_heading
+        self.encoding_name = encoding_name
+        self.exact = exact
+
+    def write(
+        self,
+        content: str,
+        output_path: Path,
+        metadata: Optional[Dict[str, Any]] = None,
+        source_path: Optional[Union[str, Path]] = None
+    ) -> None:
+        """Write content as JSON Lines chunk records.
+
+        Args:
+            content: The content to write.
+            output_path: Path to the output file.
+            metadata: Optional metadata (not written).
+            source_path: Path of the document the content was extracted from;
+                defaults to the output path.
+
+        Raises:
+            IOError: If the file cannot be written.
+        """
+        self.write_stream([content], output_path, metadata, source_path=source_path)
+
+    def write_stream(
+        self,
+        windows: Iterable[str],
+        output_path: Path,
+        metadata: Optional[Dict[str, Any]] = None,
+        source_path: Optional[Union[str, Path]] = None
+    ) -> None:
+        """Write streamed content as JSON Lines chunk records, window by window.
+
+        Windows are chunked on their own, continuing the chunk numbering and
+        heading path of the previous window; byte offsets refer to the
+        windows joined with a blank line.
+        """
+        tokenizer = get_tokenizer(self.encoding_name) if self.exact else None
+        source = str(source_path if source_path is not None else output_path)
+        heading_stack: List[Tuple[int, str]] = []
+        chunk_count = 0
+        offset = 0
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                for window in windows:
+                    chunk_count = self._write_chunks(
+                        f, window, tokenizer, source, offset, chunk_count, heading_stack
+                    )
+                    offset += len(window.encode("utf-8", "surrogatepass")) + len(WINDOW_SEPARATOR)
+        except IOError as e:
+            logger.error(f"Failed to write JSONL file {output_path}: {e}")
+            raise # Re-raise the exception
+
+    def _write_chunks(
+        self,
+        f: TextIO,
+        content: str,
+        tokenizer: Any,
+        source: str,
+        offset: int,
+        chunk_count: int,
+        heading_stack: List[Tuple[int, str]]
+    ) -> int:
+        """Write the chunk records of one piece of content; returns the chunk count so far."""
+        data = content.encode("utf-8", "surrogatepass")
+        ends = token_end_offsets(content, tokenizer, data)
+        if tokenizer is not None:
+            # The metrics count the same text; reuse this encoding for them
+            get_token_service(self.encoding_name).remember(content, len(ends))
+
+        for chunk in iter_chunks(
+            content,
+            max_tokens=self.max_tokens,
+            overlap_tokens=self.overlap_tokens,
+            tokenizer=tokenizer,
+            by_heading=self.by_heading,
+            ends=ends,
+            heading_stack=heading_stack
+        ):
+            record = {
+                "source": source,
+                "chunk_index": chunk_count,
+                "heading_path": chunk.heading_path,
+                "start_byte": offset + chunk.start_byte,
+                "end_byte": offset + chunk.end_byte,
+                "token_count": chunk.token_count,
+                "text": chunk.text,
+            }
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+            chunk_count += 1
+        return chunk_count
+
+
 class OutputManager:
     """Manager for output writers.
     
@@ -615,14 +894,27 @@ class OutputManager:
             "plain_text": PlainTextWriter(), # Instantiated correctly
             "json": JsonWriter(),           # Instantiated correctly
             "csv": CsvWriter(),             # Instantiated correctly
+            "jsonl": self._create_chunk_writer(),
         }
+
+    def _create_chunk_writer(self) -> JsonlChunkWriter:
+        """Create the chunk writer; chunks default to the preset token_limit."""
+        max_tokens = self.config.get("chunking.max_tokens") or self.config.get("token_limit") or DEFAULT_CHUNK_TOKENS
+        return JsonlChunkWriter(
+            max_tokens=max_tokens,
+            overlap_tokens=self.config.get("chunking.overlap_tokens", 0),
+            by_heading=self.config.get("general.chunk_by_heading", True),
+            encoding_name=self.config.get("metrics.tokenizer_encoding", DEFAULT_TOKENIZER_ENCODING),
+            exact=self.config.get("metrics.exact_token_counts", True)
+        )
         
     def write(
         self, 
         content: str, 
         output_path: Union[str, Path], 
         format: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        source_path: Optional[Union[str, Path]] = None
     ) -> None:
         """Write content to the output file in the specified format.
         
@@ -632,6 +924,8 @@ class OutputManager:
             format: Output format. If None, it will be inferred from
                 the file extension or the default from config will be used.
             metadata: Optional metadata to include.
+            source_path: Path of the source document, recorded by writers
+                that accept it (chunked JSONL).
             
         Raises:
             IOError: If the file cannot be written.
@@ -639,15 +933,64 @@ class OutputManager:
         """
         if isinstance(output_path, str):
             output_path = Path(output_path)
+        # Write content using the appropriate writer
+        # Pass metadata to the writer
+        writer = self._get_writer(output_path, format)
+        if source_path is not None and writer.accepts_source_path:
+            writer.write(content, output_path, metadata, source_path=source_path)
+        else:
+            writer.write(content, output_path, metadata) # Pass metadata here
+
+    def write_stream(
+        self,
+        windows: Iterable[str],
+        output_path: Union[str, Path],
+        format: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        source_path: Optional[Union[str, Path]] = None
+    ) -> None:
+        """Write content given as windows of a streamed document.
+
+        Windows are written as they are produced by writers that support it
+        (see ``BaseOutputWriter.write_stream``).
 
+        Args:
+            windows: Processed windows, in document order.
+            output_path: Path to the output file.
+            format: Output format, resolved as in ``write``.
+            metadata: Optional metadata to include.
+            source_path: Path of the source document, recorded by writers
+                that accept it (chunked JSONL).
+
+        Raises:
+            IOError: If the file cannot be written.
+            ValueError: If the format is not supported.
+        """
+        if isinstance(output_path, str):
+            output_path = Path(output_path)
+        writer = self._get_writer(output_path, format)
+        if source_path is not None and writer.accepts_source_path:
+            writer.write_stream(windows, output_path, metadata, source_path=source_path)
+        else:
+            writer.write_stream(windows, output_path, metadata)
+
+    def embeds_source_path(self, format: str) -> bool:
+        """Whether output in a format records the path of its source document.
+
+        Args:
+            format: Output format, or one of its aliases.
+
+        Returns:
+            True if the writer for the format accepts ``source_path``.
+        """
+        writer = self.writers.get(FORMAT_ALIASES.get(format.lower(), format.lower()))
+        return writer is not None and writer.accepts_source_path
+
+    def _get_writer(self, output_path: Path, format: Optional[str]) -> BaseOutputWriter:
+        """Resolve the writer for a format and prepare the output directory."""
         # Normalize format aliases first
-        format_aliases = {
-            "text": "plain_text",
-            "txt": "plain_text",
-            "md": "markdown",
-        }
         if format:
-            format = format_aliases.get(format.lower(), format.lower())
+            format = FORMAT_ALIASES.get(format.lower(), format.lower())
 
 
         # Infer format from file extension if not provided or normalized
@@ -661,6 +1004,7 @@ class OutputManager:
                 "text": "plain_text", # Keep for extension mapping
                 "json": "json",
                 "csv": "csv",
+                "jsonl": "jsonl",
             }
 
             # Use config only here to get the default format if needed
@@ -674,8 +1018,6 @@ class OutputManager:
         # Create parent directories if they don't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write content using the appropriate writer
-        # Pass metadata to the writer
         writer = self.writers[format]
         logger.debug(f"Using writer '{writer.__class__.__name__}' for format '{format}'")
-        writer.write(content, output_path, metadata) # Pass metadata here
+        return writer
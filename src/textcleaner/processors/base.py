@@ -1,25 +1,81 @@
 """Base class for all text processors."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
+
+from textcleaner.utils.line_table import LineTable, as_text
 
 
 class BaseProcessor(ABC):
     """Base class for all text processors.
-    
+
     Each processor is responsible for a specific aspect of text processing,
     such as structure preservation, content cleaning, or optimization.
+
+    Large documents are processed as paragraph-aligned windows (see
+    ``ProcessorPipeline.process_stream``). A window-local processor gives
+    the same result on each window as on the whole document and needs
+    nothing more. Processors that depend on earlier windows set
+    ``window_local`` to False and override ``start_stream`` and
+    ``process_window`` to carry a small state from window to window.
+
+    Within ``ProcessorPipeline.process`` content is passed from processor
+    to processor through ``process_lines``, which may hand over a
+    ``LineTable`` instead of text. Processors with line-oriented stages
+    override it to keep working on the table, so the document is only
+    joined where a stage needs the whole text.
     """
-    
+
+    # Whether process() can be applied to each window of a document alone
+    window_local: bool = True
+
     @abstractmethod
     def process(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Process the content.
-        
+
         Args:
             content: The content to process.
             metadata: Optional metadata about the content.
-            
+
         Returns:
             Processed content.
         """
-        pass 
\ No newline at end of file
+        pass
+
+    def process_lines(
+        self, content: Union[str, LineTable], metadata: Optional[Dict[str, Any]] = None
+    ) -> Union[str, LineTable]:
+        """Process text or a line table, returning either.
+
+        Args:
+            content: The content to process.
+            metadata: Optional metadata about the content.
+
+        Returns:
+            Processed content, as text or as a line table.
+        """
+        return self.process(as_text(content), metadata)
+
+    def start_stream(self, metadata: Optional[Dict[str, Any]] = None) -> Any:
+        """Create the state carried between the windows of one document.
+
+        Args:
+            metadata: Optional metadata about the document.
+
+        Returns:
+            The state passed to every ``process_window`` call of the document.
+        """
+        return None
+
+    def process_window(self, window: str, state: Any, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Process one window of a document.
+
+        Args:
+            window: The window to process.
+            state: The state returned by ``start_stream`` for the document.
+            metadata: Optional metadata about the document.
+
+        Returns:
+            Processed window.
+        """
+        return self.process(window, metadata)
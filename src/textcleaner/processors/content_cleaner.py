@@ -2,17 +2,31 @@
 
 # import re # Removed unused import
 # import unicodedata # Removed unused import
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Dict, Optional, Union
 
 from .base import BaseProcessor
 from textcleaner.utils import content_cleaning as cc_utils
+from textcleaner.utils.line_table import LineTable, as_table, as_text
+from textcleaner.utils.rule_engine import RuleSet
+from textcleaner.utils.streaming import RecentSet
+
+# Bounds on the state shared by the windows of a streamed document
+STREAM_MAX_COUNTED_LINES = 100_000
+STREAM_MAX_SEEN_PARAGRAPHS = 250_000
 
 class ContentCleaner(BaseProcessor):
     """Processor for cleaning content.
     
     Removes extraneous content like headers, footers, page numbers,
     and cleans whitespace, unicode, duplicates, and boilerplate.
+
+    On a streamed document, repeated headers/footers and duplicate
+    paragraphs are recognized across windows: line counts and paragraph
+    fingerprints are carried from window to window, within fixed bounds.
     """
+
+    window_local = False
     
     def __init__(self,
                  remove_headers_footers: bool,
@@ -25,7 +39,8 @@ class ContentCleaner(BaseProcessor):
                  remove_irrelevant_metadata: bool, # Keep param for config compatibility
                  merge_short_paragraphs: bool,
                  remove_footnotes: bool, # Add new param
-                 join_paragraph_lines: bool): # Add param for joining lines
+                 join_paragraph_lines: bool, # Add param for joining lines
+                 custom_rules_file: Optional[str] = None):
         """Initialize the content cleaner.
         
         Args:
@@ -40,6 +55,11 @@ class ContentCleaner(BaseProcessor):
             merge_short_paragraphs: Merge adjacent short paragraphs.
             remove_footnotes: Remove lines identified as footnotes.
             join_paragraph_lines: Join lines within the same paragraph.
+            custom_rules_file: Optional YAML rule file (see RuleSet.from_file)
+                applied after boilerplate removal.
+
+        Raises:
+            ValueError: If the custom rule file is invalid.
         """
         self.remove_headers_footers = remove_headers_footers
         # self.remove_page_numbers = remove_page_numbers # Unused member (logic handled by remove_headers_footers)
@@ -52,47 +72,91 @@ class ContentCleaner(BaseProcessor):
         self.merge_short_paragraphs = merge_short_paragraphs
         self.remove_footnotes = remove_footnotes # Assign new param
         self.join_paragraph_lines = join_paragraph_lines # Assign new param
+        self.custom_rules = RuleSet.from_file(custom_rules_file) if custom_rules_file else None
         
     def process(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Apply all configured cleaning steps to the content."""
+        return as_text(self.process_lines(content, metadata))
+
+    def process_lines(
+        self, content: Union[str, LineTable], metadata: Optional[Dict[str, Any]] = None
+    ) -> Union[str, LineTable]:
+        """Apply the cleaning steps to text or a line table, returning either."""
         if not content:
             return content
-            
-        processed_content = content
-        
-        # Apply header/footer removal (also handles page numbers)
-        if self.remove_headers_footers:
-            processed_content = cc_utils.remove_headers_footers(processed_content)
-        
-        # Add footnote removal EARLY, before duplicate/boilerplate removal
-        if self.remove_footnotes:
-            processed_content = cc_utils.remove_footnotes(processed_content)
-        
-        # Removed confusing conditional block for remove_page_numbers as it's handled above
-        # if self.remove_page_numbers and not self.remove_headers_footers:
-        #     pass 
+        return self._clean(content)
+
+    def start_stream(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Create the line counts and paragraph fingerprints shared by the windows."""
+        return {
+            "repeated_lines": {},
+            "seen_paragraphs": RecentSet(STREAM_MAX_SEEN_PARAGRAPHS),
+        }
 
-        # Step 1: Clean basic whitespace and normalize paragraph separators
-        if self.clean_whitespace:
-            processed_content = cc_utils.clean_whitespace(processed_content)
+    def process_window(self, window: str, state: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Clean one window of a streamed document."""
+        if not window:
+            return window
+        cleaned = as_text(self._clean(window, state["repeated_lines"], state["seen_paragraphs"]))
+        cc_utils.prune_line_counts(state["repeated_lines"], STREAM_MAX_COUNTED_LINES)
+        return cleaned
 
-        # Step 2: Join lines within paragraphs
-        if self.join_paragraph_lines:
-            processed_content = cc_utils.join_paragraph_lines(processed_content)
+    def _clean(
+        self,
+        content: Union[str, LineTable],
+        repeated_lines: Optional[Dict[str, int]] = None,
+        seen_paragraphs: Optional[RecentSet] = None
+    ) -> Union[str, LineTable]:
+        """Apply the cleaning steps, sharing the given state with other windows.
+
+        The content is only joined into text for the steps that work on the
+        whole text (duplicate and boilerplate removal, custom rules, unicode
+        normalization); if none of them is enabled the result is a table.
+        """
+        processed_content = content
+        remove_headers_footers = cc_utils.remove_headers_footers
+        remove_duplicates = cc_utils.remove_duplicates
+        if repeated_lines is not None:
+            remove_headers_footers = partial(remove_headers_footers, repeated_lines=repeated_lines)
+            remove_duplicates = partial(remove_duplicates, seen_paragraphs=seen_paragraphs)
+
+        # The first steps all work line by line. When more than one of them
+        # is enabled they share one line table, so the document is split once
+        # and only joined again after the last of them (a table handed over
+        # by the previous processor is used as is).
+        line_steps = [
+            step for enabled, step in (
+                # Header/footer removal (also handles page numbers)
+                (self.remove_headers_footers, remove_headers_footers),
+                # Footnote removal EARLY, before duplicate/boilerplate removal
+                (self.remove_footnotes, cc_utils.remove_footnotes),
+                # Step 1: Clean basic whitespace and normalize paragraph separators
+                (self.clean_whitespace, cc_utils.clean_whitespace),
+                # Step 2: Join lines within paragraphs
+                (self.join_paragraph_lines, cc_utils.join_paragraph_lines),
+            ) if enabled
+        ]
+        if len(line_steps) > 1:
+            processed_content = as_table(processed_content)
+        for step in line_steps:
+            processed_content = step(processed_content)
 
         # Step 3: Remove duplicates now that paragraphs are formed and separated consistently
         if self.remove_duplicate_content:
-            processed_content = cc_utils.remove_duplicates(processed_content)
+            processed_content = remove_duplicates(as_text(processed_content))
         
         if self.remove_boilerplate:
-            processed_content = cc_utils.remove_boilerplate_text(processed_content)
+            processed_content = cc_utils.remove_boilerplate_text(as_text(processed_content))
+
+        if self.custom_rules is not None:
+            processed_content = self.custom_rules.sub(as_text(processed_content))
         
         if self.merge_short_paragraphs:
-            processed_content = cc_utils.merge_short_paragraphs(processed_content)
+            processed_content = cc_utils.merge_short_paragraphs(as_table(processed_content))
         
         if self.normalize_unicode:
-            processed_content = cc_utils.normalize_unicode(processed_content)
+            processed_content = cc_utils.normalize_unicode(as_text(processed_content))
         
         # Placeholder comments for watermark/metadata removal logic removed
 
-        return processed_content.strip() # Return stripped content 
\ No newline at end of file
+        return processed_content.strip() # Return stripped content (LineTable.strip for a table) 
\ No newline at end of file
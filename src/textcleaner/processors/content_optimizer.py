@@ -2,11 +2,13 @@
 
 # import re # Removed unused import
 # import textwrap # Removed unused import
-from typing import Any, Dict, List, Optional
+import importlib.util
+from typing import Any, Dict, List, Optional, Union
 
 from .base import BaseProcessor
 from textcleaner.utils.logging_config import get_logger
 from textcleaner.utils import content_optimizations as co_utils
+from textcleaner.utils.line_table import LineTable, as_table, as_text
 
 # Conditional imports for optimizers
 try:
@@ -15,11 +17,19 @@ try:
 except ImportError:
     _replacements_available = False
 
-try:
-    from textcleaner.utils.word_simplifier import WordNetSimplifier
-    _wordnet_available = True
-except ImportError:
-    _wordnet_available = False
+# NLTK is slow to import, so the simplifier module is only imported once
+# vocabulary simplification is actually enabled
+_wordnet_available = importlib.util.find_spec("nltk") is not None
+WordNetSimplifier = None
+
+
+def _word_simplifier_class():
+    """Import and return WordNetSimplifier on first use."""
+    global WordNetSimplifier
+    if WordNetSimplifier is None:
+        from textcleaner.utils.word_simplifier import WordNetSimplifier as simplifier_class
+        WordNetSimplifier = simplifier_class
+    return WordNetSimplifier
 
 
 class ContentOptimizer(BaseProcessor):
@@ -41,8 +51,13 @@ class ContentOptimizer(BaseProcessor):
                  remove_excessive_punctuation: bool,
                  domain_abbreviations: List[str] = [],
                  simplify_vocabulary: bool = True,
+                 synonym_lexicon: Optional[str] = None,
                  ):
-        """Initialize the content optimizer."""
+        """Initialize the content optimizer.
+
+        ``synonym_lexicon`` is an optional precomputed lexicon file used for
+        vocabulary simplification instead of querying WordNet at runtime.
+        """
         self.logger = get_logger(__name__)
         
         # Store config flags
@@ -72,9 +87,10 @@ class ContentOptimizer(BaseProcessor):
                 
         if simplify_vocabulary:
             if _wordnet_available:
-                self.word_simplifier = WordNetSimplifier(
-                    min_word_length=min_word_length
-                )
+                simplifier_options: Dict[str, Any] = {"min_word_length": min_word_length}
+                if synonym_lexicon:
+                    simplifier_options["lexicon_path"] = synonym_lexicon
+                self.word_simplifier = _word_simplifier_class()(**simplifier_options)
                 self.logger.debug("WordNetSimplifier enabled.")
             else:
                 self.logger.warning("NLTK not available, cannot simplify vocabulary (simplify_vocabulary=True).")
@@ -84,6 +100,16 @@ class ContentOptimizer(BaseProcessor):
         
     def process(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Apply all configured optimization steps to the content."""
+        return as_text(self.process_lines(content, metadata))
+
+    def process_lines(
+        self, content: Union[str, LineTable], metadata: Optional[Dict[str, Any]] = None
+    ) -> Union[str, LineTable]:
+        """Apply the optimization steps to text or a line table, returning either.
+
+        Line wrapping works on a table; the other steps rewrite the whole
+        text (repeated words are condensed across line breaks too).
+        """
         if not content:
             return content
             
@@ -91,23 +117,25 @@ class ContentOptimizer(BaseProcessor):
         
         # Apply optimizations step-by-step
         if self.text_simplifier and self.config.get("abbreviate_common_terms"):
-            processed_content = self.text_simplifier.simplify(processed_content)
+            processed_content = self.text_simplifier.simplify(as_text(processed_content))
         if self.domain_optimizer:
-            processed_content = self.domain_optimizer.optimize(processed_content)
+            processed_content = self.domain_optimizer.optimize(as_text(processed_content))
         if self.word_simplifier:
-            processed_content = self.word_simplifier.simplify(processed_content)
+            processed_content = self.word_simplifier.simplify(as_text(processed_content))
             
         if self.config["remove_redundant_phrases"]:
-            processed_content = co_utils.remove_redundant_phrases(processed_content)
+            processed_content = co_utils.remove_redundant_phrases(as_text(processed_content))
         if self.config["condense_repetitive_patterns"]:
-            processed_content = co_utils.condense_repetitive_patterns(processed_content)
+            processed_content = co_utils.condense_repetitive_patterns(as_text(processed_content))
         if self.config["remove_excessive_punctuation"]:
-            processed_content = co_utils.remove_excessive_punctuation(processed_content)
+            processed_content = co_utils.remove_excessive_punctuation(as_text(processed_content))
         if self.config["simplify_citations"]:
-            processed_content = co_utils.simplify_citations(processed_content)
+            processed_content = co_utils.simplify_citations(as_text(processed_content))
         if self.config["simplify_urls"]:
-            processed_content = co_utils.simplify_urls(processed_content)
+            processed_content = co_utils.simplify_urls(as_text(processed_content))
         if self.config["max_line_length"] > 0:
-            processed_content = co_utils.optimize_line_length(processed_content, self.config["max_line_length"])
+            processed_content = co_utils.optimize_line_length(
+                as_table(processed_content, newline_only=True), self.config["max_line_length"]
+            )
         
         return processed_content 
\ No newline at end of file
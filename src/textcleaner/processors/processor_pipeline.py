@@ -1,10 +1,11 @@
 """Processing pipeline for text content."""
 
 # from abc import ABC, abstractmethod # Removed unused imports
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 import time
 
 from textcleaner.config.config_manager import ConfigManager
+from textcleaner.utils.line_table import as_text
 from textcleaner.utils.logging_config import get_logger # Added logger import
 
 # Import base and concrete processors
@@ -12,6 +13,7 @@ from .base import BaseProcessor # Import from the new base.py
 from .structure_processor import StructureProcessor
 from .content_cleaner import ContentCleaner
 from .content_optimizer import ContentOptimizer
+from .token_budget_processor import TokenBudgetProcessor
 
 # BaseProcessor class definition removed from here
 
@@ -60,7 +62,8 @@ class ProcessorPipeline:
                 remove_irrelevant_metadata=self.config.get("cleaning.remove_irrelevant_metadata", True),
                 merge_short_paragraphs=self.config.get("cleaning.merge_short_paragraphs", True),
                 remove_footnotes=self.config.get("cleaning.remove_footnotes", False),
-                join_paragraph_lines=self.config.get("cleaning.join_paragraph_lines", True)
+                join_paragraph_lines=self.config.get("cleaning.join_paragraph_lines", True),
+                custom_rules_file=self.config.get("cleaning.custom_rules_file")
             ))
         
         # --- Add Content Optimizer --- 
@@ -75,12 +78,24 @@ class ProcessorPipeline:
                 max_line_length=self.config.get("optimization.max_line_length", 0), # Default 0 (no wrap)
                 simplify_vocabulary=self.config.get("optimization.simplify_vocabulary", False),
                 min_word_length=self.config.get("optimization.min_word_length", 5),
+                synonym_lexicon=self.config.get("optimization.synonym_lexicon"),
                 condense_repetitive_patterns=self.config.get("optimization.condense_repetitive_patterns", True),
                 remove_redundant_phrases=self.config.get("optimization.remove_redundant_phrases", True),
                 remove_excessive_punctuation=self.config.get("optimization.remove_excessive_punctuation", True),
                 domain_abbreviations=self.config.get("optimization.domain_abbreviations", [])
             ))
             
+        # --- Add Token Budget Processor ---
+        # Runs last so the limit (set by the LLM presets) applies to the final text
+        token_limit = self.config.get("token_limit")
+        if self.config.get("token_budget.enforce", False) and token_limit:
+            self.processors.append(TokenBudgetProcessor(
+                token_limit=int(token_limit),
+                encoding_name=self.config.get("metrics.tokenizer_encoding", "cl100k_base"),
+                exact=self.config.get("metrics.exact_token_counts", True),
+                min_fill=self.config.get("token_budget.min_fill", 0.9)
+            ))
+            
         # TODO: Consider a more dynamic way to load/configure processors based on config.
         
     def process(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
@@ -92,6 +107,10 @@ class ProcessorPipeline:
             
         Returns:
             Fully processed content.
+
+        Processors hand the content over with ``process_lines``, so a line
+        table built by one processor is reused by the line stages of the
+        next and the text is only joined where a stage needs it.
         """
         processed_content = content
         # Log initial content length
@@ -100,11 +119,40 @@ class ProcessorPipeline:
         for processor in self.processors:
             processor_name = processor.__class__.__name__
             start_time = time.time()
-            # Log content length before processing
-            self.logger.debug(f"Before {processor_name}: length={len(processed_content)}")
-            processed_content = processor.process(processed_content, metadata)
+            processed_content = processor.process_lines(processed_content, metadata)
             end_time = time.time()
-            # Log content length after processing and time taken
-            self.logger.debug(f"After {processor_name}: length={len(processed_content)}, took {end_time - start_time:.4f}s")
+            # Log the time taken (the length is only known for text; tables are not joined for a log line)
+            if isinstance(processed_content, str):
+                self.logger.debug(f"After {processor_name}: length={len(processed_content)}, took {end_time - start_time:.4f}s")
+            else:
+                self.logger.debug(f"After {processor_name}: {len(processed_content)} lines, took {end_time - start_time:.4f}s")
             
-        return processed_content
+        return as_text(processed_content)
+
+    def process_stream(self, windows: Iterable[str], metadata: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Process a document given as paragraph-aligned windows.
+
+        Each window passes through all processors before the next is read,
+        so only one window is held at a time. Processors that are not
+        window-local carry their state between the windows of the document
+        (see ``BaseProcessor.start_stream``).
+
+        Args:
+            windows: Consecutive windows of the document.
+            metadata: Optional metadata about the document.
+
+        Yields:
+            Processed windows; windows processed to nothing are skipped.
+        """
+        states = [processor.start_stream(metadata) for processor in self.processors]
+        self.logger.debug(
+            "Streaming through processors; carrying state for "
+            f"{[type(p).__name__ for p in self.processors if not p.window_local]}"
+        )
+        for window in windows:
+            for processor, state in zip(self.processors, states):
+                window = processor.process_window(window, state, metadata)
+                if not window:
+                    break
+            if window:
+                yield window
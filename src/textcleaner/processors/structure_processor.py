@@ -1,10 +1,11 @@
 """Processor for preserving document structure."""
 
 # import re # Removed unused import
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from .base import BaseProcessor
 from textcleaner.utils import structure_operations as so_utils
+from textcleaner.utils.line_table import LineTable, as_table, as_text
 
 class StructureProcessor(BaseProcessor):
     """Processor for preserving document structure.
@@ -44,6 +45,12 @@ class StructureProcessor(BaseProcessor):
         Returns:
             Content with preserved structure.
         """
+        return as_text(self.process_lines(content, metadata))
+
+    def process_lines(
+        self, content: Union[str, LineTable], metadata: Optional[Dict[str, Any]] = None
+    ) -> Union[str, LineTable]:
+        """Process text or a line table; headings are formatted on a table."""
         if not content:
             return content
             
@@ -52,10 +59,10 @@ class StructureProcessor(BaseProcessor):
         # Only standardize if preserve_lists is NOT set to True explicitly
         # This maintains original list markers if preservation is desired.
         if not self.preserve_lists:
-            processed_content = so_utils.standardize_lists(processed_content)
+            processed_content = so_utils.standardize_lists(as_text(processed_content))
 
         if self.preserve_headings:
-            processed_content = so_utils.format_headings(processed_content)
+            processed_content = so_utils.format_headings(as_table(processed_content, newline_only=True))
 
         # Placeholder comments for future table/link preservation logic removed
 
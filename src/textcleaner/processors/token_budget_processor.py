@@ -0,0 +1,137 @@
+"""Processor for fitting content into a token budget."""
+
+from typing import Any, Dict, Optional
+
+from .base import BaseProcessor
+from textcleaner.utils.logging_config import get_logger
+from textcleaner.utils.metrics import DEFAULT_TOKENIZER_ENCODING, get_tokenizer
+from textcleaner.utils.token_budget import (
+    MAX_DROPPED_HEADINGS, fit_to_token_budget, headings_after, token_end_offsets
+)
+
+
+class TokenBudgetProcessor(BaseProcessor):
+    """Processor that cuts content to fit a token limit.
+
+    Runs last in the pipeline so that the limit applies to the final text.
+    Content is cut at a heading, paragraph or sentence boundary, and what
+    was dropped is recorded under ``token_budget`` in the metadata.
+
+    On a streamed document the budget is shared by the windows: windows are
+    kept until the budget is spent, the window that exceeds it is cut, and
+    later windows are dropped.
+    """
+
+    window_local = False
+
+    def __init__(self,
+                 token_limit: int,
+                 encoding_name: str = DEFAULT_TOKENIZER_ENCODING,
+                 exact: bool = True,
+                 min_fill: float = 0.9):
+        """Initialize the token budget processor.
+
+        Args:
+            token_limit: Maximum number of tokens in the processed content.
+            encoding_name: tiktoken encoding the limit is measured in.
+            exact: Count with tiktoken; if False (or tiktoken is unavailable)
+                the limit applies to estimated tokens.
+            min_fill: Share of the budget a preferred boundary must keep
+                before a finer boundary is used instead.
+        """
+        self.logger = get_logger(__name__)
+        self.token_limit = token_limit
+        self.encoding_name = encoding_name
+        self.exact = exact
+        self.min_fill = min_fill
+
+    def process(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Cut the content to the token limit if it is longer.
+
+        Args:
+            content: The content to process.
+            metadata: Optional metadata; receives the ``token_budget`` report.
+
+        Returns:
+            Content within the token limit.
+        """
+        if not content or self.token_limit <= 0:
+            return content
+
+        tokenizer = get_tokenizer(self.encoding_name) if self.exact else None
+        fitted, report = fit_to_token_budget(content, self.token_limit, tokenizer, self.min_fill)
+        if report["truncated"]:
+            self.logger.info(
+                f"Cut content at a {report['cut_at']} boundary to fit {self.token_limit} tokens "
+                f"(dropped {report['dropped_tokens']} of {report['original_tokens']})"
+            )
+        if metadata is not None:
+            metadata["token_budget"] = report
+        return fitted
+
+    def start_stream(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Create the budget report the windows of a document add to."""
+        tokenizer = get_tokenizer(self.encoding_name) if self.exact else None
+        report: Dict[str, Any] = {
+            "token_limit": self.token_limit,
+            "exact": tokenizer is not None,
+            "original_tokens": 0,
+            "truncated": False,
+            "kept_tokens": 0,
+        }
+        if metadata is not None:
+            metadata["token_budget"] = report
+        return {"tokenizer": tokenizer, "report": report, "separators": 0}
+
+    def process_window(self, window: str, state: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Keep, cut or drop one window of a streamed document.
+
+        Args:
+            window: The window to process.
+            state: The state returned by ``start_stream``.
+            metadata: Optional metadata (the report is added by ``start_stream``).
+
+        Returns:
+            The window, the part of it within the remaining budget, or an
+            empty string once the budget is spent.
+        """
+        if not window or self.token_limit <= 0:
+            return window
+
+        tokenizer, report = state["tokenizer"], state["report"]
+        # Kept windows are joined by a blank line, a token of its own
+        remaining = self.token_limit - report["kept_tokens"] - state["separators"]
+        if report["truncated"] or remaining < 1:
+            # The budget is spent: drop the window, recording what it held
+            data = window.encode("utf-8", "surrogatepass")
+            tokens = len(token_end_offsets(window, tokenizer, data))
+            titles, heading_count = headings_after(data, 0)
+            if not report["truncated"]:
+                report.update({
+                    "truncated": True,
+                    "dropped_tokens": 0,
+                    "dropped_characters": 0,
+                    "cut_at": "paragraph",  # Windows end at paragraph breaks
+                    "dropped_headings": [],
+                    "dropped_heading_count": 0,
+                })
+            report["original_tokens"] += tokens
+            report["dropped_tokens"] += tokens
+            report["dropped_characters"] += len(window)
+            report["dropped_headings"].extend(titles[:MAX_DROPPED_HEADINGS - len(report["dropped_headings"])])
+            report["dropped_heading_count"] += heading_count
+            return ""
+
+        fitted, window_report = fit_to_token_budget(window, remaining, tokenizer, self.min_fill)
+        report["original_tokens"] += window_report["original_tokens"]
+        report["kept_tokens"] += window_report["kept_tokens"]
+        if fitted and tokenizer is not None:
+            state["separators"] += 1
+        if window_report["truncated"]:
+            for key in ("truncated", "dropped_tokens", "dropped_characters", "cut_at",
+                        "dropped_headings", "dropped_heading_count"):
+                report[key] = window_report[key]
+            self.logger.info(
+                f"Cut streamed content at a {report['cut_at']} boundary to fit {self.token_limit} tokens"
+            )
+        return fitted
@@ -1,5 +1,13 @@
 """TextCleaner utility modules."""
 
-from textcleaner.utils.word_simplifier import WordNetSimplifier
-
 __all__ = ['WordNetSimplifier']
+
+
+def __getattr__(name):
+    # Imported on first access: NLTK is slow to import and most utilities
+    # do not need it
+    if name == 'WordNetSimplifier':
+        from textcleaner.utils.word_simplifier import WordNetSimplifier
+        globals()[name] = WordNetSimplifier
+        return WordNetSimplifier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
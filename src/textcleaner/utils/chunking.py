@@ -0,0 +1,168 @@
+"""Heading-aware, token-bounded chunking for retrieval (RAG) ingestion.
+
+Chunks are produced lazily from one tokenization of the document: the
+token end offsets that bound the token budget (see
+``textcleaner.utils.token_budget``) give every chunk its token count by
+binary search, so no chunk is encoded on its own.
+
+With ``by_heading`` a new chunk starts at every Markdown heading, and a
+heading directly followed by a subheading is kept with the subsection.
+Sections longer than the token bound are split at paragraph, sentence or
+word boundaries, and consecutive pieces of a section share
+``overlap_tokens`` tokens. Every chunk carries the path of headings it is
+under and its UTF-8 byte offsets in the document.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+from textcleaner.utils.token_budget import HEADING_PATTERN, find_cut, token_end_offsets
+
+# A section is only split at a boundary that keeps this share of the bound
+CHUNK_MIN_FILL = 0.5
+
+DEFAULT_CHUNK_TOKENS = 512
+
+
+@dataclass
+class Chunk:
+    """A piece of a document within the token bound."""
+    index: int
+    text: str
+    heading_path: List[str] = field(default_factory=list)
+    start_byte: int = 0
+    end_byte: int = 0
+    token_count: int = 0
+
+
+def _sections(
+    data: bytes,
+    by_heading: bool,
+    stack: List[Tuple[int, str]]
+) -> Iterator[Tuple[int, int, List[str]]]:
+    """Split a document at headings.
+
+    Args:
+        data: The document encoded as UTF-8.
+        by_heading: Split at headings.
+        stack: Levels and titles of the headings the document starts under,
+            updated in place with the headings of the document.
+
+    Yields:
+        Start and end byte offsets of each section and the heading path of
+        its own heading. Without ``by_heading`` the document is one section.
+    """
+    headings = list(HEADING_PATTERN.finditer(data)) if by_heading else []
+    if not headings:
+        yield 0, len(data), [title for _, title in stack]
+        return
+
+    if data[:headings[0].start()].strip():
+        yield 0, headings[0].start(), [title for _, title in stack]
+
+    pending_start: Optional[int] = None
+    for position, match in enumerate(headings):
+        level = len(match.group(1))
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        stack.append((level, match.group(2).decode("utf-8", "replace").strip()))
+
+        end = headings[position + 1].start() if position + 1 < len(headings) else len(data)
+        next_level = len(headings[position + 1].group(1)) if position + 1 < len(headings) else 0
+        if not data[match.end():end].strip() and next_level > level:
+            # A heading directly followed by a subheading stays with it
+            if pending_start is None:
+                pending_start = match.start()
+            continue
+        yield (match.start() if pending_start is None else pending_start), end, [title for _, title in stack]
+        pending_start = None
+
+
+def _strip_span(data: bytes, start: int, end: int) -> Tuple[int, int]:
+    """Narrow a byte span to exclude surrounding whitespace and split characters."""
+    while start < end and (data[start] & 0xC0) == 0x80:
+        start += 1
+    segment = data[start:end]
+    stripped = segment.strip()
+    if not stripped:
+        return start, start
+    start += len(segment) - len(segment.lstrip())
+    return start, start + len(stripped)
+
+
+def iter_chunks(
+    text: str,
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = 0,
+    tokenizer: Any = None,
+    by_heading: bool = True,
+    ends: Optional[Any] = None,
+    heading_stack: Optional[List[Tuple[int, str]]] = None
+) -> Iterator[Chunk]:
+    """Split a document into chunks of at most ``max_tokens`` tokens.
+
+    Args:
+        text: Document to split.
+        max_tokens: Maximum tokens per chunk.
+        overlap_tokens: Tokens repeated from the end of a chunk at the start
+            of the next chunk of the same section.
+        tokenizer: tiktoken encoding to count with; None counts estimated
+            tokens instead.
+        by_heading: Start a new chunk at every heading.
+        ends: Token end offsets of the text, if already computed.
+        heading_stack: Levels and titles of the headings the text is
+            under, updated in place as headings are read; lets a streamed
+            document be chunked window by window.
+
+    Yields:
+        Chunks in document order. Token counts are those of the tokens of
+        the document the chunk covers.
+
+    Raises:
+        ValueError: If ``max_tokens`` is less than 1 or ``overlap_tokens``
+            is not smaller than it.
+    """
+    if max_tokens < 1:
+        raise ValueError(f"Chunk size must be at least 1 token, got {max_tokens}")
+    if not 0 <= overlap_tokens < max_tokens:
+        raise ValueError(f"Chunk overlap must be between 0 and {max_tokens - 1} tokens, got {overlap_tokens}")
+
+    data = text.encode("utf-8", "surrogatepass")
+    if ends is None:
+        ends = token_end_offsets(text, tokenizer, data)
+    kinds = ("paragraph", "sentence") if by_heading else ("heading", "paragraph", "sentence")
+
+    index = 0
+    if heading_stack is None:
+        heading_stack = []
+    for section_start, section_end, path in _sections(data, by_heading, heading_stack):
+        start = section_start
+        first_token = bisect_right(ends, start)
+        end_token = bisect_right(ends, section_end)
+        while True:
+            if end_token - first_token <= max_tokens:
+                cut, cut_token = section_end, end_token
+            else:
+                cut, _ = find_cut(data, ends, max_tokens, CHUNK_MIN_FILL, first_token, kinds)
+                cut_token = bisect_right(ends, cut)
+
+            chunk_start, chunk_end = _strip_span(data, start, cut)
+            if chunk_end > chunk_start:
+                yield Chunk(
+                    index=index,
+                    text=data[chunk_start:chunk_end].decode("utf-8", "ignore"),
+                    heading_path=list(path),
+                    start_byte=chunk_start,
+                    end_byte=chunk_end,
+                    token_count=cut_token - first_token,
+                )
+                index += 1
+            if cut >= section_end:
+                break
+
+            if overlap_tokens:
+                first_token = max(first_token + 1, cut_token - overlap_tokens)
+                start = ends[first_token - 1]
+            else:
+                first_token, start = cut_token, cut
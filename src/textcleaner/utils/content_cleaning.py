@@ -3,6 +3,11 @@
 import re
 import unicodedata
 import logging
+from typing import Dict, Optional, Set, Union
+
+from textcleaner.utils.line_table import BLANK, HEADING, LIST_ITEM, LineTable, TextOrTable, as_table
+from textcleaner.utils.rule_engine import Rule, RuleSet
+from textcleaner.utils.streaming import RecentSet
 
 logger = logging.getLogger(__name__)
 
@@ -23,82 +28,109 @@ HEADER_FOOTER_PATTERNS = [
     # r'(?i)^\s*(?:##?#? )?(FOOTER|HEADER)\s*[-=]{3,}\s*$' # Commented out for now
     # Removed the generic separator pattern: r'^\s*[-=]{3,}\s*$'
 ]
+# All header/footer patterns in one anchored alternation: a line is tested
+# once and most lines are rejected at their first character
+HEADER_FOOTER_RULES = RuleSet(HEADER_FOOTER_PATTERNS, name="header/footer")
 
-# Common patterns for boilerplate text
-BOILERPLATE_PATTERNS = [
-    r'(?i)all rights reserved\.?.*',
-    r'(?i)confidentiality notice:.*',
-    r'(?i)this (email|document) (contains|is) confidential.*',
-    r'(?i)disclaimer:.*',
-    r'(?i)if you (have received|are not).*in error.*',
-    r'(?i)sent from my (iphone|ipad|android|mobile device)',
-    r'(?i)(tel|phone|fax|email):\s*[\w.@+-]+',
-    r'(?i)copyright\s+©?\s*\d{4}.*',
-    r'(?i)privacy policy.*',
-    r'(?i)please (find|see) (the attached|attached) (file|document)'
-]
+# Common boilerplate text; each rule lists literals one of which any match
+# contains, so documents without them are not scanned at all
+BOILERPLATE_RULES = RuleSet([
+    Rule(r'(?i)all rights reserved\.?.*', keywords=('all rights reserved',)),
+    Rule(r'(?i)confidentiality notice:.*', keywords=('confidentiality notice:',)),
+    Rule(r'(?i)this (email|document) (contains|is) confidential.*', keywords=('confidential',)),
+    Rule(r'(?i)disclaimer:.*', keywords=('disclaimer:',)),
+    Rule(r'(?i)if you (have received|are not).*in error.*', keywords=('in error',)),
+    Rule(r'(?i)sent from my (iphone|ipad|android|mobile device)', keywords=('sent from my',)),
+    Rule(r'(?i)(tel|phone|fax|email):\s*[\w.@+-]+', keywords=('tel:', 'phone:', 'fax:', 'email:')),
+    Rule(r'(?i)copyright\s+©?\s*\d{4}.*', keywords=('copyright',)),
+    Rule(r'(?i)privacy policy.*', keywords=('privacy policy',)),
+    Rule(r'(?i)please (find|see) (the attached|attached) (file|document)', keywords=('attached',)),
+], name="boilerplate")
+BOILERPLATE_PATTERNS = BOILERPLATE_RULES.patterns
+
+_MULTIPLE_SPACES = re.compile(r' {2,}')
+
+# How many times a line must repeat to be removed as a header/footer
+HEADER_FOOTER_REPEAT_THRESHOLD = 3
 
-def remove_headers_footers(content: str) -> str:
-    """Remove common headers, footers, and page numbers."""
-    lines = content.splitlines()
-    cleaned_lines = []
-    repeated_lines = {} # Track frequency of lines
-    header_footer_candidate_threshold = 3 # How many times a line must repeat
+def remove_headers_footers(content: TextOrTable, repeated_lines: Optional[Dict[str, int]] = None) -> TextOrTable:
+    """Remove common headers, footers, and page numbers.
+
+    Args:
+        content: Text or line table to clean.
+        repeated_lines: Counts of the lines seen so far, updated in place;
+            lets the windows of a streamed document share their counts.
+    """
+    table = as_table(content)
+    header_footer_candidate_threshold = HEADER_FOOTER_REPEAT_THRESHOLD
     max_hf_length = 100 # Max length for a line to be considered header/footer by repetition
+    indices = table.indices()
+    # Undo point for the safeguard below
+    original_state = table.checkpoint()
+    if repeated_lines is None:
+        repeated_lines = {} # Track frequency of lines
+    cleaned_line_count = 0 # Non-empty lines kept
     
-    for line in lines:
+    for index, line in zip(indices, table.lines(indices)):
         line_stripped = line.strip()
         
         if not line_stripped:
-            cleaned_lines.append('') # Keep empty lines for structure
+            if line:
+                table.rewrite(index, '') # Keep empty lines for structure
             continue
-        
-        # DEBUG: Inspect the line being checked
-        # if "FOOTER" in line_stripped:
-        #     print(f"DEBUG H/F: Checking line: {repr(line_stripped)}") # Use repr to see hidden chars
 
-        skip_line = False
         # Check against predefined patterns
-        for pattern in HEADER_FOOTER_PATTERNS:
-            # DEBUG: Show pattern being checked for FOOTER line
-            # if "FOOTER" in line_stripped:
-            #     print(f"DEBUG H/F: Checking pattern {repr(pattern)} against line {repr(line_stripped)}")
-
-            # Use re.search instead of re.match to find pattern anywhere in the line
-            # Although patterns use ^/$, this might handle subtle cases differently
-            # Ensure re.IGNORECASE flag is removed as patterns use inline (?i)
-            if re.search(pattern, line_stripped):
-                # print(f"DEBUG H/F: Matched pattern '{pattern}' on line: {line_stripped[:50]}...") # DEBUG
-                skip_line = True
-                break
-        if skip_line: continue
+        if HEADER_FOOTER_RULES.matches(line_stripped):
+            table.drop(index)
+            continue
         
         # Check for repetition
         repeated_lines[line_stripped] = repeated_lines.get(line_stripped, 0) + 1
         if repeated_lines[line_stripped] >= header_footer_candidate_threshold and len(line_stripped) < max_hf_length:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"HeaderFooterFilter: Skipping repeated line: {line_stripped[:50]}...")
-            skip_line = True
-            
-        if not skip_line:
-            cleaned_lines.append(line)
+            table.drop(index)
+            continue
+        cleaned_line_count += 1
     
     # Safeguard: If almost all lines were removed, it might be a false positive (e.g., code file)
     # Revert to original content if cleaning was too aggressive.
-    original_line_count = len(lines)
-    cleaned_line_count = len([line for line in cleaned_lines if line.strip()]) # Count non-empty cleaned lines
+    original_line_count = len(indices)
     # Allow removing up to 95% of lines, but not more.
     if original_line_count > 0 and (cleaned_line_count / original_line_count) < 0.05:
         logger.warning(f"Header/footer removal seemed too aggressive (removed >95% of lines). Reverting for this file.")
+        if isinstance(content, LineTable):
+            table.restore(original_state)
+            return table
         return content # Return original content
         
-    return '\n'.join(cleaned_lines)
+    return table.result_for(content)
+
+def prune_line_counts(repeated_lines: Dict[str, int], max_lines: int) -> None:
+    """Bound the line counts kept for header/footer removal.
+
+    Once more than ``max_lines`` lines are counted, lines seen only once are
+    forgotten, then lines not yet repeated often enough to be removed.
+    """
+    for min_count in (2, HEADER_FOOTER_REPEAT_THRESHOLD):
+        if len(repeated_lines) <= max_lines:
+            return
+        for line in [line for line, count in repeated_lines.items() if count < min_count]:
+            del repeated_lines[line]
+
+def remove_duplicates(content: str, seen_paragraphs: Optional[Union[Set[str], RecentSet]] = None) -> str:
+    """Remove duplicate paragraphs.
 
-def remove_duplicates(content: str) -> str:
-    """Remove duplicate paragraphs."""
+    Args:
+        content: Text to clean.
+        seen_paragraphs: Set-like collection of the normalized paragraphs
+            seen so far, updated in place; lets the windows of a streamed
+            document share it.
+    """
     paragraphs = re.split(r'\n\s*\n', content)
     unique_paragraphs = []
-    seen_paragraphs = set()
+    if seen_paragraphs is None:
+        seen_paragraphs = set()
     min_duplicate_length = 20 # Only remove duplicates longer than this
     
     # DEBUG: Log received paragraphs
@@ -145,12 +177,16 @@ def remove_duplicates(content: str) -> str:
 
 def remove_boilerplate_text(content: str) -> str:
     """Remove common boilerplate patterns."""
-    for pattern in BOILERPLATE_PATTERNS:
-        content = re.sub(pattern, '', content)
-    return content
+    return BOILERPLATE_RULES.sub(content)
 
-def clean_whitespace(content: str) -> str:
-    """Clean up excessive whitespace, tabs, and normalize line breaks."""
+def clean_whitespace(content: TextOrTable) -> TextOrTable:
+    """Clean up excessive whitespace, tabs, and normalize line breaks.
+
+    On a line table the same cleanup is applied line by line; every kind of
+    line break is then normalized, not only ``\\r\\n``.
+    """
+    if isinstance(content, LineTable):
+        return _clean_whitespace_lines(content)
     content = content.replace('\t', ' ') # Replace tabs with spaces first
     content = re.sub(r' {2,}', ' ', content) # Collapse multiple spaces
     content = re.sub(r' +\n', '\n', content) # Remove trailing spaces on lines
@@ -158,7 +194,23 @@ def clean_whitespace(content: str) -> str:
     content = re.sub(r'\n{3,}', '\n\n', content) # Collapse multiple blank lines
     return content.strip() # Remove leading/trailing whitespace from the whole content
 
-def merge_short_paragraphs(content: str) -> str:
+def _clean_whitespace_lines(table: LineTable) -> LineTable:
+    """Line table version of clean_whitespace."""
+    previous_empty = False
+    indices = table.indices()
+    for index, line in zip(indices, table.lines(indices)):
+        cleaned = _MULTIPLE_SPACES.sub(' ', line.replace('\t', ' ')).rstrip(' ')
+        if not cleaned and previous_empty:
+            table.drop(index) # Collapse multiple blank lines
+            continue
+        if cleaned != line:
+            table.rewrite(index, cleaned)
+        previous_empty = not cleaned
+
+    # Remove leading/trailing whitespace from the whole content
+    return table.strip()
+
+def merge_short_paragraphs(content: TextOrTable) -> TextOrTable:
     """Merge short consecutive paragraphs if they don't look like lists or headings."""
     # Removed first implementation using re.split and while loop
     # paragraphs = re.split(r'(\n\s*\n)', content) # Keep separators
@@ -200,97 +252,118 @@ def merge_short_paragraphs(content: str) -> str:
     # A simpler approach might be better if this logic is complex
     
     # Using the simpler line-based implementation:
-    lines = content.splitlines()
-    merged_lines = []
+    table = as_table(content)
     buffer = ""
-    for line in lines:
+    buffer_index = -1 # Line holding the buffered paragraph
+
+    def flush():
+        if buffer and table.line(buffer_index) != buffer:
+            table.rewrite(buffer_index, buffer)
+
+    indices = table.indices()
+    for index, line in zip(indices, table.lines(indices)):
         stripped_line = line.strip()
         if not stripped_line: # Blank line signals paragraph break
-            if buffer: merged_lines.append(buffer)
-            merged_lines.append("") # Preserve blank lines
+            flush()
+            if line:
+                table.rewrite(index, "") # Preserve blank lines
             buffer = ""
         elif (len(buffer) > 0 and len(buffer) < min_para_length and 
               not buffer.endswith(sentence_ending_punctuation) and 
               not buffer.startswith(list_or_heading_starts) and
               not stripped_line.startswith(list_or_heading_starts)):
             buffer += " " + stripped_line # Merge
+            table.drop(index)
         else:
-            if buffer: merged_lines.append(buffer) # Add previous buffer
+            flush() # Add previous buffer
             buffer = stripped_line # Start new buffer
-    if buffer: merged_lines.append(buffer) # Add final buffer
+            buffer_index = index
+    flush() # Add final buffer
 
-    return '\n'.join(merged_lines)
+    return table.result_for(content)
 
 def normalize_unicode(content: str) -> str:
     """Normalize unicode characters using NFC."""
     return unicodedata.normalize('NFC', content)
 
-def join_paragraph_lines(content: str) -> str:
+def join_paragraph_lines(content: TextOrTable) -> TextOrTable:
     """Join lines within paragraphs intelligently, preserving list/heading structure."""
-    lines = content.splitlines()
-    processed_lines = []
-    current_paragraph = ""
-    # Regex to detect lines likely starting new blocks (lists, headings)
-    # Simple version: starts with #, -, *, +, > or digits followed by dot/paren.
-    # Be careful not to match lines that are just numbers (e.g., page numbers already handled)
-    # Let's refine this: require a space after the marker for lists/headings.
-    block_start_pattern = re.compile(r"^\s*(?:#{1,6}|[-*+>]|\d+[\.\)])\s+")
-
-    for i, line in enumerate(lines):
-        stripped_line = line.strip()
+    table = as_table(content)
+    # Lines likely starting new blocks (lists, headings) are flagged by the
+    # table: a stripped line starting with #, -, *, +, > or digits followed by
+    # dot/paren, and a space after the marker.
+    block_start = HEADING | LIST_ITEM
+    paragraph_parts = []
+    paragraph_index = -1 # Line holding the current paragraph
+    # Only one blank line is kept between paragraphs, none at the start or end
+    last_kept_blank = True # Treat start as if preceded by blank
+    trailing_blank_index = -1
+    previous_blank = False
+
+    def finalize():
+        # Write the joined paragraph into its first line
+        nonlocal last_kept_blank, trailing_blank_index
+        if not paragraph_parts:
+            return
+        joined = " ".join(paragraph_parts)
+        if table.line(paragraph_index) != joined:
+            table.rewrite(paragraph_index, joined)
+        paragraph_parts.clear()
+        last_kept_blank = False
+        trailing_blank_index = -1
+
+    indices = table.indices()
+    line_flags = table.flags
+    for position, (index, line) in enumerate(zip(indices, table.lines(indices))):
+        flags = line_flags[index]
+
+        if flags & BLANK:
+            # Blank line: finalize previous paragraph and keep one blank line separator
+            finalize()
+            if last_kept_blank:
+                table.drop(index)
+            else:
+                if line:
+                    table.rewrite(index, "")
+                last_kept_blank = True
+                trailing_blank_index = index
+            previous_blank = True
+            continue
 
-        if not stripped_line:
-            # Blank line: finalize previous paragraph and add a blank line separator
-            if current_paragraph:
-                processed_lines.append(current_paragraph)
-            processed_lines.append("") # Preserve the blank line
-            current_paragraph = ""
-        elif block_start_pattern.match(stripped_line) or \
-             (i > 0 and not lines[i-1].strip()): # Also treat line after blank as new block
+        stripped_line = line.strip()
+        if flags & block_start or (position > 0 and previous_blank): # Also treat line after blank as new block
             # Line starts a new block (list, heading) or follows a blank line
-            if current_paragraph:
-                processed_lines.append(current_paragraph) # Finalize previous para
-            current_paragraph = stripped_line # Start new paragraph/block
-        else:
+            finalize() # Finalize previous para
+            paragraph_parts.append(stripped_line) # Start new paragraph/block
+            paragraph_index = index
+        elif paragraph_parts:
             # Continuation of the current paragraph
-            if current_paragraph: 
-                current_paragraph += " " + stripped_line # Append with space
-            else:
-                current_paragraph = stripped_line # Start the first paragraph
+            paragraph_parts.append(stripped_line)
+            table.drop(index)
+        else:
+            paragraph_parts.append(stripped_line) # Start the first paragraph
+            paragraph_index = index
+        previous_blank = False
 
     # Add the last paragraph if it exists
-    if current_paragraph:
-        processed_lines.append(current_paragraph)
-
-    # Join the processed lines, ensuring proper paragraph separation
-    # Filter out potential multiple blank lines created during processing
-    final_content = []
-    last_line_blank = True # Treat start as if preceded by blank
-    for line in processed_lines:
-        if line == "":
-            if not last_line_blank: # Add only one blank line between paragraphs
-                final_content.append("")
-                last_line_blank = True
-        else:
-            final_content.append(line)
-            last_line_blank = False
-            
-    # Join with single newline, as paragraphs are now single lines
-    # Double newlines will be formed by the blank lines added between them.
-    return '\n'.join(final_content).strip()
+    finalize()
+    if trailing_blank_index >= 0:
+        table.drop(trailing_blank_index)
+
+    return table.result_for(content)
+
+# Pattern: Optional space, digits, optional dot/paren, space, anything, https?://, anything non-space
+_FOOTNOTE_PATTERN = re.compile(r"^[ \t]*\d+[\.\)]?\s+.*?https?://\S")
 
-def remove_footnotes(content: str) -> str:
+def remove_footnotes(content: TextOrTable) -> TextOrTable:
     """Remove lines that appear to be footnotes (start with number, contain URL)."""
-    lines = content.splitlines()
-    cleaned_lines = []
-    # Pattern: Optional space, digits, optional dot/paren, space, anything, https?://, anything non-space
-    footnote_pattern = re.compile(r"^[ \t]*\d+[\.\)]?\s+.*?https?://\S")
+    table = as_table(content)
     
-    for line in lines:
+    indices = table.indices()
+    for index, line in zip(indices, table.lines(indices)):
         # Check if the line matches the footnote pattern
-        if footnote_pattern.search(line):
+        if _FOOTNOTE_PATTERN.search(line):
             logger.debug(f"Removing potential footnote line: {line[:80]}...")
-            continue # Skip this line
-        cleaned_lines.append(line)
+            table.drop(index) # Skip this line
             
-    return '\n'.join(cleaned_lines) 
\ No newline at end of file
+    return table.result_for(content)
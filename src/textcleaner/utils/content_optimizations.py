@@ -3,6 +3,9 @@
 import re
 import textwrap
 
+from textcleaner.utils.line_table import BLANK, LineTable, TextOrTable, as_table
+from textcleaner.utils.rule_engine import Rule, RuleSet
+
 # Common redundant phrases that can be removed or simplified
 REDUNDANT_PHRASES = [
     (r'(?i)at the present time', 'now'),
@@ -21,40 +24,56 @@ REDUNDANT_PHRASES = [
     (r'(?i)needless to say', ''),
     (r'(?i)the fact that', 'that'),
 ]
+# The phrases are literals, so each is its own prefilter keyword
+REDUNDANT_PHRASE_RULES = RuleSet(REDUNDANT_PHRASES, name="redundant phrases")
+
+# Runs of punctuation; any run contains one of the keyword pairs
+EXCESSIVE_PUNCTUATION_RULES = RuleSet([
+    Rule(r'([.!?]){2,}', r'\1', keywords=tuple(a + b for a in '.!?' for b in '.!?')), # Example: "!!!" -> "!"
+    Rule(r'-{2,}', '-', keywords=('--',)), # Example: "---" -> "-"
+    Rule(r'_{2,}', '_', keywords=('__',)), # Example: "___" -> "_"
+], name="excessive punctuation")
 
 def remove_redundant_phrases(content: str) -> str:
     """Remove common redundant phrases."""
-    for pattern, replacement in REDUNDANT_PHRASES:
-        content = re.sub(pattern, replacement, content)
-    return content
+    return REDUNDANT_PHRASE_RULES.sub(content)
+
+_REPEATED_WORDS = re.compile(r'(\b\w+\b)(\s+\1\b)+', re.IGNORECASE)
 
-def condense_repetitive_patterns(content: str) -> str:
-    """Condense repeated words and duplicated headers."""
+def condense_repetitive_patterns(content: TextOrTable) -> TextOrTable:
+    """Condense repeated words and duplicated headers.
+
+    On a line table, repeated words are only collapsed within a line.
+    """
     # Collapse repeated words (e.g., "very very" -> "very")
-    pattern = r'(\b\w+\b)(\s+\1\b)+'
-    content = re.sub(pattern, r'\1', content, flags=re.IGNORECASE)
+    if isinstance(content, LineTable):
+        table = content
+        indices = table.indices()
+        for index, line in zip(indices, table.lines(indices)):
+            condensed = _REPEATED_WORDS.sub(r'\1', line)
+            if condensed != line:
+                table.rewrite(index, condensed)
+    else:
+        table = as_table(_REPEATED_WORDS.sub(r'\1', content))
     
     # Collapse repeated section headers (simple case)
-    lines = content.splitlines()
-    cleaned_lines = []
-    last_line_stripped = None
-    for line in lines:
-        line_stripped = line.strip()
+    last_index = -1 # Last non-empty line
+    flags, hashes = table.flags, table.hashes
+    for index in table.indices():
+        if flags[index] & BLANK:
+            continue
         # Skip if identical to the previous non-empty stripped line
-        if line_stripped and line_stripped == last_line_stripped:
+        if (last_index >= 0 and hashes[index] == hashes[last_index]
+                and table.stripped(index) == table.stripped(last_index)):
+            table.drop(index)
             continue
-        cleaned_lines.append(line)
-        if line_stripped: # Update last non-empty line
-            last_line_stripped = line_stripped
+        last_index = index
             
-    return '\n'.join(cleaned_lines)
+    return table.result_for(content)
 
 def remove_excessive_punctuation(content: str) -> str:
     """Remove excessively repeated punctuation."""
-    content = re.sub(r'([.!?]){2,}', r'\1', content) # Example: "!!!" -> "!"
-    content = re.sub(r'-{2,}', '-', content) # Example: "---" -> "-"
-    content = re.sub(r'_{2,}', '_', content) # Example: "___" -> "_"
-    return content
+    return EXCESSIVE_PUNCTUATION_RULES.sub(content)
 
 def simplify_citations(content: str) -> str:
     """Simplify common citation formats (e.g., APA style)."""
@@ -77,26 +96,25 @@ def simplify_urls(content: str) -> str:
     )
     return simplified_content
 
-def optimize_line_length(content: str, max_length: int) -> str:
+def optimize_line_length(content: TextOrTable, max_length: int) -> TextOrTable:
     """Wrap lines to a maximum length, preserving structure like headings/lists."""
-    lines = content.split('\n')
-    wrapped_lines = []
+    table = as_table(content, newline_only=True)
     structure_prefixes = ('#', '* ', '- ', '| ') # Prefixes to not wrap
     
-    for line in lines:
-        line_stripped = line.strip()
+    indices = table.indices()
+    for index, line in zip(indices, table.lines(indices)):
         # Don't wrap structural lines or empty lines
-        if not line_stripped or any(line.startswith(p) for p in structure_prefixes):
-            wrapped_lines.append(line)
-        else:
-            wrapped = textwrap.fill(
-                line,
-                width=max_length,
-                break_long_words=False,
-                break_on_hyphens=True,
-                replace_whitespace=True, # Collapses internal whitespace
-                drop_whitespace=True # Removes leading/trailing whitespace from wrapped lines
-            )
-            wrapped_lines.append(wrapped)
+        if not line.strip() or line.startswith(structure_prefixes):
+            continue
+        wrapped = textwrap.fill(
+            line,
+            width=max_length,
+            break_long_words=False,
+            break_on_hyphens=True,
+            replace_whitespace=True, # Collapses internal whitespace
+            drop_whitespace=True # Removes leading/trailing whitespace from wrapped lines
+        )
+        if wrapped != line:
+            table.rewrite(index, wrapped)
     
-    return '\n'.join(wrapped_lines) 
\ No newline at end of file
+    return table.result_for(content)
@@ -0,0 +1,312 @@
+"""Processing events and progress reporting for TextCleaner.
+
+Processors publish ``file_started``, ``file_finished`` and ``stage_timing``
+events on the module-level ``event_bus``. Publishing is a no-op while nobody
+is subscribed, so library users pay nothing for it.
+
+Subscribers are called on the publishing thread and must be cheap. The
+``ProgressAggregator`` therefore only appends events to a deque (an atomic
+operation that needs no lock); a single renderer thread drains the deque,
+folds the events into counters and redraws a status line at a fixed rate.
+Worker processes forward their events to the parent through a queue, see
+``QueueForwarder`` and ``EventRelay``.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, IO, List, Optional, Tuple
+
+from textcleaner.utils.logging_config import get_logger
+
+FILE_STARTED = "file_started"
+FILE_FINISHED = "file_finished"
+STAGE_TIMING = "stage_timing"
+
+PROGRESS_FORMATS = ("text", "jsonl")
+
+
+@dataclass
+class ProcessingEvent:
+    """A single event published while processing files."""
+    kind: str
+    path: str
+    timestamp: float = field(default_factory=time.time)
+    worker: str = field(default_factory=lambda: f"{os.getpid()}-{threading.get_ident()}")
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the event to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+EventHandler = Callable[[ProcessingEvent], None]
+
+
+class EventBus:
+    """Fans processing events out to subscribers."""
+
+    def __init__(self):
+        self.logger = get_logger(__name__)
+        # Replaced, never mutated, so publishers can read it without a lock
+        self._subscribers: Tuple[EventHandler, ...] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """Whether anybody is listening; lets publishers skip building events."""
+        return bool(self._subscribers)
+
+    def subscribe(self, handler: EventHandler) -> None:
+        """Register a handler for all events."""
+        with self._lock:
+            self._subscribers = self._subscribers + (handler,)
+
+    def unsubscribe(self, handler: EventHandler) -> None:
+        """Remove a previously registered handler."""
+        with self._lock:
+            self._subscribers = tuple(h for h in self._subscribers if h != handler)
+
+    def emit(self, kind: str, path: Any, **data: Any) -> None:
+        """Build and publish an event if anybody is subscribed.
+
+        Args:
+            kind: Event kind, e.g. ``FILE_STARTED``.
+            path: The file the event is about.
+            **data: Event-specific payload.
+        """
+        if not self._subscribers:
+            return
+        self.publish(ProcessingEvent(kind=kind, path=str(path), data=data))
+
+    def publish(self, event: ProcessingEvent) -> None:
+        """Deliver an already built event to all subscribers."""
+        for handler in self._subscribers:
+            try:
+                handler(event)
+            except Exception as e:
+                self.logger.warning(f"Event handler {handler!r} failed: {e}")
+
+
+class ProgressAggregator:
+    """Folds events into run statistics.
+
+    Calling the aggregator (as a bus subscriber) only enqueues the event;
+    ``drain`` must be called from a single consumer thread.
+    """
+
+    def __init__(self, total_files: int):
+        self.total_files = total_files
+        self.start_time = time.time()
+        self.finished = 0
+        self.failed = 0
+        self.bytes_processed = 0
+        self.tokens_processed = 0
+        self.in_flight: Dict[str, float] = {}
+        self._events: Deque[ProcessingEvent] = deque()
+
+    def __call__(self, event: ProcessingEvent) -> None:
+        self._events.append(event)
+
+    def drain(self) -> None:
+        """Apply all queued events to the counters."""
+        while True:
+            try:
+                event = self._events.popleft()
+            except IndexError:
+                return
+            if event.kind == FILE_STARTED:
+                self.in_flight[event.path] = event.timestamp
+            elif event.kind == FILE_FINISHED:
+                self.in_flight.pop(event.path, None)
+                self.finished += 1
+                if not event.data.get("success", True):
+                    self.failed += 1
+                self.bytes_processed += event.data.get("input_bytes") or 0
+                self.tokens_processed += event.data.get("tokens") or 0
+
+    def slowest_in_flight(self, count: int = 3) -> List[Tuple[str, float]]:
+        """Return the files that have been running longest, with their age in seconds."""
+        now = time.time()
+        oldest = sorted(self.in_flight.items(), key=lambda item: item[1])[:count]
+        return [(path, now - started) for path, started in oldest]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return current throughput figures."""
+        elapsed = max(time.time() - self.start_time, 1e-6)
+        files_per_second = self.finished / elapsed
+        remaining = max(self.total_files - self.finished, 0)
+        return {
+            "finished": self.finished,
+            "failed": self.failed,
+            "total": self.total_files,
+            "elapsed_seconds": elapsed,
+            "files_per_second": files_per_second,
+            "mb_per_second": self.bytes_processed / (1024 * 1024) / elapsed,
+            "tokens_per_second": self.tokens_processed / elapsed,
+            "eta_seconds": remaining / files_per_second if files_per_second > 0 else None,
+        }
+
+
+def _format_duration(seconds: Optional[float]) -> str:
+    """Format seconds as M:SS (or H:MM:SS)."""
+    if seconds is None:
+        return "--:--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+class ProgressRenderer:
+    """Rate-limited console progress display fed by the event bus."""
+
+    def __init__(
+        self,
+        total_files: int,
+        stream: Optional[IO[str]] = None,
+        interval: float = 0.5,
+        bus: Optional[EventBus] = None,
+    ):
+        """Initialize the renderer.
+
+        Args:
+            total_files: Number of files the run will process.
+            stream: Stream to draw on. Defaults to stderr.
+            interval: Minimum seconds between redraws.
+            bus: Event bus to subscribe to. Defaults to the global bus.
+        """
+        self.aggregator = ProgressAggregator(total_files)
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.bus = bus or event_bus
+        self._interactive = hasattr(self.stream, "isatty") and self.stream.isatty()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def render_line(self) -> str:
+        """Build the current status line."""
+        stats = self.aggregator.snapshot()
+        line = (
+            f"{stats['finished']}/{stats['total']} files"
+            f" | {stats['files_per_second']:.1f} files/s"
+            f" | {stats['mb_per_second']:.2f} MB/s"
+            f" | {stats['tokens_per_second']:,.0f} tokens/s"
+            f" | ETA {_format_duration(stats['eta_seconds'])}"
+        )
+        if stats["failed"]:
+            line += f" | {stats['failed']} failed"
+        slowest = self.aggregator.slowest_in_flight()
+        if slowest:
+            line += " | slowest: " + ", ".join(
+                f"{os.path.basename(path)} ({age:.1f}s)" for path, age in slowest
+            )
+        return line
+
+    def _draw(self, final: bool = False) -> None:
+        line = self.render_line()
+        if self._interactive:
+            self.stream.write(f"\r\x1b[K{line}" + ("\n" if final else ""))
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.aggregator.drain()
+            self._draw()
+
+    def start(self) -> None:
+        """Subscribe to the bus and start redrawing."""
+        self.bus.subscribe(self.aggregator)
+        self._thread = threading.Thread(target=self._run, name="textcleaner-progress", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Unsubscribe, stop redrawing and print the final status."""
+        self.bus.unsubscribe(self.aggregator)
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1.0)
+        self.aggregator.drain()
+        self._draw(final=True)
+
+    def __enter__(self) -> "ProgressRenderer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+class JsonLinesEventWriter:
+    """Writes every event as one JSON object per line."""
+
+    def __init__(self, stream: Optional[IO[str]] = None, bus: Optional[EventBus] = None):
+        """Initialize the writer.
+
+        Args:
+            stream: Stream to write to. Defaults to stderr.
+            bus: Event bus to subscribe to. Defaults to the global bus.
+        """
+        self.stream = stream or sys.stderr
+        self.bus = bus or event_bus
+        self._lock = threading.Lock()  # Keeps lines from interleaving
+
+    def __call__(self, event: ProcessingEvent) -> None:
+        line = json.dumps(event.to_dict(), default=str, separators=(",", ":"))
+        with self._lock:
+            self.stream.write(line + "\n")
+
+    def __enter__(self) -> "JsonLinesEventWriter":
+        self.bus.subscribe(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.bus.unsubscribe(self)
+        self.stream.flush()
+
+
+class QueueForwarder:
+    """Bus subscriber that forwards events from a worker process to its parent."""
+
+    def __init__(self, queue: Any):
+        self.queue = queue
+
+    def __call__(self, event: ProcessingEvent) -> None:
+        self.queue.put(event.to_dict())
+
+
+class EventRelay:
+    """Republishes events forwarded by worker processes on the parent's bus."""
+
+    _STOP = None
+
+    def __init__(self, queue: Any, bus: Optional[EventBus] = None):
+        self.queue = queue
+        self.bus = bus or event_bus
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is self._STOP:
+                return
+            self.bus.publish(ProcessingEvent(**item))
+
+    def __enter__(self) -> "EventRelay":
+        self._thread = threading.Thread(target=self._run, name="textcleaner-event-relay", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.queue.put(self._STOP)
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+
+
+# Create singleton for common usage
+event_bus = EventBus()
@@ -0,0 +1,150 @@
+"""Content sniffing from file signatures.
+
+Only the first few KB of a file are read. The result says which extensions
+are consistent with the bytes, so mislabelled files (a PDF saved as ``.txt``,
+a DOCX renamed ``.zip``) can be rerouted or rejected before a converter opens
+them, and executables can be refused whatever they are called.
+
+Results are cached by path, size and modification time, so security
+validation and converter dispatch share a single read.
+"""
+
+import functools
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import FrozenSet, Optional, Union
+
+SNIFF_BYTES = 8192
+
+KIND_EMPTY = "empty"
+KIND_PDF = "pdf"
+KIND_OFFICE_OPEN_XML = "ooxml"
+KIND_OPEN_DOCUMENT = "odf"
+KIND_OLE = "ole"  # Legacy binary Office formats
+KIND_ZIP = "zip"
+KIND_EXECUTABLE = "executable"
+KIND_TEXT = "text"
+KIND_BINARY = "binary"
+
+# Extensions whose files are text and can be read by a text-based converter
+TEXT_EXTENSIONS = frozenset({
+    ".txt", ".md", ".markdown", ".csv", ".json", ".html", ".htm", ".xhtml", ".xml",
+})
+OLE_EXTENSIONS = frozenset({".doc", ".xls", ".ppt"})
+OFFICE_OPEN_XML_EXTENSIONS = frozenset({".docx", ".xlsx", ".pptx"})
+
+_OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_ZIP_SIGNATURE = b"PK\x03\x04"
+_MACH_O_SIGNATURES = (
+    b"\xfe\xed\xfa\xce", b"\xfe\xed\xfa\xcf", b"\xce\xfa\xed\xfe", b"\xcf\xfa\xed\xfe", b"\xca\xfe\xba\xbe",
+)
+_TEXT_BOMS = (b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff")
+# First ZIP entry of OpenDocument files is an uncompressed "mimetype" file
+_ODF_MIMETYPES = {
+    b"application/vnd.oasis.opendocument.text": ".odt",
+    b"application/vnd.oasis.opendocument.spreadsheet": ".ods",
+    b"application/vnd.oasis.opendocument.presentation": ".odp",
+}
+# Part directories identifying the OOXML document type
+_OOXML_PARTS = ((b"word/", ".docx"), (b"xl/", ".xlsx"), (b"ppt/", ".pptx"))
+
+
+@dataclass(frozen=True)
+class SniffResult:
+    """What a file's leading bytes say about its format."""
+    kind: str
+    # Best extension for the content, if the bytes identify one
+    extension: Optional[str] = None
+    # Extensions consistent with the content; None means anything goes
+    compatible: Optional[FrozenSet[str]] = None
+
+    def matches(self, extension: str) -> bool:
+        """Whether a file with this content may carry the given extension."""
+        return self.compatible is None or extension.lower() in self.compatible
+
+
+def _is_windows_executable(header: bytes) -> bool:
+    if not header.startswith(b"MZ") or len(header) < 64:
+        return False
+    pe_offset = int.from_bytes(header[60:64], "little")
+    return header[pe_offset:pe_offset + 4] == b"PE\x00\x00"
+
+
+def _sniff_zip(header: bytes) -> SniffResult:
+    if header[30:38] == b"mimetype":
+        for mimetype, extension in _ODF_MIMETYPES.items():
+            if header[38:38 + len(mimetype)] == mimetype:
+                return SniffResult(KIND_OPEN_DOCUMENT, extension, frozenset({extension}))
+    if b"[Content_Types].xml" in header:
+        for part, extension in _OOXML_PARTS:
+            if part in header:
+                return SniffResult(KIND_OFFICE_OPEN_XML, extension, frozenset({extension}))
+        return SniffResult(KIND_OFFICE_OPEN_XML, None, OFFICE_OPEN_XML_EXTENSIONS)
+    return SniffResult(KIND_ZIP, ".zip", frozenset({".zip"}))
+
+
+def _sniff_text(header: bytes) -> SniffResult:
+    start = header
+    for bom in _TEXT_BOMS:
+        if start.startswith(bom):
+            start = start[len(bom):]
+            break
+    start = start.lstrip()[:256].lower()
+    if start.startswith(b"<?xml"):
+        extension = ".xhtml" if b"<html" in start else ".xml"
+    elif start.startswith((b"<!doctype html", b"<html")):
+        extension = ".html"
+    else:
+        extension = ".txt"
+    return SniffResult(KIND_TEXT, extension, TEXT_EXTENSIONS)
+
+
+def sniff_bytes(header: bytes) -> SniffResult:
+    """Classify content from its leading bytes.
+
+    Args:
+        header: The first bytes of the file (``SNIFF_BYTES`` is enough).
+
+    Returns:
+        The sniffing result.
+    """
+    if not header:
+        return SniffResult(KIND_EMPTY)
+    # Readers tolerate whitespace before the PDF header
+    if header.lstrip().startswith(b"%PDF-"):
+        return SniffResult(KIND_PDF, ".pdf", frozenset({".pdf"}))
+    if header.startswith(_OLE_SIGNATURE):
+        return SniffResult(KIND_OLE, None, OLE_EXTENSIONS)
+    if header.startswith(_ZIP_SIGNATURE):
+        return _sniff_zip(header)
+    if (_is_windows_executable(header) or header.startswith(b"\x7fELF")
+            or header.startswith(_MACH_O_SIGNATURES)):
+        return SniffResult(KIND_EXECUTABLE, None, frozenset())
+    # UTF-16/32 text contains NUL bytes but starts with a byte order mark
+    if b"\x00" not in header or header.startswith(_TEXT_BOMS):
+        return _sniff_text(header)
+    return SniffResult(KIND_BINARY, None, frozenset())
+
+
+@functools.lru_cache(maxsize=1024)
+def _sniff_cached(path: str, size: int, mtime_ns: int) -> SniffResult:
+    with open(path, "rb") as f:
+        return sniff_bytes(f.read(SNIFF_BYTES))
+
+
+def sniff_file(file_path: Union[str, Path]) -> SniffResult:
+    """Classify a file from its first ``SNIFF_BYTES`` bytes.
+
+    Args:
+        file_path: Path of the file.
+
+    Returns:
+        The sniffing result.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    path = os.fspath(file_path)
+    stat_result = os.stat(path)
+    return _sniff_cached(path, stat_result.st_size, stat_result.st_mtime_ns)
@@ -1,7 +1,8 @@
 """File utility functions for the text processor."""
 
-# import os # Removed unused import
+import os
 import re
+import tempfile
 from pathlib import Path
 from typing import List, Set, Tuple, Union, Optional, Generator, TYPE_CHECKING
 
@@ -97,6 +98,47 @@ def ensure_dir_exists(directory: Union[str, Path]) -> Path:
     return directory
 
 
+def get_cache_dir(subdir: Optional[str] = None) -> Path:
+    """Get the per-user cache directory used by textcleaner.
+
+    Honours ``XDG_CACHE_HOME`` and falls back to ``~/.cache``.
+
+    Args:
+        subdir: Optional subdirectory name inside the textcleaner cache.
+
+    Returns:
+        Path to the (not necessarily existing) cache directory.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    cache_dir = Path(base) / "textcleaner"
+    return cache_dir / subdir if subdir else cache_dir
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """Write text to a file atomically.
+
+    The content is written to a temporary file in the same directory and
+    then moved over the destination with ``os.replace``, so concurrent
+    readers (including other processes) never observe a partial file.
+
+    Args:
+        path: Destination file path.
+        text: Text to write.
+        encoding: Text encoding to use.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline="") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 def get_relative_path(
     file_path: Path,
     base_dir: Path
@@ -176,6 +218,7 @@ def get_format_from_extension(extension: str) -> str:
         "txt": "plain_text",
         "json": "json",
         "csv": "csv",
+        "jsonl": "jsonl",
         "html": "html",
         "htm": "html",
         "xml": "xml",
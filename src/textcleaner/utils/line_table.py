@@ -0,0 +1,271 @@
+"""Array-backed line table shared by line-oriented processing stages.
+
+Most cleaning stages work line by line. Run one after another on strings,
+each of them splits the document into a list of lines and joins it back,
+so a large document is copied once per stage. A ``LineTable`` splits the
+document once: it keeps the source text and, per line, its offsets, a few
+classification flags and the hash of its stripped text in compact arrays.
+Stages drop or rewrite lines in the table and the document is materialized
+once, by ``text()``, when the last line stage is done.
+
+Some stages split on ``"\n"`` only, others like ``str.splitlines()``; a
+table records how it was split and ``as_table`` switches it over, usually
+without splitting the document again, when it reaches a stage that splits
+the other way.
+
+Stage functions in ``content_cleaning``, ``content_optimizations`` and
+``structure_operations`` accept either a string or a table and return the
+same kind, so they can be chained on a table or used on plain text.
+"""
+
+import itertools
+import operator
+import re
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+# Line flags
+BLANK = 1  # Empty after stripping whitespace
+HEADING = 2  # Markdown heading ("# Title")
+LIST_ITEM = 4  # List item or block quote ("- item", "1. item", "> quote")
+DROPPED = 8  # Removed by a stage
+
+# Lines starting a new block (heading, list item, quote) once stripped
+BLOCK_START_PATTERN = re.compile(r"^\s*(?:#{1,6}|[-*+>]|\d+[\.\)])\s+")
+# First characters BLOCK_START_PATTERN can match on a stripped line
+_BLOCK_START_CHARS = frozenset("#-*+>0123456789")
+
+# Line breaks recognized by str.splitlines, with and without "\n"
+_LINE_BREAKS = re.compile("[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+_OTHER_LINE_BREAKS = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# Snapshot of a table's mutable state, see LineTable.checkpoint
+TableState = Tuple[Optional[bytearray], Optional[array], Dict[int, str]]
+
+
+def _classify(stripped: str) -> int:
+    """Flags for a line given its stripped text."""
+    if not stripped:
+        return BLANK
+    if stripped[0] in _BLOCK_START_CHARS and BLOCK_START_PATTERN.match(stripped):
+        return HEADING if stripped[0] == "#" else LIST_ITEM
+    return 0
+
+
+class LineTable:
+    """Lines of a document as offsets into its text, with per-line flags.
+
+    Rewritten lines are kept in a dictionary next to the arrays; all other
+    lines are sliced from the source text when they are read.
+    """
+
+    def __init__(self, source: str, starts: array, ends: array, newline_only: bool = False):
+        """Initialize a table from line offsets.
+
+        Args:
+            source: The document text.
+            starts: Start offset of each line in ``source``.
+            ends: End offset of each line, excluding its line break.
+            newline_only: Whether the lines were split on ``"\n"`` only
+                (see ``from_text``).
+        """
+        self.source = source
+        self.newline_only = newline_only
+        self.starts = starts
+        self.ends = ends
+        self._rewritten: Dict[int, str] = {}
+        # Lines are classified on first use, so stages that only read lines
+        # never pay for it; until then _flags only holds drop marks (if any)
+        self._flags: Optional[bytearray] = None
+        self._hashes: Optional[array] = None
+
+    @classmethod
+    def from_text(cls, text: str, newline_only: bool = False) -> "LineTable":
+        """Build the table for a document.
+
+        Args:
+            text: The document text.
+            newline_only: Split on ``"\\n"`` only, like ``str.split("\\n")``
+                (a trailing newline yields a final empty line). By default
+                lines are split like ``str.splitlines()``.
+
+        Returns:
+            The line table.
+        """
+        if newline_only:
+            lengths = array("q", map(len, text.split("\n")))
+            # Every line but the last is followed by a one-character break
+            starts = array("q", itertools.accumulate(map((1).__add__, lengths[:-1]), initial=0))
+        else:
+            lengths = array("q", map(len, text.splitlines()))
+            starts = array("q", itertools.accumulate(map(len, text.splitlines(True)), initial=0))
+            starts.pop()
+        ends = array("q", map(operator.add, starts, lengths))
+        return cls(text, starts, ends, newline_only)
+
+    @property
+    def flags(self) -> bytearray:
+        """Flags of each line (``BLANK``, ``HEADING``, ``LIST_ITEM``, ``DROPPED``)."""
+        if self._hashes is None:
+            self._classify_lines()
+        return self._flags
+
+    @property
+    def hashes(self) -> array:
+        """Hash of each line's stripped text, for cheap equality checks."""
+        if self._hashes is None:
+            self._classify_lines()
+        return self._hashes
+
+    def _classify_lines(self) -> None:
+        """Compute the flags and hashes of all lines."""
+        count = len(self.starts)
+        flags = self._flags if self._flags is not None else bytearray(count)
+        hashes = array("q", bytes(8 * count))
+        for index, line in enumerate(self.lines(range(count))):
+            stripped = line.strip()
+            flags[index] = _classify(stripped) | (flags[index] & DROPPED)
+            hashes[index] = hash(stripped)
+        self._flags, self._hashes = flags, hashes
+
+    def __len__(self) -> int:
+        """Number of lines, including dropped ones."""
+        return len(self.starts)
+
+    def line(self, index: int) -> str:
+        """Current text of a line."""
+        rewritten = self._rewritten.get(index)
+        if rewritten is not None:
+            return rewritten
+        return self.source[self.starts[index]:self.ends[index]]
+
+    def stripped(self, index: int) -> str:
+        """Current text of a line without surrounding whitespace."""
+        return self.line(index).strip()
+
+    def is_blank(self, index: int) -> bool:
+        """Whether a line is empty or whitespace only."""
+        return bool(self.flags[index] & BLANK)
+
+    def indices(self) -> List[int]:
+        """Indices of the lines that have not been dropped, in order."""
+        if self._flags is None:
+            return list(range(len(self.starts)))
+        return [index for index, flags in enumerate(self._flags) if not flags & DROPPED]
+
+    def lines(self, indices: Iterable[int]) -> List[str]:
+        """Current text of the given lines, in one pass."""
+        source, starts, ends, rewritten = self.source, self.starts, self.ends, self._rewritten
+        if not rewritten:
+            return [source[starts[index]:ends[index]] for index in indices]
+        return [
+            rewritten[index] if index in rewritten else source[starts[index]:ends[index]]
+            for index in indices
+        ]
+
+    def drop(self, index: int) -> None:
+        """Remove a line from the document."""
+        if self._flags is None:
+            self._flags = bytearray(len(self.starts))
+        self._flags[index] |= DROPPED
+        self._rewritten.pop(index, None)
+
+    def rewrite(self, index: int, text: str) -> None:
+        """Replace the text of a line, updating its flags and hash.
+
+        The new text is materialized verbatim, so it may contain line
+        breaks; later stages then see it as a single line.
+        """
+        self._rewritten[index] = text
+        if self._hashes is not None:
+            stripped = text.strip()
+            self._flags[index] = _classify(stripped)
+            self._hashes[index] = hash(stripped)
+
+    def checkpoint(self) -> TableState:
+        """Snapshot the table's state so a stage can undo its changes."""
+        return (
+            None if self._flags is None else bytearray(self._flags),
+            None if self._hashes is None else array("q", self._hashes),
+            dict(self._rewritten),
+        )
+
+    def restore(self, state: TableState) -> None:
+        """Restore a state returned by ``checkpoint``."""
+        self._flags, self._hashes, self._rewritten = state
+
+    def text(self) -> str:
+        """Materialize the document from the lines that were not dropped."""
+        return "\n".join(self.lines(self.indices()))
+
+    def strip(self) -> "LineTable":
+        """Remove leading and trailing whitespace, like ``str.strip`` on the text."""
+        indices = self.indices()
+        content_indices = [index for index in indices if self.stripped(index)]
+        if not content_indices:
+            for index in indices:
+                self.drop(index)
+            return self
+        first, last = content_indices[0], content_indices[-1]
+        for index in indices:
+            if index < first or index > last:
+                self.drop(index)
+        for index, strip in ((first, str.lstrip), (last, str.rstrip)):
+            line = self.line(index)
+            if strip(line) != line:
+                self.rewrite(index, strip(line))
+        return self
+
+    def resplit(self, newline_only: bool) -> "LineTable":
+        """Return the table split on ``"\n"`` only or like ``str.splitlines``.
+
+        The two only differ on a trailing newline unless the document holds
+        other line breaks (``"\r"``, form feeds, ...), so the table is
+        usually switched over in place; it is only split again from its
+        text when those breaks make a difference.
+
+        Args:
+            newline_only: How the returned table is split (see ``from_text``).
+
+        Returns:
+            This table, or a new one split from its text.
+        """
+        if newline_only == self.newline_only:
+            return self
+        indices = self.indices()
+        breaks = re.compile("\n") if newline_only else _LINE_BREAKS
+        if (not indices
+                or any(breaks.search(self._rewritten[index]) for index in indices if index in self._rewritten)
+                or (not newline_only and _OTHER_LINE_BREAKS.search(self.source))):
+            return LineTable.from_text(self.text(), newline_only=newline_only)
+        # str.splitlines yields no final empty line for a trailing newline
+        if not newline_only and self.line(indices[-1]) == "":
+            self.drop(indices[-1])
+        self.newline_only = newline_only
+        return self
+
+    def result_for(self, content: Union[str, "LineTable"]) -> Union[str, "LineTable"]:
+        """Return the table itself if a stage was given a table, else its text."""
+        return self if isinstance(content, LineTable) else self.text()
+
+
+# Content accepted and returned by line-oriented stages
+TextOrTable = TypeVar("TextOrTable", str, LineTable)
+
+
+def as_table(content: Union[str, LineTable], newline_only: bool = False) -> LineTable:
+    """Return the table for content, building it if content is text.
+
+    A table split the other way is switched over (see ``LineTable.resplit``).
+    """
+    if isinstance(content, LineTable):
+        return content.resplit(newline_only)
+    return LineTable.from_text(content, newline_only=newline_only)
+
+
+def as_text(content: Union[str, LineTable]) -> str:
+    """Return content as text, materializing it if it is a table."""
+    if isinstance(content, LineTable):
+        return content.text()
+    return content
+
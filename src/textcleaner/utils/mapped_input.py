@@ -0,0 +1,179 @@
+"""Memory-mapped reading of text-like input files.
+
+Reading a file with ``open(...).read()`` holds the raw bytes and the
+decoded string at the same time, and text-mode reads add buffer copies of
+their own. Here the file is mapped read-only instead, with a hint to the
+kernel that it is read sequentially: byte-order marks, frontmatter and
+line boundaries are found by scanning the mapped buffer, and text is
+decoded straight from slices of it. Mapped pages are backed by the page
+cache rather than private memory, so reading a file costs about one copy
+of its data, the decoded text. Incremental readers also unmap the pages
+they have read, so a file read window by window or line by line never
+becomes resident as a whole.
+"""
+
+import codecs
+import io
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+# Bytes decoded at a time when a mapped file is read incrementally
+DEFAULT_DECODE_CHUNK = 1024 * 1024
+
+# Incremental readers unmap the pages behind them in steps of this many bytes
+RELEASE_STEP = 4 * 1024 * 1024
+
+_UTF8_ENCODINGS = {"utf-8", "utf8", "utf-8-sig", "utf_8", "utf_8_sig"}
+
+# Frontmatter is delimited by lines holding only "---"
+_FRONTMATTER_OPEN = re.compile(rb'[ \t\f\v]*---[ \t\r\f\v]*\n')
+_FRONTMATTER_CLOSE = re.compile(rb'^[ \t\f\v]*---[ \t\r\f\v]*$(?:\n)?', re.MULTILINE)
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+@contextmanager
+def map_file(file_path: Union[str, Path]) -> Iterator[Buffer]:
+    """Map a file read-only into memory.
+
+    Args:
+        file_path: Path to the file to map.
+
+    Yields:
+        The mapped file; an empty bytes object for an empty file, which
+        cannot be mapped.
+    """
+    with open(file_path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            yield b""
+            return
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        # Read ahead, and let pages behind the reader be reclaimed early
+        mapping.madvise(mmap.MADV_SEQUENTIAL)
+    try:
+        yield mapping
+    finally:
+        try:
+            mapping.close()
+        except BufferError:
+            # A view of the mapping is still alive (e.g. in an abandoned
+            # generator); the file is unmapped once that view is released
+            pass
+
+
+def _release_pages(buffer: Buffer, released: int, position: int) -> int:
+    """Unmap the pages of a mapped file read since the last release.
+
+    The pages stay in the page cache and are mapped again if read again.
+
+    Args:
+        buffer: The mapped file.
+        released: Offset up to which pages have already been released.
+        position: Offset the reader has consumed the file up to.
+
+    Returns:
+        The offset up to which pages have now been released.
+    """
+    if position - released < RELEASE_STEP or not isinstance(buffer, mmap.mmap):
+        return released
+    end = position - position % mmap.PAGESIZE
+    if hasattr(mmap, "MADV_DONTNEED"):
+        buffer.madvise(mmap.MADV_DONTNEED, released, end - released)
+    return end
+
+
+def bom_length(buffer: Buffer, encoding: str = "utf-8") -> int:
+    """Length of the UTF-8 byte-order mark at the start of a buffer, if any."""
+    if encoding.lower() in _UTF8_ENCODINGS and buffer[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+        return len(codecs.BOM_UTF8)
+    return 0
+
+
+def decode_buffer(buffer: Buffer, start: int = 0, encoding: str = "utf-8") -> str:
+    """Decode a buffer from a byte offset to its end.
+
+    Raises:
+        UnicodeDecodeError: If the bytes are not valid in the encoding.
+    """
+    with memoryview(buffer) as view:
+        return str(view[start:], encoding)
+
+
+def iter_decoded(
+    buffer: Buffer,
+    start: int = 0,
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_DECODE_CHUNK
+) -> Iterator[str]:
+    """Decode a buffer incrementally, a slice of ``chunk_size`` bytes at a time.
+
+    Characters split between slices are decoded with the later slice.
+
+    Raises:
+        UnicodeDecodeError: If the bytes are not valid in the encoding.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    released = start - start % mmap.PAGESIZE
+    with memoryview(buffer) as view:
+        for position in range(start, len(view), chunk_size):
+            text = decoder.decode(view[position:position + chunk_size])
+            released = _release_pages(buffer, released, position)
+            if text:
+                yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_lines(
+    buffer: Buffer,
+    start: int = 0,
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_DECODE_CHUNK
+) -> Iterator[str]:
+    """Decode a buffer line by line, keeping line breaks.
+
+    The buffer is decoded in blocks of about ``chunk_size`` bytes that end
+    at a line feed, so the encoding must be ASCII-compatible. Lines end at
+    ``\\r\\n``, ``\\r`` or ``\\n``, like the lines of a file opened with
+    ``newline=''``, as the csv module expects.
+
+    Raises:
+        UnicodeDecodeError: If the bytes are not valid in the encoding.
+    """
+    released = start - start % mmap.PAGESIZE
+    with memoryview(buffer) as view:
+        position = start
+        while position < len(view):
+            end = buffer.rfind(b"\n", position, position + chunk_size) + 1
+            if not end:
+                end = buffer.find(b"\n", position + chunk_size) + 1 or len(view)
+            yield from io.StringIO(str(view[position:end], encoding), newline="")
+            position = end
+            released = _release_pages(buffer, released, position)
+
+
+def frontmatter_span(buffer: Buffer, start: int = 0) -> Optional[Tuple[int, int, int]]:
+    """Find frontmatter delimited by ``---`` lines at the start of a buffer.
+
+    Args:
+        buffer: The file contents.
+        start: Offset the text starts at (after a byte-order mark).
+
+    Returns:
+        Start and end offsets of the frontmatter between the delimiter
+        lines, and the offset of the body after the closing line; None if
+        the buffer does not start with frontmatter.
+    """
+    opening = _FRONTMATTER_OPEN.match(buffer, start)
+    if not opening:
+        return None
+    closing = _FRONTMATTER_CLOSE.search(buffer, opening.end())
+    if not closing:
+        return None
+    return opening.end(), max(opening.end(), closing.start() - 1), closing.end()
@@ -1,26 +1,66 @@
 """Metrics and statistics for text processing."""
 
+import collections
+import hashlib
+import importlib.util
+import os
 import re
-from typing import Any, Dict, Optional
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 # Import necessary components
 from textcleaner.utils.logging_config import get_logger
 from textcleaner.config.config_manager import ConfigManager
+from textcleaner.utils.streaming import WINDOW_SEPARATOR
 
-try:
-    import tiktoken
-    _tiktoken_available = True
-except ImportError:
-    _tiktoken_available = False
+# tiktoken is imported when the first tokenizer is loaded, so importing this
+# module (and everything built on it) stays cheap
+_tiktoken_available = importlib.util.find_spec("tiktoken") is not None
 
 logger = get_logger(__name__)
 
+DEFAULT_TOKENIZER_ENCODING = "cl100k_base"
+
+# Number of token counts remembered per tokenization service
+TOKEN_COUNT_CACHE_SIZE = 1024
+
+# Threads tiktoken may use to encode a batch of texts
+DEFAULT_TOKENIZER_THREADS = min(8, os.cpu_count() or 1)
+
 # Cache for loaded tokenizers to avoid reloading
 _tokenizer_cache: Dict[str, Any] = {}
 
+
+def _load_tiktoken() -> bool:
+    """Import tiktoken into the module namespace on first use.
+
+    Returns:
+        True if tiktoken could be imported, False otherwise
+    """
+    global _tiktoken_available, tiktoken
+    if "tiktoken" in globals():
+        return True
+    if not _tiktoken_available:
+        return False
+    try:
+        import tiktoken
+    except ImportError:
+        _tiktoken_available = False
+        return False
+    return True
+
+
+def __getattr__(name: str):
+    """Resolve ``tiktoken`` lazily for code outside this module."""
+    if name == "tiktoken" and _load_tiktoken():
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_tokenizer(encoding_name: str):
     """Load and cache a tiktoken tokenizer."""
-    if not _tiktoken_available:
+    if not _tiktoken_available or not _load_tiktoken():
         return None
         
     if encoding_name not in _tokenizer_cache:
@@ -46,23 +86,212 @@ def _estimate_token_count_fallback(text: str) -> int:
     tokens = re.findall(r'\w+|[.,!?;:]', text)
     return len(tokens)
 
-def count_tokens(text: str, config: ConfigManager) -> int:
-    """Count tokens using tiktoken based on configuration, with fallback."""
-    if not text:
-        return 0
-        
-    encoding_name = config.get("metrics.tokenizer_encoding", "cl100k_base")
-    tokenizer = get_tokenizer(encoding_name)
-    
-    if tokenizer:
+
+class TokenizationService:
+    """Counts tokens for one encoding, shared by metrics, CLI and utilities.
+
+    Counts are cached by a hash of the text, so text that was already counted
+    (such as an unchanged raw extraction) is never encoded again. Several
+    texts are encoded together with tiktoken's threaded batch encoder, which
+    releases the GIL, so they are counted concurrently.
+    """
+
+    def __init__(
+        self,
+        encoding_name: str = DEFAULT_TOKENIZER_ENCODING,
+        exact: bool = True,
+        num_threads: int = DEFAULT_TOKENIZER_THREADS,
+        cache_size: int = TOKEN_COUNT_CACHE_SIZE
+    ):
+        """Initialize the service.
+
+        Args:
+            encoding_name: Name of the tiktoken encoding.
+            exact: Count with tiktoken; if False (or tiktoken is unavailable)
+                token counts are always estimated.
+            num_threads: Maximum threads used to encode a batch of texts.
+            cache_size: Number of token counts to remember.
+        """
+        self.encoding_name = encoding_name
+        self.exact = exact
+        self.num_threads = max(1, num_threads)
+        self.cache_size = cache_size
+        self._cache: "collections.OrderedDict[Tuple[bool, bytes], int]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def tokenizer(self):
+        """The tiktoken encoding, or None if counts are estimated."""
+        return get_tokenizer(self.encoding_name) if self.exact else None
+
+    def is_exact(self) -> bool:
+        """Whether counts come from the tokenizer rather than an estimate."""
+        return self.tokenizer is not None
+
+    @staticmethod
+    def _cache_key(text: str, exact: bool) -> Tuple[bool, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return exact, digest
+
+    def _cache_get(self, key: Tuple[bool, bytes]) -> Optional[int]:
+        with self._lock:
+            count = self._cache.get(key)
+            if count is not None:
+                self._cache.move_to_end(key)
+            return count
+
+    def _cache_put(self, key: Tuple[bool, bytes], count: int) -> None:
+        with self._lock:
+            self._cache[key] = count
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def remember(self, text: str, count: int) -> None:
+        """Cache an exact token count computed elsewhere from the same tokenizer.
+
+        Lets callers that already encoded a text (such as the chunk writer)
+        spare the metrics a second encoding of it.
+        """
+        if text and self.exact:
+            self._cache_put(self._cache_key(text, True), count)
+
+    def clear_cache(self) -> None:
+        """Forget all cached token counts."""
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _encode(tokenizer: Any, text: str) -> Optional[int]:
+        """Count tokens of one text, or return None if encoding fails."""
         try:
             return len(tokenizer.encode(text))
         except Exception as e:
             logger.warning(f"Tiktoken encoding failed for text snippet (falling back to estimation): {e}")
-            return _estimate_token_count_fallback(text)
-    else:
-        # Use fallback if tiktoken isn't available or failed to load
-        return _estimate_token_count_fallback(text)
+            return None
+
+    def _encode_batch(self, tokenizer: Any, texts: List[str]) -> List[Optional[int]]:
+        """Count tokens of several texts, encoding them concurrently."""
+        if len(texts) > 1 and self.num_threads > 1:
+            try:
+                encoded = tokenizer.encode_batch(texts, num_threads=min(self.num_threads, len(texts)))
+                return [len(tokens) for tokens in encoded]
+            except Exception as e:
+                # Retry one by one so only the failing text is estimated
+                logger.debug(f"Batch encoding failed, encoding texts individually: {e}")
+        return [self._encode(tokenizer, text) for text in texts]
+
+    def count(self, text: str) -> int:
+        """Count the tokens of a text.
+
+        Args:
+            text: Text to count.
+
+        Returns:
+            The token count, estimated if exact counting is disabled,
+            unavailable or fails for this text.
+        """
+        if not text:
+            return 0
+        return self.count_many([text])[0]
+
+    def count_many(self, texts: Sequence[str]) -> List[int]:
+        """Count the tokens of several texts at once.
+
+        Texts that are not cached are encoded in one threaded batch; equal
+        texts are encoded once.
+
+        Args:
+            texts: Texts to count.
+
+        Returns:
+            Token counts in the order of the texts.
+        """
+        counts = [0] * len(texts)
+        tokenizer = self.tokenizer
+        exact = tokenizer is not None
+        pending: Dict[Tuple[bool, bytes], List[int]] = {}
+        for index, text in enumerate(texts):
+            if not text:
+                continue
+            key = self._cache_key(text, exact)
+            cached = self._cache_get(key)
+            if cached is not None:
+                counts[index] = cached
+            else:
+                pending.setdefault(key, []).append(index)
+
+        if not pending:
+            return counts
+
+        keys = list(pending)
+        batch = [texts[pending[key][0]] for key in keys]
+        if exact:
+            results = self._encode_batch(tokenizer, batch)
+        else:
+            results = [_estimate_token_count_fallback(text) for text in batch]
+
+        for key, text, count in zip(keys, batch, results):
+            if count is None:
+                # Encoding failed; estimate without caching the result
+                count = _estimate_token_count_fallback(text)
+            else:
+                self._cache_put(key, count)
+            for index in pending[key]:
+                counts[index] = count
+        return counts
+
+
+@lru_cache(maxsize=None)
+def get_token_service(encoding_name: str = DEFAULT_TOKENIZER_ENCODING, exact: bool = True) -> TokenizationService:
+    """Return the shared tokenization service for an encoding.
+
+    Args:
+        encoding_name: Name of the tiktoken encoding.
+        exact: Whether to count with tiktoken or only estimate.
+
+    Returns:
+        The process-wide service, so all callers share one count cache.
+    """
+    return TokenizationService(encoding_name, exact=exact)
+
+
+def get_config_token_service(config: ConfigManager) -> TokenizationService:
+    """Return the shared tokenization service configured by ``metrics.*``."""
+    return get_token_service(
+        config.get("metrics.tokenizer_encoding", DEFAULT_TOKENIZER_ENCODING),
+        exact=bool(config.get("metrics.exact_token_counts", True))
+    )
+
+
+def count_tokens(text: str, config: ConfigManager) -> int:
+    """Count tokens using tiktoken based on configuration, with fallback."""
+    if not text:
+        return 0
+
+    return get_config_token_service(config).count(text)
+
+
+def get_token_counts(metrics: Dict[str, Any]) -> Tuple[Optional[int], Optional[int], Optional[float], bool]:
+    """Read token statistics from metrics, whether counted or estimated.
+
+    Args:
+        metrics: Dictionary of metrics from calculate_metrics().
+
+    Returns:
+        Original tokens, processed tokens and token reduction percent (None
+        where missing), and whether the values are estimates.
+    """
+    for suffix in ("", "_estimate"):
+        if f"original_tokens{suffix}" in metrics or f"processed_tokens{suffix}" in metrics:
+            return (
+                metrics.get(f"original_tokens{suffix}"),
+                metrics.get(f"processed_tokens{suffix}"),
+                metrics.get(f"token_reduction_percent{suffix}"),
+                bool(suffix)
+            )
+    return None, None, None, False
+
 
 def calculate_metrics(
     raw_text: str,
@@ -73,25 +302,40 @@ def calculate_metrics(
 ) -> Dict[str, Any]:
     """Calculate metrics for the text processing, using tiktoken if available."""
     
+    # Count raw and processed tokens together; unchanged raw text is cached
+    token_service = get_config_token_service(config)
+    original_tokens, processed_tokens = token_service.count_many([raw_text, processed_text])
+    return _build_metrics(
+        len(raw_text), len(processed_text), original_tokens, processed_tokens,
+        token_service.is_exact(), processing_time, input_file_stats
+    )
+
+
+def _build_metrics(
+    raw_length: int,
+    processed_length: int,
+    original_tokens: int,
+    processed_tokens: int,
+    exact: bool,
+    processing_time: float,
+    input_file_stats: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Assemble the metrics dictionary from text lengths and token counts."""
     metrics = {
         "processing_time_seconds": processing_time,
-        "original_text_length": len(raw_text),
-        "processed_text_length": len(processed_text),
+        "original_text_length": raw_length,
+        "processed_text_length": processed_length,
     }
     
     # Calculate reduction in text length
-    if len(raw_text) > 0:
-        reduction_percent = 100 - (len(processed_text) / len(raw_text) * 100)
+    if raw_length > 0:
+        reduction_percent = 100 - (processed_length / raw_length * 100)
         metrics["text_length_reduction_percent"] = round(reduction_percent, 2)
     else:
         metrics["text_length_reduction_percent"] = 0
-        
-    # Count tokens using the new function
-    original_tokens = count_tokens(raw_text, config)
-    processed_tokens = count_tokens(processed_text, config)
     
     # Update metric keys to reflect actual counting (or estimation if fallback used)
-    token_key_suffix = "_estimate" if get_tokenizer(config.get("metrics.tokenizer_encoding", "cl100k_base")) is None else ""
+    token_key_suffix = "" if exact else "_estimate"
     metrics[f"original_tokens{token_key_suffix}"] = original_tokens
     metrics[f"processed_tokens{token_key_suffix}"] = processed_tokens
     
@@ -108,7 +352,7 @@ def calculate_metrics(
             kb_per_second = input_file_stats["file_size_kb"] / processing_time
             metrics["processing_speed_kb_per_second"] = round(kb_per_second, 2)
             
-        chars_per_second = len(raw_text) / processing_time
+        chars_per_second = raw_length / processing_time
         metrics["processing_speed_chars_per_second"] = round(chars_per_second, 2)
         
     # Include file stats if available
@@ -118,6 +362,59 @@ def calculate_metrics(
     return metrics
 
 
+class StreamMetrics:
+    """Metrics of a document processed as windows (see ProcessorPipeline.process_stream).
+
+    Lengths and token counts are added up window by window as the windows
+    pass through ``count_raw`` and ``count_processed``, so no full copy of
+    the raw or processed text is needed. Token counts are the sums of the
+    windows' counts, which can differ from a count of the joined text by a
+    token or so per window.
+    """
+
+    def __init__(self, config: ConfigManager, separator: str = WINDOW_SEPARATOR):
+        """Initialize the accumulator.
+
+        Args:
+            config: Configuration selecting the tokenizer (see
+                ``get_config_token_service``).
+            separator: String the processed windows are joined with.
+        """
+        self.token_service = get_config_token_service(config)
+        self.separator = separator
+        self.raw_length = 0
+        self.processed_length = 0
+        self.original_tokens = 0
+        self.processed_tokens = 0
+        self.processed_windows = 0
+
+    def count_raw(self, windows: Iterable[str]) -> Iterator[str]:
+        """Pass raw windows through, counting them."""
+        for window in windows:
+            self.raw_length += len(window)
+            self.original_tokens += self.token_service.count(window)
+            yield window
+
+    def count_processed(self, windows: Iterable[str]) -> Iterator[str]:
+        """Pass processed windows through, counting them."""
+        for window in windows:
+            yield window
+            # Counted once the consumer is done with the window, so a writer
+            # that tokenizes it first (the chunk writer) leaves it cached
+            if self.processed_windows:
+                self.processed_length += len(self.separator)
+            self.processed_length += len(window)
+            self.processed_tokens += self.token_service.count(window)
+            self.processed_windows += 1
+
+    def result(self, processing_time: float, input_file_stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Metrics of the windows counted so far, as returned by calculate_metrics."""
+        return _build_metrics(
+            self.raw_length, self.processed_length, self.original_tokens, self.processed_tokens,
+            self.token_service.is_exact(), processing_time, input_file_stats
+        )
+
+
 def generate_metrics_report(metrics: Dict[str, Any]) -> str:
     """Generate a human-readable report from metrics.
     
@@ -4,12 +4,12 @@ import os
 import time
 # import signal # Unused
 # import platform # Unused
-import psutil
 import concurrent.futures
+import multiprocessing
 # import queue # Unused
 import threading
 # from pathlib import Path # Unused
-from typing import List, Callable, TypeVar, Any, Dict, Optional, Union, Tuple, Iterator, Generic # Generic unused
+from typing import List, Callable, TypeVar, Any, Dict, Optional, Union, Tuple, Iterator, Iterable, Generic # Generic unused
 from dataclasses import dataclass, field
 
 from textcleaner.utils.logging_config import get_logger
@@ -37,14 +37,19 @@ class ParallelResult(Generic[T, R]):
 
 
 class ProgressTracker:
-    """Track progress of parallel tasks with periodic updates."""
+    """Count started and completed parallel tasks.
+    
+    The tracker is only updated from the thread that submits tasks and
+    collects their results, so it needs neither a lock nor a thread of its
+    own. Live progress display is handled by ``textcleaner.utils.events``.
+    """
     
     def __init__(self, total_items: int, update_interval: float = 0.5):
         """Initialize the progress tracker.
         
         Args:
             total_items: Total number of items to process
-            update_interval: How often to update progress (in seconds)
+            update_interval: Kept for backwards compatibility; unused
         """
         self.total = total_items
         self.started = 0
@@ -53,59 +58,27 @@ class ProgressTracker:
         self.failed = 0
         self.update_interval = update_interval
         self.start_time = 0.0
-        self._lock = threading.Lock()
-        self._thread = None
-        self._stop_event = threading.Event()
+        self.end_time: Optional[float] = None
         
     def start(self):
         """Start tracking progress."""
         self.start_time = time.time()
-        self._thread = threading.Thread(target=self._update_progress, daemon=True)
-        self._thread.start()
         
     def stop(self):
         """Stop tracking progress."""
-        if self._thread and self._thread.is_alive():
-            self._stop_event.set()
-            self._thread.join(timeout=1.0)
+        self.end_time = time.time()
             
     def item_started(self):
         """Mark an item as started."""
-        with self._lock:
-            self.started += 1
+        self.started += 1
             
     def item_completed(self, success: bool = True):
         """Mark an item as completed."""
-        with self._lock:
-            self.completed += 1
-            if success:
-                self.successful += 1
-            else:
-                self.failed += 1
-            
-    def _update_progress(self):
-        """Update progress periodically."""
-        # Minimal progress updates - will mostly be disabled in our implementation
-        previous_completed = 0
-        
-        while not self._stop_event.is_set():
-            with self._lock:
-                started = self.started
-                completed = self.completed
-                successful = self.successful
-                failed = self.failed
-                
-            # Only update if something changed
-            if completed > previous_completed:
-                previous_completed = completed
-                
-                # Minimal progress display - don't print anything here as we handle it elsewhere
-                
-            # Sleep for the update interval
-            self._stop_event.wait(self.update_interval)
-            
-        # Final update when finished
-        # Again, don't print anything here as we handle it elsewhere
+        self.completed += 1
+        if success:
+            self.successful += 1
+        else:
+            self.failed += 1
 
 
 class ResourceMonitor:
@@ -149,6 +122,8 @@ class ResourceMonitor:
     
     def _monitor_resources(self):
         """Monitor system resources and log/throttle as needed."""
+        import psutil
+
         while not self._stop_event.is_set():
             try:
                 # Get memory usage
@@ -198,6 +173,8 @@ class ResourceMonitor:
         Returns:
             Dictionary with resource statistics
         """
+        import psutil
+
         try:
             memory_info = psutil.virtual_memory()
             
@@ -221,7 +198,8 @@ class ParallelProcessor:
     
     def __init__(self, max_workers: Optional[int] = None, 
                  adaptive_workers: bool = True,
-                 min_workers: int = 2):
+                 min_workers: int = 2,
+                 mp_context: Optional[multiprocessing.context.BaseContext] = None):
         """Initialize the parallel processor.
         
         Args:
@@ -229,6 +207,9 @@ class ParallelProcessor:
                          If None, defaults to number of CPU cores.
             adaptive_workers: Whether to adapt the number of workers based on system load
             min_workers: Minimum number of workers to use when adapting
+            mp_context: Optional multiprocessing context used to start worker
+                        processes (e.g. a warm forkserver template). Defaults
+                        to the platform's start method.
         """
         self.logger = get_logger(__name__)
         
@@ -237,6 +218,7 @@ class ParallelProcessor:
         self.max_workers = max_workers or max(2, min(32, cpu_count))
         self.min_workers = min(min_workers, self.max_workers)
         self.adaptive_workers = adaptive_workers
+        self.mp_context = mp_context
         
         # Create resource monitor
         self.resource_monitor = ResourceMonitor()
@@ -255,6 +237,8 @@ class ParallelProcessor:
         if not self.adaptive_workers:
             return self.max_workers
         
+        import psutil
+        
         # Check if we're throttling due to resource constraints
         if self.resource_monitor.should_throttle():
             # When throttling, use minimum workers
@@ -285,6 +269,25 @@ class ParallelProcessor:
             self.logger.exception(f"Unexpected error determining worker count: {e}")
             return self.max_workers
     
+    def _create_executor(self,
+                         worker_count: int,
+                         use_processes: bool,
+                         initializer: Optional[Callable[..., None]],
+                         initargs: Tuple[Any, ...]) -> concurrent.futures.Executor:
+        """Create a thread or process pool with the given worker count."""
+        if use_processes:
+            # A worker template context applies its settings through the initializer
+            wrap_initializer = getattr(self.mp_context, "wrap_initializer", None)
+            if wrap_initializer is not None:
+                initializer, initargs = wrap_initializer(initializer, initargs)
+            return concurrent.futures.ProcessPoolExecutor(
+                max_workers=worker_count, mp_context=self.mp_context,
+                initializer=initializer, initargs=initargs
+            )
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=worker_count, initializer=initializer, initargs=initargs
+        )
+    
     def process_items(self, 
                      items: List[T], 
                      process_func: Callable[[T], R],
@@ -293,7 +296,10 @@ class ParallelProcessor:
                      show_progress: bool = True,
                      progress_interval: float = 0.5,
                      timeout: Optional[float] = None,
-                     preserve_order: bool = True) -> List[ParallelResult[T, R]]:
+                     preserve_order: bool = True,
+                     initializer: Optional[Callable[..., None]] = None,
+                     initargs: Tuple[Any, ...] = (),
+                     cost_func: Optional[Callable[[T], float]] = None) -> List[ParallelResult[T, R]]:
         """Process items in parallel with enhanced tracking and resource management.
         
         Args:
@@ -306,6 +312,13 @@ class ParallelProcessor:
             timeout: Optional timeout per item (in seconds)
             preserve_order: Whether to preserve the original order of items in the results
                            (defaults to True to ensure consistent test behavior)
+            initializer: Optional callable run once in every worker before it
+                         takes tasks (e.g. to build per-process state)
+            initargs: Arguments passed to the initializer
+            cost_func: Optional estimate of each item's processing cost. When
+                       given, items are submitted longest-expected-first so
+                       large items do not end up running alone at the end.
+                       Result ordering is unaffected.
             
         Returns:
             List of ParallelResult objects
@@ -346,19 +359,22 @@ class ParallelProcessor:
             f"(max workers: {self.max_workers})"
         )
         
-        # Choose executor based on use_processes flag
-        executor_class = (concurrent.futures.ProcessPoolExecutor if use_processes 
-                          else concurrent.futures.ThreadPoolExecutor)
             
         # Start timing
         start_time = time.time()
         
         try:
             # Execute in parallel with dynamic worker count adjustment
-            with executor_class(max_workers=self._get_worker_count()) as executor:
+            with self._create_executor(self._get_worker_count(), use_processes,
+                                       initializer, initargs) as executor:
                 # Submit all tasks with progress tracking
                 futures = {}
-                for i, (task_id, item) in enumerate(zip(task_ids, items)):
+                submission_order = list(range(len(items)))
+                if cost_func is not None:
+                    costs = [cost_func(item) for item in items]
+                    submission_order.sort(key=lambda idx: costs[idx], reverse=True)
+                for i in submission_order:
+                    task_id, item = task_ids[i], items[i]
                     if progress:
                         progress.item_started()
                     
@@ -478,6 +494,126 @@ class ParallelProcessor:
             
         return results
     
+    def iter_items(self,
+                   items: Iterable[T],
+                   process_func: Callable[[T], R],
+                   use_processes: bool = False,
+                   max_in_flight: Optional[int] = None,
+                   preserve_order: bool = False,
+                   task_id_func: Optional[Callable[[T], str]] = None,
+                   initializer: Optional[Callable[..., None]] = None,
+                   initargs: Tuple[Any, ...] = ()) -> Iterator[ParallelResult[T, R]]:
+        """Process items lazily, yielding results as they become available.
+        
+        Unlike ``process_items``, items are pulled from ``items`` only when a
+        slot frees up, so at most ``max_in_flight`` items are submitted but not
+        yet yielded at any time. This keeps memory flat for arbitrarily long
+        inputs, including generators.
+        
+        Closing the iterator early cancels items that have not started and
+        waits for running ones to finish.
+        
+        Args:
+            items: Iterable of items to process (consumed lazily)
+            process_func: Function to apply to each item
+            use_processes: Whether to use processes instead of threads
+            max_in_flight: Maximum number of submitted but not yet yielded items.
+                           Defaults to twice the worker count.
+            preserve_order: Yield results in input order instead of completion
+                            order. Completed results wait in the window until
+                            their predecessors finish.
+            task_id_func: Optional function deriving a task ID from an item
+            initializer: Optional callable run once in every worker before it
+                         takes tasks
+            initargs: Arguments passed to the initializer
+            
+        Yields:
+            ParallelResult objects; exceptions are reported as failed results
+        """
+        worker_count = self._get_worker_count()
+        window = max(1, max_in_flight or worker_count * 2)
+        
+        self.logger.info(
+            f"Streaming items using {'processes' if use_processes else 'threads'} "
+            f"(workers: {worker_count}, window: {window})"
+        )
+        
+        item_iter = iter(items)
+        pending: Dict[concurrent.futures.Future, Tuple[int, str, T]] = {}
+        completed: Dict[int, ParallelResult[T, R]] = {}  # Only used when preserving order
+        submitted = 0
+        next_to_yield = 0
+        exhausted = False
+        successful = 0
+        start_time = time.time()
+        
+        self.resource_monitor.start()
+        executor = self._create_executor(worker_count, use_processes, initializer, initargs)
+        try:
+            while True:
+                # Refill the window from the input
+                while not exhausted and submitted - next_to_yield < window:
+                    try:
+                        item = next(item_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    task_id = task_id_func(item) if task_id_func else f"task_{submitted}"
+                    future = executor.submit(
+                        self._execute_task_with_tracking,
+                        process_func, item, task_id, submitted
+                    )
+                    pending[future] = (submitted, task_id, item)
+                    submitted += 1
+                
+                if not pending:
+                    break
+                
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    index, task_id, item = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as exc:
+                        self.logger.exception(f"Task {task_id} generated an exception: {exc}")
+                        result = ParallelResult(
+                            task_id=task_id,
+                            result=None,
+                            success=False,
+                            input_item=item,
+                            error=str(exc),
+                            metadata={"original_index": index}
+                        )
+                    if result.success:
+                        successful += 1
+                    else:
+                        self.logger.warning(f"Task {task_id} failed: {result.error}")
+                    
+                    if preserve_order:
+                        completed[index] = result
+                    else:
+                        next_to_yield += 1
+                        yield result
+                
+                # Release every result whose predecessors have all been yielded
+                while next_to_yield in completed:
+                    result = completed.pop(next_to_yield)
+                    next_to_yield += 1
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.resource_monitor.stop()
+            total_time = time.time() - start_time
+            performance_monitor.record_operation("parallel_streaming", total_time)
+            self.logger.info(
+                f"Streaming processing finished: {successful}/{next_to_yield} successful "
+                f"in {total_time:.2f}s"
+            )
+    
     @staticmethod
     def _execute_task_with_tracking(
         func: Callable[[T], R], 
@@ -503,8 +639,7 @@ class ParallelProcessor:
         
         # Try to get initial memory usage
         try:
-            # psutil already imported at top level
-            # import psutil 
+            import psutil
             process = psutil.Process(os.getpid())
             start_memory = process.memory_info().rss / (1024 * 1024)  # MB
         except ImportError:
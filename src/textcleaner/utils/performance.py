@@ -13,7 +13,6 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 import json
-import tiktoken
 
 from textcleaner.utils.logging_config import get_logger
 
@@ -21,13 +20,7 @@ T = TypeVar('T')
 logger = get_logger(__name__)
 
 # Define a standard encoding (cl100k_base is common for GPT-3.5/4)
-# Cache the encoding object for efficiency
 _DEFAULT_ENCODING_NAME = "cl100k_base"
-try:
-    _encoding = tiktoken.get_encoding(_DEFAULT_ENCODING_NAME)
-except Exception as e:
-    logger.warning(f"Could not load tiktoken encoding '{_DEFAULT_ENCODING_NAME}'. Falling back to basic split(). Error: {e}")
-    _encoding = None
 
 def timed(func: Callable[..., T]) -> Callable[..., T]:
     """Decorator that times the execution of a function.
@@ -54,8 +47,9 @@ def timed(func: Callable[..., T]) -> Callable[..., T]:
 def calculate_token_estimate(text: str) -> int:
     """Calculate estimated tokens using tiktoken.
     
-    Uses the '{_DEFAULT_ENCODING_NAME}' encoding by default.
-    Falls back to simple whitespace splitting if tiktoken fails.
+    Uses the '{_DEFAULT_ENCODING_NAME}' encoding through the shared
+    tokenization service, so counts are cached with those of the metrics.
+    Falls back to a word and punctuation estimate if tiktoken fails.
 
     Args:
         text: The text to estimate token count for
@@ -66,18 +60,10 @@ def calculate_token_estimate(text: str) -> int:
     if not text:
         return 0
 
-    if _encoding:
-        try:
-            # Use tiktoken for accurate counting
-            return len(_encoding.encode(text))
-        except Exception as e:
-            # Log the error if tiktoken fails unexpectedly on specific text
-            logger.error(f"tiktoken encoding failed for a text snippet (length {len(text)}): {e}. Falling back to split().")
-            # Fallback to splitting if encoding fails for some reason
-            return len(text.split())
-    else:
-        # Fallback if encoding couldn't be loaded initially
-        return len(text.split())
+    # Imported here so that importing this module does not load tiktoken
+    from textcleaner.utils.metrics import get_token_service
+
+    return get_token_service(_DEFAULT_ENCODING_NAME).count(text)
 
 
 class TokenCounter:
@@ -0,0 +1,143 @@
+"""Single-pass phrase replacement for large replacement dictionaries.
+
+Replacing dictionary phrases with one regex per entry costs a full pass over
+the document per entry, and a single alternation of all entries slows down
+as the dictionary grows because the regex engine tries every alternative at
+every position.
+
+``PhraseReplacer`` compiles a dictionary into a trie over word tokens. The
+text is split into words and separators once, by a C-level regex, and every
+word start is looked up in the trie. A lookup continues only while the
+following tokens extend a dictionary phrase, so the cost per word does not
+depend on the dictionary size. Phrases only match whole words (like ``\\b``
+at both ends), case-insensitively. When several phrases start at the same
+word the longest wins, and matches do not overlap.
+"""
+
+import re
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# Splits text into alternating word and separator tokens: even indices hold
+# words (the first and last may be empty), odd indices the separators
+_TOKEN_SPLIT = re.compile(r'(\W+)')
+
+# Trie key holding the replacement of the phrase ending at a node
+_VALUE = None
+
+
+def match_case(matched: str, replacement: str) -> str:
+    """Adapt a replacement to the capitalization of the text it replaces.
+
+    Lower-case text gets the replacement unchanged, upper-case text gets it
+    in upper case and capitalized text gets its first letter capitalized.
+    """
+    if not replacement or matched.islower():
+        return replacement
+    if matched.isupper():
+        return replacement.upper()
+    if matched[0].isupper():
+        return replacement[0].upper() + replacement[1:]
+    return replacement
+
+
+class PhraseReplacer:
+    """Replaces dictionary phrases in text in a single pass."""
+
+    def __init__(self, phrases: Mapping[str, str], preserve_case: bool = False):
+        """Compile a replacement dictionary.
+
+        Args:
+            phrases: Mapping of phrases to their replacements. Phrases are
+                matched case-insensitively; their words must be separated
+                exactly as in the text. Phrases that do not start and end
+                with a word character are ignored.
+            preserve_case: Adapt replacements to the capitalization of the
+                matched text (see ``match_case``); otherwise replacements
+                are inserted as given.
+        """
+        self.preserve_case = preserve_case
+        self._trie: Dict = {}
+        self._size = 0
+        for phrase, replacement in phrases.items():
+            tokens = _TOKEN_SPLIT.split(phrase.lower())
+            if not tokens[0] or not tokens[-1]:
+                continue
+            node = self._trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            if _VALUE not in node:
+                self._size += 1
+            node[_VALUE] = replacement
+
+    def __len__(self) -> int:
+        """Number of phrases in the dictionary."""
+        return self._size
+
+    def _longest_match(self, tokens: List[str], start: int, node: Dict) -> Optional[Tuple[int, str]]:
+        """Longest phrase starting at a word token.
+
+        Args:
+            tokens: Word and separator tokens of the text.
+            start: Index of the word token the phrase starts at.
+            node: Trie node of that word.
+
+        Returns:
+            Index of the last token of the phrase and its replacement, or None.
+        """
+        best = None
+        index = start
+        last = len(tokens) - 1
+        while True:
+            if _VALUE in node:
+                best = (index, node[_VALUE])
+            # A phrase continues with a separator and a word
+            if index + 2 > last:
+                break
+            separator_node = node.get(tokens[index + 1])
+            if separator_node is None:
+                break
+            node = separator_node.get(tokens[index + 2].lower())
+            if node is None:
+                break
+            index += 2
+        return best
+
+    def replace(self, text: str) -> str:
+        """Replace all dictionary phrases in the text.
+
+        Args:
+            text: Text to process.
+
+        Returns:
+            The text with every non-overlapping, leftmost-longest phrase
+            match replaced.
+        """
+        if not text or not self._size:
+            return text
+        tokens = _TOKEN_SPLIT.split(text)
+        trie = self._trie
+        output: Optional[List[str]] = None
+        copied = 0  # Tokens before this index are already in output
+        index = 0
+        count = len(tokens)
+        while index < count:
+            word = tokens[index]
+            node = trie.get(word.lower()) if word else None
+            if node is not None:
+                match = self._longest_match(tokens, index, node)
+                if match is not None:
+                    end, replacement = match
+                    if output is None:
+                        output = []
+                    output.extend(tokens[copied:index])
+                    if self.preserve_case:
+                        replacement = match_case("".join(tokens[index:end + 1]), replacement)
+                    output.append(replacement)
+                    copied = end + 1
+                    index = end + 2
+                    continue
+            index += 2
+        if output is None:
+            return text
+        output.extend(tokens[copied:])
+        return "".join(output)
@@ -1,11 +1,57 @@
 """Replacement dictionaries for text simplification."""
 
 from typing import Dict, List, Tuple, Optional
-import re
 import json
 from pathlib import Path
 import logging
 
+from textcleaner.utils.phrase_replacer import PhraseReplacer
+
+
+# Common replacements for general text, matched case-insensitively as whole
+# words; replacements are inserted as given
+COMMON_REPLACEMENTS = {
+    # Common phrases to abbreviate
+    'for example': 'e.g.', 'for instance': 'e.g.',
+    'that is': 'i.e.', 'in other words': 'i.e.',
+    'and so on': 'etc.', 'and so forth': 'etc.', 'etcetera': 'etc.',
+    'in relation to': 're:', 'regarding': 're:', 'concerning': 're:', 'with respect to': 're:',
+    'versus': 'vs.', 'as opposed to': 'vs.',
+    'and others': 'et al.', 'et alii': 'et al.',
+    'in the year': 'AD', 'anno domini': 'AD',
+    'before the common era': 'BCE', 'before christ': 'BCE',
+
+    # Time expressions
+    'hours': 'hr', 'hour': 'hr',
+    'minutes': 'min', 'minute': 'min',
+    'seconds': 'sec', 'second': 'sec',
+
+    # Units
+    'kilograms': 'kg', 'kilogram': 'kg',
+    'grams': 'g', 'gram': 'g',
+    'milligrams': 'mg', 'milligram': 'mg',
+    'kilometers': 'km', 'kilometer': 'km',
+    'meters': 'm', 'meter': 'm',
+    'centimeters': 'cm', 'centimeter': 'cm',
+    'millimeters': 'mm', 'millimeter': 'mm',
+
+    # Common titles
+    'professor': 'Prof.',
+    'doctor': 'Dr.', 'doctorate': 'Dr.',
+    'mister': 'Mr.',
+    'missus': 'Mrs.',
+
+    # Organizations
+    'united nations': 'UN',
+    'united states of america': 'USA',
+    'united kingdom': 'UK',
+    'european union': 'EU',
+    'world health organization': 'WHO',
+}
+
+# Built once and shared by all TextSimplifier instances
+_COMMON_REPLACER = PhraseReplacer(COMMON_REPLACEMENTS)
+
 
 class TextSimplifier:
     """Simplifies text using common abbreviations and replacements.
@@ -19,44 +65,8 @@ class TextSimplifier:
         self.logger = logging.getLogger(__name__)
         
         # Common replacements for general text
-        self.replacements = {
-            # Common phrases to abbreviate
-            r'\b(for example|for instance)\b': 'e.g.',
-            r'\b(that is|in other words)\b': 'i.e.',
-            r'\b(and so on|and so forth|etcetera)\b': 'etc.',
-            r'\b(in relation to|regarding|concerning|with respect to)\b': 're:',
-            r'\b(versus|as opposed to)\b': 'vs.',
-            r'\b(and others|et alii)\b': 'et al.',
-            r'\b(in the year|anno domini)\b': 'AD',
-            r'\b(before the common era|before christ)\b': 'BCE',
-            
-            # Time expressions
-            r'\b(hours|hour)\b': 'hr',
-            r'\b(minutes|minute)\b': 'min',
-            r'\b(seconds|second)\b': 'sec',
-            
-            # Units
-            r'\b(kilograms|kilogram)\b': 'kg',
-            r'\b(grams|gram)\b': 'g',
-            r'\b(milligrams|milligram)\b': 'mg',
-            r'\b(kilometers|kilometer)\b': 'km',
-            r'\b(meters|meter)\b': 'm',
-            r'\b(centimeters|centimeter)\b': 'cm',
-            r'\b(millimeters|millimeter)\b': 'mm',
-            
-            # Common titles
-            r'\b(professor)\b': 'Prof.',
-            r'\b(doctor|doctorate)\b': 'Dr.',
-            r'\b(mister)\b': 'Mr.',
-            r'\b(missus)\b': 'Mrs.',
-            
-            # Organizations
-            r'\b(united nations)\b': 'UN',
-            r'\b(united states of america)\b': 'USA',
-            r'\b(united kingdom)\b': 'UK',
-            r'\b(european union)\b': 'EU',
-            r'\b(world health organization)\b': 'WHO',
-        }
+        self.replacements = COMMON_REPLACEMENTS
+        self.replacer = _COMMON_REPLACER
         
     def simplify(self, text: str) -> str:
         """Simplify text by applying common replacements.
@@ -70,13 +80,8 @@ class TextSimplifier:
         if not text:
             return text
         
-        simplified_text = text
-        
-        # Apply all replacements
-        for pattern, replacement in self.replacements.items():
-            simplified_text = re.sub(pattern, replacement, simplified_text, flags=re.IGNORECASE)
-        
-        return simplified_text
+        # Apply all replacements in one pass
+        return self.replacer.replace(text)
 
 
 # Domain-specific abbreviations and replacements
@@ -215,18 +220,20 @@ class DomainTextOptimizer:
         if custom_dict:
             self.replacements.update(custom_dict)
             
-        # Compile a regex for efficient matching
+        # Compile the dictionary for single-pass matching
         self.compile_pattern()
     
     def compile_pattern(self):
-        """Compile the regex pattern for matching replacements."""
-        if not self.replacements:
-            self.pattern = None
-            return
-            
-        self.pattern = re.compile(
-            r'\b(' + '|'.join(re.escape(k) for k in self.replacements.keys()) + r')\b',
-            re.IGNORECASE
+        """Compile the replacement dictionary for matching."""
+        # Empty replacements leave the matched text unchanged, so they are skipped.
+        # Matched text is looked up in lower case, so phrases with capitals
+        # never match and are left out
+        self.replacer = PhraseReplacer(
+            {
+                phrase: replacement for phrase, replacement in self.replacements.items()
+                if replacement and phrase == phrase.lower()
+            },
+            preserve_case=True,
         )
     
     def optimize(self, text: str) -> str:
@@ -238,23 +245,10 @@ class DomainTextOptimizer:
         Returns:
             Optimized text.
         """
-        if not text or not self.pattern:
+        if not text:
             return text
-            
-        def _replace(match):
-            matched = match.group(0)
-            replacement = self.replacements.get(matched.lower())
-            
-            # Preserve case pattern when possible
-            if replacement and matched.islower():
-                return replacement
-            elif replacement and matched.isupper():
-                return replacement.upper()
-            elif replacement and matched[0].isupper():
-                return replacement[0].upper() + replacement[1:] if len(replacement) > 1 else replacement.upper()
-            return replacement or matched
-            
-        return self.pattern.sub(_replace, text)
+        # Case pattern of the matched text is preserved when possible
+        return self.replacer.replace(text)
         
     def add_domain(self, domain: str) -> None:
         """Add a specific domain's abbreviations to the replacements.
@@ -0,0 +1,229 @@
+"""Content-addressed on-disk cache for processing results.
+
+Entries are keyed by the SHA-256 of the input file contents combined with a
+fingerprint of the effective configuration and the requested output format,
+so renaming or touching a file does not invalidate its entry while any
+change to the bytes or settings does.  Formats whose output records the
+source path (chunked JSONL) are also keyed on the resolved input path.  Each entry is a single JSON file that
+is published with an atomic rename, which makes the cache safe to share
+between concurrent processes without any locking.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from textcleaner.utils.file_utils import atomic_write_text, get_cache_dir
+from textcleaner.utils.logging_config import get_logger
+from textcleaner.utils.security import SecurityUtils
+
+# Bump whenever the entry layout changes; old entries are then ignored.
+CACHE_FORMAT_VERSION = 1
+ENTRY_SUFFIX = ".json"
+DEFAULT_MAX_SIZE_MB = 512
+STALE_TEMP_SECONDS = 3600  # Leftover temp files older than this are swept.
+
+
+class ResultCache:
+    """Bounded, process-safe cache of rendered outputs and their metrics.
+
+    Entries are sharded into subdirectories by the first two characters of the
+    key.  Reads bump the entry's modification time so that eviction, which
+    removes the least recently used entries once the cache grows beyond
+    ``max_size_bytes``, approximates LRU across all processes sharing the
+    directory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+        security_utils: Optional[SecurityUtils] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries. Defaults to the
+                per-user textcleaner cache directory.
+            max_size_bytes: Upper bound for the total size of all entries.
+            security_utils: Security utilities used to hash input files.
+        """
+        self.logger = get_logger(__name__)
+        self.cache_dir = Path(cache_dir) if cache_dir else get_cache_dir("results")
+        self.max_size_bytes = max_size_bytes
+        self.security = security_utils or SecurityUtils()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Running estimate of the cache size; None until the first scan.
+        self._approx_size: Optional[int] = None
+
+    def make_key(
+        self,
+        input_path: Path,
+        config_fingerprint: str,
+        output_format: str,
+        include_path: bool = False,
+    ) -> Optional[str]:
+        """Build the cache key for an input file.
+
+        Args:
+            input_path: Path to the input file.
+            config_fingerprint: Fingerprint of the effective configuration.
+            output_format: Output format the result is rendered in.
+            include_path: Also key on the resolved input path, for output
+                formats that record where their content came from.
+
+        Returns:
+            Hex-encoded key, or None if the file could not be hashed.
+        """
+        content_hash, error = self.security.compute_file_hash(input_path)
+        if content_hash is None:
+            self.logger.debug(f"Not caching {input_path}: {error}")
+            return None
+
+        from textcleaner import __version__
+
+        material = f"{CACHE_FORMAT_VERSION}:{__version__}:{content_hash}:{config_fingerprint}:{output_format}"
+        if include_path:
+            material += f":{Path(input_path).resolve()}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.cache_dir / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cache entry.
+
+        Args:
+            key: Cache key from ``make_key``.
+
+        Returns:
+            The stored entry, or None on a miss.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            # A corrupt entry is treated as a miss and dropped
+            self.logger.warning(f"Discarding unreadable cache entry {entry_path.name}: {e}")
+            self._remove(entry_path)
+            return None
+
+        if entry.get("version") != CACHE_FORMAT_VERSION or "output" not in entry:
+            return None
+
+        try:
+            os.utime(entry_path)  # Record the access for LRU eviction
+        except OSError:
+            pass  # Evicted concurrently; the entry we read is still valid
+        return entry
+
+    def put(
+        self,
+        key: str,
+        output: str,
+        output_format: str,
+        metrics: Dict[str, Any],
+        metadata: Dict[str, Any],
+    ) -> None:
+        """Store a rendered result.
+
+        Args:
+            key: Cache key from ``make_key``.
+            output: Rendered output file contents.
+            output_format: Format the output was rendered in.
+            metrics: Processing metrics for the result.
+            metadata: Metadata extracted from the input file.
+        """
+        entry = {
+            "version": CACHE_FORMAT_VERSION,
+            "created_at": time.time(),
+            "output_format": output_format,
+            "output": output,
+            "metrics": metrics,
+            "metadata": metadata,
+        }
+        payload = json.dumps(entry, default=str)
+        entry_path = self._entry_path(key)
+        try:
+            entry_path.parent.mkdir(exist_ok=True)
+            atomic_write_text(entry_path, payload)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache entry for key {key[:12]}: {e}")
+            return
+
+        if self._approx_size is not None:
+            self._approx_size += len(payload)
+        if self._approx_size is None or self._approx_size > self.max_size_bytes:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits its bound.
+
+        Returns:
+            Number of entries removed.
+        """
+        entries: List[Tuple[float, int, Path]] = []
+        total_size = 0
+        now = time.time()
+        for shard in self._iter_shards():
+            try:
+                with os.scandir(shard) as it:
+                    for item in it:
+                        try:
+                            stat = item.stat()
+                        except OSError:
+                            continue
+                        if item.name.endswith(".tmp"):
+                            if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                                self._remove(Path(item.path))
+                            continue
+                        if item.name.endswith(ENTRY_SUFFIX):
+                            entries.append((stat.st_mtime, stat.st_size, Path(item.path)))
+                            total_size += stat.st_size
+            except OSError:
+                continue
+
+        removed = 0
+        if total_size > self.max_size_bytes:
+            entries.sort()  # Oldest access first
+            for _, size, path in entries:
+                if total_size <= self.max_size_bytes:
+                    break
+                self._remove(path)
+                total_size -= size
+                removed += 1
+            self.logger.debug(f"Evicted {removed} result cache entries")
+
+        self._approx_size = total_size
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        for shard in self._iter_shards():
+            for path in shard.iterdir():
+                self._remove(path)
+        self._approx_size = 0
+
+    def _iter_shards(self):
+        """Yield the shard directories currently present."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                shards = [Path(item.path) for item in it if item.is_dir()]
+        except OSError:
+            return
+        yield from shards
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        """Delete a file, ignoring races with other processes."""
+        try:
+            path.unlink()
+        except OSError:
+            pass
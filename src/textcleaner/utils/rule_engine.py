@@ -0,0 +1,235 @@
+"""Compiled rule sets for pattern-based cleaning stages.
+
+A ``RuleSet`` holds a family of regex rules (header/footer lines, boilerplate,
+redundant phrases, ...). Every rule is compiled once, and the whole family is
+also merged into one alternation with a named group per rule, so a line can
+be tested against all rules in a single scan.
+
+Rules can declare keywords: literals, one of which every match of the rule
+contains. Before a rule is run over a document, its keywords are looked up in
+the case-folded text with plain substring search, which is far cheaper than
+a regex scan. A document in which no keyword occurs is returned untouched
+without running any regex; on large, clean documents that is the common case.
+
+Custom rule files use the same engine, see ``RuleSet.from_file``.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Pattern, Tuple, Union
+
+import yaml
+
+# Characters that make a pattern more than a plain literal
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+_CASE_INSENSITIVE_PREFIX = "(?i)"
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A single pattern rule.
+
+    Attributes:
+        pattern: Regular expression; may start with ``(?i)``.
+        replacement: Replacement used by ``RuleSet.sub`` (may use group
+            references such as ``\\1``).
+        keywords: Case-insensitive literals, one of which every match
+            contains. ``None`` derives the keyword from patterns that are plain
+            literals and otherwise disables the prefilter for the rule.
+        name: Optional name, used in messages and by ``RuleSet.search``.
+    """
+    pattern: str
+    replacement: str = ""
+    keywords: Optional[Tuple[str, ...]] = None
+    name: Optional[str] = None
+
+    def literal_keywords(self) -> Optional[Tuple[str, ...]]:
+        """Case-folded keywords of the rule, or None if it has no prefilter."""
+        if self.keywords is not None:
+            return tuple(keyword.casefold() for keyword in self.keywords)
+        body = self.pattern
+        if body.startswith(_CASE_INSENSITIVE_PREFIX):
+            body = body[len(_CASE_INSENSITIVE_PREFIX):]
+        if body and not _REGEX_METACHARACTERS.intersection(body):
+            return (body.casefold(),)
+        return None
+
+
+RuleSpec = Union[Rule, str, Tuple[str, str]]
+
+
+def _as_rule(spec: RuleSpec) -> Rule:
+    """Build a rule from a rule, a pattern or a (pattern, replacement) pair."""
+    if isinstance(spec, Rule):
+        return spec
+    if isinstance(spec, str):
+        return Rule(spec)
+    pattern, replacement = spec
+    return Rule(pattern, replacement)
+
+
+def _scoped(pattern: str) -> str:
+    """Rewrite a leading ``(?i)`` as a scoped group for use in an alternation."""
+    if pattern.startswith(_CASE_INSENSITIVE_PREFIX):
+        return f"(?i:{pattern[len(_CASE_INSENSITIVE_PREFIX):]})"
+    return f"(?:{pattern})"
+
+
+def _is_anchored(pattern: str) -> bool:
+    """Whether a pattern can only match at the start of the text."""
+    if pattern.startswith(_CASE_INSENSITIVE_PREFIX):
+        pattern = pattern[len(_CASE_INSENSITIVE_PREFIX):]
+    return pattern.startswith("^")
+
+
+class RuleSet:
+    """A family of rules compiled for single-scan matching and prefiltering."""
+
+    def __init__(self, rules: Iterable[RuleSpec], name: str = "rules"):
+        """Compile a rule set.
+
+        Args:
+            rules: Rules, patterns or (pattern, replacement) pairs, in the
+                order they are applied.
+            name: Name of the family, used in error messages.
+
+        Raises:
+            ValueError: If a pattern does not compile.
+        """
+        self.name = name
+        self.rules: List[Rule] = [_as_rule(spec) for spec in rules]
+        self._regexes: List[Pattern[str]] = []
+        for index, rule in enumerate(self.rules):
+            try:
+                self._regexes.append(re.compile(rule.pattern))
+            except re.error as e:
+                raise ValueError(f"Invalid pattern in rule {index} of {name}: {rule.pattern!r} ({e})") from e
+        self._keywords = [rule.literal_keywords() for rule in self.rules]
+        self._prefiltered = bool(self.rules) and all(keywords is not None for keywords in self._keywords)
+
+        # All rules in one alternation; the group "r<index>" identifies the rule.
+        # If every rule is anchored at the start, match() is equivalent to
+        # search() and fails after the first character on most lines.
+        self._matcher = re.compile(
+            "|".join(f"(?P<r{index}>{_scoped(rule.pattern)})" for index, rule in enumerate(self.rules))
+        ) if self.rules else None
+        anchored = bool(self.rules) and all(_is_anchored(rule.pattern) for rule in self.rules)
+        self._scan = self._matcher.match if anchored else (self._matcher.search if self._matcher else None)
+
+    @classmethod
+    def from_file(cls, file_path: Union[str, Path]) -> "RuleSet":
+        """Load a rule set from a YAML (or JSON) rule file.
+
+        The file holds a list of rules, either at the top level or under a
+        ``rules`` key. Each rule is a pattern string or a mapping with a
+        ``pattern`` and optional ``replacement``, ``keywords`` and ``name``.
+
+        Args:
+            file_path: Path of the rule file.
+
+        Returns:
+            The compiled rule set.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a valid rule file.
+        """
+        path = Path(file_path)
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                data: Any = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid rule file {path}: {e}") from e
+        if isinstance(data, dict):
+            data = data.get("rules")
+        if not isinstance(data, list):
+            raise ValueError(f"Invalid rule file {path}: expected a list of rules")
+
+        rules = []
+        for index, entry in enumerate(data):
+            if isinstance(entry, str):
+                rules.append(Rule(entry))
+            elif isinstance(entry, dict) and isinstance(entry.get("pattern"), str):
+                keywords = entry.get("keywords")
+                if isinstance(keywords, str):
+                    keywords = [keywords]
+                rules.append(Rule(
+                    pattern=entry["pattern"],
+                    replacement=str(entry.get("replacement") or ""),
+                    keywords=tuple(str(keyword) for keyword in keywords) if keywords else None,
+                    name=entry.get("name"),
+                ))
+            else:
+                raise ValueError(f"Invalid rule {index} in {path}: expected a pattern or a mapping with 'pattern'")
+        return cls(rules, name=path.name)
+
+    @property
+    def patterns(self) -> List[str]:
+        """Patterns of the rules, in order."""
+        return [rule.pattern for rule in self.rules]
+
+    def __len__(self) -> int:
+        """Number of rules."""
+        return len(self.rules)
+
+    def _may_match(self, index: int, folded: str) -> bool:
+        """Whether a rule's keywords allow a match in case-folded text."""
+        keywords = self._keywords[index]
+        return keywords is None or any(keyword in folded for keyword in keywords)
+
+    def candidates(self, text: str) -> List[Rule]:
+        """Rules whose keywords occur in the text (all rules without keywords)."""
+        folded = text.casefold()
+        return [rule for index, rule in enumerate(self.rules) if self._may_match(index, folded)]
+
+    def search(self, text: str) -> Optional[Rule]:
+        """Find the first rule matching the text, in a single scan.
+
+        Args:
+            text: Text to test, typically a single line.
+
+        Returns:
+            The rule of the leftmost match (the earliest rule on ties), or
+            None if no rule matches.
+        """
+        if self._scan is None:
+            return None
+        if self._prefiltered:
+            folded = text.casefold()
+            if not any(self._may_match(index, folded) for index in range(len(self.rules))):
+                return None
+        match = self._scan(text)
+        if match is None:
+            return None
+        return self.rules[int(match.lastgroup[1:])]
+
+    def matches(self, text: str) -> bool:
+        """Whether any rule matches the text."""
+        return self.search(text) is not None
+
+    def sub(self, text: str) -> str:
+        """Apply every rule's replacement to the text, in rule order.
+
+        Rules are applied one after the other, so a rule sees the output of
+        the rules before it. A rule is skipped without scanning the text if
+        none of its keywords occur; the keyword check uses the current text,
+        so text produced by an earlier replacement is taken into account.
+
+        Args:
+            text: Text to rewrite.
+
+        Returns:
+            The rewritten text.
+        """
+        folded: Optional[str] = None
+        for index, (rule, regex) in enumerate(zip(self.rules, self._regexes)):
+            if self._keywords[index] is not None:
+                if folded is None:
+                    folded = text.casefold()
+                if not self._may_match(index, folded):
+                    continue
+            text, count = regex.subn(rule.replacement, text)
+            if count:
+                folded = None
+        return text
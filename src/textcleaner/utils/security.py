@@ -8,10 +8,10 @@ import secrets
 import platform
 import hashlib
 import mimetypes
-import bleach
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Set, Any, Union
+from typing import Optional, Tuple, List, Dict, Set, Any, Union, Iterator
 
+from textcleaner.utils.file_sniffer import KIND_EXECUTABLE, sniff_file
 from textcleaner.utils.logging_config import get_logger
 
 # --- Constants ---
@@ -20,7 +20,7 @@ KB = 1024
 MB = KB * 1024
 GB = MB * 1024
 
-HASH_CHUNK_SIZE = 4096  # Size in bytes for reading file chunks during hashing.
+HASH_CHUNK_SIZE = 1024 * 1024  # Size in bytes for reading file chunks during hashing.
 SECURE_DELETE_THRESHOLD = 150 * MB  # Files smaller than this are overwritten before deletion.
 
 # Potentially dangerous file extensions (lowercase)
@@ -88,6 +88,43 @@ SUSPICIOUS_PATTERNS = [(re.compile(pattern, flags), pattern) for pattern, flags
 # Specific compiled pattern for path traversal (used early in validate_path on original path)
 PATH_TRAVERSAL_PATTERN = re.compile(r'\.\.[\\/]')
 
+
+def _scoped_pattern(pattern: str, flags: int) -> str:
+    """Rewrite a pattern and its flags as a scoped group for use in a combined regex."""
+    letters = ''
+    if pattern.startswith('(?i)'):
+        pattern = pattern[len('(?i)'):]
+        flags |= re.IGNORECASE
+    if flags & re.IGNORECASE:
+        letters += 'i'
+    if flags & re.DOTALL:
+        letters += 's'
+    return f"(?{letters}:{pattern})" if letters else f"(?:{pattern})"
+
+
+def _sensitive_path_regex(pattern: str) -> str:
+    """Regex for a SENSITIVE_PATHS entry; wildcards become non-greedy matches."""
+    return re.escape(pattern).replace('\\*', '.*?')
+
+
+# All suspicious patterns except traversal in one regex, so a path is scanned
+# once; the name of the matching group ("p<index>") identifies the pattern.
+SUSPICIOUS_PATH_MATCHER = re.compile('|'.join(
+    f"(?P<p{index}>{_scoped_pattern(pattern, flags)})"
+    for index, (pattern, flags) in enumerate(SUSPICIOUS_PATTERNS_RAW)
+    if pattern != PATH_TRAVERSAL_PATTERN.pattern
+))
+
+# All SENSITIVE_PATHS in one regex, anchored with match(); alternatives are
+# tried in list order, so the first matching entry is reported.
+SENSITIVE_PATH_MATCHER = re.compile('|'.join(
+    f"(?P<p{index}>{_sensitive_path_regex(pattern)})"
+    for index, pattern in enumerate(SENSITIVE_PATHS)
+))
+
+# Upper bound on remembered bulk validation verdicts per SecurityUtils instance
+MAX_VALIDATED_FILES = 100_000
+
 # Specific compiled patterns used directly by sanitize_text_content (removed by bleach now)
 # SCRIPT_TAG_PATTERN = re.compile(r'<script.*?>.*?</script>', re.IGNORECASE | re.DOTALL)
 # IFRAME_TAG_PATTERN = re.compile(r'<iframe.*?>.*?</iframe>', re.IGNORECASE | re.DOTALL)
@@ -133,6 +170,20 @@ class SecurityUtils:
         
         # Patterns for potential security issues in text content
         self.suspicious_patterns = SUSPICIOUS_PATTERNS
+
+        # Files that passed bulk validation in validate_tree, mapped to the
+        # (mode, size, mtime) they had then
+        self._validated_files: Dict[str, Tuple[int, int, int]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the bulk validation verdicts.
+
+        Process workers receive a copy of the parent's SecurityUtils; they
+        validate files themselves instead of being sent every verdict.
+        """
+        state = self.__dict__.copy()
+        state['_validated_files'] = {}
+        return state
     
     def _log_validation_failure(self, message: str, level: str = 'warning', path: Optional[Path] = None):
         """Logs a validation failure message, standardizing format and level."""
@@ -165,6 +216,11 @@ class SecurityUtils:
             Tuple of (is_valid: bool, error_message: Optional[str]).
             Returns (True, None) if the path is considered safe, otherwise (False, error_message).
         """
+        # Files validated in bulk by validate_tree need no further checks
+        # unless they have been replaced since
+        if self.is_validated_file(path):
+            return True, None
+
         # Step 1: Perform initial checks (symlink, traversal) on the original path
         original_path_str = str(path)
         if path.is_symlink():
@@ -185,62 +241,61 @@ class SecurityUtils:
             self._log_validation_failure(error_msg, level='error', path=path)
             return False, error_msg
 
-        # Step 3: Perform remaining standard checks (existence, patterns, extension)
-        #          using the *resolved* path.
-        
-        # Check existence
+        # Step 3: Check existence on the *resolved* path
         if not resolved_path.exists():
             error = "Path does not exist"
             self._log_validation_failure(error, path=resolved_path)
             return False, f"{error}: {resolved_path}"
-            
-        # Check suspicious patterns (excluding traversal)
-        # Note: We check the string representation of the *resolved* path
+
+        # Step 4: Checks on the resolved path string (patterns, extension, location)
+        is_valid, error = self._validate_resolved_path(resolved_path, resolved_path.is_file())
+        if not is_valid:
+            self._log_validation_failure(error)
+            return False, error
+
+        return True, None
+
+    def _validate_resolved_path(self, resolved_path: Path, is_file: bool) -> Tuple[bool, Optional[str]]:
+        """Checks of validate_path that only need the resolved path, without logging failures.
+
+        Covers suspicious patterns, dangerous extensions and sensitive locations
+        (allowing the temporary directory if `allow_temp_dir_sensitive` is set).
+
+        Args:
+            resolved_path: The absolute, resolved path.
+            is_file: Whether the path is a regular file.
+
+        Returns:
+            Tuple of (is_valid: bool, error_message: Optional[str]).
+        """
+        # Check suspicious patterns (excluding traversal, which is checked on
+        # the original path)
         path_str = str(resolved_path)
-        for compiled_pattern, raw_pattern_str in SUSPICIOUS_PATTERNS:
-            # Skip the path traversal pattern which was checked earlier on the original path
-            if raw_pattern_str == PATH_TRAVERSAL_PATTERN.pattern:
-                continue
-            if compiled_pattern.search(path_str):
-                error_msg = f"Resolved path contains suspicious pattern '{raw_pattern_str}'"
-                self._log_validation_failure(error_msg, path=resolved_path)
-                return False, f"{error_msg}: {resolved_path}"
+        match = SUSPICIOUS_PATH_MATCHER.search(path_str)
+        if match:
+            raw_pattern_str = SUSPICIOUS_PATTERNS_RAW[int(match.lastgroup[1:])][0]
+            return False, f"Resolved path contains suspicious pattern '{raw_pattern_str}': {resolved_path}"
 
         # Check dangerous extensions
-        if resolved_path.is_file() and resolved_path.suffix.lower() in DANGEROUS_EXTENSIONS:
-            error = "File has a potentially dangerous extension"
-            self._log_validation_failure(error, path=resolved_path)
-            return False, f"{error}: {resolved_path}"
+        if is_file and resolved_path.suffix.lower() in DANGEROUS_EXTENSIONS:
+            return False, f"File has a potentially dangerous extension: {resolved_path}"
 
-        # Step 4: Check for sensitive location, but allow temporary directories
+        # Check for sensitive location, but allow temporary directories
         is_sensitive, sensitive_error = self._check_sensitive_location(resolved_path)
+        if not is_sensitive:
+            return True, None
 
-        if is_sensitive:
-            # Check if we should allow sensitive paths if they are in the temp dir
-            if self.allow_temp_dir_sensitive:
-                try:
-                    temp_dir = Path(tempfile.gettempdir()).resolve()
-                    if str(resolved_path).startswith(str(temp_dir)):
-                        # It IS sensitive, BUT it IS in the temp dir AND allowance is enabled
-                        self.logger.debug(f"Allowing sensitive path in temporary directory (allow_temp_dir_sensitive=True): {resolved_path}")
-                        # Continue validation (don't return True yet, other checks might fail)
-                        is_sensitive = False # Treat as non-sensitive for the rest of this check
-                    else:
-                        # Sensitive, not in temp dir, fail regardless of the flag
-                        self._log_validation_failure(sensitive_error)
-                        return False, sensitive_error
-                except Exception as e:
-                    # Log exception during temp check first
-                    self.logger.error(f"Error checking temporary directory for path {resolved_path}: {e}")
-                    # Then log and return the original sensitive error
-                    self._log_validation_failure(sensitive_error)
-                    return False, sensitive_error
-            else:
-                 # Sensitive path found and allowance is NOT enabled, so fail
-                 self._log_validation_failure(sensitive_error)
-                 return False, sensitive_error
-
-        # If it was not sensitive, or sensitive but allowed in temp dir, validation passes
+        # Sensitive paths are only allowed inside the temp dir, and only if enabled
+        if not self.allow_temp_dir_sensitive:
+            return False, sensitive_error
+        try:
+            temp_dir = Path(tempfile.gettempdir()).resolve()
+        except Exception as e:
+            self.logger.error(f"Error checking temporary directory for path {resolved_path}: {e}")
+            return False, sensitive_error
+        if not path_str.startswith(str(temp_dir)):
+            return False, sensitive_error
+        self.logger.debug(f"Allowing sensitive path in temporary directory (allow_temp_dir_sensitive=True): {resolved_path}")
         return True, None
 
     def _check_sensitive_location(self, resolved_path: Path) -> Tuple[bool, Optional[str]]:
@@ -256,27 +311,113 @@ class SecurityUtils:
             Tuple of (is_sensitive: bool, match_description: Optional[str]).
             Returns (True, description) if a match is found, otherwise (False, None).
         """
-        path_str = str(resolved_path)
-        for sensitive_path_pattern in SENSITIVE_PATHS:
-            if '*' in sensitive_path_pattern:
-                # Handle wildcard: escape regex characters, then replace escaped asterisk \\* with .*?
-                # This creates a non-greedy match for the wildcard section.
-                # Use re.escape for robust escaping.
-                regex_pattern_str = re.escape(sensitive_path_pattern).replace('\\*', '.*?')
-                try:
-                    # Anchor the pattern to the start of the string for safety
-                    if re.match(f"^{regex_pattern_str}", path_str):
-                        error = f"Path matches sensitive pattern '{sensitive_path_pattern}': {resolved_path}"
-                        return True, error
-                except re.error as e:
-                    # Log the original pattern and the generated regex pattern
-                    self.logger.warning(f"Invalid regex pattern generated from sensitive path '{sensitive_path_pattern}' (regex: '{regex_pattern_str}'). Error: {e}")
-            elif path_str.startswith(sensitive_path_pattern):
-                # Keep the simple startswith check for non-wildcard paths
-                error = f"Path starts with sensitive prefix '{sensitive_path_pattern}': {resolved_path}"
-                return True, error
-        return False, None
-    
+        match = SENSITIVE_PATH_MATCHER.match(str(resolved_path))
+        if not match:
+            return False, None
+        sensitive_path_pattern = SENSITIVE_PATHS[int(match.lastgroup[1:])]
+        if '*' in sensitive_path_pattern:
+            return True, f"Path matches sensitive pattern '{sensitive_path_pattern}': {resolved_path}"
+        return True, f"Path starts with sensitive prefix '{sensitive_path_pattern}': {resolved_path}"
+
+    def is_validated_file(self, path: Path) -> bool:
+        """Whether a file passed validate_tree and is unchanged since (one lstat).
+
+        Such a file has passed the path, file type and read permission
+        checks, so callers can skip them.
+        """
+        expected = self._validated_files.get(str(path))
+        if expected is None:
+            return False
+        try:
+            stat_result = os.lstat(path)
+        except OSError:
+            return False
+        return (stat_result.st_mode, stat_result.st_size, stat_result.st_mtime_ns) == expected
+
+    def _remember_if_valid(self, entry: os.DirEntry, file_path: Path, resolved_path: Path) -> None:
+        """Record a scandir file entry that passes validate_path and check_file_permissions."""
+        key = str(file_path)
+        self._validated_files.pop(key, None)
+        try:
+            if entry.is_symlink():
+                return
+            stat_result = entry.stat(follow_symlinks=False)
+        except OSError:
+            return
+        # Executable files are left to check_file_permissions, which warns about them
+        if platform.system() != "Windows" and stat_result.st_mode & stat.S_IEXEC:
+            return
+        is_valid, _ = self._validate_resolved_path(resolved_path, is_file=True)
+        if not is_valid or not os.access(entry.path, os.R_OK):
+            return
+        if len(self._validated_files) >= MAX_VALIDATED_FILES:
+            self._validated_files.pop(next(iter(self._validated_files)))
+        self._validated_files[key] = (stat_result.st_mode, stat_result.st_size, stat_result.st_mtime_ns)
+
+    def validate_tree(self, root: Path, recursive: bool = True) -> Iterator[Path]:
+        """Yield the files in a directory, validating them in bulk.
+
+        The tree is walked with ``os.scandir``. Each directory is resolved once
+        and files are checked from their directory entries, without the
+        per-file ``resolve``/``exists``/``is_file`` calls of `validate_path`.
+        Files passing every check of `validate_path` and `check_file_permissions`
+        are remembered, and both methods then accept them after a single
+        ``lstat`` confirming they are unchanged. Files failing a check are
+        still yielded and get the usual error when validated individually.
+
+        Symbolic links to directories are not followed, like ``Path.rglob``.
+        The root itself should already have passed `validate_path`.
+
+        Args:
+            root: Directory to walk.
+            recursive: If True, descends into subdirectories.
+
+        Yields:
+            Path objects for each file found, in ``Path.rglob`` order.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+            NotADirectoryError: If the path is not a directory.
+        """
+        if not root.exists():
+            raise FileNotFoundError(f"Directory not found: {root}")
+        if not root.is_dir():
+            raise NotADirectoryError(f"Path is not a directory: {root}")
+
+        # validate_path rejects every file under a root with a traversal
+        # reference, so nothing may be remembered for such a tree
+        remember = PATH_TRAVERSAL_PATTERN.search(str(root)) is None
+        pending = [(root, root.resolve())]
+        while pending:
+            directory, resolved_directory = pending.pop()
+            files: List[Path] = []
+            subdirectories: List[str] = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirectories.append(entry.name)
+                                continue
+                            if not entry.is_file():
+                                continue
+                        except OSError:
+                            continue
+                        file_path = directory / entry.name
+                        if remember:
+                            self._remember_if_valid(entry, file_path, resolved_directory / entry.name)
+                        files.append(file_path)
+            except OSError as e:
+                if directory == root:
+                    raise
+                self.logger.warning(f"Could not read directory {directory}: {e}")
+                continue
+            yield from files
+            if recursive:
+                pending.extend(
+                    (directory / name, resolved_directory / name) for name in reversed(subdirectories)
+                )
+
     def validate_file_size(self, file_path: Path) -> Tuple[bool, Optional[str]]:
         """Validate that a file's size is within acceptable limits defined in FILE_SIZE_LIMITS."""
         if not file_path.is_file():
@@ -317,6 +458,9 @@ class SecurityUtils:
         Returns:
             Tuple of (has_permission: bool, error_message: Optional[str]).
         """
+        if not require_write and self.is_validated_file(file_path):
+            return True, None
+
         # Check read permission
         if not os.access(file_path, os.R_OK):
             error = "No read permission for file"
@@ -374,6 +518,32 @@ class SecurityUtils:
             self._log_validation_failure(error_msg, level='error', path=file_path)
             return False, error_msg
     
+    def validate_file_content(self, file_path: Path) -> Tuple[bool, Optional[str]]:
+        """Validate that a file's content is not an executable, whatever its extension.
+
+        Complements `validate_mime_type`, which only looks at the extension,
+        by sniffing the file's leading bytes.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            Tuple of (is_valid: bool, error_message: Optional[str]).
+        """
+        try:
+            sniffed = sniff_file(file_path)
+        except OSError as e:
+            error_msg = f"Error reading file content: {str(e)}"
+            self._log_validation_failure(error_msg, level='error', path=file_path)
+            return False, error_msg
+
+        if sniffed.kind == KIND_EXECUTABLE:
+            error = "File content is an executable"
+            self._log_validation_failure(error, path=file_path)
+            return False, f"{error}: {file_path}"
+
+        return True, None
+    
     def validate_output_path(self, output_path: Path) -> Tuple[bool, Optional[str]]:
         """Validate that an output path is safe to write to.
 
@@ -540,8 +710,9 @@ class SecurityUtils:
                 self.logger.warning(f"Suspicious pattern detected in original content: {raw_pattern_str}")
                 # We don't remove all patterns, but log them for awareness
 
-        # Sanitize HTML content using bleach
+        # Sanitize HTML content using bleach (imported here, it is slow to import)
         # Allow empty tags list to strip all tags, attributes, and styles
+        import bleach
         sanitized = bleach.clean(content, tags=[], attributes={}, strip=True)
 
         return sanitized
@@ -587,7 +758,7 @@ class SecurityUtils:
         """Perform a sequence of validations on a file path.
 
         Combines: validate_path, validate_file_size, validate_mime_type,
-        and check_file_permissions.
+        check_file_permissions and validate_file_content.
 
         Args:
             file_path: Path to the file to validate.
@@ -614,6 +785,11 @@ class SecurityUtils:
         is_valid, error = self.check_file_permissions(file_path)
         if not is_valid:
             return False, error
+
+        # Validate file content
+        is_valid, error = self.validate_file_content(file_path)
+        if not is_valid:
+            return False, error
             
         return True, None
 
@@ -1,16 +1,120 @@
 """
 Streaming utilities for processing large files efficiently
+
+Large text inputs are processed as windows: consecutive pieces of the
+document of roughly a fixed size that end at paragraph breaks, so that
+paragraph-level processing gives the same result on a window as on the
+whole document. Processed windows are joined with ``WINDOW_SEPARATOR``.
 """
 
 # import io # Unused
 # import os # Unused
-from typing import Generator, BinaryIO, Optional, Callable, Any, Dict, Union, TextIO
+import hashlib
+import re
+from typing import Generator, BinaryIO, Optional, Callable, Any, Dict, Hashable, Iterable, Iterator, Set, Union, TextIO
 from pathlib import Path
 import tempfile
 
 from textcleaner.utils.logging_config import get_logger
+from textcleaner.utils.mapped_input import bom_length, iter_decoded, map_file
 from textcleaner.utils.performance import performance_monitor
 
+# Target size of a window, in characters
+DEFAULT_WINDOW_SIZE = 1024 * 1024
+
+# A paragraph longer than the window is kept whole up to this many windows
+MAX_WINDOW_FACTOR = 4
+
+# Processed windows are joined with a blank line, like paragraphs
+WINDOW_SEPARATOR = "\n\n"
+
+_PARAGRAPH_BREAK = re.compile(r'\n[ \t\r\f\v]*\n')
+
+
+def _window_end(text: str, window_size: int, final: bool) -> int:
+    """End of the first window of buffered text.
+
+    Returns:
+        The offset after the last paragraph break within the window size. A
+        paragraph longer than the window extends the window up to
+        ``MAX_WINDOW_FACTOR`` window sizes; beyond that the window ends at a
+        line break, or at the window size. 0 if more text is needed first.
+    """
+    end = 0
+    for match in _PARAGRAPH_BREAK.finditer(text, 0, window_size):
+        end = match.end()
+    if end:
+        return end
+    match = _PARAGRAPH_BREAK.search(text, window_size, window_size * MAX_WINDOW_FACTOR)
+    if match:
+        return match.end()
+    if len(text) < window_size * MAX_WINDOW_FACTOR and not final:
+        return 0
+    end = text.rfind("\n", 0, window_size) + 1
+    return end or window_size
+
+
+def iter_windows(texts: Iterable[str], window_size: int = DEFAULT_WINDOW_SIZE) -> Iterator[str]:
+    """Regroup consecutive pieces of a text into windows that end at paragraph breaks.
+
+    Args:
+        texts: Consecutive pieces of the text, of any size.
+        window_size: Target size of each window, in characters.
+
+    Yields:
+        Windows that concatenate to the same text.
+    """
+    buffer = ""
+    for text in texts:
+        buffer += text
+        while len(buffer) >= window_size:
+            end = _window_end(buffer, window_size, final=False)
+            if not end:
+                break
+            yield buffer[:end]
+            buffer = buffer[end:]
+    while buffer:
+        end = _window_end(buffer, window_size, final=True) if len(buffer) > window_size else len(buffer)
+        yield buffer[:end]
+        buffer = buffer[end:]
+
+
+class RecentSet:
+    """Set of fingerprints of recently added items, bounded in size.
+
+    Items are stored as 8-byte digests of their string form. Once
+    ``max_items`` have been added the older half of the entries is
+    forgotten, so at most twice that many are kept.
+    """
+
+    def __init__(self, max_items: int):
+        """Initialize the set.
+
+        Args:
+            max_items: Number of items added before older items are forgotten.
+        """
+        self.max_items = max_items
+        self._current: Set[bytes] = set()
+        self._previous: Set[bytes] = set()
+
+    @staticmethod
+    def _fingerprint(item: Hashable) -> bytes:
+        return hashlib.blake2b(str(item).encode("utf-8", "surrogatepass"), digest_size=8).digest()
+
+    def __contains__(self, item: Hashable) -> bool:
+        fingerprint = self._fingerprint(item)
+        return fingerprint in self._current or fingerprint in self._previous
+
+    def __len__(self) -> int:
+        return len(self._current | self._previous)
+
+    def add(self, item: Hashable) -> None:
+        """Add an item, forgetting the older half of the set if it is full."""
+        if len(self._current) >= self.max_items:
+            self._previous = self._current
+            self._current = set()
+        self._current.add(self._fingerprint(item))
+
 
 class StreamProcessor:
     """Utility for processing large files in a memory-efficient way using streaming."""
@@ -43,6 +147,35 @@ class StreamProcessor:
                     break
                 yield chunk
     
+    def stream_windows(
+        self,
+        file_path: Union[str, Path],
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        encoding: str = 'utf-8'
+    ) -> Generator[str, None, None]:
+        """Stream a text file as windows that end at paragraph breaks.
+
+        The file is memory-mapped and decoded ``chunk_size`` bytes at a
+        time. Concatenated, the windows are exactly the text of the file
+        (without a byte-order mark). At most a few windows of text are held
+        in memory at a time.
+
+        Args:
+            file_path: Path to the file to stream
+            window_size: Target size of each window, in characters
+            encoding: File encoding
+
+        Yields:
+            Consecutive windows of the file's text
+
+        Raises:
+            UnicodeDecodeError: If the file is not valid in the encoding
+        """
+        self.logger.debug(f"Streaming {file_path} in windows of {window_size} characters")
+        with map_file(file_path) as buffer:
+            start = bom_length(buffer, encoding)
+            yield from iter_windows(iter_decoded(buffer, start, encoding, self.chunk_size), window_size)
+
     def stream_process_text(
         self, 
         file_path: Union[str, Path],
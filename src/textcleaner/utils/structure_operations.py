@@ -2,6 +2,8 @@
 
 import re
 
+from textcleaner.utils.line_table import BLANK, TextOrTable, as_table
+
 def standardize_lists(content: str) -> str:
     """Standardize list item markers (e.g., bullets, dashes) to use Markdown asterisks."""
     # Pattern for various bullet point symbols
@@ -12,11 +14,13 @@ def standardize_lists(content: str) -> str:
     content = re.sub(dash_pattern, '* ', content, flags=re.MULTILINE)
     return content
 
-def format_headings(content: str) -> str:
+def format_headings(content: TextOrTable) -> TextOrTable:
     """Identify potential headings and format them using Markdown."""
-    lines = content.split('\n')
-    potential_headings_indices = []
-    for i, line in enumerate(lines):
+    table = as_table(content, newline_only=True)
+    indices = table.indices()
+    last_position = len(indices) - 1
+    flags = table.flags
+    for position, (index, line) in enumerate(zip(indices, table.lines(indices))):
         line_stripped = line.strip()
         
         # Skip lines already formatted or empty or list items
@@ -26,25 +30,17 @@ def format_headings(content: str) -> str:
         # Potential heading: relatively short line, not list item
         if len(line_stripped) < 80:
             # Check context: preceded or followed by an empty line
-            prev_line_empty = (i == 0) or (i > 0 and not lines[i-1].strip())
-            next_line_empty = (i == len(lines) - 1) or (i+1 < len(lines) and not lines[i+1].strip())
+            prev_line_empty = position == 0 or bool(flags[indices[position - 1]] & BLANK)
+            next_line_empty = position == last_position or bool(flags[indices[position + 1]] & BLANK)
             
             # Heuristic: require surrounding empty lines or be short & preceded by empty
             if (prev_line_empty and next_line_empty) or (prev_line_empty and len(line_stripped) < 60):
-                potential_headings_indices.append(i)
-
-    # Apply heading formats after identifying all potential candidates
-    if potential_headings_indices:
-        temp_lines = list(lines) # Work on a copy
-        for i in potential_headings_indices:
-            line_stripped = temp_lines[i].strip()
-            # Determine header level based on length
-            if len(line_stripped) < 25:
-                lines[i] = f"## {line_stripped}"
-            elif len(line_stripped) < 60:
-                lines[i] = f"### {line_stripped}"
-            # Note: Longer lines identified as potential headings are not modified
-        
-        content = '\n'.join(lines)
+                # Determine header level based on length. Formatting does not
+                # change whether a line is blank, so neighbours are unaffected.
+                if len(line_stripped) < 25:
+                    table.rewrite(index, f"## {line_stripped}")
+                elif len(line_stripped) < 60:
+                    table.rewrite(index, f"### {line_stripped}")
+                # Note: Longer lines identified as potential headings are not modified
     
-    return content 
\ No newline at end of file
+    return table.result_for(content)
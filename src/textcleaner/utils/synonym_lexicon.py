@@ -0,0 +1,195 @@
+"""Precomputed, memory-mapped synonym lexicon.
+
+Vocabulary simplification with WordNet lemmatizes every candidate word and
+walks its synsets at runtime. The lexicon moves that work offline: it maps
+every word form the simplifier would replace to its replacement, so runtime
+simplification is one hash table lookup per word and needs neither NLTK nor
+the WordNet corpus.
+
+The file is an open-addressing hash table that is memory-mapped read-only,
+so it is opened lazily, costs no parsing, and its pages are shared between
+all processes using the same file::
+
+    header   magic, format version, slot count, entry count, source length
+    source   UTF-8 description of what the lexicon was built from
+    slots    slot_count x (crc32 of key, blob offset, key length, value length)
+    blob     UTF-8 key and value bytes, back to back
+
+Empty slots have a key length of 0. Build a lexicon with
+``textcleaner.utils.word_simplifier.build_wordnet_lexicon`` (or the
+``build-lexicon`` command) and point ``optimization.synonym_lexicon`` at it.
+"""
+
+import functools
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Mapping, Optional, Union
+
+MAGIC = b"TCSYNLEX"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIII")
+_SLOT = struct.Struct("<IIHH")
+_MAX_FIELD_LENGTH = 0xFFFF
+
+
+def _slots_offset(source_length: int) -> int:
+    """Offset of the slot array, aligned to 8 bytes after the source string."""
+    return (_HEADER.size + source_length + 7) & ~7
+
+
+def write_lexicon(entries: Mapping[str, str], file_path: Union[str, Path], source: str = "") -> int:
+    """Write a lexicon file.
+
+    Args:
+        entries: Mapping of lower-case word forms to their replacements.
+        file_path: Path of the lexicon file to write.
+        source: Description of the data the lexicon was built from.
+
+    Returns:
+        The number of entries written.
+
+    Raises:
+        ValueError: If a key is empty or a key or value is too long.
+    """
+    encoded = []
+    for key, value in entries.items():
+        key_bytes, value_bytes = key.encode("utf-8"), value.encode("utf-8")
+        if not key_bytes or len(key_bytes) > _MAX_FIELD_LENGTH or len(value_bytes) > _MAX_FIELD_LENGTH:
+            raise ValueError(f"Invalid lexicon entry: {key!r} -> {value!r}")
+        encoded.append((key_bytes, value_bytes))
+
+    # Load factor of at most 0.5 keeps probe sequences short
+    slot_count = 1
+    while slot_count < 2 * len(encoded):
+        slot_count *= 2
+    mask = slot_count - 1
+
+    slots = bytearray(slot_count * _SLOT.size)
+    used = bytearray(slot_count)
+    blob = bytearray()
+    for key_bytes, value_bytes in encoded:
+        key_hash = zlib.crc32(key_bytes)
+        index = key_hash & mask
+        while used[index]:
+            index = (index + 1) & mask
+        used[index] = 1
+        _SLOT.pack_into(slots, index * _SLOT.size, key_hash, len(blob), len(key_bytes), len(value_bytes))
+        blob += key_bytes
+        blob += value_bytes
+
+    source_bytes = source.encode("utf-8")
+    slots_offset = _slots_offset(len(source_bytes))
+    path = Path(file_path)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, slot_count, len(encoded), len(source_bytes)))
+        f.write(source_bytes)
+        f.write(b"\x00" * (slots_offset - _HEADER.size - len(source_bytes)))
+        f.write(slots)
+        f.write(blob)
+    os.replace(temp_path, path)
+    return len(encoded)
+
+
+class SynonymLexicon:
+    """Read-only view of a lexicon file.
+
+    The header is checked when the lexicon is created; the file is only
+    mapped into memory on the first lookup.
+    """
+
+    def __init__(self, file_path: Union[str, Path]):
+        """Open a lexicon.
+
+        Args:
+            file_path: Path of the lexicon file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a lexicon of a supported version.
+        """
+        self.path = Path(file_path)
+        with open(self.path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"Not a synonym lexicon: {self.path}")
+            magic, version, slot_count, entry_count, source_length = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"Not a synonym lexicon: {self.path}")
+            if version != FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported synonym lexicon version {version} in {self.path} "
+                    f"(expected {FORMAT_VERSION}); rebuild it with build-lexicon"
+                )
+            self.source = f.read(source_length).decode("utf-8")
+        self.slot_count = slot_count
+        self.entry_count = entry_count
+        self._mask = slot_count - 1
+        self._slots_offset = _slots_offset(source_length)
+        self._blob_offset = self._slots_offset + slot_count * _SLOT.size
+        self._map: Optional[mmap.mmap] = None
+
+    def __getstate__(self):
+        """Drop the mapping when pickled; it is reopened lazily."""
+        state = self.__dict__.copy()
+        state["_map"] = None
+        return state
+
+    def __len__(self) -> int:
+        """Number of word forms in the lexicon."""
+        return self.entry_count
+
+    def _mapping(self) -> mmap.mmap:
+        """Map the file into memory on first use."""
+        if self._map is None:
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def lookup(self, word: str) -> Optional[str]:
+        """Return the replacement for a lower-case word form, if any."""
+        if not self.entry_count:
+            return None
+        data = self._mapping()
+        key = word.encode("utf-8")
+        key_hash = zlib.crc32(key)
+        index = key_hash & self._mask
+        slots_offset, blob_offset = self._slots_offset, self._blob_offset
+        while True:
+            slot_hash, offset, key_length, value_length = _SLOT.unpack_from(data, slots_offset + index * _SLOT.size)
+            if not key_length:
+                return None
+            start = blob_offset + offset
+            if slot_hash == key_hash and data[start:start + key_length] == key:
+                return data[start + key_length:start + key_length + value_length].decode("utf-8")
+            index = (index + 1) & self._mask
+
+    def close(self) -> None:
+        """Unmap the file; a later lookup maps it again."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+@functools.lru_cache(maxsize=8)
+def _open_lexicon(path: str, size: int, mtime_ns: int) -> SynonymLexicon:
+    return SynonymLexicon(path)
+
+
+def get_lexicon(file_path: Union[str, Path]) -> SynonymLexicon:
+    """Return the shared lexicon for a file, opening it on first use.
+
+    All simplifiers in a process share one instance (and one mapping) per
+    file; a rebuilt file is reopened.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not a supported lexicon.
+    """
+    path = os.path.abspath(os.fspath(file_path))
+    stat_result = os.stat(path)
+    return _open_lexicon(path, stat_result.st_size, stat_result.st_mtime_ns)
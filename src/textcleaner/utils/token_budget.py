@@ -0,0 +1,213 @@
+"""Fit text into a token budget by cutting at structural boundaries.
+
+The document is encoded once. The byte length of every token gives a
+prefix sum of token end offsets, so the number of tokens before any byte
+position is a binary search away and candidate cut points never have to be
+re-encoded. The cut is placed at the latest heading, paragraph or sentence
+boundary that fits (in that order of preference), falling back to a word
+boundary. Only the kept text is encoded again, to verify it fits, so every
+document costs a small, fixed number of encoder calls however large it is.
+
+Without tiktoken the same search runs over estimated tokens, using the
+word-and-punctuation estimate of the metrics module. The token offsets and
+boundary search are shared with the chunker (``textcleaner.utils.chunking``).
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from textcleaner.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Boundaries, from most to least preferred. The text is cut before a heading,
+# at a blank line, or after sentence-ending punctuation.
+HEADING_PATTERN = re.compile(rb'^(#{1,6})[ \t]+(.*)$', re.MULTILINE)
+_PARAGRAPH_BREAK = re.compile(rb'\n[ \t]*\n')
+_SENTENCE_END = re.compile(rb'[.!?]["\')\]]*(?=\s)')
+_WHITESPACE = re.compile(rb'\s+')
+_BOUNDARIES = {
+    "heading": (HEADING_PATTERN, False),
+    "paragraph": (_PARAGRAPH_BREAK, False),
+    "sentence": (_SENTENCE_END, True),
+}
+BOUNDARY_KINDS = ("heading", "paragraph", "sentence")
+
+# Bytes regex equivalent of the metrics fallback estimate (\w+|[.,!?;:]),
+# treating every non-ASCII byte as a word character
+_ESTIMATED_TOKEN = re.compile(rb'(?:\w|[\x80-\xff])+|[.,!?;:]')
+
+# Boundary matches may extend this far beyond the window they are searched in
+_LOOKAHEAD_BYTES = 16
+
+# Attempts to find a cut that fits before falling back to a token cut
+MAX_FIT_ATTEMPTS = 3
+
+# Headings listed in the metadata of dropped content
+MAX_DROPPED_HEADINGS = 50
+
+
+def token_end_offsets(text: str, tokenizer: Any, data: Optional[bytes] = None) -> array:
+    """Byte offset after each token of the text.
+
+    With a tokenizer this is one encoder call (plus a lookup of the token
+    bytes); otherwise each estimated token ends at the end of its match.
+
+    Args:
+        text: Text to tokenize.
+        tokenizer: tiktoken encoding, or None to estimate tokens.
+        data: The text encoded as UTF-8, if already available.
+
+    Returns:
+        Ascending UTF-8 byte offsets; the number of tokens before a byte
+        offset is ``bisect_right(offsets, offset)``.
+    """
+    if tokenizer is None:
+        if data is None:
+            data = text.encode("utf-8", "surrogatepass")
+        return array("q", (match.end() for match in _ESTIMATED_TOKEN.finditer(data)))
+    tokens = tokenizer.encode_ordinary(text)
+    return array("q", accumulate(map(len, tokenizer.decode_tokens_bytes(tokens))))
+
+
+def _count_tokens(text: str, tokenizer: Any) -> int:
+    """Count the tokens of kept text the same way the budget was measured."""
+    if tokenizer is None:
+        return len(_ESTIMATED_TOKEN.findall(text.encode("utf-8", "surrogatepass")))
+    return len(tokenizer.encode_ordinary(text))
+
+
+def _last_boundary(pattern: "re.Pattern", use_end: bool, data: bytes, floor: int, limit: int) -> Optional[int]:
+    """Byte offset of the last boundary of a kind within [floor, limit]."""
+    last = None
+    start = max(0, floor - _LOOKAHEAD_BYTES)
+    for match in pattern.finditer(data, start, min(len(data), limit + _LOOKAHEAD_BYTES)):
+        position = match.end() if use_end else match.start()
+        if position > limit:
+            break
+        if position >= floor and position > 0:
+            last = position
+    return last
+
+
+def find_cut(
+    data: bytes,
+    ends: array,
+    budget: int,
+    min_fill: float,
+    first_token: int = 0,
+    kinds: Sequence[str] = BOUNDARY_KINDS
+) -> Tuple[int, str]:
+    """Find where to cut so that at most ``budget`` tokens are kept.
+
+    Args:
+        data: The text encoded as UTF-8.
+        ends: Token end offsets of the text (see ``token_end_offsets``).
+        budget: Number of tokens to keep, at least 1.
+        min_fill: Share of the budget a boundary must keep to be used.
+        first_token: Index of the first token to keep; the cut is always
+            after the end of this token.
+        kinds: Boundary kinds to try, most preferred first.
+
+    Returns:
+        The byte offset to cut at and the kind of boundary used.
+    """
+    lower = ends[first_token]
+    limit = ends[first_token + budget - 1]
+    floor = ends[first_token + max(0, int(budget * min_fill) - 1)]
+    for kind in kinds:
+        pattern, use_end = _BOUNDARIES[kind]
+        position = _last_boundary(pattern, use_end, data, floor, limit)
+        if position is not None:
+            return position, kind
+    # No structural boundary keeps enough of the budget: cut between words
+    start = max(lower, limit - 4096)
+    position = _last_boundary(_WHITESPACE, False, data, start, limit)
+    if position is not None:
+        return position, "word"
+    return limit, "token"
+
+
+def headings_after(data: bytes, start: int) -> Tuple[List[str], int]:
+    """Titles of the headings after a byte offset, and their total count."""
+    titles: List[str] = []
+    count = 0
+    for match in HEADING_PATTERN.finditer(data, start):
+        count += 1
+        if len(titles) < MAX_DROPPED_HEADINGS:
+            titles.append(match.group(2).decode("utf-8", "replace").strip())
+    return titles, count
+
+
+def fit_to_token_budget(
+    text: str,
+    token_limit: int,
+    tokenizer: Any = None,
+    min_fill: float = 0.9
+) -> Tuple[str, Dict[str, Any]]:
+    """Cut text so that it fits into a token budget.
+
+    Args:
+        text: Text to fit.
+        token_limit: Maximum number of tokens to keep.
+        tokenizer: tiktoken encoding to count with; None counts estimated
+            tokens instead.
+        min_fill: A boundary of a preferred kind (heading before paragraph
+            before sentence) is only used if the text up to it keeps at
+            least this share of the budget.
+
+    Returns:
+        The fitted text and a report of what was kept and dropped.
+
+    Raises:
+        ValueError: If the token limit is less than 1.
+    """
+    if token_limit < 1:
+        raise ValueError(f"Token limit must be at least 1, got {token_limit}")
+    data = text.encode("utf-8", "surrogatepass")
+    ends = token_end_offsets(text, tokenizer, data)
+    report: Dict[str, Any] = {
+        "token_limit": token_limit,
+        "exact": tokenizer is not None,
+        "original_tokens": len(ends),
+        "truncated": False,
+    }
+    if len(ends) <= token_limit:
+        report["kept_tokens"] = len(ends)
+        return text, report
+
+    budget = token_limit
+    fitted, kept_tokens, kind, position = "", 0, "token", 0
+    for _ in range(MAX_FIT_ATTEMPTS):
+        position, kind = find_cut(data, ends, budget, min_fill)
+        fitted = data[:position].decode("utf-8", "ignore").rstrip()
+        kept_tokens = _count_tokens(fitted, tokenizer)
+        if kept_tokens <= token_limit:
+            break
+        # Tokens merged differently at the cut; leave room for the excess
+        budget = max(1, budget - (kept_tokens - token_limit))
+    else:
+        # Cut after the last token that fits and drop a split character
+        position = ends[max(0, budget - 1)]
+        kind = "token"
+        fitted = data[:position].decode("utf-8", "ignore").rstrip()
+        kept_tokens = _count_tokens(fitted, tokenizer)
+
+    titles, heading_count = headings_after(data, position)
+    report.update({
+        "truncated": True,
+        "kept_tokens": kept_tokens,
+        "dropped_tokens": len(ends) - bisect_right(ends, position),
+        "dropped_characters": len(text) - len(fitted),
+        "cut_at": kind,
+        "dropped_headings": titles,
+        "dropped_heading_count": heading_count,
+    })
+    logger.debug(
+        f"Cut text at a {kind} boundary to fit {token_limit} tokens: "
+        f"kept {kept_tokens} of {len(ends)} tokens"
+    )
+    return fitted, report
@@ -1,39 +1,99 @@
 """Module for simplifying vocabulary using WordNet."""
 
+import functools
+import importlib.util
 import logging
 import re
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
 
-try:
-    import nltk
-    from nltk.corpus import wordnet
-    from nltk.tokenize import word_tokenize
-    from nltk.stem import WordNetLemmatizer
-    NLTK_AVAILABLE = True
-except ImportError:
-    NLTK_AVAILABLE = False
+from textcleaner.utils.synonym_lexicon import SynonymLexicon, get_lexicon, write_lexicon
+
+# NLTK is only imported when WordNet is actually used, so lookups in a
+# synonym lexicon never pay for it
+NLTK_AVAILABLE = importlib.util.find_spec("nltk") is not None
+_NLTK_NAMES = ("nltk", "wordnet", "WordNetLemmatizer")
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-# Ensure necessary NLTK resources are downloaded automatically
-# _ensure_nltk_resources()
+# Words and the delimiters between them
+_WORD_DELIMITERS = re.compile(r'(\W+)')
+
+# Distinct (word, part of speech) pairs kept by the lemmatization cache
+LEMMA_CACHE_SIZE = 65536
+
+# Set once the NLTK resources have been checked in this process
+_nltk_resources_ready = False
+_lemmatizer = None
+
+
+def _load_nltk() -> bool:
+    """Import NLTK and WordNet into the module namespace on first use.
+
+    Returns:
+        True if NLTK could be imported, False otherwise
+    """
+    global NLTK_AVAILABLE, nltk, wordnet, WordNetLemmatizer
+    if "wordnet" in globals():
+        return True
+    if not NLTK_AVAILABLE:
+        return False
+    try:
+        import nltk
+        from nltk.corpus import wordnet
+        from nltk.stem import WordNetLemmatizer
+    except ImportError:
+        NLTK_AVAILABLE = False
+        return False
+    return True
+
+
+def __getattr__(name: str):
+    """Resolve the NLTK names lazily for code outside this module."""
+    if name in _NLTK_NAMES and _load_nltk():
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def _lemmatize(word: str, pos: str = 'n') -> str:
+    """Lemmatize a lower-case word, caching the result."""
+    global _lemmatizer
+    if _lemmatizer is None:
+        _load_nltk()
+        _lemmatizer = WordNetLemmatizer()
+    return _lemmatizer.lemmatize(word, pos=pos)
 
 class WordNetSimplifier:
     """Simplify complex vocabulary using WordNet.
     
     This class uses NLTK's WordNet to find simpler synonyms for complex words
     in the text, helping to reduce token usage by using more common words.
+
+    With a precomputed synonym lexicon (see ``build_wordnet_lexicon``) each
+    word is a single lookup in the memory-mapped lexicon instead, and neither
+    NLTK nor the WordNet corpus is loaded.
     """
     
-    def __init__(self, min_word_length: int):
+    def __init__(self, min_word_length: int, lexicon_path: Optional[Union[str, Path]] = None):
         """Initialize the WordNet simplifier.
         
         Args:
             min_word_length: Minimum word length to consider for simplification
+            lexicon_path: Optional synonym lexicon file; if it cannot be
+                opened, WordNet is used instead
         """
         self.min_word_length = min_word_length
-        self.lemmatizer = WordNetLemmatizer()
+        self.lexicon: Optional[SynonymLexicon] = None
+        if lexicon_path:
+            try:
+                self.lexicon = get_lexicon(lexicon_path)
+                logger.debug(f"Using synonym lexicon {lexicon_path} ({len(self.lexicon)} entries)")
+                return
+            except (OSError, ValueError) as e:
+                logger.warning(f"Cannot use synonym lexicon {lexicon_path}, falling back to WordNet: {e}")
+
         self._ensure_nltk_resources() # Call resource check during init
         
         if not NLTK_AVAILABLE:
@@ -42,6 +102,9 @@ class WordNetSimplifier:
     
     def _ensure_nltk_resources(self):
         """Downloads required NLTK resources ('wordnet', 'omw-1.4') if not found."""
+        global _nltk_resources_ready
+        if _nltk_resources_ready or not _load_nltk():
+            return
         required_resources = ['wordnet', 'omw-1.4'] 
         try:
             for resource in required_resources:
@@ -56,6 +119,7 @@ class WordNetSimplifier:
                     logger.info(f"NLTK resource '{resource}' downloaded successfully.")
             # Verify WordNet is loaded after download attempt
             wordnet.ensure_loaded()
+            _nltk_resources_ready = True
             logger.debug("Required NLTK resources are available and WordNet is loaded.")
         except Exception as e:
             logger.error(f"Failed to download or verify required NLTK resources: {e}")
@@ -70,7 +134,7 @@ class WordNetSimplifier:
         Returns:
             List of synonyms, sorted by commonality (most common first)
         """
-        if not NLTK_AVAILABLE:
+        if not NLTK_AVAILABLE or not _load_nltk():
             return []
             
         synonyms = set()
@@ -85,8 +149,9 @@ class WordNetSimplifier:
                 if synonym != word and len(synonym) < len(word):
                     synonyms.add(synonym)
         
-        # Sort synonyms by length (shorter words are typically simpler)
-        return sorted(list(synonyms), key=len)
+        # Sort synonyms by length (shorter words are typically simpler), then
+        # alphabetically so ties resolve the same way in every process
+        return sorted(synonyms, key=lambda synonym: (len(synonym), synonym))
     
     def _is_complex_word(self, word: str) -> bool:
         """Check if a word is complex enough to be simplified.
@@ -107,6 +172,33 @@ class WordNetSimplifier:
             
         return True
     
+    def _find_replacement(self, word: str) -> Optional[str]:
+        """Find the replacement for a lower-case word.
+
+        Args:
+            word: Lower-case word to replace
+
+        Returns:
+            The shortest synonym, or None if the word should be kept
+        """
+        if self.lexicon is not None:
+            return self.lexicon.lookup(word)
+
+        # Lemmatize the word before looking for synonyms
+        lemmatized_word = _lemmatize(word)
+        # Also try lemmatizing as a verb, as default is noun
+        if lemmatized_word == word: # If noun lemmatization didn't change it
+            lemmatized_word = _lemmatize(word, 'v')
+
+        synonyms = self._get_synonyms(lemmatized_word)
+
+        # If no synonyms found for lemmatized word, try original word
+        if not synonyms and lemmatized_word != word:
+            synonyms = self._get_synonyms(word)
+
+        # Use the first (shortest) synonym
+        return synonyms[0] if synonyms else None
+
     def simplify(self, text: str) -> str:
         """Simplify complex vocabulary in text.
         
@@ -116,16 +208,17 @@ class WordNetSimplifier:
         Returns:
             Text with complex words replaced by simpler synonyms
         """
-        if not NLTK_AVAILABLE or not text:
+        if not text or (self.lexicon is None and not NLTK_AVAILABLE):
             return text
             
         try:
-            # Check if WordNet is actually available before processing
-            wordnet.ensure_loaded()
-            # wordnet.synsets('test') # Quick check - avoid unnecessary calls
+            if self.lexicon is None:
+                # Check if WordNet is actually available before processing
+                _load_nltk()
+                wordnet.ensure_loaded()
             
             # Split text while preserving delimiters (whitespace, punctuation)
-            parts = re.split(r'(\W+)', text)
+            parts = _WORD_DELIMITERS.split(text)
             result_parts = []
             
             for part in parts:
@@ -137,21 +230,9 @@ class WordNetSimplifier:
                                          # Or use re.match(r'\w+$', part)
                 
                 if is_word and self._is_complex_word(part):
-                    # Lemmatize the word before looking for synonyms
-                    lemmatized_word = self.lemmatizer.lemmatize(part.lower())
-                    # Also try lemmatizing as a verb, as default is noun
-                    if lemmatized_word == part.lower(): # If noun lemmatization didn't change it
-                        lemmatized_word = self.lemmatizer.lemmatize(part.lower(), pos='v')
-
-                    synonyms = self._get_synonyms(lemmatized_word)
-                    
-                    # If no synonyms found for lemmatized word, try original word
-                    if not synonyms and lemmatized_word != part.lower():
-                         synonyms = self._get_synonyms(part.lower())
+                    replacement = self._find_replacement(part.lower())
 
-                    if synonyms:
-                        # Use the first (shortest) synonym
-                        replacement = synonyms[0]
+                    if replacement:
                         # Preserve original capitalization
                         if part.istitle(): # Handle title case e.g. 'Utilizing' -> 'Use'
                             replacement = replacement.title()
@@ -171,6 +252,62 @@ class WordNetSimplifier:
             logger.warning(f"Error in vocabulary simplification: {str(e)}")
             return text  # Return original text on error
 
+
+def _inflected_forms(lemma: str, pos: str) -> Set[str]:
+    """Word forms WordNet's morphology reduces to a lemma, for one part of speech."""
+    forms = {lemma}
+    for suffix, ending in wordnet.MORPHOLOGICAL_SUBSTITUTIONS.get(pos, ()):
+        if lemma.endswith(ending):
+            forms.add(lemma[:len(lemma) - len(ending)] + suffix)
+    return forms
+
+
+def build_wordnet_lexicon(output_path: Union[str, Path]) -> int:
+    """Precompute the synonym lexicon from WordNet.
+
+    Every WordNet lemma, its regular inflections and the irregular forms from
+    WordNet's exception lists are run through the same lookup the simplifier
+    uses at runtime; the forms that get a replacement are written to the
+    lexicon. This takes a few minutes and only needs to be redone when
+    WordNet or the lookup changes.
+
+    Args:
+        output_path: Path of the lexicon file to write
+
+    Returns:
+        The number of entries written
+
+    Raises:
+        RuntimeError: If NLTK or the WordNet corpus is not available
+    """
+    if not _load_nltk():
+        raise RuntimeError("NLTK is required to build the synonym lexicon")
+    simplifier = WordNetSimplifier(min_word_length=1)
+    try:
+        wordnet.ensure_loaded()
+    except LookupError as e:
+        raise RuntimeError(f"The WordNet corpus is required to build the synonym lexicon: {e}") from e
+
+    forms: Set[str] = set()
+    for pos in (wordnet.NOUN, wordnet.VERB, wordnet.ADJ, wordnet.ADV):
+        for lemma in wordnet.all_lemma_names(pos):
+            forms.update(_inflected_forms(lemma, pos))
+        forms.update(getattr(wordnet, "_exception_map", {}).get(pos, {}))
+
+    entries: Dict[str, str] = {}
+    for form in sorted(forms):
+        # Only plain words reach the lookup at runtime
+        if not form.isalpha() or form != form.lower():
+            continue
+        replacement = simplifier._find_replacement(form)
+        if replacement:
+            entries[form] = replacement
+
+    source = f"WordNet {wordnet.get_version()}, NLTK {nltk.__version__}"
+    count = write_lexicon(entries, output_path, source=source)
+    logger.info(f"Wrote synonym lexicon with {count} entries to {output_path} ({source})")
+    return count
+
 # Example usage (optional, for testing)
 if __name__ == '__main__':
     simplifier = WordNetSimplifier(min_word_length=5)
@@ -0,0 +1,95 @@
+"""
+Import-time checks for the CLI and package entry points
+
+Each check runs in a fresh interpreter, so it sees exactly what an import
+loads rather than what earlier tests already imported.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import textcleaner
+
+# Libraries that must only be imported when a file actually needs them
+HEAVY_MODULES = [
+    "pandas", "docx", "pptx", "pypdf", "pdfminer", "bs4", "markdown_it",
+    "nltk", "psutil", "tiktoken", "bleach", "tqdm",
+]
+
+# Generous bound that still catches the processing stack creeping back in
+MAX_CLI_IMPORT_SECONDS = 1.0
+
+
+def _run_python(code):
+    """Run code in a fresh interpreter and return its JSON output"""
+    env = dict(os.environ)
+    src_dir = str(Path(textcleaner.__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True, timeout=60
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _loaded_heavy_modules(statement):
+    return _run_python(
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+
+
+@pytest.mark.performance
+def test_cli_import_is_lightweight():
+    """Test that importing the CLI loads none of the heavy libraries"""
+    assert _loaded_heavy_modules("import textcleaner.cli.commands") == []
+
+
+@pytest.mark.performance
+def test_package_import_is_lightweight():
+    """Test that the package exports are only imported on first access"""
+    assert _loaded_heavy_modules("import textcleaner, textcleaner.utils, textcleaner.core") == []
+
+
+@pytest.mark.performance
+def test_converter_libraries_load_on_first_conversion(tmp_path):
+    """Test that building a processor defers converter imports until they are needed"""
+    text_file = tmp_path / "sample.txt"
+    text_file.write_text("Some text.\n")
+    loaded = _loaded_heavy_modules(
+        "from textcleaner.core.factories import TextProcessorFactory\n"
+        "processor = TextProcessorFactory().create_minimal_processor()\n"
+        f"processor.converter_registry.find_converter({str(text_file)!r}).convert({str(text_file)!r})"
+    )
+    assert not {"pandas", "docx", "pptx", "pypdf", "pdfminer"} & set(loaded)
+    assert "tiktoken" not in loaded
+
+
+@pytest.mark.performance
+def test_lexicon_lookup_does_not_import_nltk(tmp_path):
+    """Test that simplifying with a synonym lexicon never imports NLTK"""
+    lexicon_path = tmp_path / "synonyms.lex"
+    loaded = _loaded_heavy_modules(
+        "from textcleaner.utils.synonym_lexicon import write_lexicon\n"
+        "from textcleaner.utils.word_simplifier import WordNetSimplifier\n"
+        f"write_lexicon({{'utilizing': 'use'}}, {str(lexicon_path)!r})\n"
+        f"simplifier = WordNetSimplifier(min_word_length=5, lexicon_path={str(lexicon_path)!r})\n"
+        "assert simplifier.simplify('Utilizing it.') == 'Use it.'"
+    )
+    assert "nltk" not in loaded
+
+
+@pytest.mark.performance
+def test_cli_import_time():
+    """Benchmark the CLI import and guard against large regressions"""
+    seconds = _run_python(
+        "import json, time\n"
+        "start = time.perf_counter()\n"
+        "import textcleaner.cli.commands\n"
+        "print(json.dumps(time.perf_counter() - start))"
+    )
+    assert seconds < MAX_CLI_IMPORT_SECONDS
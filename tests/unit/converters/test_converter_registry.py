@@ -0,0 +1,124 @@
+"""
+Tests for lazy converter registration
+"""
+
+import sys
+
+import pytest
+
+from textcleaner.config.config_manager import ConfigManager
+from textcleaner.converters.base import ConverterRegistry, LazyConverter
+from textcleaner.converters.text_converter import TextConverter
+
+
+@pytest.fixture
+def registry():
+    """Create a populated converter registry"""
+    registry = ConverterRegistry(config=ConfigManager())
+    registry.populate_registry()
+    return registry
+
+
+def test_registry_registers_lazy_converters(registry):
+    """Test that converters are registered without being built"""
+    assert registry.converters
+    assert all(isinstance(converter, LazyConverter) for converter in registry.converters)
+    assert not any(converter.loaded for converter in registry.converters)
+
+
+def test_find_converter_uses_declared_extensions(registry):
+    """Test that finding a converter does not build it"""
+    converter = registry.find_converter("report.PDF")
+
+    assert converter.name == "PDFConverter"
+    assert not converter.loaded
+    assert registry.find_converter("archive.zip") is None
+
+
+def test_convert_builds_the_real_converter(registry, tmp_path):
+    """Test that the first conversion imports and builds the converter"""
+    text_file = tmp_path / "notes.txt"
+    text_file.write_text("Hello from a lazy converter.\n")
+    converter = registry.find_converter(text_file)
+
+    content, metadata = converter.convert(text_file)
+
+    assert "Hello from a lazy converter." in content
+    assert converter.loaded
+    assert isinstance(converter.load(), TextConverter)
+    assert converter.load().config is registry.config
+
+
+def test_options_and_attributes_are_forwarded(registry):
+    """Test that constructor options reach the converter and attributes are forwarded"""
+    html = registry.find_converter("page.html")
+
+    assert html.parser == registry.config.get("converters.html.parser", "html.parser")
+    assert html.loaded
+    assert "textcleaner.converters.html_converter" in sys.modules
+
+
+def test_url_checks_use_the_real_converter(registry):
+    """Test that URL handling defers to the converter's own logic"""
+    converter = registry.find_converter("https://example.com/article")
+    assert converter is not None and converter.name == "HTMLConverter"
+
+
+def test_set_config_reaches_loaded_converters(registry):
+    """Test that a new config is passed on to already built converters"""
+    converter = registry.find_converter("notes.txt")
+    converter.load()
+    new_config = ConfigManager()
+
+    registry.set_config(new_config)
+
+    assert converter.load().config is new_config
+
+
+def test_dispatch_matching_content(registry, tmp_path):
+    """Test that files whose content matches go to their extension's converter"""
+    text_file = tmp_path / "notes.md"
+    text_file.write_text("# Notes\n\nSome text.")
+
+    converter, detected = registry.dispatch(text_file)
+
+    assert converter.name == "MarkdownConverter"
+    assert detected is None
+
+
+def test_dispatch_reroutes_mislabelled_files(registry, tmp_path):
+    """Test that a PDF saved with a text extension goes to the PDF converter"""
+    pdf_file = tmp_path / "paper.txt"
+    pdf_file.write_bytes(b"%PDF-1.4\n%fake\n")
+
+    converter, detected = registry.dispatch(pdf_file)
+
+    assert converter.name == "PDFConverter"
+    assert detected == ".pdf"
+    assert not converter.loaded
+
+
+def test_dispatch_rejects_unroutable_content(registry, tmp_path):
+    """Test that executables and content for extension-routed converters are rejected"""
+    executable = tmp_path / "report.pdf"
+    executable.write_bytes(b"\x7fELF\x02\x01\x01\x00")
+    with pytest.raises(ValueError, match="executable"):
+        registry.dispatch(executable)
+
+    docx_as_pdf = tmp_path / "letter.pdf"
+    docx_as_pdf.write_bytes(b"PK\x03\x04" + b"\x00" * 26 + b"[Content_Types].xml word/")
+    with pytest.raises(ValueError, match="looks like .docx"):
+        registry.dispatch(docx_as_pdf)
+
+
+def test_dispatch_without_sniffing(tmp_path):
+    """Test that sniffing can be disabled"""
+    registry = ConverterRegistry(config=ConfigManager(initial_config={"formats": {"sniff_content": False}}))
+    registry.populate_registry()
+    pdf_file = tmp_path / "paper.txt"
+    pdf_file.write_bytes(b"%PDF-1.4\n")
+
+    converter, detected = registry.dispatch(pdf_file)
+
+    assert converter.name == "TextConverter"
+    assert detected is None
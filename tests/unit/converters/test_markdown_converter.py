@@ -1,8 +1,8 @@
 import unittest
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 from pathlib import Path
-import os
+import tempfile
 import time
 
 # Import the class to test
@@ -26,7 +26,9 @@ class TestMarkdownConverter(unittest.TestCase):
         # self.addCleanup(self.yaml_patcher.stop) # Ensure patch stops even on test failures
         
         self.converter = MarkdownConverter(config=self.mock_config)
-        self.test_file_path = Path("test_dir/test_file.md")
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.test_file_path = Path(temp_dir.name) / "test_file.md"
         
         # Reset mock for each test - REMOVED
         # mock_yaml.reset_mock()
@@ -37,18 +39,17 @@ class TestMarkdownConverter(unittest.TestCase):
 
     @patch('pathlib.Path.exists', return_value=True)
     @patch('textcleaner.converters.markdown_converter.MarkdownConverter.get_stats')
-    @patch("builtins.open", new_callable=mock_open, read_data='''# Heading 1
-
-Some content.''')
-    def test_convert_success_no_frontmatter(self, mock_file_open, mock_get_stats, mock_exists):
+    def test_convert_success_no_frontmatter(self, mock_get_stats, mock_exists):
         """Test successful conversion of a markdown file without frontmatter."""
+        self.test_file_path.write_text('''# Heading 1
+
+Some content.''', encoding="utf-8")
         mock_stats_data = {"file_size_bytes": 50, "created_at": time.time(), "modified_at": time.time()}
         mock_get_stats.return_value = mock_stats_data
         
         content, metadata = self.converter.convert(self.test_file_path)
         
         mock_exists.assert_called_once_with()
-        mock_file_open.assert_called_once_with(self.test_file_path, "r", encoding="utf-8")
         mock_get_stats.assert_called_once_with(self.test_file_path)
         # mock_yaml.safe_load.assert_not_called() # Cannot assert on non-existent mock
         
@@ -85,12 +86,11 @@ Body content.'''
         # Mock yaml parsing
         parsed_frontmatter = {"title": "Test Title", "author": "Tester", "tags": ["tag1", "tag2"]}
         # Patch yaml.safe_load specifically for this test
+        self.test_file_path.write_text(file_content, encoding="utf-8")
         with patch('textcleaner.converters.markdown_converter.yaml.safe_load', return_value=parsed_frontmatter) as mock_safe_load:
-            with patch("builtins.open", mock_open(read_data=file_content)) as mock_file_open:
-                content, metadata = self.converter.convert(self.test_file_path)
+            content, metadata = self.converter.convert(self.test_file_path)
             
             mock_exists.assert_called_once_with()
-            mock_file_open.assert_called_once_with(self.test_file_path, "r", encoding="utf-8")
             mock_get_stats.assert_called_once_with(self.test_file_path)
             # Verify yaml was called with the extracted frontmatter text (without leading/trailing newlines)
             mock_safe_load.assert_called_once_with(frontmatter_text) 
@@ -127,9 +127,9 @@ invalid yaml: - [ ]'''
         
         # Simulate YAML parsing error
         # Patch yaml.safe_load specifically for this test
+        self.test_file_path.write_text(file_content, encoding="utf-8")
         with patch('textcleaner.converters.markdown_converter.yaml.safe_load', side_effect=Exception("YAML parse error")) as mock_safe_load:
-            with patch("builtins.open", mock_open(read_data=file_content)) as mock_file_open:
-                content, metadata = self.converter.convert(self.test_file_path)
+            content, metadata = self.converter.convert(self.test_file_path)
                 
             # Content should still be the body (frontmatter removed despite parse error)
             self.assertEqual(content, body)
@@ -143,13 +143,13 @@ invalid yaml: - [ ]'''
         
     @patch('pathlib.Path.exists', return_value=True)
     @patch('textcleaner.converters.markdown_converter.MarkdownConverter.get_stats')
-    @patch("builtins.open", new_callable=mock_open, read_data='''# H1
+    def test_extract_headings(self, mock_get_stats, mock_exists):
+        """Test extraction of various levels of ATX headings."""
+        self.test_file_path.write_text('''# H1
 ## H2
 ### H3
 Not a heading
-#### H4 # Also valid''')
-    def test_extract_headings(self, mock_file_open, mock_get_stats, mock_exists):
-        """Test extraction of various levels of ATX headings."""
+#### H4 # Also valid''', encoding="utf-8")
         mock_stats_data = {"file_size_bytes": 100, "created_at": time.time(), "modified_at": time.time()}
         mock_get_stats.return_value = mock_stats_data
         
@@ -165,9 +165,9 @@ Not a heading
         
     @patch('pathlib.Path.exists', return_value=True)
     @patch('textcleaner.converters.markdown_converter.MarkdownConverter.get_stats')
-    @patch("builtins.open", new_callable=mock_open, read_data="No headings here.")
-    def test_no_headings_found(self, mock_file_open, mock_get_stats, mock_exists):
+    def test_no_headings_found(self, mock_get_stats, mock_exists):
         """Test conversion when no headings are present."""
+        self.test_file_path.write_text("No headings here.", encoding="utf-8")
         mock_stats_data = {"file_size_bytes": 20, "created_at": time.time(), "modified_at": time.time()}
         mock_get_stats.return_value = mock_stats_data
         
@@ -182,16 +182,25 @@ Not a heading
         mock_exists.assert_called_once_with()
 
     @patch('pathlib.Path.exists', return_value=True)
-    @patch("builtins.open", new_callable=mock_open)
-    def test_convert_unicode_decode_error(self, mock_file_open, mock_exists):
+    def test_convert_unicode_decode_error(self, mock_exists):
         """Test conversion raises ValueError for files with encoding issues."""
-        mock_file_open.side_effect = UnicodeDecodeError('utf-8', b'\x80abc', 0, 1, 'invalid start byte')
+        self.test_file_path.write_bytes(b'\x80abc')
         
         with self.assertRaisesRegex(ValueError, "File is not a valid markdown file or has an unsupported encoding"):
             self.converter.convert(self.test_file_path)
             
         mock_exists.assert_called_once_with()
-        mock_file_open.assert_called_once_with(self.test_file_path, "r", encoding="utf-8")
+
+    @patch('textcleaner.converters.markdown_converter.MarkdownConverter.get_stats', return_value={})
+    def test_convert_frontmatter_after_bom_with_crlf(self, mock_get_stats):
+        """Test that frontmatter is found after a BOM and line breaks are normalized."""
+        self.test_file_path.write_bytes(b"\xef\xbb\xbf---\r\ntitle: BOM\r\n---\r\n# Title\r\n\r\nText.\r\n")
+
+        content, metadata = self.converter.convert(self.test_file_path)
+
+        self.assertEqual(content, "# Title\n\nText.\n")
+        self.assertEqual(metadata["title"], "BOM")
+        self.assertEqual(metadata["headings"], [{"level": 1, "text": "Title"}])
 
 
 if __name__ == "__main__":
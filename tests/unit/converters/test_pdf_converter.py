@@ -1,14 +1,19 @@
 """Unit tests for the PDFConverter class."""
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
 
-from textcleaner.converters.pdf_converter import PDFConverter
+from textcleaner.config.config_manager import ConfigManager
+from textcleaner.converters.pdf_converter import (
+    PDFConverter, _document_info, _page_count, _page_ranges, _parse_document, text_quality
+)
 from textcleaner.utils.logging_config import get_logger
-from pypdf.errors import PdfReadError
 from pdfminer.pdfparser import PDFSyntaxError
 from pdfminer.pdfdocument import PDFEncryptionError
+from pdfminer.psparser import PSEOF
 
 # Mock logger to prevent actual logging during tests
 @pytest.fixture(autouse=True)
@@ -19,8 +24,10 @@ def mock_logging():
 
 @pytest.fixture
 def pdf_converter():
-    """Fixture to create a PDFConverter instance."""
-    return PDFConverter()
+    """Fixture to create a PDFConverter instance that extracts text with pdfminer."""
+    config = ConfigManager()
+    config.config["formats"]["pdf"]["text_engine"]["engine"] = "pdfminer"
+    return PDFConverter(config)
 
 @pytest.fixture
 def mock_path():
@@ -31,6 +38,14 @@ def mock_path():
     mock.name = "document.pdf" # Needed for logging if extraction fails
     return mock
 
+@pytest.fixture
+def mock_document():
+    """Fixture for the parsed document, with one page and no document information."""
+    with patch('textcleaner.converters.pdf_converter._parse_document') as mock_parse, \
+            patch('textcleaner.converters.pdf_converter._page_count', return_value=1) as mock_page_count, \
+            patch('textcleaner.converters.pdf_converter._document_info', return_value={}) as mock_info:
+        yield mock_parse, mock_page_count, mock_info
+
 # --- Test Initialization ---
 
 def test_pdf_converter_initialization(pdf_converter):
@@ -40,35 +55,26 @@ def test_pdf_converter_initialization(pdf_converter):
 
 # --- Test convert Method (Happy Path) ---
 
-@patch('textcleaner.converters.pdf_converter.PdfReader')
+@patch('textcleaner.converters.pdf_converter._extract_document_text')
 @patch('textcleaner.converters.pdf_converter.pdfminer_extract_text')
 @patch.object(PDFConverter, 'get_stats', return_value={"size": 1024, "last_modified": 1234567890})
-def test_convert_success(mock_get_stats, mock_extract_text, mock_pdf_reader, pdf_converter, mock_path):
+def test_convert_success(mock_get_stats, mock_extract_text, mock_document_text, pdf_converter, mock_path, mock_document):
     """Test successful conversion of a PDF file."""
     # --- Arrange ---
-    # Mock PdfReader metadata
-    mock_metadata = MagicMock()
-    mock_metadata.title = "Test Title"
-    mock_metadata.author = "Test Author"
-    mock_metadata.subject = None # Test filtering None values
-    mock_metadata.creator = "Test Creator"
-    
-    mock_reader_instance = MagicMock()
-    mock_reader_instance.metadata = mock_metadata
-    mock_reader_instance.pages = [MagicMock()] * 3 # Simulate 3 pages
-    mock_pdf_reader.return_value = mock_reader_instance
+    mock_parse, mock_page_count, mock_info = mock_document
+    mock_page_count.return_value = 3
+    mock_info.return_value = {"title": "Test Title", "author": "Test Author", "creator": "Test Creator"}
     
-    # Mock pdfminer text extraction
     expected_text = "This is the extracted text from the PDF."
-    mock_extract_text.return_value = expected_text
+    mock_document_text.return_value = expected_text
     
     expected_metadata = {
         "page_count": 3,
         "file_stats": {"size": 1024, "last_modified": 1234567890},
         "title": "Test Title",
         "author": "Test Author",
-        # subject should be excluded
-        "creator": "Test Creator"
+        "creator": "Test Creator",
+        "text_engine": "pdfminer"
     }
 
     # --- Act ---
@@ -79,14 +85,19 @@ def test_convert_success(mock_get_stats, mock_extract_text, mock_pdf_reader, pdf
     assert metadata == expected_metadata
     
     mock_path.exists.assert_called_once()
-    mock_pdf_reader.assert_called_once_with(mock_path)
-    mock_extract_text.assert_called_once_with(mock_path)
+    # The file is parsed once, for both metadata and text
+    mock_path.open.assert_called_once_with("rb")
+    mock_parse.assert_called_once()
+    document = mock_parse.return_value
+    mock_page_count.assert_called_once_with(document)
+    mock_info.assert_called_once_with(document)
+    mock_document_text.assert_called_once_with(document, True)
+    mock_extract_text.assert_not_called()
     mock_get_stats.assert_called_once_with(mock_path)
 
-@patch('textcleaner.converters.pdf_converter.PdfReader')
-@patch('textcleaner.converters.pdf_converter.pdfminer_extract_text')
+@patch('textcleaner.converters.pdf_converter._extract_document_text')
 @patch.object(PDFConverter, 'get_stats', return_value={"size": 500})
-def test_convert_success_with_string_path(mock_get_stats, mock_extract_text, mock_pdf_reader, pdf_converter):
+def test_convert_success_with_string_path(mock_get_stats, mock_document_text, pdf_converter, mock_document):
     """Test successful conversion when path is provided as a string."""
     # --- Arrange ---
     file_path_str = "/fake/string/path.pdf"
@@ -97,18 +108,14 @@ def test_convert_success_with_string_path(mock_get_stats, mock_extract_text, moc
         mock_path_instance.exists.return_value = True
         mock_path_instance.__str__.return_value = file_path_str
         mock_path_class.return_value = mock_path_instance
-
-        mock_reader_instance = MagicMock()
-        mock_reader_instance.metadata = None # No metadata case
-        mock_reader_instance.pages = [MagicMock()] # 1 page
-        mock_pdf_reader.return_value = mock_reader_instance
         
         expected_text = "Text from string path."
-        mock_extract_text.return_value = expected_text
+        mock_document_text.return_value = expected_text
         
         expected_metadata = {
             "page_count": 1,
-            "file_stats": {"size": 500}
+            "file_stats": {"size": 500},
+            "text_engine": "pdfminer"
         }
 
         # --- Act ---
@@ -120,12 +127,9 @@ def test_convert_success_with_string_path(mock_get_stats, mock_extract_text, moc
         
         mock_path_class.assert_called_once_with(file_path_str)
         mock_path_instance.exists.assert_called_once()
-        mock_pdf_reader.assert_called_once_with(mock_path_instance)
-        mock_extract_text.assert_called_once_with(mock_path_instance)
+        mock_path_instance.open.assert_called_once_with("rb")
         mock_get_stats.assert_called_once_with(mock_path_instance)
 
-# Add more tests for edge cases and errors below...
-
 # --- Test convert Method (Error Cases) ---
 
 def test_convert_file_not_found(pdf_converter, mock_path):
@@ -139,52 +143,47 @@ def test_convert_file_not_found(pdf_converter, mock_path):
     
     mock_path.exists.assert_called_once()
 
-@patch('textcleaner.converters.pdf_converter.PdfReader')
+@patch('textcleaner.converters.pdf_converter._extract_document_text')
 @patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
-def test_convert_metadata_read_error(mock_get_stats, mock_pdf_reader, pdf_converter, mock_path, mock_logging):
-    """Test handling of PdfReadError during metadata extraction."""
+def test_convert_metadata_read_error(mock_get_stats, mock_document_text, pdf_converter, mock_path, mock_logging, mock_document):
+    """Test handling of a damaged page tree during metadata extraction."""
     # --- Arrange ---
-    mock_pdf_reader.side_effect = PdfReadError("Corrupted PDF")
+    _, mock_page_count, _ = mock_document
+    mock_page_count.side_effect = PSEOF("Unexpected EOF")
     
     # Metadata extraction fails, but text extraction should still be attempted
-    with patch('textcleaner.converters.pdf_converter.pdfminer_extract_text') as mock_extract_text:
-        mock_extract_text.return_value = "Text extracted despite metadata error."
-        
-        expected_metadata = {
-            "file_stats": {"size": 100},
-            "metadata_extraction_error": "PDF read error: PdfReadError"
-        }
-        expected_text = "Text extracted despite metadata error."
+    mock_document_text.return_value = "Text extracted despite metadata error."
+    
+    expected_metadata = {
+        "file_stats": {"size": 100},
+        "metadata_extraction_error": "PDF read error: PSEOF",
+        "text_engine": "pdfminer"
+    }
+    expected_text = "Text extracted despite metadata error."
 
-        # --- Act ---
-        text, metadata = pdf_converter.convert(mock_path)
+    # --- Act ---
+    text, metadata = pdf_converter.convert(mock_path)
 
-        # --- Assert ---
-        assert text == expected_text
-        assert metadata == expected_metadata
-        
-        mock_path.exists.assert_called_once()
-        mock_pdf_reader.assert_called_once_with(mock_path)
-        mock_extract_text.assert_called_once_with(mock_path)
-        mock_get_stats.assert_called_with(mock_path) # Called only in the error handler
-        assert mock_get_stats.call_count == 1
-        # Assert on the mock logger directly
-        mock_logging.warning.assert_called_once_with(
-            f"Could not read PDF metadata for {mock_path} (PdfReadError): Corrupted PDF"
-        )
+    # --- Assert ---
+    assert text == expected_text
+    assert metadata == expected_metadata
+    
+    mock_document_text.assert_called_once()
+    mock_get_stats.assert_called_once_with(mock_path) # Called only in the error handler
+    mock_logging.warning.assert_called_once_with(
+        f"Could not read PDF metadata for {mock_path} (PSEOF): Unexpected EOF"
+    )
 
-@patch('textcleaner.converters.pdf_converter.PdfReader')
+@patch('textcleaner.converters.pdf_converter._extract_document_text')
 @patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
-@patch('textcleaner.converters.pdf_converter.pdfminer_extract_text')
-def test_convert_metadata_unexpected_error(mock_extract_text, mock_get_stats, mock_pdf_reader, pdf_converter, mock_path, mock_logging):
+def test_convert_metadata_unexpected_error(mock_get_stats, mock_document_text, pdf_converter, mock_path, mock_logging, mock_document):
     """Test handling of unexpected Exception during metadata extraction.
     
     This should be caught by the main convert method's exception handler.
     """
     # --- Arrange ---
-    mock_pdf_reader.side_effect = Exception("Something unexpected")
-    # Set a return value for mock_extract_text, though it shouldn't be called
-    mock_extract_text.return_value = "Should not reach here" 
+    _, mock_page_count, _ = mock_document
+    mock_page_count.side_effect = Exception("Something unexpected")
     
     # --- Act & Assert ---
     # Expect a RuntimeError raised by the main convert method
@@ -199,46 +198,25 @@ def test_convert_metadata_unexpected_error(mock_extract_text, mock_get_stats, mo
     mock_logging.exception.assert_any_call(
         f"Unexpected error during PDF conversion for {mock_path}"
     )
-    # Assert that mock_extract_text was NOT called
-    mock_extract_text.assert_not_called()
+    # Assert that text extraction was NOT attempted
+    mock_document_text.assert_not_called()
     # Assert that get_stats was NOT called (error happens before it in _extract_metadata)
     mock_get_stats.assert_not_called()
 
-@patch('textcleaner.converters.pdf_converter.PdfReader')
-@patch('textcleaner.converters.pdf_converter.pdfminer_extract_text')
+@patch('textcleaner.converters.pdf_converter._extract_document_text')
 @patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
-def test_convert_text_extraction_pdfminer_error(mock_get_stats, mock_extract_text, mock_pdf_reader, pdf_converter, mock_path, mock_logging):
+def test_convert_text_extraction_pdfminer_error(mock_get_stats, mock_document_text, pdf_converter, mock_path, mock_logging, mock_document):
     """Test handling of pdfminer errors (PDFSyntaxError)."""
     # --- Arrange ---
-    # Simulate successful metadata extraction
-    mock_reader_instance = MagicMock()
-    mock_reader_instance.metadata = None
-    mock_reader_instance.pages = [MagicMock()]
-    mock_pdf_reader.return_value = mock_reader_instance
-    
-    # Simulate pdfminer failure
-    mock_extract_text.side_effect = PDFSyntaxError("Invalid PDF structure")
-    
-    expected_metadata = {
-        "page_count": 1,
-        "file_stats": {"size": 100}
-    }
-    # expected_text = "" # Should return empty string on pdfminer error
+    # Simulate pdfminer failure after successful metadata extraction
+    mock_document_text.side_effect = PDFSyntaxError("Invalid PDF structure")
 
     # --- Act & Assert ---
     # Expect a RuntimeError because extraction fails and results in no text
     with pytest.raises(RuntimeError, match="Conversion resulted in empty content"):
         pdf_converter.convert(mock_path)
 
-    # --- Assert mocks ---
-    # text, metadata = pdf_converter.convert(mock_path)
-
-    # # --- Assert ---
-    # assert text == expected_text
-    # assert metadata == expected_metadata
-    
-    mock_pdf_reader.assert_called_once_with(mock_path)
-    mock_extract_text.assert_called_once_with(mock_path)
+    mock_document_text.assert_called_once()
     mock_get_stats.assert_called_once_with(mock_path) # Called during metadata extraction
     mock_logging.error.assert_any_call(
         f"pdfminer extraction failed for {mock_path} (PDFSyntaxError): Invalid PDF structure"
@@ -248,40 +226,19 @@ def test_convert_text_extraction_pdfminer_error(mock_get_stats, mock_extract_tex
         f"PDF text extraction yielded empty result for: {mock_path}"
     )
 
-@patch('textcleaner.converters.pdf_converter.PdfReader')
-@patch('textcleaner.converters.pdf_converter.pdfminer_extract_text')
+@patch('textcleaner.converters.pdf_converter._extract_document_text')
 @patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
-def test_convert_text_extraction_unexpected_error(mock_get_stats, mock_extract_text, mock_pdf_reader, pdf_converter, mock_path, mock_logging):
+def test_convert_text_extraction_unexpected_error(mock_get_stats, mock_document_text, pdf_converter, mock_path, mock_logging, mock_document):
     """Test handling of unexpected Exception during pdfminer extraction."""
     # --- Arrange ---
-    # Simulate successful metadata extraction
-    mock_reader_instance = MagicMock()
-    mock_reader_instance.metadata = None
-    mock_reader_instance.pages = [MagicMock()]
-    mock_pdf_reader.return_value = mock_reader_instance
-    
-    # Simulate pdfminer failure
-    mock_extract_text.side_effect = Exception("Something broke in pdfminer")
-    
-    expected_metadata = {
-        "page_count": 1,
-        "file_stats": {"size": 100}
-    }
-    # expected_text = "" # Should return empty string on unexpected pdfminer error
+    mock_document_text.side_effect = Exception("Something broke in pdfminer")
 
     # --- Act & Assert ---
     # Expect a RuntimeError because extraction fails and results in no text
     with pytest.raises(RuntimeError, match="Conversion resulted in empty content"):
         pdf_converter.convert(mock_path)
 
-    # --- Assert mocks ---
-    # text, metadata = pdf_converter.convert(mock_path)
-
-    # # --- Assert ---
-    # assert text == expected_text
-    # assert metadata == expected_metadata
-    
-    mock_extract_text.assert_called_once_with(mock_path)
+    mock_document_text.assert_called_once()
     mock_logging.exception.assert_any_call(
         f"Unexpected error during pdfminer extraction for {mock_path}"
     )
@@ -290,50 +247,26 @@ def test_convert_text_extraction_unexpected_error(mock_get_stats, mock_extract_t
         f"PDF text extraction yielded empty result for: {mock_path}"
     )
 
-@patch('textcleaner.converters.pdf_converter.PdfReader')
-@patch('textcleaner.converters.pdf_converter.pdfminer_extract_text')
+@patch('textcleaner.converters.pdf_converter._extract_document_text', return_value="")
 @patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
-def test_convert_empty_text_extraction(mock_get_stats, mock_extract_text, mock_pdf_reader, pdf_converter, mock_path, mock_logging):
+def test_convert_empty_text_extraction(mock_get_stats, mock_document_text, pdf_converter, mock_path, mock_logging, mock_document):
     """Test the case where pdfminer returns an empty string."""
-    # --- Arrange ---
-    # Simulate successful metadata extraction
-    mock_reader_instance = MagicMock()
-    mock_reader_instance.metadata = None
-    mock_reader_instance.pages = [MagicMock()]
-    mock_pdf_reader.return_value = mock_reader_instance
-    
-    # Simulate pdfminer returning empty text
-    mock_extract_text.return_value = ""
-    
-    expected_metadata = {
-        "page_count": 1,
-        "file_stats": {"size": 100}
-    }
-    # expected_text = ""
-
     # --- Act & Assert ---
     # Expect a RuntimeError because extraction yields empty content
     with pytest.raises(RuntimeError, match="Conversion resulted in empty content"):
         pdf_converter.convert(mock_path)
 
-    # --- Assert mocks ---
-    # text, metadata = pdf_converter.convert(mock_path)
-
-    # # --- Assert ---
-    # assert text == expected_text
-    # assert metadata == expected_metadata
-    
-    mock_extract_text.assert_called_once_with(mock_path)
+    mock_document_text.assert_called_once()
     # Verify the final error log before the exception is raised
     mock_logging.error.assert_called_once_with(
          f"PDF text extraction yielded empty result for: {mock_path}"
     )
 
-@patch('textcleaner.converters.pdf_converter.PdfReader', side_effect=Exception("Top level failure"))
-def test_convert_unexpected_general_exception(mock_pdf_reader, pdf_converter, mock_path, mock_logging):
+def test_convert_unexpected_general_exception(pdf_converter, mock_path, mock_logging):
     """Test handling of an unexpected exception in the main convert method."""
     # --- Arrange ---
-    # Exception raised before text extraction is even called
+    # Exception raised before the document is even parsed
+    mock_path.open.side_effect = Exception("Top level failure")
     
     # --- Act & Assert ---
     with pytest.raises(RuntimeError, match="Unexpected error converting PDF /fake/path/document.pdf: Top level failure"):
@@ -350,42 +283,207 @@ def test_convert_unexpected_general_exception(mock_pdf_reader, pdf_converter, mo
     (PDFEncryptionError, "Encrypted file"),
     (OSError, "Cannot open file")
 ])
-@patch('textcleaner.converters.pdf_converter.PdfReader')
-@patch('textcleaner.converters.pdf_converter.pdfminer_extract_text')
+@patch('textcleaner.converters.pdf_converter._extract_document_text')
 @patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
-def test_convert_text_extraction_pdfminer_known_errors(mock_get_stats, mock_extract_text, mock_pdf_reader, pdf_converter, mock_path, mock_logging, error_type, error_msg):
+def test_convert_text_extraction_pdfminer_known_errors(mock_get_stats, mock_document_text, pdf_converter, mock_path, mock_logging, mock_document, error_type, error_msg):
     """Test handling of various known pdfminer errors."""
     # --- Arrange ---
-    mock_reader_instance = MagicMock()
-    mock_reader_instance.metadata = None
-    mock_reader_instance.pages = [MagicMock()]
-    mock_pdf_reader.return_value = mock_reader_instance
-    
-    mock_extract_text.side_effect = error_type(error_msg)
-    
-    expected_metadata = {
-        "page_count": 1,
-        "file_stats": {"size": 100}
-    }
-    # expected_text = ""
+    mock_document_text.side_effect = error_type(error_msg)
 
     # --- Act & Assert ---
     # Expect a RuntimeError because extraction fails and results in no text
     with pytest.raises(RuntimeError, match="Conversion resulted in empty content"):
         pdf_converter.convert(mock_path)
 
-    # --- Assert mocks ---
-    # text, metadata = pdf_converter.convert(mock_path)
-
-    # # --- Assert ---
-    # assert text == expected_text
-    # assert metadata == expected_metadata
-    
-    mock_extract_text.assert_called_once_with(mock_path)
+    mock_document_text.assert_called_once()
     mock_logging.error.assert_any_call(
         f"pdfminer extraction failed for {mock_path} ({error_type.__name__}): {error_msg}"
     ) 
     # Also check for the final error log before the exception is raised
     mock_logging.error.assert_any_call(
         f"PDF text extraction yielded empty result for: {mock_path}"
-    ) 
\ No newline at end of file
+    ) 
+
+@pytest.mark.parametrize("error_type, error_msg", [
+    (PDFSyntaxError, "No /Root object!"),
+    (PDFEncryptionError, "Unknown algorithm"),
+])
+@patch('textcleaner.converters.pdf_converter._extract_document_text')
+@patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
+def test_convert_unparseable_document(mock_get_stats, mock_document_text, pdf_converter, mock_path, mock_logging, mock_document, error_type, error_msg):
+    """Test that a document pdfminer cannot parse is neither read for metadata nor text."""
+    mock_parse, mock_page_count, _ = mock_document
+    mock_parse.side_effect = error_type(error_msg)
+
+    with pytest.raises(RuntimeError, match="Conversion resulted in empty content"):
+        pdf_converter.convert(mock_path)
+
+    mock_page_count.assert_not_called()
+    mock_document_text.assert_not_called()
+    mock_logging.error.assert_any_call(
+        f"pdfminer extraction failed for {mock_path} ({error_type.__name__}): {error_msg}"
+    )
+
+# --- Test page-parallel extraction ---
+
+@pytest.fixture
+def parallel_pdf_converter():
+    """Fixture for a PDFConverter that extracts documents of 16+ pages in parallel."""
+    config = ConfigManager()
+    config.config["formats"]["pdf"]["parallel_pages"] = {"min_pages": 16, "max_workers": 2}
+    config.config["formats"]["pdf"]["text_engine"]["engine"] = "pdfminer"
+    return PDFConverter(config)
+
+def test_page_ranges_cover_all_pages():
+    """Test that page ranges are consecutive and nearly equal."""
+    assert _page_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert _page_ranges(2, 5) == [(0, 1), (1, 2)]
+
+@patch('textcleaner.converters.pdf_converter._get_page_pool')
+@patch('textcleaner.converters.pdf_converter.pdfminer_extract_text')
+@patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
+def test_convert_extracts_page_ranges_in_order(mock_get_stats, mock_extract_text, mock_get_pool, parallel_pdf_converter, mock_path, mock_document):
+    """Test that long documents are extracted in page ranges and reassembled in order."""
+    mock_document[1].return_value = 40
+    mock_extract_text.side_effect = lambda path, page_numbers, laparams: "".join(f"page {n}\f" for n in page_numbers)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        mock_get_pool.return_value = pool
+        text, metadata = parallel_pdf_converter.convert(mock_path)
+
+    assert text == "".join(f"page {n}\f" for n in range(40))
+    assert metadata["page_ranges"] == 4
+    assert [call.args[0] for call in mock_extract_text.call_args_list] == [str(mock_path)] * 4
+
+@patch('textcleaner.converters.pdf_converter._get_page_pool')
+@patch('textcleaner.converters.pdf_converter._extract_document_text', return_value="Serial text.")
+@patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
+def test_convert_falls_back_to_serial_extraction(mock_get_stats, mock_document_text, mock_get_pool, parallel_pdf_converter, mock_path, mock_logging, mock_document):
+    """Test that a broken worker pool falls back to extracting the parsed document serially."""
+    mock_document[1].return_value = 40
+    mock_get_pool.return_value.submit.side_effect = BrokenProcessPool("worker died")
+
+    text, metadata = parallel_pdf_converter.convert(mock_path)
+
+    assert text == "Serial text."
+    assert "page_ranges" not in metadata
+    mock_document_text.assert_called_once_with(mock_document[0].return_value, True)
+    mock_logging.warning.assert_called_once()
+
+# --- Test text engines ---
+
+@pytest.fixture
+def auto_pdf_converter():
+    """Fixture for a PDFConverter that tries pypdf first."""
+    config = ConfigManager()
+    config.config["formats"]["pdf"]["text_engine"].update({"engine": "auto", "fallback": "pdfminer_fast"})
+    return PDFConverter(config)
+
+def test_text_quality():
+    """Test the measures of plausible and implausible text."""
+    assert text_quality("") is None
+    plain = text_quality("The quick brown fox jumps over the lazy dog.\f")
+    assert 3.5 < plain["chars_per_word"] < 5.5
+    assert plain["garbled_ratio"] == 0
+    assert text_quality("Thequickbrownfoxjumpsoverthelazydog.")["chars_per_word"] > 10
+    assert text_quality("(cid:12)(cid:13) ok \ufffd")["garbled_ratio"] > 0.1
+    assert text_quality(" \nThe\n \nquick\n \nfox\n \n")["whitespace_ratio"] > 0.3
+
+def pypdf_reader(page_texts, info=None):
+    """Build a mocked pypdf reader with the given page texts and document information."""
+    pages = [MagicMock(**{"extract_text.return_value": text}) for text in page_texts]
+    return MagicMock(pages=pages, metadata=info)
+
+@patch('textcleaner.converters.pdf_converter._extract_document_text')
+@patch('textcleaner.converters.pdf_converter.PdfReader')
+@patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
+def test_convert_accepts_fast_engine_text(mock_get_stats, mock_pdf_reader, mock_document_text, auto_pdf_converter, mock_path, mock_document):
+    """Test that plausible pypdf text and its metadata are kept without parsing with pdfminer."""
+    info = MagicMock(title="Report", author="Test Author", subject=None, creator="")
+    mock_pdf_reader.return_value = pypdf_reader(["Clean text from a ", "born-digital document."], info)
+
+    text, metadata = auto_pdf_converter.convert(mock_path)
+
+    assert text == "Clean text from a \fborn-digital document.\f"
+    assert metadata == {
+        "page_count": 2,
+        "file_stats": {"size": 100},
+        "title": "Report",
+        "author": "Test Author",
+        "text_engine": "pypdf",
+    }
+    # The document is parsed once, by pypdf
+    mock_document[0].assert_not_called()
+    mock_document_text.assert_not_called()
+
+@pytest.mark.parametrize("fast_text", [
+    "",
+    " \nOne\n \nword\n \nper\n \nline\n \n",
+    "Wordsruntogetherwhenthefonthasnospaceglyphs.",
+])
+@patch('textcleaner.converters.pdf_converter._extract_document_text', return_value="Text from pdfminer.")
+@patch('textcleaner.converters.pdf_converter.PdfReader')
+@patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
+def test_convert_falls_back_from_fast_engine(mock_get_stats, mock_pdf_reader, mock_document_text, auto_pdf_converter, mock_path, mock_document, fast_text):
+    """Test that implausible pypdf text is replaced by the fallback engine's."""
+    mock_pdf_reader.return_value = pypdf_reader([fast_text], MagicMock(title="From pypdf"))
+
+    text, metadata = auto_pdf_converter.convert(mock_path)
+
+    assert text == "Text from pdfminer."
+    assert metadata == {"page_count": 1, "file_stats": {"size": 100}, "text_engine": "pdfminer_fast"}
+    # The fallback does not order text boxes
+    mock_document_text.assert_called_once_with(mock_document[0].return_value, False)
+
+@patch('textcleaner.converters.pdf_converter._extract_document_text', return_value="Text from pdfminer.")
+@patch('textcleaner.converters.pdf_converter.PdfReader')
+@patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
+def test_convert_stops_fast_engine_after_failed_probe(mock_get_stats, mock_pdf_reader, mock_document_text, auto_pdf_converter, mock_path, mock_document):
+    """Test that pypdf stops once the first pages fail the quality check."""
+    reader = pypdf_reader([" \nOne\n \nword\n \nper\n \nline\n \n"] * 10)
+    mock_pdf_reader.return_value = reader
+
+    text, metadata = auto_pdf_converter.convert(mock_path)
+
+    assert text == "Text from pdfminer."
+    assert [page.extract_text.call_count for page in reader.pages] == [1, 1] + [0] * 8
+
+@patch('textcleaner.converters.pdf_converter._extract_document_text', return_value="Text from pdfminer.")
+@patch('textcleaner.converters.pdf_converter.PdfReader', side_effect=ValueError("bad xref"))
+@patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
+def test_convert_falls_back_when_fast_engine_fails(mock_get_stats, mock_pdf_reader, mock_document_text, auto_pdf_converter, mock_path, mock_document, mock_logging):
+    """Test that a pypdf failure falls back instead of failing the conversion."""
+    text, metadata = auto_pdf_converter.convert(mock_path)
+
+    assert text == "Text from pdfminer."
+    assert metadata["text_engine"] == "pdfminer_fast"
+    mock_logging.warning.assert_called_once_with(
+        f"pypdf extraction failed for {mock_path} (ValueError): bad xref"
+    )
+
+@patch('textcleaner.converters.pdf_converter._extract_document_text', return_value="Text from pdfminer.")
+@patch.object(PDFConverter, 'get_stats', return_value={"size": 100})
+def test_convert_unknown_engine_uses_default(mock_get_stats, mock_document_text, mock_path, mock_document, mock_logging):
+    """Test that an unknown engine name is reported and the default engine used."""
+    config = ConfigManager()
+    config.config["formats"]["pdf"]["text_engine"].update({"engine": "fastest", "fallback": "pypdf"})
+
+    with patch('textcleaner.converters.pdf_converter.PdfReader', return_value=pypdf_reader([""])):
+        text, metadata = PDFConverter(config).convert(mock_path)
+
+    assert metadata["text_engine"] == "pdfminer"
+    warnings = [call.args[0] for call in mock_logging.warning.call_args_list]
+    assert any("Unknown PDF text engine 'fastest'" in message for message in warnings)
+    assert any("Unknown PDF text engine 'pypdf' in formats.pdf.text_engine.fallback" in message for message in warnings)
+
+def test_document_metadata_from_single_parse():
+    """Test reading the page count and document information of a real PDF."""
+    path = Path(__file__).parents[2] / "fixtures" / "docs" / "Email Chain 2.pdf"
+    with path.open("rb") as fp:
+        document = _parse_document(fp)
+        assert _page_count(document) == 13
+        assert _document_info(document) == {
+            "title": "RePrilis Ors Old NewingtoniansUnion Incorporated URGENT",
+            "author": "Edward Miller",
+            "creator": "Mail",
+        }
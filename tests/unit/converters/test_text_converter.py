@@ -1,9 +1,8 @@
 import unittest
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 from pathlib import Path
-import os
-import time
+import tempfile
 
 # Import the class to test
 from textcleaner.converters.text_converter import TextConverter
@@ -18,36 +17,48 @@ class TestTextConverter(unittest.TestCase):
         """Set up test fixtures for each test."""
         self.mock_config = MagicMock(spec=ConfigManager)
         self.converter = TextConverter(config=self.mock_config)
-        self.test_file_path = Path("test_dir/test_file.txt")
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.test_file_path = Path(temp_dir.name) / "test_file.txt"
 
     def test_init_sets_supported_extensions(self):
         """Test that the constructor correctly sets supported extensions."""
         self.assertEqual(self.converter.supported_extensions, [".txt"])
 
-    @patch('pathlib.Path.exists', return_value=True)
-    @patch('pathlib.Path.stat')
-    @patch("builtins.open", new_callable=mock_open, read_data="Test file content.")
-    def test_convert_success(self, mock_file_open, mock_stat, mock_exists):
+    def test_convert_success(self):
         """Test successful conversion of a valid text file."""
-        # Setup mock stat result
-        mock_stat_result = MagicMock()
-        mock_stat_result.st_size = 100
-        mock_stat_result.st_ctime = time.time() - 3600 # 1 hour ago
-        mock_stat_result.st_mtime = time.time()       # Now
-        mock_stat.return_value = mock_stat_result
-        
+        self.test_file_path.write_bytes(b"Test file content.")
+        stat_result = self.test_file_path.stat()
+
         content, metadata = self.converter.convert(self.test_file_path)
-        
-        mock_exists.assert_called_once_with()
-        mock_file_open.assert_called_once_with(self.test_file_path, "r", encoding="utf-8")
-        mock_stat.assert_called_once_with()
-        
+
         self.assertEqual(content, "Test file content.")
         self.assertEqual(metadata["file_name"], "test_file.txt")
         self.assertEqual(metadata["file_extension"], ".txt")
-        self.assertEqual(metadata["file_stats"]["size_bytes"], 100)
-        self.assertEqual(metadata["file_stats"]["created_at"], mock_stat_result.st_ctime)
-        self.assertEqual(metadata["file_stats"]["modified_at"], mock_stat_result.st_mtime)
+        self.assertEqual(metadata["file_stats"]["size_bytes"], 18)
+        self.assertEqual(metadata["file_stats"]["created_at"], stat_result.st_ctime)
+        self.assertEqual(metadata["file_stats"]["modified_at"], stat_result.st_mtime)
+
+    def test_convert_strips_byte_order_mark(self):
+        """Test that a UTF-8 byte-order mark is not part of the content."""
+        self.test_file_path.write_bytes(b"\xef\xbb\xbfCaf\xc3\xa9 menu.")
+        content, _ = self.converter.convert(self.test_file_path)
+        self.assertEqual(content, "Café menu.")
+
+    def test_convert_normalizes_line_breaks(self):
+        """Test that CRLF and CR line breaks are read as LF, like text mode."""
+        self.test_file_path.write_bytes(b"one\r\ntwo\rthree\n\r\nfour")
+        content, _ = self.converter.convert(self.test_file_path)
+        self.assertEqual(content, "one\ntwo\nthree\n\nfour")
+
+        windows, _ = self.converter.stream(self.test_file_path, window_size=4)
+        self.assertEqual("".join(windows), content)
+
+    def test_convert_empty_file(self):
+        """Test that an empty file converts to empty content."""
+        self.test_file_path.write_bytes(b"")
+        content, _ = self.converter.convert(self.test_file_path)
+        self.assertEqual(content, "")
 
     @patch('pathlib.Path.exists', return_value=False)
     def test_convert_file_not_found(self, mock_exists):
@@ -56,42 +67,33 @@ class TestTextConverter(unittest.TestCase):
             self.converter.convert(self.test_file_path)
         mock_exists.assert_called_once_with()
 
-    @patch('pathlib.Path.exists', return_value=True)
-    @patch("builtins.open", new_callable=mock_open)
-    def test_convert_unicode_decode_error(self, mock_file_open, mock_exists):
+    def test_convert_unicode_decode_error(self):
         """Test conversion raises ValueError for files with encoding issues."""
-        # Simulate UnicodeDecodeError during read
-        mock_file_open.side_effect = UnicodeDecodeError('utf-8', b'\x80abc', 0, 1, 'invalid start byte')
-        
+        self.test_file_path.write_bytes(b'\x80abc')
+
         with self.assertRaisesRegex(ValueError, "File is not a valid text file or has an unsupported encoding"):
             self.converter.convert(self.test_file_path)
-            
-        mock_exists.assert_called_once_with()
-        mock_file_open.assert_called_once_with(self.test_file_path, "r", encoding="utf-8")
 
     @patch('pathlib.Path.exists', return_value=True)
-    @patch("builtins.open", new_callable=mock_open)
+    @patch("builtins.open")
     def test_convert_other_read_error(self, mock_file_open, mock_exists):
         """Test conversion propagates other file reading errors."""
-        # Simulate a generic OSError during read
+        # Simulate a generic OSError while opening the file
         mock_file_open.side_effect = OSError("Disk read error")
-        
+
         with self.assertRaises(OSError):
             self.converter.convert(self.test_file_path)
-            
+
         mock_exists.assert_called_once_with()
-        mock_file_open.assert_called_once_with(self.test_file_path, "r", encoding="utf-8")
-        
+        mock_file_open.assert_called_once_with(self.test_file_path, "rb")
+
     def test_convert_accepts_string_path(self):
         """Test that convert accepts a string path argument."""
-        # Use patch.object to avoid patching builtins globally for this test
-        with patch.object(Path, 'exists', return_value=True), \
-             patch.object(Path, 'stat', return_value=MagicMock(st_size=10)), \
-             patch("builtins.open", mock_open(read_data="content")):
-            
-            # Call convert with a string path
-            content, _ = self.converter.convert(str(self.test_file_path))
-            self.assertEqual(content, "content")
+        self.test_file_path.write_text("content", encoding="utf-8")
+
+        # Call convert with a string path
+        content, _ = self.converter.convert(str(self.test_file_path))
+        self.assertEqual(content, "content")
 
 
 if __name__ == "__main__":
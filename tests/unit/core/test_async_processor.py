@@ -0,0 +1,168 @@
+"""
+Tests for the asyncio processor interface
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from textcleaner.core.async_processor import AsyncTextProcessor
+from textcleaner.core.factories import TextProcessorFactory
+
+
+@pytest.fixture
+def processor(test_security_utils):
+    """Create a standard processor with relaxed security"""
+    return TextProcessorFactory(security_utils=test_security_utils).create_standard_processor()
+
+
+@pytest.fixture
+def input_files(temp_directory):
+    """Create a few input files"""
+    files = []
+    for i in range(6):
+        path = temp_directory / f"doc{i}.txt"
+        path.write_text(f"Document {i}.\n\nAnother paragraph for {i}.\n")
+        files.append(path)
+    return files
+
+
+def test_aprocess_file_matches_sync(processor, input_files, temp_directory):
+    """Test that the async path writes the same output as process_file"""
+    sync_result = processor.process_file(input_files[0], temp_directory / "sync.md")
+
+    async def run():
+        async with AsyncTextProcessor(processor, max_concurrency=2) as async_processor:
+            return await async_processor.aprocess_file(input_files[0], temp_directory / "async.md")
+
+    result = asyncio.run(run())
+
+    assert result.success and sync_result.success
+    assert (temp_directory / "async.md").read_text() == (temp_directory / "sync.md").read_text()
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_aprocess_many_keeps_input_order(processor, input_files, temp_directory, use_processes):
+    """Test batch processing with output paths on both pool types"""
+    specs = [(path, temp_directory / "out" / f"{path.stem}.md") for path in input_files]
+
+    async def run():
+        async with AsyncTextProcessor(processor, max_concurrency=3, use_processes=use_processes) as async_processor:
+            return await async_processor.aprocess_many(specs)
+
+    results = asyncio.run(run())
+
+    assert [r.input_path for r in results] == input_files
+    assert all(r.success for r in results)
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_large_files_stream_on_the_compute_pool(test_security_utils, input_files, temp_directory, use_processes):
+    """Test that streamed files are processed on the compute pool, not the default executor"""
+    streaming_processor = TextProcessorFactory(security_utils=test_security_utils).create_processor(
+        custom_overrides={"processing.streaming.threshold_mb": 0}
+    )
+    sync_result = streaming_processor.process_file(input_files[0], temp_directory / "sync.md")
+    execute = streaming_processor._execute_streaming_steps
+    threads = []
+
+    def record_thread(*args):
+        threads.append(threading.current_thread().name)
+        return execute(*args)
+
+    streaming_processor._execute_streaming_steps = record_thread
+
+    async def run():
+        async with AsyncTextProcessor(streaming_processor, max_concurrency=2, use_processes=use_processes) as async_processor:
+            return await async_processor.aprocess_file(input_files[0], temp_directory / "async.md")
+
+    result = asyncio.run(run())
+
+    assert result.success and result.metadata.get("streamed") is True
+    assert (temp_directory / "async.md").read_text() == (temp_directory / "sync.md").read_text()
+    assert sync_result.metadata.get("streamed") is True
+    if use_processes:
+        assert threads == [] # Worker processes stream with their own processor
+    else:
+        assert len(threads) == 1 and threads[0].startswith("textcleaner-async")
+
+
+def test_aiter_process_streams_and_reports_failures(processor, input_files, temp_directory):
+    """Test that streaming yields every result, including failures"""
+    missing = temp_directory / "missing.txt"
+    specs = [(path, temp_directory / "out" / f"{path.stem}.md") for path in input_files]
+    specs.append((missing, temp_directory / "out" / "missing.md"))
+
+    async def run():
+        async with AsyncTextProcessor(processor, max_concurrency=2) as async_processor:
+            return [r async for r in async_processor.aiter_process(specs, ordered=True)]
+
+    results = asyncio.run(run())
+
+    assert [r.input_path for r in results] == [spec[0] for spec in specs]
+    assert not results[-1].success
+    assert all(r.success for r in results[:-1])
+
+
+def test_concurrency_limit_is_respected(processor, input_files, temp_directory):
+    """Test that no more than max_concurrency files run at once"""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    original = processor._apply_pipeline
+
+    def tracking_pipeline(*args):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            threading.Event().wait(0.05)
+            return original(*args)
+        finally:
+            with lock:
+                active -= 1
+
+    processor._apply_pipeline = tracking_pipeline
+    specs = [(path, temp_directory / "out" / f"{path.stem}.md") for path in input_files]
+
+    async def run():
+        async with AsyncTextProcessor(processor, max_concurrency=2) as async_processor:
+            return await async_processor.aprocess_many(specs)
+
+    results = asyncio.run(run())
+
+    assert all(r.success for r in results)
+    assert peak <= 2
+
+
+def test_cancellation_stops_queued_work(processor, input_files, temp_directory):
+    """Test that cancelling a batch leaves queued files unprocessed"""
+    started = []
+    release = threading.Event()
+    original = processor._convert
+
+    def blocking_convert(path):
+        started.append(path)
+        release.wait(5)
+        return original(path)
+
+    processor._convert = blocking_convert
+    specs = [(path, temp_directory / "out" / f"{path.stem}.md") for path in input_files]
+
+    async def run():
+        async_processor = AsyncTextProcessor(processor, max_concurrency=1)
+        task = asyncio.ensure_future(async_processor.aprocess_many(specs))
+        while not started:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await async_processor.aclose()
+
+    asyncio.run(run())
+
+    assert len(started) == 1
+    assert not (temp_directory / "out" / "doc5.md").exists()
@@ -0,0 +1,99 @@
+"""
+Tests for the scheduling cost model
+"""
+
+from pathlib import Path
+
+import pytest
+
+from textcleaner.core.cost_model import CostModel, DEFAULT_BYTES_PER_SECOND
+from textcleaner.core.directory_processor import DirectoryProcessor
+from textcleaner.core.factories import TextProcessorFactory
+from textcleaner.core.models import ProcessingResult
+from textcleaner.utils.parallel import ParallelProcessor
+
+
+@pytest.fixture
+def model(temp_directory):
+    """Create an empty cost model stored in a temporary directory"""
+    return CostModel(temp_directory / "cost_model.json")
+
+
+def test_empty_model_falls_back_to_file_size(model):
+    """Test that estimates without history are proportional to size"""
+    assert model.estimate(Path("a.pdf"), size=DEFAULT_BYTES_PER_SECOND) == pytest.approx(1.0)
+    assert model.estimate(Path("b.txt"), size=10) < model.estimate(Path("c.txt"), size=20)
+
+
+def test_learned_rates_are_per_extension(model):
+    """Test that slow extensions get higher estimates than fast ones"""
+    model.observe(Path("slow.pdf"), 1000, 10.0)
+    model.observe(Path("fast.txt"), 1000, 0.1)
+
+    assert model.bytes_per_second(".pdf") == pytest.approx(100)
+    assert model.estimate(Path("big.pdf"), size=500) > model.estimate(Path("big.txt"), size=5000)
+    # Unknown extensions use the overall rate
+    assert model.bytes_per_second(".docx") == pytest.approx(2000 / 10.1)
+
+
+def test_observe_results_skips_cached_and_failed(model, temp_directory):
+    """Test that only real processing timings are learned"""
+    source = temp_directory / "doc.txt"
+    source.write_text("x" * 100)
+    results = [
+        ProcessingResult(source, metrics={"processing_time_seconds": 0.5}),
+        ProcessingResult(source, metrics={"processing_time_seconds": 0.5, "cache_hit": True}),
+        ProcessingResult(source, metrics={"processing_time_seconds": 0.0, "skipped_unchanged": True}),
+        ProcessingResult(source, success=False, metrics={"processing_time_seconds": 0.5}),
+    ]
+
+    assert model.observe_results(results) == 1
+    assert model.stats[".txt"]["files"] == 1
+
+
+def test_model_persists_between_instances(model):
+    """Test that saved statistics are loaded again"""
+    model.observe(Path("doc.pdf"), 4096, 2.0)
+    model.save()
+
+    reloaded = CostModel(model.path)
+    assert reloaded.bytes_per_second(".pdf") == pytest.approx(2048)
+
+
+def test_process_items_submits_costliest_first():
+    """Test longest-expected-first submission with input-ordered results"""
+    started = []
+
+    def record(item):
+        started.append(item)
+        return item
+
+    processor = ParallelProcessor(max_workers=1, adaptive_workers=False, min_workers=1)
+    results = processor.process_items([1, 5, 3, 4], record, cost_func=lambda item: item)
+
+    assert started == [5, 4, 3, 1]
+    assert [r.result for r in results] == [1, 5, 3, 4]
+
+
+def test_directory_run_updates_model(test_security_utils, temp_directory):
+    """Test that directory runs feed their timings into the model"""
+    input_dir = temp_directory / "input"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"doc{i}.txt").write_text(f"Document {i}.\n\nWith a second paragraph.\n")
+
+    single_file_processor = TextProcessorFactory(security_utils=test_security_utils).create_standard_processor()
+    model = CostModel(temp_directory / "cost_model.json")
+    dir_processor = DirectoryProcessor(
+        config=single_file_processor.config,
+        security_utils=test_security_utils,
+        parallel_processor=ParallelProcessor(max_workers=2),
+        single_file_processor=single_file_processor,
+        cost_model=model
+    )
+
+    results = dir_processor.process_directory_parallel(input_dir, temp_directory / "output", quiet_mode=True)
+
+    assert all(r.success for r in results)
+    assert model.stats[".txt"]["files"] == 3
+    assert CostModel(model.path).stats == model.stats
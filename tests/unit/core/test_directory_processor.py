@@ -0,0 +1,121 @@
+"""
+Tests for the DirectoryProcessor executor backends
+"""
+
+import pytest
+
+from textcleaner.core.directory_processor import DirectoryProcessor
+from textcleaner.core.factories import TextProcessorFactory
+from textcleaner.utils.parallel import ParallelProcessor
+
+
+@pytest.fixture
+def dir_processor(test_security_utils):
+    """Create a DirectoryProcessor with relaxed security for temp dirs"""
+    single_file_processor = TextProcessorFactory(security_utils=test_security_utils).create_standard_processor()
+    return DirectoryProcessor(
+        config=single_file_processor.config,
+        security_utils=test_security_utils,
+        parallel_processor=ParallelProcessor(max_workers=2),
+        single_file_processor=single_file_processor
+    )
+
+
+@pytest.fixture
+def source_tree(temp_directory):
+    """Create an input directory with a handful of text files"""
+    input_dir = temp_directory / "input"
+    input_dir.mkdir()
+    for i in range(5):
+        (input_dir / f"doc{i}.txt").write_text(f"Document number {i}.\n\nSome more text for {i}.\n")
+    return input_dir, temp_directory / "output"
+
+
+@pytest.mark.parametrize("executor", ["thread", "process", "sequential"])
+def test_executors_process_every_file(dir_processor, source_tree, executor):
+    """Test that every executor processes all files with the same outputs"""
+    input_dir, output_dir = source_tree
+
+    results = dir_processor.process_directory_parallel(
+        input_dir, output_dir, quiet_mode=True, executor=executor
+    )
+
+    assert sorted(r.input_path.name for r in results) == [f"doc{i}.txt" for i in range(5)]
+    assert all(r.success for r in results)
+    for i in range(5):
+        assert f"Document number {i}" in (output_dir / f"doc{i}.md").read_text()
+
+
+def test_process_executor_reports_failures(dir_processor, source_tree):
+    """Test that failures in worker processes are returned as failed results"""
+    input_dir, output_dir = source_tree
+    (input_dir / "doc2.txt").write_bytes(b"")
+
+    results = dir_processor.process_directory_parallel(
+        input_dir, output_dir, quiet_mode=True, executor="process"
+    )
+
+    by_name = {r.input_path.name: r for r in results}
+    assert len(by_name) == 5
+    assert not by_name["doc2.txt"].success
+    assert by_name["doc2.txt"].error
+    assert all(r.success for name, r in by_name.items() if name != "doc2.txt")
+
+
+def test_executor_defaults_to_config(dir_processor, source_tree):
+    """Test that the configured executor is used when none is given"""
+    input_dir, output_dir = source_tree
+    dir_processor.config.config["processing"]["executor"] = "sequential"
+
+    results = dir_processor.process_directory_parallel(input_dir, output_dir, quiet_mode=True)
+    assert len(results) == 5 and all(r.success for r in results)
+
+
+def test_unknown_executor_is_rejected(dir_processor, source_tree):
+    """Test that an invalid executor name raises ValueError"""
+    input_dir, output_dir = source_tree
+    with pytest.raises(ValueError):
+        dir_processor.process_directory_parallel(input_dir, output_dir, executor="gpu")
+
+
+def test_process_executor_keeps_thread_ordering(dir_processor, source_tree):
+    """Test that the process pool returns results in the same order as threads"""
+    input_dir, output_dir = source_tree
+
+    threaded = dir_processor.process_directory_parallel(input_dir, output_dir, quiet_mode=True, executor="thread")
+    pooled = dir_processor.process_directory_parallel(input_dir, output_dir, quiet_mode=True, executor="process")
+
+    assert [r.input_path for r in pooled] == [r.input_path for r in threaded]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process", "sequential"])
+def test_iter_process_directory_streams_results(dir_processor, source_tree, executor):
+    """Test that streaming yields one result per file"""
+    input_dir, output_dir = source_tree
+
+    stream = dir_processor.iter_process_directory(
+        input_dir, output_dir, executor=executor, max_in_flight=2
+    )
+    results = list(stream)
+
+    assert sorted(r.input_path.name for r in results) == [f"doc{i}.txt" for i in range(5)]
+    assert all(r.success for r in results)
+    assert (output_dir / "doc4.md").exists()
+
+
+def test_iter_process_directory_preserves_order(dir_processor, source_tree):
+    """Test that ordered streaming matches the batch API order"""
+    input_dir, output_dir = source_tree
+
+    batch = dir_processor.process_directory_parallel(input_dir, output_dir, quiet_mode=True)
+    streamed = list(dir_processor.iter_process_directory(input_dir, output_dir, preserve_order=True))
+
+    assert [r.input_path for r in streamed] == [r.input_path for r in batch]
+
+
+def test_iter_process_directory_setup_failure(dir_processor, temp_directory):
+    """Test that an invalid input directory yields a single failed result"""
+    results = list(dir_processor.iter_process_directory(temp_directory / "missing"))
+
+    assert len(results) == 1
+    assert not results[0].success
@@ -0,0 +1,90 @@
+"""
+Tests for per-format execution lanes
+"""
+
+from pathlib import Path
+
+import pytest
+
+from textcleaner.config.config_manager import ConfigManager
+from textcleaner.core.directory_processor import DirectoryProcessor
+from textcleaner.core.factories import TextProcessorFactory
+from textcleaner.core.lanes import DEFAULT_LANE, Lane, LaneRouter, load_lanes
+from textcleaner.utils.parallel import ParallelProcessor
+
+
+@pytest.fixture
+def single_file_processor(test_security_utils):
+    """Create a standard processor with relaxed security"""
+    return TextProcessorFactory(security_utils=test_security_utils).create_standard_processor()
+
+
+def test_load_lanes_adds_default_lane():
+    """Test that lanes are parsed and a default lane always exists"""
+    config = ConfigManager(initial_config={"processing": {"lanes": {
+        "pdf": {"converters": ["PDFConverter"], "executor": "process", "max_workers": 2},
+        "sheets": {"extensions": ["xlsx"]},
+    }}})
+
+    lanes = {lane.name: lane for lane in load_lanes(config)}
+
+    assert set(lanes) == {"pdf", "sheets", DEFAULT_LANE}
+    assert lanes["pdf"].executor == "process" and lanes["pdf"].max_workers == 2
+    assert lanes["sheets"].extensions == (".xlsx",)
+
+
+def test_load_lanes_rejects_unknown_executor():
+    """Test that a lane with an invalid executor raises ValueError"""
+    config = ConfigManager(initial_config={"processing": {"lanes": {"pdf": {"executor": "gpu"}}}})
+    with pytest.raises(ValueError):
+        load_lanes(config)
+
+
+def test_router_matches_extension_then_converter(single_file_processor):
+    """Test routing by extension, converter class and fallback"""
+    lanes = [
+        Lane(name="office", converters=("OfficeConverter",)),
+        Lane(name="sheets", extensions=(".xlsx",)),
+        Lane(name=DEFAULT_LANE),
+    ]
+    router = LaneRouter(lanes, single_file_processor.converter_registry)
+
+    assert router.route(Path("report.xlsx")).name == "sheets"
+    assert router.route(Path("letter.docx")).name == "office"
+    assert router.route(Path("notes.txt")).name == DEFAULT_LANE
+
+
+def test_memory_cap_limits_workers():
+    """Test that memory_per_task_mb bounds the worker count"""
+    assert Lane(name="huge", max_workers=8, memory_per_task_mb=10**9).worker_limit(4) == 1
+    assert Lane(name="small", max_workers=3).worker_limit(16) == 3
+    assert Lane(name="default").worker_limit(5) == 5
+
+
+def test_lanes_executor_processes_directory(single_file_processor, test_security_utils, temp_directory):
+    """Test that the lanes executor runs every lane and keeps input order"""
+    input_dir = temp_directory / "input"
+    input_dir.mkdir()
+    (input_dir / "a.txt").write_text("Plain text file.\n")
+    (input_dir / "b.md").write_text("# Title\n\nMarkdown file.\n")
+    (input_dir / "c.txt").write_text("Another text file.\n")
+
+    single_file_processor.config.config["processing"]["lanes"] = {
+        "markdown": {"extensions": [".md"], "executor": "process", "max_workers": 1},
+        "default": {"executor": "thread", "max_workers": 2},
+    }
+    dir_processor = DirectoryProcessor(
+        config=single_file_processor.config,
+        security_utils=test_security_utils,
+        parallel_processor=ParallelProcessor(max_workers=2),
+        single_file_processor=single_file_processor
+    )
+
+    threaded = dir_processor.process_directory_parallel(input_dir, temp_directory / "out1", quiet_mode=True)
+    laned = dir_processor.process_directory_parallel(
+        input_dir, temp_directory / "out2", quiet_mode=True, executor="lanes"
+    )
+
+    assert all(r.success for r in laned)
+    assert [r.input_path for r in laned] == [r.input_path for r in threaded]
+    assert (temp_directory / "out2" / "b.md").exists()
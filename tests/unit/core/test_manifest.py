@@ -0,0 +1,162 @@
+"""
+Tests for incremental directory processing with the build manifest
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from textcleaner.core.directory_processor import DirectoryProcessor
+from textcleaner.core.factories import TextProcessorFactory
+from textcleaner.core.manifest import MANIFEST_FILENAME, commit_output
+from textcleaner.utils.metrics import get_token_counts
+from textcleaner.utils.parallel import ParallelProcessor
+
+
+@pytest.fixture
+def dir_processor(test_security_utils):
+    """Create a DirectoryProcessor with relaxed security for temp dirs"""
+    single_file_processor = TextProcessorFactory().create_standard_processor()
+    return DirectoryProcessor(
+        config=single_file_processor.config,
+        security_utils=test_security_utils,
+        parallel_processor=ParallelProcessor(max_workers=2),
+        single_file_processor=single_file_processor
+    )
+
+
+@pytest.fixture
+def source_tree(temp_directory):
+    """Create an input tree with a few text files"""
+    input_dir = temp_directory / "input"
+    (input_dir / "sub").mkdir(parents=True)
+    for name in ("a.txt", "b.txt", "sub/c.txt"):
+        (input_dir / name).write_text(f"Content of {name}.\n\nAnother paragraph in {name}.\n")
+    return input_dir, temp_directory / "output"
+
+
+def _skipped(results):
+    return sorted(r.input_path.name for r in results if r.metrics.get("skipped_unchanged"))
+
+
+@pytest.mark.parametrize("method", ["process_directory", "process_directory_parallel"])
+def test_second_run_skips_unchanged_files(dir_processor, source_tree, method):
+    """Test that only changed files are processed again"""
+    input_dir, output_dir = source_tree
+    run = getattr(dir_processor, method)
+
+    first = run(input_dir, output_dir, quiet_mode=True, incremental=True)
+    assert len(first) == 3 and all(r.success for r in first)
+    assert _skipped(first) == []
+    assert (output_dir / MANIFEST_FILENAME).exists()
+
+    (input_dir / "b.txt").write_text("Changed content.\n")
+    second = run(input_dir, output_dir, quiet_mode=True, incremental=True)
+
+    assert len(second) == 3 and all(r.success for r in second)
+    assert _skipped(second) == ["a.txt", "c.txt"]
+    # Skipped and processed files are reported in discovery order
+    assert [r.input_path for r in second] == [r.input_path for r in first]
+    assert "Changed content" in (output_dir / "b.md").read_text()
+    assert not list(output_dir.rglob(".tc-partial-*"))
+
+
+def test_touched_file_with_same_bytes_is_skipped(dir_processor, source_tree):
+    """Test that a new mtime alone does not trigger reprocessing"""
+    input_dir, output_dir = source_tree
+    dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+
+    source = input_dir / "a.txt"
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    results = dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+    assert _skipped(results) == ["a.txt", "b.txt", "c.txt"]
+
+
+def test_config_change_reprocesses_everything(dir_processor, source_tree):
+    """Test that a different configuration invalidates the manifest"""
+    input_dir, output_dir = source_tree
+    dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+
+    dir_processor.config.config["general"]["log_level"] = "DEBUG"
+    results = dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+    assert _skipped(results) == []
+
+
+def test_identical_output_is_not_rewritten(dir_processor, source_tree):
+    """Test that reprocessing to identical bytes keeps the old output mtime"""
+    input_dir, output_dir = source_tree
+    dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+
+    output = output_dir / "a.md"
+    old_mtime = output.stat().st_mtime_ns - 10**9
+    os.utime(output, ns=(old_mtime, old_mtime))
+    # Append and remove a trailing space so the source changes but cleans identically
+    (input_dir / "a.txt").write_text("Content of a.txt. \n\nAnother paragraph in a.txt.\n")
+
+    results = dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+    assert "a.txt" not in _skipped(results)
+    assert output.stat().st_mtime_ns == old_mtime
+
+
+def test_outputs_of_deleted_sources_are_pruned(dir_processor, source_tree):
+    """Test that deleting a source removes its output"""
+    input_dir, output_dir = source_tree
+    dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+    assert (output_dir / "sub" / "c.md").exists()
+
+    (input_dir / "sub" / "c.txt").unlink()
+    results = dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+
+    assert len(results) == 2
+    assert not (output_dir / "sub" / "c.md").exists()
+    assert (output_dir / "a.md").exists()
+
+
+def test_partial_outputs_of_killed_runs_are_removed(dir_processor, source_tree):
+    """Test that staged outputs of dead processes are swept, others are kept"""
+    input_dir, output_dir = source_tree
+    dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    stale = output_dir / "sub" / f".tc-partial-{dead.pid}-c.md"
+    running = output_dir / f".tc-partial-{os.getppid()}-a.md"
+    own = output_dir / f".tc-partial-{os.getpid()}-b.md"
+    for path in (stale, running, own):
+        path.write_text("partial")
+
+    dir_processor.process_directory_parallel(input_dir, output_dir, quiet_mode=True, incremental=True)
+
+    assert not stale.exists()
+    assert running.exists() and own.exists()
+
+
+def test_commit_output_replaces_changed_file(temp_directory):
+    """Test that differing staged output replaces the destination"""
+    staged = temp_directory / "staged.md"
+    final = temp_directory / "final.md"
+    final.write_text("old")
+    staged.write_text("new")
+
+    assert commit_output(staged, final) is True
+    assert final.read_text() == "new"
+    assert not staged.exists()
+
+
+def test_skipped_files_keep_token_metrics(dir_processor, source_tree):
+    """Test that token metrics of skipped files survive a rerun"""
+    input_dir, output_dir = source_tree
+
+    first = {r.input_path.name: r for r in dir_processor.process_directory(
+        input_dir, output_dir, quiet_mode=True, incremental=True)}
+    second = dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, incremental=True)
+
+    assert _skipped(second) == ["a.txt", "b.txt", "c.txt"]
+    for result in second:
+        counts = get_token_counts(result.metrics)
+        assert counts[0] is not None and counts[1] is not None
+        assert counts == get_token_counts(first[result.input_path.name].metrics)
@@ -243,3 +243,40 @@ def test_very_large_input(parallel_processor):
     
     print(f"Sequential processing: {sequential_elapsed:.2f} seconds")
     print(f"Parallel speedup: {sequential_elapsed/elapsed:.1f}x")
+
+
+def test_iter_items_preserves_order(parallel_processor):
+    """Test that ordered streaming yields results in input order"""
+    results = list(parallel_processor.iter_items(
+        iter(range(20)), slow_function, max_in_flight=4, preserve_order=True
+    ))
+
+    assert [r.input_item for r in results] == list(range(20))
+    assert [r.result for r in results] == [i * 2 for i in range(20)]
+
+
+def test_iter_items_bounds_items_in_flight(parallel_processor):
+    """Test that items are pulled lazily within the window"""
+    pulled = []
+
+    def source():
+        for i in range(50):
+            pulled.append(i)
+            yield i
+
+    stream = parallel_processor.iter_items(source(), slow_function, max_in_flight=3)
+    first = next(stream)
+    assert first.success
+    # One window, plus at most one refill after the first completion
+    assert len(pulled) <= 4
+    stream.close()
+    assert len(pulled) < 50
+
+
+def test_iter_items_reports_failures(parallel_processor):
+    """Test that exceptions in streamed items become failed results"""
+    results = list(parallel_processor.iter_items(range(10), failing_function))
+
+    failed = sorted(r.input_item for r in results if not r.success)
+    assert failed == [0, 5]
+    assert len(results) == 10
@@ -27,13 +27,15 @@ def mock_components():
     mock_security = Mock(spec=SecurityUtils)
     
     # Configure common mock behaviors
-    mock_config.get.return_value = "default_value"
+    mock_config.get.side_effect = lambda key, default=None: default
     mock_file_registry.should_process_file.return_value = True
     mock_file_registry.get_default_extension.return_value = "txt"
     
+    mock_security.is_validated_file.return_value = False
     mock_security.validate_path.return_value = (True, None)
     mock_security.validate_output_path.return_value = (True, None)
     mock_security.check_file_permissions.return_value = (True, None)
+    mock_security.validate_file_content.return_value = (True, None)
     
     return {
         "config": mock_config,
@@ -80,7 +82,7 @@ def test_process_file_success(processor, mock_components, temp_directory):
     # Configure mocks for success scenario
     mock_converter = Mock()
     mock_converter.convert.return_value = ("Extracted content", {"metadata": "value"})
-    mock_components["converter_registry"].find_converter.return_value = mock_converter
+    mock_components["converter_registry"].dispatch.return_value = (mock_converter, None)
     
     mock_components["processor_pipeline"].process.return_value = "Processed content"
     
@@ -93,7 +95,7 @@ def test_process_file_success(processor, mock_components, temp_directory):
     assert result.output_path == output_file
     
     # Verify component interactions
-    mock_components["converter_registry"].find_converter.assert_called_once_with(input_file)
+    mock_components["converter_registry"].dispatch.assert_called_once_with(input_file)
     mock_converter.convert.assert_called_once_with(input_file)
     mock_components["processor_pipeline"].process.assert_called_once()
     mock_components["output_manager"].write.assert_called_once()
@@ -106,7 +108,9 @@ def test_process_file_no_converter(processor, mock_components, temp_directory):
     input_file.write_text("Test content")
     
     # Configure mocks for no converter scenario
-    mock_components["converter_registry"].find_converter.return_value = None
+    mock_components["converter_registry"].dispatch.side_effect = ValueError(
+        "No converter found for file type: .txt"
+    )
     
     # Process the file
     result = processor.process_file(input_file)
@@ -117,7 +121,7 @@ def test_process_file_no_converter(processor, mock_components, temp_directory):
     assert result.input_path == input_file
     
     # Verify component interactions
-    mock_components["converter_registry"].find_converter.assert_called_once_with(input_file)
+    mock_components["converter_registry"].dispatch.assert_called_once_with(input_file)
     mock_components["processor_pipeline"].process.assert_not_called()
     mock_components["output_manager"].write.assert_not_called()
 
@@ -139,11 +143,27 @@ def test_process_file_security_validation(processor, mock_components, temp_direc
     assert "Security validation failed" in result.error
     
     # Verify component interactions
-    mock_components["converter_registry"].find_converter.assert_not_called()
+    mock_components["converter_registry"].dispatch.assert_not_called()
     mock_components["processor_pipeline"].process.assert_not_called()
     mock_components["output_manager"].write.assert_not_called()
 
 
+def test_validate_file_skips_checks_for_prevalidated_files(processor, mock_components, temp_directory):
+    """Test that a file validated in bulk is not checked or stat'ed again"""
+    input_file = temp_directory / "test.txt"
+    input_file.write_text("Test content")
+    security = mock_components["security"]
+    security.is_validated_file.return_value = True
+
+    with patch.object(Path, "exists", side_effect=AssertionError("stat again")), \
+            patch.object(Path, "is_file", side_effect=AssertionError("stat again")):
+        assert processor.validate_file(input_file) == (True, None)
+
+    security.validate_path.assert_not_called()
+    security.check_file_permissions.assert_not_called()
+    security.validate_file_content.assert_called_once_with(input_file)
+
+
 def test_process_file_converter_exception(processor, mock_components, temp_directory):
     """Test file processing when converter raises an exception"""
     # Create a test file
@@ -153,7 +173,7 @@ def test_process_file_converter_exception(processor, mock_components, temp_direc
     # Configure mocks for exception scenario
     mock_converter = Mock()
     mock_converter.convert.side_effect = Exception("Conversion error")
-    mock_components["converter_registry"].find_converter.return_value = mock_converter
+    mock_components["converter_registry"].dispatch.return_value = (mock_converter, None)
     
     # Process the file
     result = processor.process_file(input_file)
@@ -163,7 +183,7 @@ def test_process_file_converter_exception(processor, mock_components, temp_direc
     assert "Conversion error" in result.error
     
     # Verify component interactions
-    mock_components["converter_registry"].find_converter.assert_called_once_with(input_file)
+    mock_components["converter_registry"].dispatch.assert_called_once_with(input_file)
     mock_converter.convert.assert_called_once_with(input_file)
     mock_components["processor_pipeline"].process.assert_not_called()
     mock_components["output_manager"].write.assert_not_called()
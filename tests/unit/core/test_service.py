@@ -0,0 +1,199 @@
+"""
+Tests for the local HTTP service
+"""
+
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+from urllib.parse import urlparse
+
+import pytest
+
+from textcleaner.core.factories import TextProcessorFactory
+from textcleaner.core.service import (
+    MicroBatcher, ServiceBusyError, ServiceRequest, TextCleanerService
+)
+
+
+@pytest.fixture
+def service(test_security_utils, temp_directory):
+    """Create a service with a warm standard processor"""
+    service = TextCleanerService(
+        factory=TextProcessorFactory(security_utils=test_security_utils),
+        max_workers=2,
+        scratch_dir=temp_directory / "scratch",
+    )
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def server_url(service):
+    """Serve the service on a free local port"""
+    server = service.create_server("127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _request(url, data=None, headers=None):
+    request = urllib.request.Request(url, data=data, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_health_lists_warm_profiles(server_url):
+    """Test the health endpoint"""
+    status, body = _request(f"{server_url}/health")
+    assert status == 200
+    assert body["profiles"] == ["standard"]
+
+
+def test_process_local_path(server_url, temp_directory):
+    """Test processing a file referenced by path"""
+    source = temp_directory / "doc.txt"
+    source.write_text("A paragraph of text.\n\nAnother paragraph.\n")
+
+    status, body = _request(
+        f"{server_url}/process",
+        data=json.dumps({"path": str(source), "format": "plain_text"}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert status == 200
+    assert body["success"] is True
+    assert "Another paragraph" in body["text"]
+    assert body["output_format"] == "plain_text"
+    assert "processing_time_seconds" in body["metrics"]
+
+
+def test_process_uploaded_bytes(server_url):
+    """Test processing an uploaded document"""
+    html = b"<html><body><h1>Title</h1><p>Uploaded body text.</p></body></html>"
+    status, body = _request(
+        f"{server_url}/process?filename=page.html",
+        data=html,
+        headers={"Content-Type": "application/octet-stream"},
+    )
+
+    assert status == 200
+    assert "Uploaded body text" in body["text"]
+
+
+def test_bad_requests_are_rejected(server_url, temp_directory):
+    """Test error statuses for invalid input"""
+    status, _ = _request(
+        f"{server_url}/process",
+        data=json.dumps({"profile": "standard"}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    assert status == 400
+
+    status, _ = _request(
+        f"{server_url}/process?profile=nonexistent&filename=a.txt",
+        data=b"text",
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    assert status == 400
+
+    status, body = _request(
+        f"{server_url}/process",
+        data=json.dumps({"path": str(temp_directory / "missing.txt")}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    assert status == 422
+    assert body["success"] is False
+
+
+@pytest.mark.parametrize("body", [b"[1, 2]", b'"text"', b'{"path": 42}', b'{"path": "a.txt", "profile": ["x"]}'])
+def test_malformed_json_requests_are_rejected(server_url, body):
+    """Test that JSON bodies of the wrong shape get a 400"""
+    status, body = _request(f"{server_url}/process", data=body, headers={"Content-Type": "application/json"})
+    assert status == 400
+    assert "error" in body
+
+
+@pytest.mark.parametrize("content_length", ["abc", "-1"])
+def test_invalid_content_length_is_rejected(server_url, content_length):
+    """Test that an unusable Content-Length gets a 400 instead of a dropped or stalled connection"""
+    connection = http.client.HTTPConnection(urlparse(server_url).netloc, timeout=10)
+    try:
+        connection.putrequest("POST", "/process")
+        connection.putheader("Content-Type", "application/octet-stream")
+        connection.putheader("Content-Length", content_length)
+        connection.endheaders()
+        response = connection.getresponse()
+        assert response.status == 400
+        assert "Content-Length" in json.loads(response.read())["error"]
+    finally:
+        connection.close()
+
+
+def test_micro_batcher_groups_requests():
+    """Test that queued requests are dispatched together"""
+    batches = []
+    gate = threading.Event()
+
+    def handler(batch):
+        gate.wait(5)
+        batches.append(len(batch))
+        for request in batch:
+            request.future.set_result(len(batch))
+
+    batcher = MicroBatcher(handler, max_workers=1, max_batch_size=4, batch_window=0.05)
+    try:
+        futures = [batcher.submit(ServiceRequest()) for _ in range(5)]
+        gate.set()
+        results = [f.result(timeout=5) for f in futures]
+    finally:
+        batcher.close()
+
+    assert sum(batches) == 5
+    assert max(batches) > 1
+    assert results.count(max(batches)) >= max(batches)
+
+
+def test_micro_batcher_runs_concurrent_requests_in_parallel():
+    """Test that requests collected together are spread over the workers"""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def handler(batch):
+        for request in batch:
+            # Only returns once all three requests are running at the same time
+            barrier.wait()
+            request.future.set_result(threading.current_thread().name)
+
+    batcher = MicroBatcher(handler, max_workers=3, max_batch_size=8, batch_window=0.05)
+    try:
+        futures = [batcher.submit(ServiceRequest()) for _ in range(3)]
+        threads = [f.result(timeout=10) for f in futures]
+    finally:
+        batcher.close()
+
+    assert len(set(threads)) == 3
+
+
+def test_micro_batcher_rejects_when_full():
+    """Test backpressure when the queue is full"""
+    gate = threading.Event()
+
+    def handler(batch):
+        gate.wait(5)
+        for request in batch:
+            request.future.set_result(None)
+
+    batcher = MicroBatcher(handler, max_workers=1, max_batch_size=1, batch_window=0, max_queue=1)
+    try:
+        with pytest.raises(ServiceBusyError):
+            for _ in range(10):
+                batcher.submit(ServiceRequest())
+    finally:
+        gate.set()
+        batcher.close()
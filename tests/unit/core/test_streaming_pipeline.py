@@ -0,0 +1,81 @@
+"""
+Tests for processing large text files in paragraph-aligned windows
+"""
+
+import json
+
+import pytest
+
+from textcleaner.core.factories import TextProcessorFactory
+
+
+def _paragraphs(count):
+    paragraphs = []
+    for index in range(count):
+        paragraphs.append("ACME Corp Confidential")
+        paragraphs.append(f"Paragraph {index} describes step {index % 7} of the process in some detail.")
+        if index % 10 == 0:
+            paragraphs.append("This disclaimer paragraph is repeated throughout the document.")
+    return "\n\n".join(paragraphs)
+
+
+@pytest.fixture
+def large_text(temp_directory):
+    path = temp_directory / "large.txt"
+    path.write_text(_paragraphs(120), encoding="utf-8")
+    return path
+
+
+def _processor(security_utils, threshold_mb):
+    return TextProcessorFactory(security_utils=security_utils).create_processor(
+        custom_overrides={
+            "processing.streaming.threshold_mb": threshold_mb,
+            "processing.streaming.window_kb": 1,
+        }
+    )
+
+
+def test_streamed_output_matches_whole_file(large_text, temp_directory, test_security_utils):
+    """Test that windowed processing gives the same output as whole-file processing"""
+    streamed_path = temp_directory / "streamed.md"
+    whole_path = temp_directory / "whole.md"
+
+    streamed = _processor(test_security_utils, 0).process_file(large_text, streamed_path, "markdown")
+    whole = _processor(test_security_utils, None).process_file(large_text, whole_path, "markdown")
+
+    assert streamed.success and whole.success
+    assert streamed.metadata.get("streamed") is True
+    assert "streamed" not in whole.metadata
+
+    content = streamed_path.read_text(encoding="utf-8")
+    # Repeated lines and paragraphs are only kept once across windows
+    assert content.count("ACME Corp Confidential") == 1
+    assert content.count("This disclaimer paragraph") == 1
+    assert content == whole_path.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("output_format, suffix", [("json", ".json"), ("plain_text", ".txt")])
+def test_streamed_output_formats_match_whole_file(large_text, temp_directory, test_security_utils,
+                                                  output_format, suffix):
+    """Test that incrementally written formats give the same file as whole-file processing"""
+    streamed_path = temp_directory / f"streamed{suffix}"
+    whole_path = temp_directory / f"whole{suffix}"
+
+    streamed = _processor(test_security_utils, 0).process_file(large_text, streamed_path, output_format)
+    whole = _processor(test_security_utils, None).process_file(large_text, whole_path, output_format)
+
+    assert streamed.success and whole.success
+    assert streamed_path.read_bytes() == whole_path.read_bytes()
+
+
+def test_streamed_json_output(large_text, temp_directory, test_security_utils):
+    """Test that the incrementally written JSON document is valid"""
+    output_path = temp_directory / "streamed.json"
+
+    result = _processor(test_security_utils, 0).process_file(large_text, output_path, "json")
+
+    assert result.success
+    document = json.loads(output_path.read_text(encoding="utf-8"))
+    assert list(document) == ["content"]
+    assert "Paragraph 119 describes" in document["content"]
+    assert result.metrics["processed_text_length"] == len(document["content"])
@@ -0,0 +1,73 @@
+"""
+Tests for the warm worker template
+"""
+
+import gc
+import multiprocessing
+import os
+import sys
+
+import pytest
+
+from textcleaner.config.config_manager import ConfigManager
+from textcleaner.core.factories import TextProcessorFactory
+from textcleaner.core.worker_template import create_worker_context, template_initializer
+from textcleaner.utils.parallel import ParallelProcessor
+
+forkserver_only = pytest.mark.skipif(
+    "forkserver" not in multiprocessing.get_all_start_methods(),
+    reason="forkserver start method not available"
+)
+
+
+def describe_worker(_):
+    """Report what a worker process inherited from the template"""
+    return {
+        "pdf_converter_loaded": "textcleaner.converters.pdf_converter" in sys.modules,
+        "frozen_objects": gc.get_freeze_count(),
+    }
+
+
+def test_disabled_template_uses_default_context():
+    """Test that no context is created when the template is disabled"""
+    config = ConfigManager(initial_config={"processing": {"worker_template": {"enabled": False}}})
+    assert create_worker_context(config) is None
+
+
+@forkserver_only
+def test_context_carries_template_settings():
+    """Test that the settings reach workers through the initializer, not the environment"""
+    config = ConfigManager(initial_config={"processing": {"worker_template": {"pdf_cmaps": ["UniJIS-UCS2-H"]}}})
+    environment = dict(os.environ)
+
+    context = create_worker_context(config)
+    initializer, initargs = template_initializer(context, print, ("ready",))
+
+    assert context.get_start_method() == "forkserver"
+    assert os.environ == environment
+    settings, pool_initializer, pool_initargs = initargs
+    assert settings["pdf_cmaps"] == ["UniJIS-UCS2-H"]
+    assert (pool_initializer, pool_initargs) == (print, ("ready",))
+    assert template_initializer(None, print, ("ready",)) == (print, ("ready",))
+
+
+@forkserver_only
+def test_workers_are_forked_warm():
+    """Test that workers start with the template's modules loaded and frozen"""
+    factory = TextProcessorFactory()
+    processor = factory.create_standard_processor()
+    parallel = factory.create_parallel_processor(max_workers=2, config_manager=processor.config)
+
+    results = parallel.process_items(
+        [0, 1], describe_worker, use_processes=True, show_progress=False
+    )
+
+    assert all(result.success for result in results)
+    for result in results:
+        assert result.result["pdf_converter_loaded"]
+        assert result.result["frozen_objects"] > 0
+
+
+def test_parallel_processor_without_context_uses_default():
+    """Test that a plain ParallelProcessor keeps the platform start method"""
+    assert ParallelProcessor(max_workers=1).mp_context is None
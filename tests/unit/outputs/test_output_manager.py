@@ -4,9 +4,10 @@ import re
 from unittest.mock import patch, mock_open, MagicMock
 import unittest.mock
 import csv
+import json
 
 # Import the classes to be tested
-from textcleaner.outputs.output_manager import PlainTextWriter, CsvWriter, JsonWriter, MarkdownWriter, OutputManager
+from textcleaner.outputs.output_manager import PlainTextWriter, CsvWriter, JsonWriter, JsonlChunkWriter, MarkdownWriter, OutputManager
 from textcleaner.config.config_manager import ConfigManager
 
 # Mock the logger to avoid actual logging during tests
@@ -849,4 +850,36 @@ def test_output_manager_writer_raises_error(mock_mkdir, output_manager, mock_wri
     mock_logger.debug.assert_called_with("Using writer 'PlainTextWriter' for format 'plain_text'")
     # Ensure the writer's error wasn't swallowed (mock_logger in writer is separate)
     mock_writers["plain_text"].write.assert_called_once()
-    mock_mkdir.assert_called_once() 
\ No newline at end of file
+    mock_mkdir.assert_called_once() 
+
+# --- Tests for JsonlChunkWriter ---
+
+def test_jsonl_chunk_writer_records(tmp_path):
+    """Test that the chunk writer writes one record per chunk."""
+    content = "# Intro\n\nFirst section text.\n\n# Usage\n\nSecond section text."
+    output_path = tmp_path / "out.jsonl"
+
+    JsonlChunkWriter(max_tokens=100, exact=False).write(content, output_path, source_path="docs/guide.pdf")
+
+    records = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert [record["heading_path"] for record in records] == [["Intro"], ["Usage"]]
+    assert [record["chunk_index"] for record in records] == [0, 1]
+    assert all(record["source"] == "docs/guide.pdf" for record in records)
+    data = content.encode("utf-8")
+    for record in records:
+        assert data[record["start_byte"]:record["end_byte"]].decode("utf-8") == record["text"]
+        assert record["token_count"] > 0
+
+
+@patch('pathlib.Path.mkdir')
+def test_output_manager_passes_source_path_to_chunk_writer(mock_mkdir, output_manager, mock_writers, tmp_path):
+    """Test that the source path only reaches writers that record it."""
+    mock_writers["jsonl"] = MagicMock(spec=JsonlChunkWriter)
+    mock_writers["markdown"].accepts_source_path = False
+    output_path = tmp_path / "chunks.jsonl"
+
+    output_manager.write("content", output_path, source_path=Path("input.pdf"))
+    mock_writers["jsonl"].write.assert_called_once_with("content", output_path, None, source_path=Path("input.pdf"))
+
+    output_manager.write("content", tmp_path / "out.md", source_path=Path("input.pdf"))
+    mock_writers["markdown"].write.assert_called_once_with("content", tmp_path / "out.md", None)
@@ -1,8 +1,11 @@
+import os
+import tempfile
 import unittest
 import pytest
 from unittest.mock import patch, MagicMock, call
 
 from textcleaner.processors.content_cleaner import ContentCleaner
+from textcleaner.utils.line_table import LineTable
 # Add other necessary imports here
 
 # Define the path to the utility functions to mock
@@ -87,17 +90,35 @@ class TestContentCleaner(unittest.TestCase):
 
         # Assert calls in the NEW correct order with intermediate results
         # (Footnotes would be called here if enabled)
-        mock_rm_hf.assert_called_once_with(input_content)
+        # The line stages share one line table built from the input
+        mock_rm_hf.assert_called_once()
+        table = mock_rm_hf.call_args[0][0]
+        self.assertIsInstance(table, LineTable)
+        self.assertEqual(table.text(), input_content)
         mock_clean_ws.assert_called_once_with("Header Removed") # After header removal
         mock_join_pl.assert_called_once_with("Whitespace Cleaned") # After whitespace
         mock_rm_dup.assert_called_once_with("Lines Joined") # After joining lines
         mock_rm_bp.assert_called_once_with("Duplicates Removed") # After duplicate removal
-        mock_merge_sp.assert_called_once_with("Boilerplate Removed") # After boilerplate
+        mock_merge_sp.assert_called_once() # After boilerplate, on a line table
+        table = mock_merge_sp.call_args[0][0]
+        self.assertIsInstance(table, LineTable)
+        self.assertEqual(table.text(), "Boilerplate Removed")
         mock_norm_uni.assert_called_once_with("Short Paras Merged") # After merging
         
         # Final result should be the output of the last step, stripped
         self.assertEqual(result, "Final Content No Strip") # .strip() is applied
         
+    def test_process_applies_custom_rules(self):
+        """Test that rules from a custom rule file are applied."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rule_file = os.path.join(tmp_dir, "rules.yaml")
+            with open(rule_file, "w", encoding="utf-8") as f:
+                f.write("rules:\n  - pattern: '(?i)internal memo'\n    replacement: 'memo'\n")
+            processor = ContentCleaner(False, False, False, False, False, False, False, False, False, False, False,
+                                       custom_rules_file=rule_file)
+
+        self.assertEqual(processor.process("INTERNAL MEMO for staff"), "memo for staff")
+
     # Patch only the necessary utils for this specific test
     @patch(f'{UTILS_PATH}.clean_whitespace')
     @patch(f'{UTILS_PATH}.normalize_unicode')
@@ -195,7 +216,8 @@ class TestContentCleaner(unittest.TestCase):
         processor_true.process(input_content)
 
         # Assert remove_footnotes was called after remove_headers_footers
-        mock_rm_hf.assert_called_once_with(input_content)
+        mock_rm_hf.assert_called_once()
+        self.assertEqual(mock_rm_hf.call_args[0][0].text(), input_content)
         mock_rm_fn.assert_called_once_with("Actual Content\n1. Footnote https://example.com")
 
         # Reset mocks for the next case
@@ -226,8 +248,6 @@ class TestContentCleaner(unittest.TestCase):
         # Assert remove_footnotes was NOT called
         mock_rm_hf.assert_called_once_with(input_content)
         mock_rm_fn.assert_not_called()
-        
-    # Patch only the necessary utils for this specific test
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from textcleaner.processors.content_optimizer import ContentOptimizer
+from textcleaner.utils.line_table import LineTable
 
 # Define paths for mocking
 OPTIMIZER_MODULE_PATH = 'textcleaner.processors.content_optimizer'
@@ -177,7 +178,11 @@ class TestContentOptimizerProcess(unittest.TestCase):
             self.mock_remove_punctuation.assert_called_once_with("PatternsCondensed")
             self.mock_simplify_citations.assert_called_once_with("PunctuationRemoved")
             self.mock_simplify_urls.assert_called_once_with("CitationsSimplified")
-            self.mock_optimize_lines.assert_called_once_with("UrlsSimplified", 80)
+            self.mock_optimize_lines.assert_called_once()
+            table, max_line_length = self.mock_optimize_lines.call_args[0]
+            self.assertIsInstance(table, LineTable) # Lines are wrapped on a line table
+            self.assertEqual(table.text(), "UrlsSimplified")
+            self.assertEqual(max_line_length, 80)
             
             self.assertEqual(result, "LinesOptimized")
 
@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from textcleaner.config.config_manager import ConfigManager
+from textcleaner.processors.processor_pipeline import ProcessorPipeline
+from textcleaner.utils.line_table import LineTable
+
+DOCUMENTS = (
+    "Introduction\n\nFirst line of a paragraph\ncontinues here.\n\n- item one\n- item two\n\nShort\n\nAlso short\n",
+    "Page 1\nTitle\n\nvery very repeated words   and  spaces\r\nwith CRLF endings\r\n\r\n\r\nEnd!!!!\n",
+    "  \n\nA heading line\n\nBody text (Smith et al., 2020) continues\x0cafter a form feed\n\n\n",
+)
+
+
+@pytest.mark.unit
+class TestProcessorPipeline(unittest.TestCase):
+    """Test suite for the ProcessorPipeline."""
+
+    def test_process_matches_processors_run_on_text(self):
+        """Test that handing tables between processors does not change the result."""
+        config = ConfigManager()
+        config.config["optimization"]["max_line_length"] = 30
+        pipeline = ProcessorPipeline(config)
+        for document in DOCUMENTS:
+            expected = document
+            for processor in pipeline.processors:
+                expected = processor.process(expected)
+            self.assertEqual(pipeline.process(document), expected)
+
+    def test_line_table_is_shared_across_processors(self):
+        """Test that the content cleaner's line stages reuse the structure processor's table."""
+        config = ConfigManager()
+        config.config["processing"]["enable_optimizer"] = False
+        config.config.setdefault("cleaning", {}).update({
+            "remove_duplicate_content": False,
+            "remove_boilerplate": False,
+            "merge_short_paragraphs": False,
+            "normalize_unicode": False,
+        })
+        pipeline = ProcessorPipeline(config)
+        document = DOCUMENTS[0]
+        expected = document
+        for processor in pipeline.processors:
+            expected = processor.process(expected)
+
+        with patch.object(LineTable, "from_text", wraps=LineTable.from_text) as from_text:
+            result = pipeline.process(document)
+
+        from_text.assert_called_once_with(document, newline_only=True)
+        self.assertEqual(result, expected)
@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from textcleaner.processors.structure_processor import StructureProcessor
+from textcleaner.utils.line_table import LineTable
 # Add other necessary imports here
 
 # Define the path to the utility functions to mock
@@ -44,7 +45,10 @@ class TestStructureProcessor(unittest.TestCase):
         result = processor.process(input_content)
         
         mock_standardize_lists.assert_not_called() # preserve_lists is True
-        mock_format_headings.assert_called_once_with(input_content)
+        mock_format_headings.assert_called_once()
+        table = mock_format_headings.call_args[0][0]
+        self.assertIsInstance(table, LineTable) # Headings are formatted on a line table
+        self.assertEqual(table.text(), input_content)
         self.assertEqual(result, "Formatted Heading Content")
 
     @patch(f'{UTILS_PATH}.standardize_lists')
@@ -77,7 +81,8 @@ class TestStructureProcessor(unittest.TestCase):
         # Check calls in order
         mock_standardize_lists.assert_called_once_with(input_content)
         # format_headings should be called with the output of standardize_lists
-        mock_format_headings.assert_called_once_with("List Standardized") 
+        mock_format_headings.assert_called_once()
+        self.assertEqual(mock_format_headings.call_args[0][0].text(), "List Standardized")
         
         self.assertEqual(result, "Headings Formatted") # Final result is from format_headings
 
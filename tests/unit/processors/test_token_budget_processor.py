@@ -0,0 +1,63 @@
+import unittest
+import pytest
+from unittest.mock import patch
+
+from textcleaner.config.config_manager import ConfigManager
+from textcleaner.processors.processor_pipeline import ProcessorPipeline
+from textcleaner.processors.token_budget_processor import TokenBudgetProcessor
+
+PROCESSOR_PATH = 'textcleaner.processors.token_budget_processor'
+
+@pytest.mark.unit
+class TestTokenBudgetProcessor(unittest.TestCase):
+    """Test suite for the TokenBudgetProcessor."""
+
+    def test_process_records_report_in_metadata(self):
+        """Test that cut content is reported in the metadata."""
+        processor = TokenBudgetProcessor(token_limit=5, exact=False)
+        metadata = {}
+        result = processor.process("One two three. Four five six. Seven eight.", metadata)
+        self.assertEqual(result, "One two three.")
+        self.assertTrue(metadata["token_budget"]["truncated"])
+        self.assertEqual(metadata["token_budget"]["cut_at"], "sentence")
+        self.assertEqual(metadata["token_budget"]["kept_tokens"], 4)
+
+    def test_process_leaves_short_content(self):
+        """Test that content within the limit is unchanged."""
+        processor = TokenBudgetProcessor(token_limit=100, exact=False)
+        metadata = {}
+        self.assertEqual(processor.process("Short text.", metadata), "Short text.")
+        self.assertFalse(metadata["token_budget"]["truncated"])
+
+    @patch(f'{PROCESSOR_PATH}.get_tokenizer', return_value=None)
+    def test_process_uses_configured_encoding(self, mock_get_tokenizer):
+        """Test that the tokenizer of the configured encoding is used."""
+        processor = TokenBudgetProcessor(token_limit=100, encoding_name="p50k_base")
+        processor.process("Some text.")
+        mock_get_tokenizer.assert_called_once_with("p50k_base")
+
+    def test_streamed_windows_share_the_budget(self):
+        """Test that windows are kept until the budget is spent, then dropped."""
+        processor = TokenBudgetProcessor(token_limit=6, exact=False)
+        metadata = {}
+        state = processor.start_stream(metadata)
+        windows = ["One two three.\n\n", "Four five six.\n\n", "# Later\n\nSeven eight."]
+        results = [processor.process_window(window, state, metadata) for window in windows]
+        self.assertEqual(results, ["One two three.\n\n", "Four five", ""])
+        report = metadata["token_budget"]
+        self.assertTrue(report["truncated"])
+        self.assertEqual(report["kept_tokens"], 6)
+        self.assertEqual(report["original_tokens"], 12)
+        self.assertEqual(report["dropped_headings"], ["Later"])
+
+    def test_pipeline_adds_processor_only_when_enforced(self):
+        """Test that the pipeline enforces token_limit only when asked to."""
+        config = ConfigManager()
+        config.config["token_limit"] = 4096
+        pipeline = ProcessorPipeline(config)
+        self.assertFalse(any(isinstance(p, TokenBudgetProcessor) for p in pipeline.processors))
+
+        config.config["token_budget"] = {"enforce": True}
+        pipeline = ProcessorPipeline(config)
+        self.assertIsInstance(pipeline.processors[-1], TokenBudgetProcessor)
+        self.assertEqual(pipeline.processors[-1].token_limit, 4096)
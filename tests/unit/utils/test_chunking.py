@@ -0,0 +1,94 @@
+"""
+Tests for heading-aware, token-bounded chunking
+"""
+
+import re
+
+import pytest
+
+from textcleaner.utils.chunking import iter_chunks
+
+
+class WordTokenizer:
+    """A fake tiktoken encoding with one token per word and its leading space."""
+
+    pattern = re.compile(r'\s*\S+|\s+')
+
+    def encode_ordinary(self, text):
+        return self.pattern.findall(text)
+
+    def decode_tokens_bytes(self, tokens):
+        return [token.encode("utf-8") for token in tokens]
+
+
+DOCUMENT = (
+    "Preamble before any heading.\n\n"
+    "# Guide\n\n"
+    "## Setup\n\n"
+    "Install the package. Then configure it.\n\n"
+    "## Usage\n\n"
+    "Run the command on a file.\n\n"
+    "# Notes\n\n"
+    "Café prices vary."
+)
+
+
+def test_chunks_follow_headings():
+    """Test that every section becomes a chunk with its heading path"""
+    chunks = list(iter_chunks(DOCUMENT, max_tokens=100, tokenizer=WordTokenizer()))
+
+    assert [chunk.heading_path for chunk in chunks] == [
+        [], ["Guide", "Setup"], ["Guide", "Usage"], ["Notes"]
+    ]
+    assert [chunk.index for chunk in chunks] == [0, 1, 2, 3]
+    # A heading directly followed by a subheading stays with the subsection
+    assert chunks[1].text.startswith("# Guide\n\n## Setup")
+    assert chunks[3].text == "# Notes\n\nCafé prices vary."
+
+
+def test_byte_offsets_and_token_counts():
+    """Test that offsets address the chunk in the UTF-8 text and counts match"""
+    data = DOCUMENT.encode("utf-8")
+    tokenizer = WordTokenizer()
+    for chunk in iter_chunks(DOCUMENT, max_tokens=100, tokenizer=tokenizer):
+        assert data[chunk.start_byte:chunk.end_byte].decode("utf-8") == chunk.text
+        assert chunk.token_count == len(tokenizer.encode_ordinary(chunk.text))
+
+
+def test_long_sections_are_split_within_the_bound():
+    """Test that long sections split at sentence boundaries and respect the bound"""
+    text = "# Long\n\n" + " ".join(f"Sentence number {index} ends here." for index in range(40))
+    chunks = list(iter_chunks(text, max_tokens=20, tokenizer=WordTokenizer()))
+
+    assert len(chunks) > 1
+    assert all(chunk.token_count <= 20 for chunk in chunks)
+    assert all(chunk.heading_path == ["Long"] for chunk in chunks)
+    assert all(chunk.text.endswith(".") for chunk in chunks)
+    assert sum(chunk.text.count("ends here.") for chunk in chunks) == 40
+
+
+def test_overlap_repeats_tokens():
+    """Test that consecutive chunks of a section share the overlap"""
+    text = " ".join(f"w{index}" for index in range(30))
+    chunks = list(iter_chunks(text, max_tokens=10, overlap_tokens=3, tokenizer=WordTokenizer(), by_heading=False))
+
+    assert all(chunk.token_count <= 10 for chunk in chunks)
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous.text.split()[-3:] == current.text.split()[:3]
+    assert chunks[-1].text.endswith("w29")
+
+
+def test_estimated_tokens_without_tokenizer():
+    """Test chunking over estimated tokens"""
+    chunks = list(iter_chunks(DOCUMENT, max_tokens=100))
+
+    assert len(chunks) == 4
+    assert chunks[3].token_count == 5  # Notes, Café, prices, vary, .
+
+
+def test_invalid_bounds():
+    """Test that impossible bounds are rejected"""
+    with pytest.raises(ValueError):
+        list(iter_chunks(DOCUMENT, max_tokens=0))
+    with pytest.raises(ValueError):
+        list(iter_chunks(DOCUMENT, max_tokens=10, overlap_tokens=10))
@@ -0,0 +1,174 @@
+"""
+Tests for processing events and progress reporting
+"""
+
+import io
+import json
+
+import pytest
+
+from textcleaner.core.directory_processor import DirectoryProcessor
+from textcleaner.core.factories import TextProcessorFactory
+from textcleaner.utils.events import (
+    EventBus, FILE_FINISHED, FILE_STARTED, JsonLinesEventWriter, ProgressAggregator,
+    ProgressRenderer, STAGE_TIMING, event_bus
+)
+from textcleaner.utils.parallel import ParallelProcessor
+
+
+@pytest.fixture
+def collected_events():
+    """Collect every event published on the global bus"""
+    events = []
+    event_bus.subscribe(events.append)
+    yield events
+    event_bus.unsubscribe(events.append)
+
+
+@pytest.fixture
+def dir_processor(test_security_utils):
+    """Create a DirectoryProcessor with relaxed security for temp dirs"""
+    single_file_processor = TextProcessorFactory(security_utils=test_security_utils).create_standard_processor()
+    return DirectoryProcessor(
+        config=single_file_processor.config,
+        security_utils=test_security_utils,
+        parallel_processor=ParallelProcessor(max_workers=2),
+        single_file_processor=single_file_processor
+    )
+
+
+@pytest.fixture
+def source_tree(temp_directory):
+    """Create an input directory with a few text files"""
+    input_dir = temp_directory / "input"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"doc{i}.txt").write_text(f"Document {i}.\n\nMore text for document {i}.\n")
+    return input_dir, temp_directory / "output"
+
+
+def test_emit_without_subscribers_is_noop():
+    """Test that an idle bus reports itself inactive"""
+    bus = EventBus()
+    assert not bus.active
+    bus.emit(FILE_STARTED, "a.txt")  # Must not fail
+
+    received = []
+    bus.subscribe(received.append)
+    assert bus.active
+    bus.emit(FILE_STARTED, "a.txt", size=3)
+    bus.unsubscribe(received.append)
+    bus.emit(FILE_STARTED, "b.txt")
+
+    assert [(e.kind, e.path, e.data) for e in received] == [(FILE_STARTED, "a.txt", {"size": 3})]
+
+
+def test_aggregator_counts_events():
+    """Test that drained events update throughput counters"""
+    bus = EventBus()
+    aggregator = ProgressAggregator(total_files=3)
+    bus.subscribe(aggregator)
+
+    bus.emit(FILE_STARTED, "a.txt")
+    bus.emit(FILE_STARTED, "b.txt")
+    bus.emit(FILE_FINISHED, "a.txt", success=True, input_bytes=2048, tokens=100)
+    bus.emit(FILE_FINISHED, "b.txt", success=False, input_bytes=1024, tokens=0)
+    bus.emit(FILE_STARTED, "c.txt")
+    aggregator.drain()
+
+    stats = aggregator.snapshot()
+    assert stats["finished"] == 2 and stats["failed"] == 1
+    assert aggregator.bytes_processed == 3072
+    assert aggregator.tokens_processed == 100
+    assert [path for path, _ in aggregator.slowest_in_flight()] == ["c.txt"]
+
+
+def test_renderer_writes_final_status():
+    """Test that stopping the renderer prints the final counts"""
+    stream = io.StringIO()
+    bus = EventBus()
+    renderer = ProgressRenderer(total_files=1, stream=stream, interval=10, bus=bus)
+
+    with renderer:
+        bus.emit(FILE_STARTED, "a.txt")
+        bus.emit(FILE_FINISHED, "a.txt", success=True, input_bytes=10, tokens=5)
+
+    assert not bus.active
+    assert "1/1 files" in stream.getvalue()
+
+
+def test_processor_publishes_file_events(test_security_utils, temp_directory, collected_events):
+    """Test that processing a file publishes start, stage and finish events"""
+    processor = TextProcessorFactory(security_utils=test_security_utils).create_standard_processor()
+    source = temp_directory / "doc.txt"
+    source.write_text("Some text to process.\n")
+
+    result = processor.process_file(source, temp_directory / "doc.md")
+
+    assert result.success
+    kinds = [e.kind for e in collected_events]
+    assert kinds == [FILE_STARTED, STAGE_TIMING, FILE_FINISHED]
+    finished = collected_events[-1]
+    assert finished.data["success"] is True
+    assert finished.data["input_bytes"] == source.stat().st_size
+    assert set(collected_events[1].data) == {"convert", "pipeline", "write", "metrics"}
+
+
+def test_process_executor_relays_worker_events(dir_processor, source_tree, collected_events):
+    """Test that events from worker processes reach the parent bus"""
+    input_dir, output_dir = source_tree
+
+    results = dir_processor.process_directory_parallel(
+        input_dir, output_dir, quiet_mode=True, executor="process"
+    )
+
+    assert all(r.success for r in results)
+    finished = sorted(e.path for e in collected_events if e.kind == FILE_FINISHED)
+    assert finished == sorted(str(r.input_path) for r in results)
+
+
+def test_template_pool_relays_worker_events(test_security_utils, source_tree, collected_events):
+    """Test that events are relayed from pools started in the worker template's context"""
+    input_dir, output_dir = source_tree
+    factory = TextProcessorFactory(security_utils=test_security_utils)
+    single_file_processor = factory.create_standard_processor()
+    dir_processor = DirectoryProcessor(
+        config=single_file_processor.config,
+        security_utils=test_security_utils,
+        parallel_processor=factory.create_parallel_processor(
+            max_workers=2, config_manager=single_file_processor.config
+        ),
+        single_file_processor=single_file_processor
+    )
+
+    results = dir_processor.process_directory_parallel(
+        input_dir, output_dir, quiet_mode=True, executor="process"
+    )
+
+    assert len(results) == 3
+    assert all(r.success for r in results)
+    finished = sorted(e.path for e in collected_events if e.kind == FILE_FINISHED)
+    assert finished == sorted(str(r.input_path) for r in results)
+
+
+def test_jsonl_progress_format(dir_processor, source_tree, capsys):
+    """Test that the JSON-lines format streams one object per event"""
+    input_dir, output_dir = source_tree
+
+    dir_processor.process_directory(input_dir, output_dir, quiet_mode=True, progress_format="jsonl")
+
+    lines = [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+    assert sum(1 for e in lines if e["kind"] == FILE_FINISHED) == 3
+    assert not event_bus.active
+
+
+def test_jsonl_writer_serializes_events():
+    """Test the JSON-lines writer directly"""
+    stream = io.StringIO()
+    bus = EventBus()
+    with JsonLinesEventWriter(stream, bus=bus):
+        bus.emit(FILE_FINISHED, "a.txt", success=True)
+
+    event = json.loads(stream.getvalue())
+    assert event["kind"] == FILE_FINISHED
+    assert event["data"] == {"success": True}
@@ -0,0 +1,83 @@
+"""
+Tests for content sniffing from file signatures
+"""
+
+import zipfile
+
+from textcleaner.utils.file_sniffer import (
+    KIND_BINARY, KIND_EMPTY, KIND_EXECUTABLE, KIND_OFFICE_OPEN_XML, KIND_OLE,
+    KIND_PDF, KIND_TEXT, KIND_ZIP, sniff_bytes, sniff_file
+)
+
+
+def test_pdf_signature():
+    """Test that PDFs are recognised, including leading whitespace"""
+    result = sniff_bytes(b"\n%PDF-1.7\n...")
+    assert result.kind == KIND_PDF
+    assert result.matches(".pdf")
+    assert not result.matches(".txt")
+
+
+def test_text_matches_text_extensions():
+    """Test that text content is compatible with any text extension"""
+    result = sniff_bytes(b"# Heading\n\nSome text")
+    assert result.kind == KIND_TEXT
+    assert result.matches(".md") and result.matches(".TXT") and result.matches(".csv")
+    assert not result.matches(".pdf")
+    assert sniff_bytes(b"<!DOCTYPE html><html></html>").extension == ".html"
+
+
+def test_utf16_text_is_not_binary():
+    """Test that text with a byte order mark is treated as text"""
+    assert sniff_bytes("hello".encode("utf-16")).kind == KIND_TEXT
+
+
+def test_executables_match_nothing():
+    """Test that executables are detected and compatible with no extension"""
+    for header in (b"\x7fELF\x02\x01\x01", b"\xcf\xfa\xed\xfe\x07\x00"):
+        result = sniff_bytes(header)
+        assert result.kind == KIND_EXECUTABLE
+        assert not result.matches(".txt")
+
+    pe_header = bytearray(b"MZ" + b"\x00" * 126)
+    pe_header[60:64] = (64).to_bytes(4, "little")
+    pe_header[64:68] = b"PE\x00\x00"
+    assert sniff_bytes(bytes(pe_header)).kind == KIND_EXECUTABLE
+    # "MZ" alone is just text
+    assert sniff_bytes(b"MZ is a plain text line").kind == KIND_TEXT
+
+
+def test_binary_and_empty_content():
+    """Test classification of unknown binary and empty content"""
+    assert sniff_bytes(b"\x89PNG\r\n\x1a\n\x00\x00").kind == KIND_BINARY
+    assert sniff_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1").kind == KIND_OLE
+    empty = sniff_bytes(b"")
+    assert empty.kind == KIND_EMPTY
+    assert empty.matches(".pdf")
+
+
+def test_zip_containers(tmp_path):
+    """Test that OOXML documents are told apart from plain archives"""
+    docx = tmp_path / "report.zip"
+    with zipfile.ZipFile(docx, "w") as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", "<document/>")
+    archive_file = tmp_path / "data.zip"
+    with zipfile.ZipFile(archive_file, "w") as archive:
+        archive.writestr("notes.txt", "hello")
+
+    docx_result = sniff_file(docx)
+    assert docx_result.kind == KIND_OFFICE_OPEN_XML
+    assert docx_result.extension == ".docx"
+    assert not docx_result.matches(".zip")
+    assert sniff_file(archive_file).kind == KIND_ZIP
+
+
+def test_sniff_file_sees_modifications(tmp_path):
+    """Test that cached results are invalidated when the file changes"""
+    path = tmp_path / "file.txt"
+    path.write_text("plain text")
+    assert sniff_file(path).kind == KIND_TEXT
+
+    path.write_bytes(b"%PDF-1.4 and more bytes")
+    assert sniff_file(path).kind == KIND_PDF
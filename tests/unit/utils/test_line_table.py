@@ -0,0 +1,111 @@
+"""
+Tests for the array-backed line table
+"""
+
+from textcleaner.utils import content_cleaning
+from textcleaner.utils.line_table import BLANK, HEADING, LIST_ITEM, LineTable, as_table, as_text
+
+SAMPLE = (
+    "Page 1\n# Title\nFirst line of a paragraph\ncontinues here.\n\n"
+    "- item one\n- item two\n\nAnother   paragraph   with  spaces\nPage 2\n"
+)
+LINE_STAGES = (
+    content_cleaning.remove_headers_footers,
+    content_cleaning.remove_footnotes,
+    content_cleaning.clean_whitespace,
+    content_cleaning.join_paragraph_lines,
+)
+
+
+def test_offsets_follow_splitlines():
+    """Test that lines and offsets match str.splitlines"""
+    text = "one\r\ntwo\n\nthree"
+    table = LineTable.from_text(text)
+    assert len(table) == 4
+    assert table.lines(range(len(table))) == text.splitlines()
+    assert table.text() == "one\ntwo\n\nthree"
+
+
+def test_newline_only_keeps_trailing_empty_line():
+    """Test that newline_only splits like str.split('\\n')"""
+    text = "one\ntwo\n"
+    table = LineTable.from_text(text, newline_only=True)
+    assert table.lines(range(len(table))) == text.split("\n")
+    assert table.text() == text
+
+
+def test_flags_classify_lines():
+    """Test that blank, heading and list lines are flagged"""
+    table = LineTable.from_text("# Title\n\n- item\n1. first\nplain")
+    assert table.flags[0] & HEADING
+    assert table.flags[1] & BLANK
+    assert table.flags[2] & LIST_ITEM and table.flags[3] & LIST_ITEM
+    assert table.flags[4] == 0
+    assert table.hashes[0] == hash("# Title")
+
+
+def test_drop_and_rewrite():
+    """Test that dropped lines disappear and rewrites are materialized"""
+    table = LineTable.from_text("a\nb\nc")
+    table.drop(1)
+    table.rewrite(2, "# C")
+    assert table.indices() == [0, 2]
+    assert table.text() == "a\n# C"
+    assert table.flags[2] & HEADING
+
+
+def test_checkpoint_restore():
+    """Test that restoring a checkpoint undoes drops and rewrites"""
+    table = LineTable.from_text("a\nb\nc")
+    state = table.checkpoint()
+    table.drop(0)
+    table.rewrite(1, "changed")
+    table.restore(state)
+    assert table.text() == "a\nb\nc"
+
+
+def test_chained_stages_match_string_results():
+    """Test that stages chained on one table give the same text as on strings"""
+    expected = SAMPLE
+    for stage in LINE_STAGES:
+        expected = stage(expected)
+
+    content = LineTable.from_text(SAMPLE)
+    for stage in LINE_STAGES:
+        content = stage(content)
+        assert isinstance(content, LineTable)
+
+    assert as_text(content) == expected
+
+
+def test_resplit_switches_in_place():
+    """Test that switching to splitlines only drops the trailing empty line"""
+    text = "# Title\n\nbody\n"
+    table = LineTable.from_text(text, newline_only=True)
+    table.rewrite(0, "## Title")
+    assert as_table(table) is table
+    assert not table.newline_only
+    assert table.lines(table.indices()) == "## Title\n\nbody\n".splitlines()
+    assert as_table(table, newline_only=True) is table
+    assert table.text() == "## Title\n\nbody"
+
+
+def test_resplit_rebuilds_on_other_line_breaks():
+    """Test that a table is split again when other line breaks make a difference"""
+    table = LineTable.from_text("one\r\ntwo\x0cthree", newline_only=True)
+    resplit = as_table(table)
+    assert resplit is not table
+    assert resplit.lines(resplit.indices()) == table.text().splitlines()
+
+    table = LineTable.from_text("a\nb")
+    table.rewrite(0, "wrapped\nline")
+    resplit = as_table(table, newline_only=True)
+    assert resplit.lines(resplit.indices()) == ["wrapped", "line", "b"]
+
+
+def test_strip_matches_str_strip():
+    """Test that strip removes surrounding blank lines and whitespace"""
+    text = " \n\n  first \nmiddle\n last  \n\t\n"
+    table = LineTable.from_text(text).strip()
+    assert table.text() == LineTable.from_text(text).text().strip()
+    assert LineTable.from_text(" \n \n").strip().text() == ""
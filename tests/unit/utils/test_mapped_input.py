@@ -0,0 +1,53 @@
+"""
+Tests for memory-mapped reading of text-like input files
+"""
+
+import csv
+
+from textcleaner.utils.mapped_input import (
+    bom_length, decode_buffer, frontmatter_span, iter_decoded, iter_lines, map_file
+)
+
+
+def test_map_file_and_decode(tmp_path):
+    """Test decoding a mapped file after its byte-order mark"""
+    path = tmp_path / "bom.txt"
+    path.write_bytes(b"\xef\xbb\xbfna\xc3\xafve text")
+
+    with map_file(path) as buffer:
+        start = bom_length(buffer)
+        assert start == 3
+        assert decode_buffer(buffer, start) == "naïve text"
+
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    with map_file(empty) as buffer:
+        assert decode_buffer(buffer, bom_length(buffer)) == ""
+
+
+def test_iter_decoded_joins_split_characters():
+    """Test that characters split between slices are decoded whole"""
+    data = "é€😀 mixed".encode("utf-8")
+    pieces = list(iter_decoded(data, chunk_size=3))
+
+    assert len(pieces) > 1
+    assert "".join(pieces) == "é€😀 mixed"
+
+
+def test_iter_lines_feeds_csv_reader():
+    """Test that lines keep their breaks, so quoted line breaks survive"""
+    data = b'a,b\r\n"multi\nline",c\rlast,row'
+
+    assert list(iter_lines(data)) == ['a,b\r\n', '"multi\n', 'line",c\r', 'last,row']
+    assert list(csv.reader(iter_lines(data))) == [["a", "b"], ["multi\nline", "c"], ["last", "row"]]
+
+
+def test_frontmatter_span():
+    """Test locating frontmatter between --- lines"""
+    data = b"---\ntitle: Test\ntags: [a]\n---\n# Body\n"
+    start, end, body = frontmatter_span(data)
+
+    assert data[start:end] == b"title: Test\ntags: [a]"
+    assert data[body:] == b"# Body\n"
+    assert frontmatter_span(b"# No frontmatter\n---\n") is None
+    assert frontmatter_span(b"---\nnever closed\n") is None
@@ -8,6 +8,9 @@ from textcleaner.utils.metrics import (
     count_tokens,
     calculate_metrics,
     generate_metrics_report,
+    get_token_counts,
+    get_token_service,
+    TokenizationService,
     _tiktoken_available, # Import for patching tests
     _tokenizer_cache # Import the cache for testing
 )
@@ -20,6 +23,13 @@ def mock_metrics_logger():
     with patch('textcleaner.utils.metrics.logger') as mock_log:
         yield mock_log
 
+@pytest.fixture(autouse=True)
+def fresh_token_services():
+    """Fixture to discard cached token counts between tests."""
+    get_token_service.cache_clear()
+    yield
+    get_token_service.cache_clear()
+
 # Mock ConfigManager for tests needing configuration
 @pytest.fixture
 def mock_config():
@@ -150,7 +160,7 @@ def test_count_tokens_uses_tiktoken_when_available(mock_get_tokenizer, mock_conf
 
     token_count = count_tokens(text, mock_config)
 
-    mock_config.get.assert_called_once_with("metrics.tokenizer_encoding", "cl100k_base")
+    mock_config.get.assert_any_call("metrics.tokenizer_encoding", "cl100k_base")
     mock_get_tokenizer.assert_called_once_with("cl100k_base")
     mock_tokenizer.encode.assert_called_once_with(text)
     assert token_count == 4
@@ -164,7 +174,7 @@ def test_count_tokens_uses_fallback_when_tokenizer_none(mock_fallback, mock_get_
 
     token_count = count_tokens(text, mock_config)
 
-    mock_config.get.assert_called_once_with("metrics.tokenizer_encoding", "cl100k_base")
+    mock_config.get.assert_any_call("metrics.tokenizer_encoding", "cl100k_base")
     mock_get_tokenizer.assert_called_once_with("cl100k_base")
     mock_fallback.assert_called_once_with(text)
     assert token_count == 5
@@ -182,7 +192,7 @@ def test_count_tokens_uses_fallback_on_encode_error(mock_fallback, mock_get_toke
 
     token_count = count_tokens(text, mock_config)
 
-    mock_config.get.assert_called_once_with("metrics.tokenizer_encoding", "cl100k_base")
+    mock_config.get.assert_any_call("metrics.tokenizer_encoding", "cl100k_base")
     mock_get_tokenizer.assert_called_once_with("cl100k_base")
     mock_tokenizer.encode.assert_called_once_with(text)
     mock_metrics_logger.warning.assert_called_once_with(
@@ -212,22 +222,102 @@ def test_count_tokens_uses_config_encoding(mock_get_tokenizer, mock_config):
 
     count_tokens(text, mock_config)
 
-    mock_config.get.assert_called_once_with("metrics.tokenizer_encoding", "cl100k_base")
+    mock_config.get.assert_any_call("metrics.tokenizer_encoding", "cl100k_base")
     mock_get_tokenizer.assert_called_once_with(custom_encoding)
     mock_tokenizer.encode.assert_called_once_with(text)
 
-# --- Placeholder for calculate_metrics Tests ---
-# TODO: Add tests
+def test_count_tokens_respects_exact_token_counts(mock_config):
+    """Test count_tokens only estimates when exact counting is disabled in the config."""
+    mock_config.get.side_effect = lambda key, default=None: False if key == "metrics.exact_token_counts" else default
+
+    with patch('textcleaner.utils.metrics.get_tokenizer') as mock_get_tokenizer:
+        token_count = count_tokens("Hello world", mock_config)
+
+    mock_get_tokenizer.assert_not_called()
+    assert token_count == 2
+
+# --- Tests for TokenizationService ---
+
+def _word_tokenizer():
+    """A fake tiktoken encoding that yields one token per word."""
+    tokenizer = MagicMock()
+    tokenizer.encode.side_effect = lambda text: text.split()
+    tokenizer.encode_batch.side_effect = lambda texts, num_threads: [text.split() for text in texts]
+    return tokenizer
+
+def test_token_service_caches_counts_by_content():
+    """Test that counted text is not encoded again."""
+    tokenizer = _word_tokenizer()
+    service = TokenizationService("cl100k_base")
+    with patch('textcleaner.utils.metrics.get_tokenizer', return_value=tokenizer):
+        assert service.count("one two three") == 3
+        assert service.count("one two " + "three") == 3
+        assert service.count_many(["one two three", "four"]) == [3, 1]
+
+    assert tokenizer.encode.call_count == 2
+    tokenizer.encode_batch.assert_not_called() # Only one uncached text per call
+
+def test_token_service_encodes_batches_concurrently():
+    """Test that uncached texts are encoded in one threaded batch."""
+    tokenizer = _word_tokenizer()
+    service = TokenizationService("cl100k_base", num_threads=4)
+    texts = ["a b c", "", "d e", "a b c"]
+    with patch('textcleaner.utils.metrics.get_tokenizer', return_value=tokenizer):
+        assert service.count_many(texts) == [3, 0, 2, 3]
+
+    tokenizer.encode_batch.assert_called_once_with(["a b c", "d e"], num_threads=2)
+    tokenizer.encode.assert_not_called()
+
+def test_token_service_batch_error_estimates_failing_text_only():
+    """Test that a failing batch falls back to counting texts one by one."""
+    tokenizer = MagicMock()
+    tokenizer.encode_batch.side_effect = ValueError("special token")
+    tokenizer.encode.side_effect = lambda text: text.split() if "bad" not in text else 1 / 0
+    service = TokenizationService("cl100k_base", num_threads=2)
+    with patch('textcleaner.utils.metrics.get_tokenizer', return_value=tokenizer):
+        assert service.count_many(["good text", "bad, text"]) == [2, 3]
+        # The estimate for the failing text is not cached
+        service.count("bad, text")
+
+    assert tokenizer.encode.call_count == 3
+
+def test_token_service_exact_counting_disabled():
+    """Test that disabling exact counting never loads tiktoken."""
+    with patch('textcleaner.utils.metrics.get_tokenizer') as mock_get_tokenizer:
+        service = get_token_service("cl100k_base", exact=False)
+        assert service.count_many(["Hello world", "One two three."]) == [2, 4]
+        assert not service.is_exact()
+        mock_get_tokenizer.assert_not_called()
+
+def test_calculate_metrics_estimates_when_exact_counting_disabled():
+    """Test that metrics are reported as estimates when exact counting is off."""
+    config = MagicMock()
+    config.get.side_effect = lambda key, default=None: False if key == "metrics.exact_token_counts" else default
+
+    with patch('textcleaner.utils.metrics.get_tokenizer') as mock_get_tokenizer:
+        metrics = calculate_metrics("Hello world, again.", "Hello world", 0.1, config)
+
+    mock_get_tokenizer.assert_not_called()
+    assert metrics["original_tokens_estimate"] == 5
+    assert metrics["processed_tokens_estimate"] == 2
+    assert "original_tokens" not in metrics
+
+def test_get_token_counts():
+    """Test reading token statistics from counted and estimated metrics."""
+    assert get_token_counts({"original_tokens": 10, "processed_tokens": 5, "token_reduction_percent": 50.0}) == (10, 5, 50.0, False)
+    assert get_token_counts({"original_tokens_estimate": 6, "processed_tokens_estimate": 3}) == (6, 3, None, True)
+    assert get_token_counts({"processing_time_seconds": 1.0}) == (None, None, None, False)
+
 # --- Tests for calculate_metrics ---
 
-@patch('textcleaner.utils.metrics.count_tokens')
+@patch('textcleaner.utils.metrics.TokenizationService.count_many')
 @patch('textcleaner.utils.metrics.get_tokenizer', return_value=True) # Simulate tokenizer available
-def test_calculate_metrics_basic_tiktoken(mock_get_tokenizer, mock_count_tokens, mock_config):
+def test_calculate_metrics_basic_tiktoken(mock_get_tokenizer, mock_count_many, mock_config):
     """Test basic metrics calculation when tiktoken is available."""
     raw_text = "This is the original long text."
     processed_text = "This is shorter."
     processing_time = 0.5
-    mock_count_tokens.side_effect = [10, 5] # Original tokens, processed tokens
+    mock_count_many.return_value = [10, 5] # Original tokens, processed tokens
     input_stats = {"file_size_kb": 2.0}
 
     metrics = calculate_metrics(raw_text, processed_text, processing_time, mock_config, input_stats)
@@ -247,19 +337,18 @@ def test_calculate_metrics_basic_tiktoken(mock_get_tokenizer, mock_count_tokens,
     assert "processed_tokens_estimate" not in metrics
     assert "token_reduction_percent_estimate" not in metrics
 
-    mock_count_tokens.assert_any_call(raw_text, mock_config)
-    mock_count_tokens.assert_any_call(processed_text, mock_config)
-    assert mock_count_tokens.call_count == 2
+    # Raw and processed text are counted together in one batch
+    mock_count_many.assert_called_once_with([raw_text, processed_text])
     mock_get_tokenizer.assert_called_once_with("cl100k_base") # Checked for key suffix
 
-@patch('textcleaner.utils.metrics.count_tokens')
+@patch('textcleaner.utils.metrics.TokenizationService.count_many')
 @patch('textcleaner.utils.metrics.get_tokenizer', return_value=None) # Simulate tokenizer NOT available
-def test_calculate_metrics_basic_fallback(mock_get_tokenizer, mock_count_tokens, mock_config):
+def test_calculate_metrics_basic_fallback(mock_get_tokenizer, mock_count_many, mock_config):
     """Test basic metrics calculation using fallback estimation."""
     raw_text = "Original text, estimate tokens."
     processed_text = "Processed text."
     processing_time = 0.2
-    mock_count_tokens.side_effect = [6, 3] # Estimated tokens
+    mock_count_many.return_value = [6, 3] # Estimated tokens
 
     metrics = calculate_metrics(raw_text, processed_text, processing_time, mock_config)
 
@@ -278,13 +367,12 @@ def test_calculate_metrics_basic_fallback(mock_get_tokenizer, mock_count_tokens,
     assert "processed_tokens" not in metrics
     assert "token_reduction_percent" not in metrics
 
-    mock_count_tokens.assert_any_call(raw_text, mock_config)
-    mock_count_tokens.assert_any_call(processed_text, mock_config)
-    assert mock_count_tokens.call_count == 2
+    # Raw and processed text are counted together in one batch
+    mock_count_many.assert_called_once_with([raw_text, processed_text])
     mock_get_tokenizer.assert_called_once_with("cl100k_base") # Checked for key suffix
 
-@patch('textcleaner.utils.metrics.count_tokens', return_value=0)
-def test_calculate_metrics_empty_input(mock_count_tokens, mock_config):
+@patch('textcleaner.utils.metrics.TokenizationService.count_many', return_value=[0, 0])
+def test_calculate_metrics_empty_input(mock_count_many, mock_config):
     """Test metrics calculation with empty raw text."""
     raw_text = ""
     processed_text = ""
@@ -302,11 +390,11 @@ def test_calculate_metrics_empty_input(mock_count_tokens, mock_config):
     assert "processing_speed_kb_per_second" not in metrics
     assert metrics["processing_speed_chars_per_second"] == 0 # len(raw_text) / time
 
-    # count_tokens should still be called, returning 0
-    assert mock_count_tokens.call_count == 2
+    # Token counting should still be called, returning 0
+    mock_count_many.assert_called_once_with([raw_text, processed_text])
 
-@patch('textcleaner.utils.metrics.count_tokens', return_value=10)
-def test_calculate_metrics_zero_time(mock_count_tokens, mock_config):
+@patch('textcleaner.utils.metrics.TokenizationService.count_many', return_value=[10, 10])
+def test_calculate_metrics_zero_time(mock_count_many, mock_config):
     """Test metrics calculation with zero processing time."""
     raw_text = "Some text"
     processed_text = "Less text"
@@ -0,0 +1,61 @@
+"""
+Tests for single-pass phrase replacement
+"""
+
+from textcleaner.utils.phrase_replacer import PhraseReplacer, match_case
+from textcleaner.utils.replacement_dictionaries import DomainTextOptimizer, TextSimplifier
+
+
+def test_whole_words_only():
+    """Test that phrases only match on word boundaries"""
+    replacer = PhraseReplacer({"hour": "hr", "gram": "g"})
+    assert replacer.replace("one hour, kilogram, hours, hour_x") == "one hr, kilogram, hours, hour_x"
+
+
+def test_leftmost_longest():
+    """Test that the longest phrase starting at a word wins"""
+    replacer = PhraseReplacer({
+        "united": "U",
+        "united states": "US",
+        "united states of america": "USA",
+        "states of": "SO",
+    })
+    assert replacer.replace("The United States of America and the united states") == "The USA and the US"
+    assert replacer.replace("united states of") == "US of"
+
+
+def test_separators_must_match():
+    """Test that words of a phrase must be separated as in the dictionary"""
+    replacer = PhraseReplacer({"pursuant to": "per"})
+    assert replacer.replace("pursuant to the act") == "per the act"
+    assert replacer.replace("pursuant  to the act") == "pursuant  to the act"
+    assert replacer.replace("pursuant to") == "per"
+
+
+def test_case_preservation():
+    """Test that replacements follow the capitalization of the match"""
+    replacer = PhraseReplacer({"pursuant to": "per"}, preserve_case=True)
+    assert replacer.replace("Pursuant to x, PURSUANT TO y, pursuant to z") == "Per x, PER y, per z"
+    assert match_case("Hello", "") == ""
+    assert PhraseReplacer({"for example": "e.g."}).replace("For example") == "e.g."
+
+
+def test_large_dictionary():
+    """Test that a large dictionary is compiled and applied"""
+    phrases = {f"term{index} alpha": f"t{index}" for index in range(20000)}
+    replacer = PhraseReplacer(phrases)
+    assert len(replacer) == 20000
+    assert replacer.replace("see term19999 alpha and term5 alpha, not term5") == "see t19999 and t5, not term5"
+
+
+def test_simplifiers_use_phrase_replacement():
+    """Test the dictionary classes built on the replacer"""
+    assert TextSimplifier().simplify("Wait 2 hours, for example.") == "Wait 2 hr, e.g.."
+    optimizer = DomainTextOptimizer(domains=["legal"], custom_dict={"quality assurance": "QA", "blank": ""})
+    assert optimizer.optimize("Quality assurance pursuant to blank rules") == "QA per blank rules"
+
+
+def test_domain_optimizer_ignores_keys_with_capitals():
+    """Test that custom keys with capitals are never applied, whatever the text's case"""
+    optimizer = DomainTextOptimizer(custom_dict={"AI": "artificial intelligence", "ml": "machine learning"})
+    assert optimizer.optimize("AI and ai use ML") == "AI and ai use MACHINE LEARNING"
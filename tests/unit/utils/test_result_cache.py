@@ -0,0 +1,165 @@
+"""
+Tests for the content-addressed result cache
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from textcleaner.config.config_manager import ConfigManager
+from textcleaner.core.factories import TextProcessorFactory
+from textcleaner.utils.result_cache import ResultCache
+
+
+@pytest.fixture
+def cache(temp_directory, test_security_utils):
+    """Create a result cache in a temporary directory"""
+    return ResultCache(temp_directory / "cache", security_utils=test_security_utils)
+
+
+def test_key_depends_on_content_config_and_format(cache, temp_directory):
+    """Test that keys follow file contents, not names"""
+    first = temp_directory / "a.txt"
+    second = temp_directory / "b.txt"
+    first.write_text("same content")
+    second.write_text("same content")
+
+    key = cache.make_key(first, "cfg", "markdown")
+    assert key == cache.make_key(second, "cfg", "markdown")
+    assert key != cache.make_key(first, "other-cfg", "markdown")
+    assert key != cache.make_key(first, "cfg", "plain_text")
+
+    second.write_text("different content")
+    assert key != cache.make_key(second, "cfg", "markdown")
+
+
+def test_put_and_get_round_trip(cache, temp_directory):
+    """Test storing and retrieving an entry"""
+    source = temp_directory / "doc.txt"
+    source.write_text("hello")
+    key = cache.make_key(source, "cfg", "markdown")
+
+    assert cache.get(key) is None
+    cache.put(key, "# Output\r\n", "markdown", {"processed_tokens": 3}, {"file_name": "doc.txt"})
+
+    entry = cache.get(key)
+    assert entry["output"] == "# Output\r\n"
+    assert entry["metrics"] == {"processed_tokens": 3}
+    assert entry["metadata"] == {"file_name": "doc.txt"}
+
+
+def test_corrupt_entry_is_a_miss(cache):
+    """Test that unreadable entries are discarded"""
+    key = "ab" + "0" * 62
+    entry_path = cache.cache_dir / key[:2] / f"{key}.json"
+    entry_path.parent.mkdir(parents=True)
+    entry_path.write_text("{not json")
+
+    assert cache.get(key) is None
+    assert not entry_path.exists()
+
+
+def test_evicts_least_recently_used(temp_directory, test_security_utils):
+    """Test that eviction keeps the cache within its size bound"""
+    cache = ResultCache(temp_directory / "cache", max_size_bytes=3500,
+                        security_utils=test_security_utils)
+    keys = [f"{i:02d}" + "f" * 62 for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, "x" * 1000, "markdown", {}, {})
+        # Space out the access times so LRU order is deterministic
+        past = time.time() - 100 + i
+        os.utime(cache._entry_path(key), (past, past))
+
+    # Touch the oldest entry so the middle one becomes least recently used
+    assert cache.get(keys[0]) is not None
+    cache.put("99" + "f" * 62, "x" * 1000, "markdown", {}, {})
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+
+
+def test_processor_serves_unchanged_file_from_cache(temp_directory, test_security_utils):
+    """Test that a second run of an unchanged file is a cache hit"""
+    factory = TextProcessorFactory()
+    factory._security_utils_instance = test_security_utils
+    processor = factory.create_processor(custom_overrides={
+        "cache.enabled": True,
+        "cache.directory": str(temp_directory / "cache"),
+    })
+    assert processor.result_cache is not None
+
+    source = temp_directory / "doc.txt"
+    source.write_text("A first paragraph of text.\n\nA second paragraph of text.\n")
+    first_output = temp_directory / "first.md"
+    second_output = temp_directory / "second.md"
+
+    first = processor.process_file(source, first_output)
+    assert first.success
+    assert "cache_hit" not in first.metrics
+
+    second = processor.process_file(source, second_output)
+    assert second.success
+    assert second.metrics["cache_hit"] is True
+    assert second_output.read_bytes() == first_output.read_bytes()
+
+
+def test_cache_hit_reports_the_current_file(temp_directory, test_security_utils):
+    """Test that identical files at different paths share an entry but keep their own metadata"""
+    factory = TextProcessorFactory()
+    factory._security_utils_instance = test_security_utils
+    processor = factory.create_processor(custom_overrides={
+        "cache.enabled": True,
+        "cache.directory": str(temp_directory / "cache"),
+    })
+    alpha = temp_directory / "a" / "alpha.txt"
+    beta = temp_directory / "b" / "beta.txt"
+    for source in (alpha, beta):
+        source.parent.mkdir()
+        source.write_text("A paragraph of text.\n\nAnother paragraph of text.\n")
+    os.utime(alpha, (1_000_000, 1_000_000))
+
+    first = processor.process_file(alpha, temp_directory / "alpha.md")
+    second = processor.process_file(beta, temp_directory / "beta.md")
+
+    assert second.metrics["cache_hit"] is True
+    assert first.metadata["file_name"] == "alpha.txt"
+    assert second.metadata["file_name"] == "beta.txt"
+    assert second.metadata["file_stats"]["modified_at"] == beta.stat().st_mtime
+    assert first.metadata["file_stats"]["modified_at"] == 1_000_000
+
+
+def test_path_dependent_output_is_not_shared(temp_directory, test_security_utils):
+    """Test that JSONL chunks of identical files record their own source path"""
+    factory = TextProcessorFactory()
+    factory._security_utils_instance = test_security_utils
+    processor = factory.create_processor(custom_overrides={
+        "cache.enabled": True,
+        "cache.directory": str(temp_directory / "cache"),
+    })
+    alpha = temp_directory / "a" / "alpha.txt"
+    beta = temp_directory / "b" / "beta.txt"
+    for source in (alpha, beta):
+        source.parent.mkdir()
+        source.write_text("A paragraph of text.\n\nAnother paragraph of text.\n")
+
+    processor.process_file(alpha, temp_directory / "alpha.jsonl", "jsonl")
+    second = processor.process_file(beta, temp_directory / "beta.jsonl", "jsonl")
+    third = processor.process_file(beta, temp_directory / "beta-again.jsonl", "jsonl")
+
+    assert "cache_hit" not in second.metrics
+    assert third.metrics["cache_hit"] is True
+    for output in ("beta.jsonl", "beta-again.jsonl"):
+        records = [json.loads(line) for line in (temp_directory / output).read_text().splitlines()]
+        assert records and all(record["source"] == str(beta) for record in records)
+
+
+def test_config_fingerprint_ignores_key_order():
+    """Test that equal configurations share a fingerprint"""
+    first = ConfigManager(initial_config={"a": 1, "b": {"c": 2, "d": 3}})
+    second = ConfigManager(initial_config={"b": {"d": 3, "c": 2}, "a": 1})
+    third = ConfigManager(initial_config={"a": 1, "b": {"c": 2, "d": 4}})
+
+    assert first.fingerprint() == second.fingerprint()
+    assert first.fingerprint() != third.fingerprint()
@@ -0,0 +1,91 @@
+"""
+Tests for compiled rule sets
+"""
+
+import pytest
+
+from textcleaner.utils.content_cleaning import HEADER_FOOTER_RULES
+from textcleaner.utils.rule_engine import Rule, RuleSet
+
+
+def test_search_identifies_rule():
+    """Test that the single-scan search reports the first matching rule"""
+    rules = RuleSet([
+        Rule(r"(?i)^page \d+$", name="page"),
+        Rule(r"^\d+$", name="number"),
+    ])
+    assert rules.search("Page 4").name == "page"
+    assert rules.search("17").name == "number"
+    assert rules.search("page four") is None
+
+
+def test_header_footer_rules_are_anchored():
+    """Test that header/footer rules only match whole lines"""
+    assert HEADER_FOOTER_RULES.matches("Page 2 of 10")
+    assert HEADER_FOOTER_RULES.matches("## FOOTER")
+    assert not HEADER_FOOTER_RULES.matches("See Page 2 of 10")
+
+
+def test_literal_patterns_are_their_own_keywords():
+    """Test that plain literal patterns get a keyword derived automatically"""
+    assert Rule(r"(?i)in order to", "to").literal_keywords() == ("in order to",)
+    assert Rule(r"\d+").literal_keywords() is None
+    assert Rule(r"\d+", keywords=("Page",)).literal_keywords() == ("page",)
+
+
+def test_sub_skips_rules_without_keywords_in_text():
+    """Test that a rule is not scanned when none of its keywords occur"""
+    rules = RuleSet([(r"(?i)in order to", "to"), (r"(?i)due to the fact that", "because")])
+    scanned = []
+
+    class SpyRegex:
+        def __init__(self, regex):
+            self.regex = regex
+
+        def subn(self, replacement, text):
+            scanned.append(self.regex.pattern)
+            return self.regex.subn(replacement, text)
+
+    rules._regexes = [SpyRegex(regex) for regex in rules._regexes]
+
+    assert rules.sub("Plain text without phrases.") == "Plain text without phrases."
+    assert scanned == []
+    assert rules.sub("We did it In Order To win.") == "We did it to win."
+    assert scanned == ["(?i)in order to"]
+
+
+def test_sub_applies_rules_in_order():
+    """Test that later rules see the output of earlier ones"""
+    rules = RuleSet([
+        Rule(r"colour", "color"),
+        Rule(r"color", "hue", keywords=("color",)),
+    ])
+    assert rules.sub("colour") == "hue"
+
+
+def test_from_file(tmp_path):
+    """Test loading a custom rule file"""
+    rule_file = tmp_path / "rules.yaml"
+    rule_file.write_text(
+        "rules:\n"
+        "  - pattern: '(?i)lorem ipsum'\n"
+        "  - pattern: 'Acme\\s+Corp'\n"
+        "    replacement: 'Acme'\n"
+        "    keywords: [acme]\n",
+        encoding="utf-8",
+    )
+    rules = RuleSet.from_file(rule_file)
+    assert len(rules) == 2
+    assert rules.sub("Lorem Ipsum by Acme  Corp") == " by Acme"
+
+
+def test_from_file_rejects_invalid_rules(tmp_path):
+    """Test that invalid rule files raise ValueError"""
+    rule_file = tmp_path / "rules.yaml"
+    rule_file.write_text("rules:\n  - pattern: '(unclosed'\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        RuleSet.from_file(rule_file)
+
+    rule_file.write_text("rules: 3\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        RuleSet.from_file(rule_file)
@@ -142,3 +142,61 @@ def test_validate_output_path(test_security_utils, temp_directory):
     
     # Verify directory was created
     assert nested_path.parent.exists()
+
+
+def test_validate_tree_matches_rglob(test_security_utils, temp_directory):
+    """Test that bulk validation yields the same files as Path.rglob"""
+    (temp_directory / "sub" / "deeper").mkdir(parents=True)
+    for name in ("a.txt", "sub/b.md", "sub/deeper/c.txt"):
+        (temp_directory / name).write_text("content")
+    if hasattr(os, "symlink"):
+        os.symlink(temp_directory / "sub", temp_directory / "linked_dir")
+
+    expected = [path for path in temp_directory.rglob("*") if path.is_file()]
+
+    assert list(test_security_utils.validate_tree(temp_directory)) == expected
+    assert list(test_security_utils.validate_tree(temp_directory, recursive=False)) == [temp_directory / "a.txt"]
+
+
+def test_validate_tree_remembers_valid_files(test_security_utils, temp_directory):
+    """Test that files validated in bulk skip the per-file checks until changed"""
+    test_file = temp_directory / "test.txt"
+    test_file.write_text("Test content")
+    list(test_security_utils.validate_tree(temp_directory))
+
+    with patch.object(Path, "resolve", side_effect=AssertionError("resolved again")):
+        assert test_security_utils.validate_path(test_file) == (True, None)
+        assert test_security_utils.check_file_permissions(test_file) == (True, None)
+
+    # A replaced file is validated from scratch
+    test_file.unlink()
+    os.symlink(temp_directory / "other.txt", test_file)
+    is_valid, error = test_security_utils.validate_path(test_file)
+    assert not is_valid
+    assert "symbolic link" in error
+
+
+def test_validate_tree_does_not_remember_invalid_files(test_security_utils, temp_directory):
+    """Test that files failing bulk validation are yielded but still rejected"""
+    script = temp_directory / "script.sh"
+    script.write_text("echo hi")
+
+    assert list(test_security_utils.validate_tree(temp_directory)) == [script]
+    is_valid, error = test_security_utils.validate_path(script)
+    assert not is_valid
+    assert "dangerous extension" in error
+
+
+def test_combined_matchers_report_the_matching_pattern(security_utils):
+    """Test that the precompiled matchers identify the pattern that matched"""
+    is_sensitive, error = security_utils._check_sensitive_location(Path("/Users/alice/Library/file.txt"))
+    assert is_sensitive
+    assert "'/Users/*/Library'" in error
+
+    is_sensitive, error = security_utils._check_sensitive_location(Path("/etc/passwd"))
+    assert is_sensitive
+    assert "sensitive prefix '/etc'" in error
+
+    is_valid, error = security_utils._validate_resolved_path(Path("/data/report;rm.txt"), is_file=True)
+    assert not is_valid
+    assert "suspicious pattern" in error
@@ -0,0 +1,47 @@
+"""
+Tests for paragraph-aligned streaming of large text files
+"""
+
+from textcleaner.utils.streaming import RecentSet, StreamProcessor
+
+
+def test_windows_end_at_paragraph_breaks(tmp_path):
+    """Test that windows reassemble the file and end at blank lines"""
+    text = "\n\n".join(f"Paragraph {index} has a few words in it." for index in range(200))
+    path = tmp_path / "doc.txt"
+    path.write_text(text, encoding="utf-8")
+
+    windows = list(StreamProcessor(chunk_size=100).stream_windows(path, window_size=500))
+
+    assert len(windows) > 1
+    assert "".join(windows) == text
+    assert all(window.endswith("\n\n") for window in windows[:-1])
+    assert all(len(window) <= 500 for window in windows)
+
+
+def test_long_paragraphs_and_multibyte_text(tmp_path):
+    """Test windows over paragraphs longer than the window and split characters"""
+    long_paragraph = "é" * 1500
+    text = f"Intro.\n\n{long_paragraph}\n\nOutro.\nLast line."
+    path = tmp_path / "doc.txt"
+    path.write_text(text, encoding="utf-8")
+
+    windows = list(StreamProcessor(chunk_size=7).stream_windows(path, window_size=1000))
+
+    assert "".join(windows) == text
+    assert windows[0] == "Intro.\n\n"
+    assert windows[1] == long_paragraph + "\n\n"
+
+
+def test_recent_set_is_bounded():
+    """Test that the set forgets its older half once full"""
+    seen = RecentSet(max_items=3)
+    for item in ("a", "b", "c"):
+        seen.add(item)
+    assert "a" in seen and "d" not in seen
+
+    for item in ("d", "e", "f", "g"):
+        seen.add(item)
+    assert "a" not in seen
+    assert all(item in seen for item in ("d", "e", "f", "g"))
+    assert len(seen) == 4
@@ -0,0 +1,91 @@
+"""
+Tests for the precomputed synonym lexicon
+"""
+
+import pickle
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from textcleaner.utils.synonym_lexicon import (
+    FORMAT_VERSION, MAGIC, SynonymLexicon, get_lexicon, write_lexicon
+)
+from textcleaner.utils.word_simplifier import WordNetSimplifier
+
+
+@pytest.fixture
+def lexicon_path(tmp_path):
+    """A small lexicon file"""
+    path = tmp_path / "synonyms.lex"
+    write_lexicon(
+        {"utilizing": "use", "methodologies": "methods", "demonstration": "demo", "café": "bar"},
+        path,
+        source="test data",
+    )
+    return path
+
+
+def test_lookup_round_trip(lexicon_path):
+    """Test that written entries are found and others are not"""
+    lexicon = SynonymLexicon(lexicon_path)
+    assert len(lexicon) == 4
+    assert lexicon.source == "test data"
+    assert lexicon.lookup("utilizing") == "use"
+    assert lexicon.lookup("café") == "bar"
+    assert lexicon.lookup("utilize") is None
+
+
+def test_many_entries(tmp_path):
+    """Test lookups in a table with collisions"""
+    entries = {f"word{index}": f"w{index}" for index in range(5000)}
+    path = tmp_path / "big.lex"
+    assert write_lexicon(entries, path) == 5000
+    lexicon = SynonymLexicon(path)
+    assert all(lexicon.lookup(word) == replacement for word, replacement in entries.items())
+    assert lexicon.lookup("word5000") is None
+
+
+def test_rejects_other_files_and_versions(tmp_path):
+    """Test that foreign files and other format versions are refused"""
+    other = tmp_path / "other.lex"
+    other.write_bytes(b"not a lexicon at all")
+    with pytest.raises(ValueError):
+        SynonymLexicon(other)
+
+    newer = tmp_path / "newer.lex"
+    newer.write_bytes(struct.pack("<8sIIII", MAGIC, FORMAT_VERSION + 1, 1, 0, 0) + bytes(16))
+    with pytest.raises(ValueError, match="version"):
+        SynonymLexicon(newer)
+
+
+def test_shared_instance_and_pickling(lexicon_path):
+    """Test that a file is opened once per process and pickles without its mapping"""
+    lexicon = get_lexicon(lexicon_path)
+    assert get_lexicon(str(lexicon_path)) is lexicon
+    lexicon.lookup("utilizing")
+
+    restored = pickle.loads(pickle.dumps(lexicon))
+    assert restored._map is None
+    assert restored.lookup("methodologies") == "methods"
+
+
+def test_simplifier_uses_lexicon_without_wordnet(lexicon_path):
+    """Test that simplification with a lexicon never touches NLTK"""
+    with patch.object(WordNetSimplifier, "_ensure_nltk_resources") as mock_ensure, \
+         patch.object(WordNetSimplifier, "_get_synonyms") as mock_get_synonyms:
+        simplifier = WordNetSimplifier(min_word_length=5, lexicon_path=lexicon_path)
+        result = simplifier.simplify("Utilizing complex methodologies, a demonstration.")
+
+    assert result == "Use complex methods, a demo."
+    mock_ensure.assert_not_called()
+    mock_get_synonyms.assert_not_called()
+
+
+def test_simplifier_falls_back_without_lexicon(tmp_path):
+    """Test that a missing lexicon falls back to WordNet"""
+    with patch.object(WordNetSimplifier, "_ensure_nltk_resources") as mock_ensure:
+        simplifier = WordNetSimplifier(min_word_length=5, lexicon_path=tmp_path / "missing.lex")
+
+    assert simplifier.lexicon is None
+    mock_ensure.assert_called_once()
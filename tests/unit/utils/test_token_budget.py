@@ -0,0 +1,99 @@
+"""
+Tests for fitting text into a token budget
+"""
+
+import re
+
+from textcleaner.utils.token_budget import fit_to_token_budget
+
+
+class WordTokenizer:
+    """A fake tiktoken encoding with one token per word and its leading space."""
+
+    pattern = re.compile(r'\s*\S+|\s+')
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode_ordinary(self, text):
+        self.calls += 1
+        return self.pattern.findall(text)
+
+    def decode_tokens_bytes(self, tokens):
+        return [token.encode("utf-8") for token in tokens]
+
+
+DOCUMENT = (
+    "# Introduction\n\n"
+    "First paragraph has six words here.\n\n"
+    "Second paragraph. It has two sentences.\n\n"
+    "# Details\n\n"
+    "Third paragraph with some more words in it.\n\n"
+    "# Appendix\n\n"
+    "Last words."
+)
+
+
+def test_text_within_budget_is_unchanged():
+    """Test that text that fits is returned as is"""
+    tokenizer = WordTokenizer()
+    text, report = fit_to_token_budget(DOCUMENT, 1000, tokenizer)
+    assert text == DOCUMENT
+    assert report["truncated"] is False
+    assert report["kept_tokens"] == report["original_tokens"]
+    assert tokenizer.calls == 1
+
+
+def test_cut_prefers_heading_boundary():
+    """Test that the text is cut before the last heading that fits"""
+    tokenizer = WordTokenizer()
+    text, report = fit_to_token_budget(DOCUMENT, 25, tokenizer, min_fill=0.5)
+    assert text.endswith("more words in it.")
+    assert report["cut_at"] == "heading"
+    assert report["dropped_headings"] == ["Appendix"]
+    assert report["dropped_heading_count"] == 1
+    assert report["kept_tokens"] == 24
+    assert report["dropped_characters"] == len(DOCUMENT) - len(text)
+    # One encoding of the document and one of the kept text
+    assert tokenizer.calls == 2
+
+
+def test_cut_falls_back_to_paragraph_and_sentence():
+    """Test finer boundaries when no coarser one keeps enough of the budget"""
+    text, report = fit_to_token_budget(DOCUMENT, 9, WordTokenizer(), min_fill=0.9)
+    assert report["cut_at"] == "paragraph"
+    assert text.endswith("six words here.")
+
+    text, report = fit_to_token_budget(DOCUMENT, 12, WordTokenizer(), min_fill=0.9)
+    assert report["cut_at"] == "sentence"
+    assert text.endswith("Second paragraph.")
+    assert report["kept_tokens"] == 10
+    assert report["dropped_headings"] == ["Details", "Appendix"]
+
+
+def test_cut_between_words_without_boundaries():
+    """Test the word fallback for text without structural boundaries"""
+    text, report = fit_to_token_budget("alpha beta gamma delta epsilon", 3, WordTokenizer())
+    assert text == "alpha beta gamma"
+    assert report["cut_at"] == "word"
+
+
+def test_estimated_tokens_without_tokenizer():
+    """Test that the budget applies to estimated tokens without tiktoken"""
+    text, report = fit_to_token_budget(DOCUMENT, 20, None, min_fill=0.5)
+    assert report["exact"] is False
+    assert report["truncated"] is True
+    assert report["kept_tokens"] <= 20
+    assert text.endswith("It has two sentences.")
+
+
+def test_large_document_uses_bounded_encoder_calls():
+    """Test that a long document is encoded a fixed number of times"""
+    paragraph = "This sentence has exactly seven word tokens. " * 20
+    document = "\n\n".join(f"# Section {index}\n\n{paragraph}" for index in range(2000))
+    tokenizer = WordTokenizer()
+    text, report = fit_to_token_budget(document, 100000, tokenizer)
+    assert report["original_tokens"] > 250000
+    assert report["kept_tokens"] <= 100000
+    assert report["kept_tokens"] >= 90000
+    assert tokenizer.calls == 2